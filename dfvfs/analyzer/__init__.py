@@ -1,40 +1,100 @@
 # -*- coding: utf-8 -*-
-"""Imports for the format analyzer."""
+"""Imports for the format analyzer.
 
-from dfvfs.analyzer import apfs_analyzer_helper
-from dfvfs.analyzer import apfs_container_analyzer_helper
-from dfvfs.analyzer import apm_analyzer_helper
-from dfvfs.analyzer import bde_analyzer_helper
-from dfvfs.analyzer import bzip2_analyzer_helper
-from dfvfs.analyzer import cpio_analyzer_helper
-from dfvfs.analyzer import cs_analyzer_helper
-from dfvfs.analyzer import ewf_analyzer_helper
-from dfvfs.analyzer import ext_analyzer_helper
-from dfvfs.analyzer import fat_analyzer_helper
-from dfvfs.analyzer import gpt_analyzer_helper
-from dfvfs.analyzer import gzip_analyzer_helper
-from dfvfs.analyzer import hfs_analyzer_helper
-from dfvfs.analyzer import luksde_analyzer_helper
-from dfvfs.analyzer import lvm_analyzer_helper
-from dfvfs.analyzer import modi_analyzer_helper
-from dfvfs.analyzer import ntfs_analyzer_helper
-from dfvfs.analyzer import phdi_analyzer_helper
-from dfvfs.analyzer import qcow_analyzer_helper
-from dfvfs.analyzer import tar_analyzer_helper
+The analyzer helpers are registered by type indicator and their modules,
+including the back-ends they depend on, are only imported when one of their
+format categories is first analyzed.
+"""
 
-try:
-  from dfvfs.analyzer import tsk_analyzer_helper
-except ImportError:
-  pass
+from dfvfs.analyzer import analyzer
+from dfvfs.lib import definitions
 
-try:
-  from dfvfs.analyzer import tsk_partition_analyzer_helper
-except ImportError:
-  pass
 
-from dfvfs.analyzer import vhdi_analyzer_helper
-from dfvfs.analyzer import vmdk_analyzer_helper
-from dfvfs.analyzer import vshadow_analyzer_helper
-from dfvfs.analyzer import xfs_analyzer_helper
-from dfvfs.analyzer import xz_analyzer_helper
-from dfvfs.analyzer import zip_analyzer_helper
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_APFS, 'dfvfs.analyzer.apfs_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_FILE_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_APFS_CONTAINER,
+    'dfvfs.analyzer.apfs_container_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_APM, 'dfvfs.analyzer.apm_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_BDE, 'dfvfs.analyzer.bde_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_BZIP2, 'dfvfs.analyzer.bzip2_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_COMPRESSED_STREAM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_CPIO, 'dfvfs.analyzer.cpio_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_ARCHIVE])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_CS, 'dfvfs.analyzer.cs_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_EWF, 'dfvfs.analyzer.ewf_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_ARCHIVE,
+     definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_EXT, 'dfvfs.analyzer.ext_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_FILE_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_FAT, 'dfvfs.analyzer.fat_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_FILE_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_GPT, 'dfvfs.analyzer.gpt_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_GZIP, 'dfvfs.analyzer.gzip_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_COMPRESSED_STREAM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_HFS, 'dfvfs.analyzer.hfs_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_FILE_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_LUKSDE, 'dfvfs.analyzer.luksde_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_LVM, 'dfvfs.analyzer.lvm_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_MODI, 'dfvfs.analyzer.modi_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_NTFS, 'dfvfs.analyzer.ntfs_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_FILE_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_PHDI, 'dfvfs.analyzer.phdi_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_QCOW, 'dfvfs.analyzer.qcow_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_TAR, 'dfvfs.analyzer.tar_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_ARCHIVE])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_TSK, 'dfvfs.analyzer.tsk_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_FILE_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_TSK_PARTITION,
+    'dfvfs.analyzer.tsk_partition_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_VHDI, 'dfvfs.analyzer.vhdi_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_VMDK, 'dfvfs.analyzer.vmdk_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_VSHADOW,
+    'dfvfs.analyzer.vshadow_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_XFS, 'dfvfs.analyzer.xfs_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_FILE_SYSTEM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_XZ, 'dfvfs.analyzer.xz_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_COMPRESSED_STREAM])
+analyzer.Analyzer.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_ZIP, 'dfvfs.analyzer.zip_analyzer_helper',
+    [definitions.FORMAT_CATEGORY_ARCHIVE])
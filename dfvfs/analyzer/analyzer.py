@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """The format analyzer."""
 
+import importlib
+import threading
+
 import pysigscan
 
 from dfvfs.analyzer import specification
@@ -8,11 +11,19 @@ from dfvfs.lib import definitions
 from dfvfs.resolver import resolver
 
 
+# Serializes importing the deferred modules of analyzer helpers.
+_IMPORT_LOCK = threading.RLock()
+
+
 class Analyzer(object):
   """Format analyzer."""
 
   _SCAN_BUFFER_SIZE = 33 * 1024
 
+  # The deferred modules of analyzer helpers and their format categories,
+  # per type indicator.
+  _analyzer_helper_modules = {}
+
   _analyzer_helpers = {}
 
   # The archive format category analyzer helpers that do not have
@@ -25,6 +36,11 @@ class Analyzer(object):
   # The archive format category specification store.
   _archive_store = None
 
+  # The signature scanners, specification stores and analyzer helpers that
+  # do not have a format specification of combined format categories, per
+  # set of format categories.
+  _combined_categories_cache = {}
+
   # The compressed stream format category analyzer helpers that do not have
   # a format specification.
   _compressed_stream_remainder_list = None
@@ -72,6 +88,10 @@ class Analyzer(object):
     Args:
       format_categories (set[str]): format categories.
     """
+    for combined_format_categories in list(cls._combined_categories_cache):
+      if combined_format_categories.intersection(format_categories):
+        del cls._combined_categories_cache[combined_format_categories]
+
     if definitions.FORMAT_CATEGORY_ARCHIVE in format_categories:
       cls._archive_remainder_list = None
       cls._archive_scanner = None
@@ -97,6 +117,37 @@ class Analyzer(object):
       cls._volume_system_scanner = None
       cls._volume_system_store = None
 
+  @classmethod
+  def _GetCombinedSpecificationStore(cls, format_categories):
+    """Retrieves the specification store for multiple format categories.
+
+    Args:
+      format_categories (frozenset[str]): format categories.
+
+    Returns:
+      tuple[FormatSpecificationStore, list[AnalyzerHelper]]: a format
+          specification store and remaining analyzer helpers that do not have
+          a format specification.
+    """
+    cls._ImportHelperModules(format_categories)
+
+    specification_store = specification.FormatSpecificationStore()
+    remainder_list = []
+
+    for analyzer_helper in list(cls._analyzer_helpers.values()):
+      if not analyzer_helper.IsEnabled():
+        continue
+
+      if format_categories.intersection(analyzer_helper.format_categories):
+        format_specification = analyzer_helper.GetFormatSpecification()
+
+        if format_specification is not None:
+          specification_store.AddSpecification(format_specification)
+        else:
+          remainder_list.append(analyzer_helper)
+
+    return specification_store, remainder_list
+
   @classmethod
   def _GetSignatureScanner(cls, specification_store):
     """Initializes a signature scanner based on a specification store.
@@ -140,10 +191,12 @@ class Analyzer(object):
           specification store and remaining analyzer helpers that do not have
           a format specification.
     """
+    cls._ImportHelperModules(frozenset([format_category]))
+
     specification_store = specification.FormatSpecificationStore()
     remainder_list = []
 
-    for analyzer_helper in cls._analyzer_helpers.values():
+    for analyzer_helper in list(cls._analyzer_helpers.values()):
       if not analyzer_helper.IsEnabled():
         continue
 
@@ -198,6 +251,29 @@ class Analyzer(object):
 
     return type_indicator_list
 
+  @classmethod
+  def _ImportHelperModules(cls, format_categories):
+    """Imports the deferred modules of analyzer helpers.
+
+    Importing a module registers its analyzer helper. If the module cannot be
+    imported, for example because the back-end it depends on is not
+    available, no analyzer helper is registered.
+
+    Args:
+      format_categories (frozenset[str]): format categories of the analyzer
+          helpers to import.
+    """
+    with _IMPORT_LOCK:
+      for type_indicator, (module_name, module_format_categories) in list(
+          cls._analyzer_helper_modules.items()):
+        if format_categories.intersection(module_format_categories):
+          try:
+            importlib.import_module(module_name)
+          except ImportError:
+            pass
+
+          cls._analyzer_helper_modules.pop(type_indicator, None)
+
   @classmethod
   def DeregisterHelper(cls, analyzer_helper):
     """Deregisters a format analyzer helper.
@@ -331,6 +407,63 @@ class Analyzer(object):
         cls._storage_media_image_remainder_list, path_spec,
         resolver_context=resolver_context)
 
+  @classmethod
+  def GetTypeIndicatorsByCategory(
+      cls, path_spec, format_categories, resolver_context=None):
+    """Determines if a file contains supported types of multiple categories.
+
+    The file is opened and scanned once for the signatures of all the format
+    categories, instead of once per format category.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_categories (list[str]): format categories.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built-in context which is not multi process safe.
+
+    Returns:
+      dict[str, list[str]]: supported format type indicators per format
+          category.
+    """
+    format_categories = frozenset(format_categories)
+
+    lookup_value = cls._combined_categories_cache.get(format_categories, None)
+    if lookup_value is None:
+      specification_store, remainder_list = (
+          cls._GetCombinedSpecificationStore(format_categories))
+      signature_scanner = cls._GetSignatureScanner(specification_store)
+
+      lookup_value = (signature_scanner, specification_store, remainder_list)
+      cls._combined_categories_cache[format_categories] = lookup_value
+
+    signature_scanner, specification_store, remainder_list = lookup_value
+
+    type_indicators = cls._GetTypeIndicators(
+        signature_scanner, specification_store, remainder_list, path_spec,
+        resolver_context=resolver_context)
+
+    type_indicators_per_category = {
+        format_category: [] for format_category in format_categories}
+
+    for type_indicator in type_indicators:
+      analyzer_helper = cls._analyzer_helpers.get(type_indicator, None)
+      if not analyzer_helper:
+        continue
+
+      for format_category in format_categories.intersection(
+          analyzer_helper.format_categories):
+        type_indicators_per_category[format_category].append(type_indicator)
+
+    type_indicators = type_indicators_per_category.get(
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM, None)
+    if (type_indicators and len(type_indicators) > 1 and
+        definitions.TYPE_INDICATOR_TSK_PARTITION in type_indicators):
+      # The TSK partition analyzer is used as a fallback, remove it if
+      # an alternative analyzer detected a supported volume system.
+      type_indicators.remove(definitions.TYPE_INDICATOR_TSK_PARTITION)
+
+    return type_indicators_per_category
+
   @classmethod
   def GetVolumeSystemTypeIndicators(cls, path_spec, resolver_context=None):
     """Determines if a file contains a supported volume system types.
@@ -386,3 +519,35 @@ class Analyzer(object):
     cls._FlushCache(analyzer_helper.format_categories)
 
     cls._analyzer_helpers[analyzer_helper.type_indicator] = analyzer_helper
+    cls._analyzer_helper_modules.pop(analyzer_helper.type_indicator, None)
+
+  @classmethod
+  def RegisterHelperModule(cls, type_indicator, module_name, format_categories):
+    """Registers a deferred module of a format analyzer helper.
+
+    The module is imported, which registers its analyzer helper, when one of
+    its format categories is first analyzed.
+
+    Args:
+      type_indicator (str): type indicator.
+      module_name (str): name of the module that registers the analyzer
+          helper on import, such as "dfvfs.analyzer.ntfs_analyzer_helper".
+      format_categories (list[str]): format categories of the analyzer
+          helper.
+
+    Raises:
+      KeyError: if analyzer helper object or module is already set for
+          the corresponding type indicator.
+    """
+    if (type_indicator in cls._analyzer_helpers or
+        type_indicator in cls._analyzer_helper_modules):
+      raise KeyError((
+          f'Analyzer helper object or module already set for type indicator: '
+          f'{type_indicator:s}.'))
+
+    format_categories = frozenset(format_categories)
+
+    cls._FlushCache(format_categories)
+
+    cls._analyzer_helper_modules[type_indicator] = (
+        module_name, format_categories)
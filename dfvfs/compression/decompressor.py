@@ -9,6 +9,18 @@ class Decompressor(object):
 
   # pylint: disable=redundant-returns-doc
 
+  def Copy(self):
+    """Copies the decompressor including its decompression state.
+
+    A copy allows to resume decompression from the point at which the copy
+    was made, without decompressing the preceding data again.
+
+    Returns:
+      Decompressor: copy of the decompressor or None if the decompressor does
+          not support copying its decompression state.
+    """
+    return None
+
   @abc.abstractmethod
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
@@ -15,6 +15,10 @@ class Base16Decoder(decoder.Decoder):
 
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE16
 
+  _DECODED_BLOCK_SIZE = 1
+
+  _ENCODED_BLOCK_SIZE = 2
+
   def Decode(self, encoded_data):
     """Decode the encoded data.
 
@@ -15,6 +15,10 @@ class Base32Decoder(decoder.Decoder):
 
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE32
 
+  _DECODED_BLOCK_SIZE = 5
+
+  _ENCODED_BLOCK_SIZE = 8
+
   def Decode(self, encoded_data):
     """Decode the encoded data.
 
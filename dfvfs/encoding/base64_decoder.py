@@ -15,6 +15,10 @@ class Base64Decoder(decoder.Decoder):
 
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE64
 
+  _DECODED_BLOCK_SIZE = 3
+
+  _ENCODED_BLOCK_SIZE = 4
+
   def Decode(self, encoded_data):
     """Decode the encoded data.
 
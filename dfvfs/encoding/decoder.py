@@ -5,7 +5,28 @@ import abc
 
 
 class Decoder(object):
-  """Decoder interface."""
+  """Decoder interface.
+
+  Encoded data is decoded in blocks, where a block of encoded characters is
+  decoded into a block of bytes of a fixed size, except for the last block
+  that can contain padding.
+  """
+
+  # The number of encoded characters in a block.
+  _ENCODED_BLOCK_SIZE = 1
+
+  # The number of bytes in a decoded block.
+  _DECODED_BLOCK_SIZE = 1
+
+  @property
+  def decoded_block_size(self):
+    """int: number of bytes in a decoded block."""
+    return self._DECODED_BLOCK_SIZE
+
+  @property
+  def encoded_block_size(self):
+    """int: number of encoded characters in a block."""
+    return self._ENCODED_BLOCK_SIZE
 
   # pylint: disable=redundant-returns-doc
 
@@ -19,3 +40,29 @@ class Decoder(object):
     Returns:
       tuple(bytes, bytes): decoded data and remaining encoded data.
     """
+
+  def GetDecodedOffset(self, encoded_offset):
+    """Retrieves the decoded offset of the block of an encoded character.
+
+    Args:
+      encoded_offset (int): index of the encoded character, without
+          whitespace.
+
+    Returns:
+      int: offset of the decoded block that contains the encoded character.
+    """
+    block_number = encoded_offset // self._ENCODED_BLOCK_SIZE
+    return block_number * self._DECODED_BLOCK_SIZE
+
+  def GetEncodedOffset(self, decoded_offset):
+    """Retrieves the encoded offset of the block of a decoded byte.
+
+    Args:
+      decoded_offset (int): offset of the decoded byte.
+
+    Returns:
+      int: index of the first encoded character, without whitespace, of
+          the block that contains the decoded byte.
+    """
+    block_number = decoded_offset // self._DECODED_BLOCK_SIZE
+    return block_number * self._ENCODED_BLOCK_SIZE
@@ -13,6 +13,8 @@ class AESDecrypter(decrypter.Decrypter):
 
   ENCRYPTION_METHOD = definitions.ENCRYPTION_METHOD_AES
 
+  SUPPORTS_RANDOM_ACCESS = True
+
   _BLOCK_SIZE = 16
 
   # TODO: add CFB and OFB support
@@ -54,6 +56,7 @@ class AESDecrypter(decrypter.Decrypter):
     self._aes_context = pycaes.context()
     self._cipher_mode = cipher_mode
     self._initialization_vector = initialization_vector
+    self._start_initialization_vector = initialization_vector
 
     self._aes_context.set_key(pycaes.crypt_modes.DECRYPT, key)
 
@@ -96,5 +99,28 @@ class AESDecrypter(decrypter.Decrypter):
     decrypted_data_size = encrypted_data_size - block_offset
     return decrypted_data[:decrypted_data_size], remaining_encrypted_data
 
+  def SeekBlock(self, previous_encrypted_block=None):
+    """Prepares the decrypter to decrypt data that starts at a block boundary.
+
+    In CBC mode the initialization vector of a block is the preceding
+    encrypted block. In ECB mode every block is decrypted independently.
+
+    Args:
+      previous_encrypted_block (Optional[bytes]): encrypted block that precedes
+          the block boundary or None if the data starts at the beginning of
+          the encrypted stream.
+
+    Raises:
+      ValueError: if the size of the previous encrypted block is not supported.
+    """
+    if previous_encrypted_block is None:
+      self._initialization_vector = self._start_initialization_vector
+
+    elif len(previous_encrypted_block) != self._BLOCK_SIZE:
+      raise ValueError('Unsupported previous encrypted block size.')
+
+    elif self._cipher_mode == definitions.ENCRYPTION_MODE_CBC:
+      self._initialization_vector = previous_encrypted_block
+
 
 manager.EncryptionManager.RegisterDecrypter(AESDecrypter)
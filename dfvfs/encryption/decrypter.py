@@ -5,7 +5,17 @@ import abc
 
 
 class Decrypter(object):
-  """Decrypter interface."""
+  """Decrypter interface.
+
+  Attributes:
+    SUPPORTS_RANDOM_ACCESS (bool): True if the decrypter can decrypt data that
+        starts at any block boundary, without decrypting the preceding data.
+  """
+
+  SUPPORTS_RANDOM_ACCESS = False
+
+  # The size of a cipher block, which is 1 for a stream cipher.
+  _BLOCK_SIZE = 1
 
   def __init__(self, **kwargs):
     """Initializes a decrypter.
@@ -22,6 +32,11 @@ class Decrypter(object):
 
     super(Decrypter, self).__init__()
 
+  @property
+  def block_size(self):
+    """int: size of a cipher block, which is 1 for a stream cipher."""
+    return self._BLOCK_SIZE
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def Decrypt(self, encrypted_data, finalize=False):
@@ -35,3 +50,16 @@ class Decrypter(object):
     Returns:
       tuple[bytes, bytes]: decrypted data and remaining encrypted data.
     """
+
+  def SeekBlock(self, previous_encrypted_block=None):
+    """Prepares the decrypter to decrypt data that starts at a block boundary.
+
+    Args:
+      previous_encrypted_block (Optional[bytes]): encrypted block that precedes
+          the block boundary or None if the data starts at the beginning of
+          the encrypted stream.
+
+    Raises:
+      ValueError: if the decrypter does not support random access.
+    """
+    raise ValueError('Decrypter does not support random access.')
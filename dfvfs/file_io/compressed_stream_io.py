@@ -1,39 +1,148 @@
 # -*- coding: utf-8 -*-
 """The compressed stream file-like object implementation."""
 
+import bisect
 import os
 
 from dfvfs.compression import manager as compression_manager
 from dfvfs.file_io import file_io
+from dfvfs.lib import bzip2file
+from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import xzfile
 from dfvfs.resolver import resolver
 
 
+class _AccessPoint(object):
+  """Access point of a compressed stream.
+
+  An access point is a location in the compressed stream from which
+  decompression can be resumed without decompressing the preceding data.
+
+  Attributes:
+    compressed_data (bytes): compressed data that is to be decompressed before
+        the compressed data at the compressed data offset.
+    compressed_data_offset (int): offset in the compressed stream to resume
+        reading compressed data from.
+    decompressor (Decompressor): decompressor with the decompression state at
+        the access point or None if decompression is resumed with a new
+        decompressor.
+    uncompressed_data_offset (int): offset in the uncompressed stream of
+        the data that is decompressed after the access point.
+  """
+
+  def __init__(
+      self, compressed_data_offset, uncompressed_data_offset,
+      compressed_data=b'', decompressor=None):
+    """Initializes an access point.
+
+    Args:
+      compressed_data_offset (int): offset in the compressed stream to resume
+          reading compressed data from.
+      uncompressed_data_offset (int): offset in the uncompressed stream of
+          the data that is decompressed after the access point.
+      compressed_data (Optional[bytes]): compressed data that is to be
+          decompressed before the compressed data at the compressed data
+          offset.
+      decompressor (Optional[Decompressor]): decompressor with
+          the decompression state at the access point or None if
+          decompression is resumed with a new decompressor.
+    """
+    super(_AccessPoint, self).__init__()
+    self.compressed_data = compressed_data
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class CompressedStream(file_io.FileIO):
-  """File input/output (IO) object of a compressed stream."""
+  """File input/output (IO) object of a compressed stream.
+
+  To support random access the compressed stream maintains an index of access
+  points, which is built during the first sequential pass over the compressed
+  data. For zlib and DEFLATE compressed data the access points are snapshots
+  of the decompression state at regular intervals of uncompressed data. For
+  XZ compressed data the access points are the starts of the blocks, as
+  defined by the index of the stream. BZIP2 compressed data, and XZ
+  compressed data with multiple blocks if multiple workers are used, is
+  read per block, since every block can be decompressed independently.
+  If multiple workers are used and the stream is read sequentially, the blocks
+  that follow the block that is read are decompressed ahead, concurrently.
+  """
 
   # The size of the compressed data buffer.
   _COMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
-  def __init__(self, resolver_context, path_spec):
+  # The minimum size of the uncompressed data between access points.
+  _ACCESS_POINT_INTERVAL = 16 * 1024 * 1024
+
+  # The maximum size of the uncompressed data of a XZ compressed block that
+  # is read per block.
+  _MAXIMUM_XZ_BLOCK_SIZE = 16 * 1024 * 1024
+
+  def __init__(self, resolver_context, path_spec, maximum_number_of_workers=1):
     """Initializes a file input/output (IO) object.
 
     Args:
       resolver_context (Context): resolver context.
       path_spec (PathSpec): a path specification.
+      maximum_number_of_workers (Optional[int]): maximum number of threads
+          that decompress BZIP2 and XZ compressed blocks, where 1 represents
+          that blocks are only decompressed by the thread that reads them.
+
+    Raises:
+      ValueError: if the maximum number of workers is invalid.
     """
+    if maximum_number_of_workers < 1:
+      raise ValueError((
+          f'Invalid maximum number of workers: {maximum_number_of_workers:d} '
+          f'value out of bounds.'))
+
     super(CompressedStream, self).__init__(resolver_context, path_spec)
+    self._access_point_offsets = []
+    self._access_points = []
+    self._block_index = None
+    self._block_number = None
     self._compression_method = None
     self._file_object = None
     self._compressed_data = b''
+    self._compressed_data_offset = 0
+    self._compressed_data_size = None
     self._current_offset = 0
+    self._decompression_engine = None
     self._decompressor = None
+    self._maximum_number_of_workers = maximum_number_of_workers
     self._realign_offset = True
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_data_start_offset = 0
     self._uncompressed_stream_size = None
 
+  def _AddAccessPoint(
+      self, compressed_data_offset, uncompressed_data_offset,
+      compressed_data=b'', decompressor=None):
+    """Adds an access point.
+
+    Args:
+      compressed_data_offset (int): offset in the compressed stream to resume
+          reading compressed data from.
+      uncompressed_data_offset (int): offset in the uncompressed stream of
+          the data that is decompressed after the access point.
+      compressed_data (Optional[bytes]): compressed data that is to be
+          decompressed before the compressed data at the compressed data
+          offset.
+      decompressor (Optional[Decompressor]): decompressor with
+          the decompression state at the access point or None if
+          decompression is resumed with a new decompressor.
+    """
+    access_point = _AccessPoint(
+        compressed_data_offset, uncompressed_data_offset,
+        compressed_data=compressed_data, decompressor=decompressor)
+
+    self._access_points.append(access_point)
+    self._access_point_offsets.append(uncompressed_data_offset)
+
   def _Close(self):
     """Closes the file-like object.
 
@@ -41,6 +150,10 @@ class CompressedStream(file_io.FileIO):
     stream file-like object does not control the file-like object and should not
     actually close it.
     """
+    if self._decompression_engine:
+      self._decompression_engine.Close()
+      self._decompression_engine = None
+
     self._compressed_data = b''
     self._file_object = None
     self._decompressor = None
@@ -58,26 +171,63 @@ class CompressedStream(file_io.FileIO):
   def _GetUncompressedStreamSize(self):
     """Retrieves the uncompressed stream size.
 
+    This function also builds the access points of the compressed stream.
+
     Returns:
       int: uncompressed stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    if self._decompression_engine:
+      self._decompression_engine.Close()
+      self._decompression_engine = None
+
+    self._access_point_offsets = []
+    self._access_points = []
+    self._block_index = None
+    self._block_number = None
+    self._realign_offset = True
 
+    compression_method = self._compression_method.lower()
+    if compression_method == definitions.COMPRESSION_METHOD_BZIP2:
+      uncompressed_stream_size = self._ReadBZIP2BlockIndex()
+      if uncompressed_stream_size is not None:
+        return uncompressed_stream_size
+
+    elif compression_method == definitions.COMPRESSION_METHOD_XZ:
+      uncompressed_stream_size = self._ReadXZBlockIndex()
+      if uncompressed_stream_size is not None:
+        return uncompressed_stream_size
+
+    self._compressed_data = b''
+    self._compressed_data_offset = 0
+    self._compressed_data_size = self._file_object.get_size()
     self._decompressor = self._GetDecompressor()
     self._uncompressed_data = b''
+    self._uncompressed_data_size = 0
+    self._uncompressed_data_start_offset = 0
+
+    self._AddAccessPoint(0, 0)
 
-    compressed_data_offset = 0
-    compressed_data_size = self._file_object.get_size()
     uncompressed_stream_size = 0
 
-    while compressed_data_offset < compressed_data_size:
+    while self._compressed_data_offset < self._compressed_data_size:
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
       uncompressed_stream_size += self._uncompressed_data_size
 
+      last_access_point_offset = self._access_point_offsets[-1]
+      if (uncompressed_stream_size - last_access_point_offset >=
+          self._ACCESS_POINT_INTERVAL):
+        # Note that Copy returns None if the decompressor does not support
+        # copying its decompression state.
+        decompressor = self._decompressor.Copy()
+        if decompressor:
+          self._AddAccessPoint(
+              self._compressed_data_offset, uncompressed_stream_size,
+              compressed_data=self._compressed_data,
+              decompressor=decompressor)
+
     return uncompressed_stream_size
 
   def _Open(self, mode='rb'):
@@ -109,44 +259,131 @@ class CompressedStream(file_io.FileIO):
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+    Decompression is resumed from the nearest access point before
+    the uncompressed data offset.
+
     Args:
       uncompressed_data_offset (int): uncompressed data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
-
-    self._decompressor = self._GetDecompressor()
+    uncompressed_data_end_offset = (
+        self._uncompressed_data_start_offset + self._uncompressed_data_size)
+    if (self._uncompressed_data_start_offset <= uncompressed_data_offset <
+        uncompressed_data_end_offset):
+      self._uncompressed_data_offset = (
+          uncompressed_data_offset - self._uncompressed_data_start_offset)
+      return
+
+    if self._block_index:
+      block_number = self._block_index.GetBlockIndexForOffset(
+          uncompressed_data_offset)
+      if block_number is None:
+        return
+
+      self._block_number = block_number - 1
+      self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+      self._uncompressed_data_offset = (
+          uncompressed_data_offset - self._uncompressed_data_start_offset)
+      return
+
+    access_point_index = bisect.bisect_right(
+        self._access_point_offsets, uncompressed_data_offset) - 1
+    access_point = self._access_points[access_point_index]
+
+    if access_point.decompressor:
+      # Note that the decompressor of the access point is copied so that
+      # the access point can be reused.
+      self._decompressor = access_point.decompressor.Copy()
+    else:
+      self._decompressor = self._GetDecompressor()
+
+    self._compressed_data = access_point.compressed_data
+    self._compressed_data_offset = access_point.compressed_data_offset
     self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+    self._uncompressed_data_start_offset = (
+        access_point.uncompressed_data_offset)
 
-    compressed_data_offset = 0
-    compressed_data_size = self._file_object.get_size()
-
-    while compressed_data_offset < compressed_data_size:
+    while self._compressed_data_offset < self._compressed_data_size:
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
-
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      uncompressed_data_end_offset = (
+          self._uncompressed_data_start_offset + self._uncompressed_data_size)
+      if uncompressed_data_offset < uncompressed_data_end_offset:
+        self._uncompressed_data_offset = (
+            uncompressed_data_offset - self._uncompressed_data_start_offset)
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+  def _ReadBZIP2BlockIndex(self):
+    """Reads the block index of a BZIP2 compressed stream.
+
+    Returns:
+      int: uncompressed stream size or None if the block index could not
+          be read.
+    """
+    block_index = bzip2file.BZIP2BlockIndex()
+
+    try:
+      block_index.Read(
+          self._file_object,
+          maximum_number_of_workers=self._maximum_number_of_workers)
+    except (errors.BackEndError, errors.FileFormatError):
+      return None
+
+    self._block_index = block_index
+    self._decompression_engine = block_index.CreateDecompressionEngine(
+        self._file_object,
+        maximum_number_of_workers=self._maximum_number_of_workers)
+    self._uncompressed_data = b''
+    self._uncompressed_data_size = 0
+    self._uncompressed_data_start_offset = 0
+
+    return block_index.uncompressed_data_size
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
 
+    If the compressed stream is read per block, the next block is read
+    instead.
+
     Args:
       read_size (int): number of bytes of compressed data to read.
 
     Returns:
       int: number of bytes of compressed data read.
     """
+    if self._block_index:
+      block_number = 0
+      if self._block_number is not None:
+        block_number = self._block_number + 1
+
+      if block_number >= len(self._block_index.blocks):
+        return 0
+
+      block = self._block_index.blocks[block_number]
+
+      self._uncompressed_data = self._decompression_engine.GetBlock(
+          block_number)
+      self._uncompressed_data_size = len(self._uncompressed_data)
+      self._uncompressed_data_start_offset = block.uncompressed_data_offset
+      self._block_number = block_number
+
+      return block.compressed_data_size
+
+    read_size = min(
+        read_size, self._compressed_data_size - self._compressed_data_offset)
+
+    self._file_object.seek(self._compressed_data_offset, os.SEEK_SET)
     compressed_data = self._file_object.read(read_size)
 
     read_count = len(compressed_data)
 
     self._compressed_data = b''.join([self._compressed_data, compressed_data])
+    self._compressed_data_offset += read_count
+
+    self._uncompressed_data_start_offset += self._uncompressed_data_size
 
     self._uncompressed_data, self._compressed_data = (
         self._decompressor.Decompress(self._compressed_data))
@@ -155,22 +392,19 @@ class CompressedStream(file_io.FileIO):
 
     return read_count
 
-  # Note: that the following functions do not follow the style guide
-  # because they are part of the file-like object interface.
-  # pylint: disable=invalid-name
+  def _ReadUncompressedDataSegments(self, size):
+    """Reads segments of uncompressed data at the current offset.
 
-  def read(self, size=None):
-    """Reads a byte string from the file-like object at the current offset.
-
-    The function will read a byte string of the specified size or
-    all of the remaining data if no size was specified.
+    The segments are views on the uncompressed data buffers, therefore the data
+    is only copied once, when the segments are joined or copied into
+    a buffer.
 
     Args:
       size (Optional[int]): number of bytes to read, where None is all
           remaining data.
 
     Returns:
-      bytes: data read.
+      list[memoryview]: segments of uncompressed data.
 
     Raises:
       IOError: if the read failed.
@@ -191,7 +425,7 @@ class CompressedStream(file_io.FileIO):
       raise IOError('Invalid uncompressed stream size.')
 
     if self._current_offset >= self._uncompressed_stream_size:
-      return b''
+      return []
 
     if self._realign_offset:
       self._AlignUncompressedDataOffset(self._current_offset)
@@ -202,42 +436,130 @@ class CompressedStream(file_io.FileIO):
     if self._current_offset + size > self._uncompressed_stream_size:
       size = self._uncompressed_stream_size - self._current_offset
 
-    uncompressed_data = b''
+    segments = []
+    while size > 0:
+      remaining_uncompressed_data_size = (
+          self._uncompressed_data_size - self._uncompressed_data_offset)
 
-    if size == 0:
-      return uncompressed_data
+      if remaining_uncompressed_data_size <= 0:
+        read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+        self._uncompressed_data_offset = 0
+        if read_count == 0:
+          break
+        continue
 
-    while size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
+      segment_size = min(size, remaining_uncompressed_data_size)
 
-      remaining_uncompressed_data_size = (
-          self._uncompressed_data_size - self._uncompressed_data_offset)
+      segment_start_offset = self._uncompressed_data_offset
+      segment_end_offset = segment_start_offset + segment_size
 
-      self._current_offset += remaining_uncompressed_data_size
-      size -= remaining_uncompressed_data_size
+      segments.append(memoryview(self._uncompressed_data)[
+          segment_start_offset:segment_end_offset])
 
-      if self._current_offset >= self._uncompressed_stream_size:
-        break
+      self._uncompressed_data_offset += segment_size
+      self._current_offset += segment_size
+      size -= segment_size
 
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      self._uncompressed_data_offset = 0
-      if read_count == 0:
-        break
+    return segments
+
+  def _ReadXZBlockIndex(self):
+    """Reads the block index of a XZ compressed stream.
+
+    If the stream contains multiple blocks of a limited size, the stream is
+    read per block. Otherwise the access points are the starts of the blocks,
+    from which decompression is resumed by a new decompressor after
+    the stream header.
+
+    Returns:
+      int: uncompressed stream size or None if the block index could not
+          be read.
+    """
+    block_index = xzfile.XZBlockIndex()
+
+    try:
+      block_index.Read(self._file_object)
+    except errors.FileFormatError:
+      return None
+
+    self._uncompressed_data = b''
+    self._uncompressed_data_size = 0
+    self._uncompressed_data_start_offset = 0
+
+    if len(block_index.blocks) > 1 and max(
+        block.uncompressed_data_size for block in block_index.blocks) <= (
+            self._MAXIMUM_XZ_BLOCK_SIZE):
+      decompression_engine = block_index.CreateDecompressionEngine(
+          self._file_object,
+          maximum_number_of_workers=self._maximum_number_of_workers)
+
+      # Reading per block decompresses entire blocks, hence it is only
+      # preferred over the access points if the blocks are decompressed
+      # concurrently.
+      if decompression_engine.maximum_number_of_workers > 1:
+        self._block_index = block_index
+        self._decompression_engine = decompression_engine
+        return block_index.uncompressed_data_size
+
+      decompression_engine.Close()
+
+    # Note that the index at the end of the stream is not decompressed, since
+    # decompression can start at any block.
+    self._compressed_data_size = block_index.compressed_data_size
+
+    for block in block_index.blocks:
+      self._AddAccessPoint(
+          block.compressed_data_offset, block.uncompressed_data_offset,
+          compressed_data=block_index.stream_header_data)
+
+    if not self._access_points:
+      self._AddAccessPoint(block_index.compressed_data_size, 0)
+
+    return block_index.uncompressed_data_size
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
 
-    if size > 0:
-      slice_start_offset = self._uncompressed_data_offset
-      slice_end_offset = slice_start_offset + size
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+    Returns:
+      bytes: data read.
 
-    return uncompressed_data
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    return b''.join(self._ReadUncompressedDataSegments(size))
+
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read, which is 0 at the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    with memoryview(buffer).cast('B') as buffer_view:
+      buffer_offset = 0
+      for segment in self._ReadUncompressedDataSegments(len(buffer_view)):
+        segment_size = len(segment)
+        buffer_view[buffer_offset:buffer_offset + segment_size] = segment
+        buffer_offset += segment_size
+
+    return buffer_offset
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
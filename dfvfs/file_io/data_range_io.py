@@ -8,7 +8,7 @@ from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
-class DataRange(file_io.FileIO):
+class DataRange(file_io.BlockCacheMixIn, file_io.FileIO):
   """File input/output (IO) object that maps an in-file data range.
 
   The data range object allows to expose a single partition within a full disk
@@ -16,6 +16,8 @@ class DataRange(file_io.FileIO):
   size) of the volume on top of the full disk image.
   """
 
+  _SUPPORTS_BLOCK_CACHE = True
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file input/output (IO) object.
 
@@ -92,6 +94,27 @@ class DataRange(file_io.FileIO):
     self._range_size = range_size
     self._current_offset = 0
 
+  def _ReadDataAtOffset(self, offset, size):
+    """Reads a byte string from the data range at a specific offset.
+
+    Args:
+      offset (int): offset of the data relative to the start of the data
+          range.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    size = min(size, self._range_size - offset)
+    if size <= 0:
+      return b''
+
+    return self._file_object.read_at(self._range_offset + offset, size)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -132,15 +155,101 @@ class DataRange(file_io.FileIO):
     if self._current_offset + size > self._range_size:
       size = self._range_size - self._current_offset
 
-    self._file_object.seek(
-        self._range_offset + self._current_offset, os.SEEK_SET)
+    if self._block_cache:
+      data = self._ReadWithBlockCache(self._current_offset, size)
 
-    data = self._file_object.read(size)
+    else:
+      data = self._file_object.read_at(
+          self._range_offset + self._current_offset, size)
 
     self._current_offset += len(data)
 
     return data
 
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read, which is 0 at the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError('Invalid data range.')
+
+    if self._current_offset < 0:
+      raise IOError((
+          f'Invalid current offset: {self._current_offset:d} value less than '
+          f'zero.'))
+
+    if self._current_offset >= self._range_size:
+      return 0
+
+    with memoryview(buffer).cast('B') as buffer_view:
+      size = min(len(buffer_view), self._range_size - self._current_offset)
+
+      if self._block_cache:
+        read_count = self._ReadIntoWithBlockCache(
+            self._current_offset, buffer_view[:size])
+
+      else:
+        data = self._file_object.read_at(
+            self._range_offset + self._current_offset, size)
+
+        read_count = len(data)
+        buffer_view[:read_count] = data
+
+    self._current_offset += read_count
+
+    return read_count
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at an offset.
+
+    The data is read from the parent file-like object at an offset, hence
+    the current offset is not changed.
+
+    Args:
+      offset (int): offset of the data relative to the start of the data
+          range.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed or the offset or size is invalid.
+      OSError: if the read failed or the offset or size is invalid.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError('Invalid data range.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    if size < 0:
+      raise IOError('Invalid size value less than zero.')
+
+    size = min(size, self._range_size - offset)
+    if size <= 0:
+      return b''
+
+    if self._block_cache:
+      return self._ReadWithBlockCache(offset, size)
+
+    return self._file_object.read_at(self._range_offset + offset, size)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
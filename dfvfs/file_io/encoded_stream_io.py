@@ -5,6 +5,7 @@ import os
 
 from dfvfs.encoding import manager as encoding_manager
 from dfvfs.file_io import file_io
+from dfvfs.lib import encoded_data_layout
 from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
@@ -12,8 +13,9 @@ from dfvfs.resolver import resolver
 class EncodedStream(file_io.FileIO):
   """File input/output (IO) object of a encoded stream."""
 
-  # The size of the encoded data buffer.
-  _ENCODED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
+  # The size of the encoded data buffer, which is small since the encoded
+  # data layout allows to decode only the blocks that are read.
+  _ENCODED_DATA_BUFFER_SIZE = 64 * 1024
 
   def __init__(self, resolver_context, path_spec):
     """Initializes a file input/output (IO) object.
@@ -27,9 +29,13 @@ class EncodedStream(file_io.FileIO):
     self._decoded_data = b''
     self._decoded_data_offset = 0
     self._decoded_data_size = 0
+    self._decoded_data_stream_offset = 0
     self._decoded_stream_size = None
     self._decoder = None
+    self._encoded_character_index = 0
+    self._encoded_characters_to_skip = 0
     self._encoded_data = b''
+    self._encoded_data_layout = None
     self._encoding_method = None
     self._file_object = None
     self._realign_offset = True
@@ -44,6 +50,7 @@ class EncodedStream(file_io.FileIO):
     self._decoder = None
     self._decoded_data = b''
     self._encoded_data = b''
+    self._encoded_data_layout = None
     self._file_object = None
 
   def _GetDecoder(self):
@@ -57,25 +64,53 @@ class EncodedStream(file_io.FileIO):
   def _GetDecodedStreamSize(self):
     """Retrieves the decoded stream size.
 
+    Every block of encoded characters, except for the last block, is decoded
+    into a block of a fixed size, therefore only the last block is decoded to
+    determine the decoded stream size.
+
     Returns:
       int: decoded stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    if not self._decoder:
+      self._decoder = self._GetDecoder()
 
-    self._decoder = self._GetDecoder()
-    self._decoded_data = b''
+    if not self._encoded_data_layout:
+      self._encoded_data_layout = encoded_data_layout.EncodedDataLayout(
+          self._file_object)
+      self._encoded_data_layout.Open()
 
-    encoded_data_offset = 0
-    encoded_data_size = self._file_object.get_size()
-    decoded_stream_size = 0
+    encoded_block_size = self._decoder.encoded_block_size
 
-    while encoded_data_offset < encoded_data_size:
-      read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
-      if read_count == 0:
-        break
+    # Reading the last block can rebuild the encoded data layout, which
+    # changes the number of characters, in which case the decoded stream size
+    # is determined again.
+    decoded_stream_size = None
+    while decoded_stream_size is None:
+      uses_index = self._encoded_data_layout.uses_index
+      number_of_characters = self._encoded_data_layout.number_of_characters
+
+      last_block_size = number_of_characters % encoded_block_size
+      if not last_block_size:
+        last_block_size = min(number_of_characters, encoded_block_size)
+
+      last_block_offset = number_of_characters - last_block_size
+
+      self._SeekEncodedCharacter(last_block_offset)
+      self._ResetDecodedData(0)
+
+      while len(self._encoded_data) < last_block_size:
+        if not self._ReadEncodedCharacters(self._ENCODED_DATA_BUFFER_SIZE):
+          break
+
+      if uses_index == self._encoded_data_layout.uses_index:
+        decoded_data, _ = self._decoder.Decode(
+            self._encoded_data[:last_block_size])
 
-      encoded_data_offset += read_count
-      decoded_stream_size += self._decoded_data_size
+        decoded_stream_size = self._decoder.GetDecodedOffset(
+            last_block_offset) + len(decoded_data)
+
+    self._encoded_data = b''
+    self._realign_offset = True
 
     return decoded_stream_size
 
@@ -107,51 +142,227 @@ class EncodedStream(file_io.FileIO):
   def _AlignDecodedDataOffset(self, decoded_data_offset):
     """Aligns the encoded file with the decoded data offset.
 
+    Decoding starts at the block of encoded characters that contains
+    the decoded data offset.
+
     Args:
       decoded_data_offset (int): decoded data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    relative_offset = decoded_data_offset - self._decoded_data_stream_offset
+    if 0 <= relative_offset < self._decoded_data_size:
+      self._decoded_data_offset = relative_offset
+      return
+
+    encoded_offset = self._decoder.GetEncodedOffset(decoded_data_offset)
+
+    self._SeekEncodedCharacter(encoded_offset)
+    self._ResetDecodedData(self._decoder.GetDecodedOffset(encoded_offset))
+
+    while self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE) > 0:
+      relative_offset = (
+          decoded_data_offset - self._decoded_data_stream_offset)
+      if relative_offset < self._decoded_data_size:
+        self._decoded_data_offset = relative_offset
+        return
+
+    self._decoded_data_offset = (
+        decoded_data_offset - self._decoded_data_stream_offset)
+
+  def _ReadEncodedCharacters(self, read_size):
+    """Reads encoded characters from the file-like object.
+
+    The encoded characters, without whitespace, are appended to the encoded
+    data. If the encoded data does not match the encoded data layout,
+    the layout is rebuilt with a sparse index of offsets and the encoded data
+    is read again.
+
+    Args:
+      read_size (int): number of bytes of encoded data to read.
+
+    Returns:
+      int: number of bytes of encoded data read.
+    """
+    offset = self._file_object.get_offset()
+    encoded_data = self._file_object.read(read_size)
+
+    if not self._encoded_data_layout.VerifyData(offset, encoded_data):
+      character_index = (
+          self._encoded_character_index + self._encoded_characters_to_skip)
+      self._encoded_data_layout.BuildIndex()
+
+      # The decoded stream size is determined again on the next read.
+      self._decoded_stream_size = None
+      self._realign_offset = True
+
+      remaining_encoded_data = self._encoded_data
+      self._SeekEncodedCharacter(character_index)
+      self._encoded_data = remaining_encoded_data
+
+      encoded_data = self._file_object.read(read_size)
 
-    self._decoder = self._GetDecoder()
+    read_count = len(encoded_data)
+
+    encoded_data = self._encoded_data_layout.RemoveWhitespace(encoded_data)
+    self._encoded_character_index += len(encoded_data)
+
+    if self._encoded_characters_to_skip:
+      skip_size = min(self._encoded_characters_to_skip, len(encoded_data))
+      encoded_data = encoded_data[skip_size:]
+      self._encoded_characters_to_skip -= skip_size
+
+    if self._encoded_data:
+      encoded_data = b''.join([self._encoded_data, encoded_data])
+    self._encoded_data = encoded_data
+
+    return read_count
+
+  def _ResetDecodedData(self, decoded_data_stream_offset):
+    """Resets the decoded data.
+
+    Args:
+      decoded_data_stream_offset (int): offset in the decoded stream of
+          the data that is decoded next.
+    """
     self._decoded_data = b''
+    self._decoded_data_offset = 0
+    self._decoded_data_size = 0
+    self._decoded_data_stream_offset = decoded_data_stream_offset
 
-    encoded_data_offset = 0
-    encoded_data_size = self._file_object.get_size()
+  def _SeekEncodedCharacter(self, character_index):
+    """Seeks the encoded file to an encoded character.
 
-    while encoded_data_offset < encoded_data_size:
-      read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
-      if read_count == 0:
-        break
+    Args:
+      character_index (int): index of the encoded character, without
+          whitespace.
+    """
+    offset, offset_character_index = self._encoded_data_layout.GetOffset(
+        character_index)
+
+    self._file_object.seek(offset, os.SEEK_SET)
+    self._encoded_character_index = offset_character_index
+    self._encoded_characters_to_skip = (
+        character_index - offset_character_index)
+    self._encoded_data = b''
+
+  def _ReadDecodedDataSegments(self, size):
+    """Reads segments of decoded data at the current offset.
+
+    The segments are views on the decoded data buffers, therefore the data
+    is only copied once, when the segments are joined or copied into
+    a buffer.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      list[memoryview]: segments of decoded data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError((
+          f'Invalid current offset: {self._current_offset:d} value less than '
+          f'zero.'))
 
-      encoded_data_offset += read_count
+    segments = []
+    while size is None or size > 0:
+      self._UpdateDecodedStreamSizeAndOffset()
 
-      if decoded_data_offset < self._decoded_data_size:
-        self._decoded_data_offset = decoded_data_offset
+      remaining_stream_size = self._decoded_stream_size - self._current_offset
+      if remaining_stream_size <= 0:
         break
 
-      decoded_data_offset -= self._decoded_data_size
+      remaining_decoded_data_size = (
+          self._decoded_data_size - self._decoded_data_offset)
+
+      if remaining_decoded_data_size <= 0:
+        read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
+        self._decoded_data_offset = 0
+        if read_count == 0:
+          break
+        continue
+
+      segment_size = min(remaining_stream_size, remaining_decoded_data_size)
+      if size is not None:
+        segment_size = min(size, segment_size)
+        size -= segment_size
+
+      segment_start_offset = self._decoded_data_offset
+      segment_end_offset = segment_start_offset + segment_size
+
+      segments.append(memoryview(self._decoded_data)[
+          segment_start_offset:segment_end_offset])
+
+      self._decoded_data_offset += segment_size
+      self._current_offset += segment_size
+
+    return segments
 
   def _ReadEncodedData(self, read_size):
     """Reads encoded data from the file-like object.
 
+    Only complete blocks of encoded characters are decoded, the remaining
+    encoded characters are decoded on the next read or at the end of
+    the encoded data.
+
     Args:
       read_size (int): number of bytes of encoded data to read.
 
     Returns:
-      int: number of bytes of encoded data read.
+      int: number of bytes of encoded data read or, at the end of the encoded
+          data, number of bytes decoded from the remaining encoded characters.
     """
-    encoded_data = self._file_object.read(read_size)
+    read_count = self._ReadEncodedCharacters(read_size)
 
-    read_count = len(encoded_data)
+    encoded_data_size = len(self._encoded_data)
+    if read_count:
+      encoded_data_size -= encoded_data_size % self._decoder.encoded_block_size
 
-    self._encoded_data = b''.join([self._encoded_data, encoded_data])
+    self._decoded_data_stream_offset += self._decoded_data_size
 
-    self._decoded_data, self._encoded_data = (
-        self._decoder.Decode(self._encoded_data))
+    if encoded_data_size:
+      self._decoded_data, remaining_encoded_data = self._decoder.Decode(
+          self._encoded_data[:encoded_data_size])
+      self._encoded_data = b''.join([
+          remaining_encoded_data, self._encoded_data[encoded_data_size:]])
+    else:
+      self._decoded_data = b''
 
     self._decoded_data_size = len(self._decoded_data)
 
-    return read_count
+    return read_count or self._decoded_data_size
+
+  def _UpdateDecodedStreamSizeAndOffset(self):
+    """Determines the decoded stream size and aligns the decoded data offset.
+
+    Reading encoded characters can rebuild the encoded data layout, which
+    resets the decoded stream size and requests the decoded data offset to
+    be aligned again, also while the decoded stream size is determined or
+    the decoded data offset is aligned.
+
+    Raises:
+      IOError: if the decoded stream size is invalid.
+      OSError: if the decoded stream size is invalid.
+    """
+    while self._decoded_stream_size is None or self._realign_offset:
+      if self._decoded_stream_size is None:
+        self._decoded_stream_size = self._GetDecodedStreamSize()
+
+      if self._decoded_stream_size < 0:
+        raise IOError('Invalid decoded stream size.')
+
+      if self._current_offset >= self._decoded_stream_size:
+        break
+
+      if self._realign_offset:
+        self._realign_offset = False
+        self._AlignDecodedDataOffset(self._current_offset)
 
   def SetDecodedStreamSize(self, decoded_stream_size):
     """Sets the decoded stream size.
@@ -198,67 +409,29 @@ class EncodedStream(file_io.FileIO):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError('Not opened.')
-
-    if self._current_offset < 0:
-      raise IOError((
-          f'Invalid current offset: {self._current_offset:d} value less than '
-          f'zero.'))
-
-    if self._decoded_stream_size is None:
-      self._decoded_stream_size = self._GetDecodedStreamSize()
-
-    if self._decoded_stream_size < 0:
-      raise IOError('Invalid decoded stream size.')
-
-    if self._current_offset >= self._decoded_stream_size:
-      return b''
-    if self._realign_offset:
-      self._AlignDecodedDataOffset(self._current_offset)
-      self._realign_offset = False
+    return b''.join(self._ReadDecodedDataSegments(size))
 
-    if size is None:
-      size = self._decoded_stream_size
-    if self._current_offset + size > self._decoded_stream_size:
-      size = self._decoded_stream_size - self._current_offset
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a buffer.
 
-    decoded_data = b''
-
-    if size == 0:
-      return decoded_data
-
-    while size > self._decoded_data_size:
-      decoded_data = b''.join([
-          decoded_data,
-          self._decoded_data[self._decoded_data_offset:]])
-
-      remaining_decoded_data_size = (
-          self._decoded_data_size - self._decoded_data_offset)
-
-      self._current_offset += remaining_decoded_data_size
-      size -= remaining_decoded_data_size
-
-      if self._current_offset >= self._decoded_stream_size:
-        break
-
-      read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
-      self._decoded_data_offset = 0
-      if read_count == 0:
-        break
-
-    if size > 0:
-      slice_start_offset = self._decoded_data_offset
-      slice_end_offset = slice_start_offset + size
-
-      decoded_data = b''.join([
-          decoded_data,
-          self._decoded_data[slice_start_offset:slice_end_offset]])
+    Args:
+      buffer (bytearray|memoryview): writable buffer to read into.
 
-      self._decoded_data_offset += size
-      self._current_offset += size
+    Returns:
+      int: number of bytes read, which is 0 at the end of the data.
 
-    return decoded_data
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    with memoryview(buffer).cast('B') as buffer_view:
+      buffer_offset = 0
+      for segment in self._ReadDecodedDataSegments(len(buffer_view)):
+        segment_size = len(segment)
+        buffer_view[buffer_offset:buffer_offset + segment_size] = segment
+        buffer_offset += segment_size
+
+    return buffer_offset
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -15,6 +15,11 @@ class EncryptedStream(file_io.FileIO):
   # The size of the encrypted data buffer.
   _ENCRYPTED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The size of the encrypted data buffer if the decrypter supports random
+  # access, which is smaller since only the blocks that are read need to be
+  # decrypted.
+  _RANDOM_ACCESS_ENCRYPTED_DATA_BUFFER_SIZE = 64 * 1024
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file input/output (IO) object.
 
@@ -27,9 +32,11 @@ class EncryptedStream(file_io.FileIO):
     self._decrypted_data = b''
     self._decrypted_data_offset = 0
     self._decrypted_data_size = 0
+    self._decrypted_data_stream_offset = 0
     self._decrypted_stream_size = None
     self._decrypter = None
     self._encrypted_data = b''
+    self._encrypted_data_buffer_size = self._ENCRYPTED_DATA_BUFFER_SIZE
     self._encryption_method = None
     self._file_object = None
     self._realign_offset = True
@@ -68,28 +75,22 @@ class EncryptedStream(file_io.FileIO):
   def _GetDecryptedStreamSize(self):
     """Retrieves the decrypted stream size.
 
+    Every complete block of the encrypted stream is decrypted into a block of
+    the same size and a trailing incomplete block is ignored, therefore
+    the decrypted stream size is determined without decrypting the data.
+
     Returns:
       int: decrypted stream size.
-    """
-    self._decrypter = self._GetDecrypter()
-    self._decrypted_data = b''
-    self._decrypted_data_size = 0
-
-    self._file_object.seek(0, os.SEEK_SET)
-    self._encrypted_data = b''
-
-    decrypted_stream_size = 0
 
-    read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
-    while read_count > 0:
-      decrypted_stream_size += self._decrypted_data_size
-
-      read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
-
-    self._ReadEncryptedData(0, finalize=True)
-    decrypted_stream_size += self._decrypted_data_size
+    Raises:
+      IOError: if the decrypter cannot be initialized.
+      OSError: if the decrypter cannot be initialized.
+    """
+    decrypter = self._decrypter or self._GetDecrypter()
 
-    return decrypted_stream_size
+    encrypted_stream_size = self._file_object.get_size()
+    return encrypted_stream_size - (
+        encrypted_stream_size % decrypter.block_size)
 
   def _Open(self, mode='rb'):
     """Opens the file-like object.
@@ -120,28 +121,149 @@ class EncryptedStream(file_io.FileIO):
   def _AlignDecryptedDataOffset(self, decrypted_data_offset):
     """Aligns the encrypted file with the decrypted data offset.
 
+    If the decrypter supports random access, decryption starts at the block
+    that contains the decrypted data offset. Otherwise decryption continues
+    at the current position if the decrypted data offset lies beyond it or
+    restarts at the beginning of the encrypted stream.
+
     Args:
       decrypted_data_offset (int): decrypted data offset.
     """
-    self._decrypter = self._GetDecrypter()
+    if self._decrypter:
+      relative_offset = (
+          decrypted_data_offset - self._decrypted_data_stream_offset)
+      if 0 <= relative_offset < self._decrypted_data_size:
+        self._decrypted_data_offset = relative_offset
+        return
+
+    if not self._decrypter or (
+        not self._decrypter.SUPPORTS_RANDOM_ACCESS and
+        decrypted_data_offset < self._decrypted_data_stream_offset):
+      self._decrypter = self._GetDecrypter()
+      if self._decrypter.SUPPORTS_RANDOM_ACCESS:
+        self._encrypted_data_buffer_size = (
+            self._RANDOM_ACCESS_ENCRYPTED_DATA_BUFFER_SIZE)
+      else:
+        self._encrypted_data_buffer_size = self._ENCRYPTED_DATA_BUFFER_SIZE
+
+      self._file_object.seek(0, os.SEEK_SET)
+      self._ResetDecryptedData(0)
+
+    if self._decrypter.SUPPORTS_RANDOM_ACCESS:
+      block_size = self._decrypter.block_size
+      block_offset = decrypted_data_offset - (
+          decrypted_data_offset % block_size)
+
+      previous_encrypted_block = None
+      if block_offset > 0:
+        self._file_object.seek(block_offset - block_size, os.SEEK_SET)
+        previous_encrypted_block = self._file_object.read(block_size)
+      else:
+        self._file_object.seek(0, os.SEEK_SET)
+
+      self._decrypter.SeekBlock(previous_encrypted_block)
+      self._ResetDecryptedData(block_offset)
+
+    read_count = self._ReadEncryptedData(self._encrypted_data_buffer_size)
+    while read_count > 0:
+      relative_offset = (
+          decrypted_data_offset - self._decrypted_data_stream_offset)
+      if relative_offset < self._decrypted_data_size:
+        self._decrypted_data_offset = relative_offset
+        return
+
+      read_count = self._ReadEncryptedData(self._encrypted_data_buffer_size)
+
+    self._ReadEncryptedData(0, finalize=True)
+    self._decrypted_data_offset = (
+        decrypted_data_offset - self._decrypted_data_stream_offset)
+
+  def _ResetDecryptedData(self, decrypted_data_stream_offset):
+    """Resets the decrypted and encrypted data.
+
+    Args:
+      decrypted_data_stream_offset (int): offset in the decrypted stream of
+          the data that is decrypted next.
+    """
     self._decrypted_data = b''
+    self._decrypted_data_offset = 0
     self._decrypted_data_size = 0
-
-    self._file_object.seek(0, os.SEEK_SET)
+    self._decrypted_data_stream_offset = decrypted_data_stream_offset
     self._encrypted_data = b''
 
-    read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
-    while read_count > 0:
-      if decrypted_data_offset < self._decrypted_data_size:
-        self._decrypted_data_offset = decrypted_data_offset
-        return
+  def _ReadDecryptedDataSegments(self, size):
+    """Reads segments of decrypted data at the current offset.
 
-      decrypted_data_offset -= self._decrypted_data_size
+    The segments are views on the decrypted data buffers, therefore the data
+    is only copied once, when the segments are joined or copied into
+    a buffer.
 
-      read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
 
-    self._ReadEncryptedData(0, finalize=True)
-    self._decrypted_data_offset = decrypted_data_offset
+    Returns:
+      list[memoryview]: segments of decrypted data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError((
+          f'Invalid current offset: {self._current_offset:d} value less than '
+          f'zero.'))
+
+    if self._decrypted_stream_size is None:
+      self._decrypted_stream_size = self._GetDecryptedStreamSize()
+
+    if self._decrypted_stream_size < 0:
+      raise IOError('Invalid decrypted stream size.')
+
+    if self._current_offset >= self._decrypted_stream_size:
+      return []
+
+    if self._realign_offset:
+      self._AlignDecryptedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    if size is None:
+      size = self._decrypted_stream_size
+    if self._current_offset + size > self._decrypted_stream_size:
+      size = self._decrypted_stream_size - self._current_offset
+
+    segments = []
+    while size > 0:
+      remaining_decrypted_data_size = (
+          self._decrypted_data_size - self._decrypted_data_offset)
+
+      if remaining_decrypted_data_size <= 0:
+        read_count = self._ReadEncryptedData(
+            self._encrypted_data_buffer_size)
+        if read_count == 0:
+          self._ReadEncryptedData(0, finalize=True)
+
+        self._decrypted_data_offset = 0
+        if read_count == 0 and self._decrypted_data_size == 0:
+          break
+        continue
+
+      segment_size = min(size, remaining_decrypted_data_size)
+
+      segment_start_offset = self._decrypted_data_offset
+      segment_end_offset = segment_start_offset + segment_size
+
+      segments.append(memoryview(self._decrypted_data)[
+          segment_start_offset:segment_end_offset])
+
+      self._decrypted_data_offset += segment_size
+      self._current_offset += segment_size
+      size -= segment_size
+
+    return segments
 
   def _ReadEncryptedData(self, read_size, finalize=False):
     """Reads encrypted data from the file-like object.
@@ -156,6 +278,8 @@ class EncryptedStream(file_io.FileIO):
     """
     encrypted_data = self._file_object.read(read_size)
 
+    self._decrypted_data_stream_offset += self._decrypted_data_size
+
     read_count = len(encrypted_data)
 
     self._encrypted_data = b''.join([self._encrypted_data, encrypted_data])
@@ -215,69 +339,29 @@ class EncryptedStream(file_io.FileIO):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    if not self._is_open:
-      raise IOError('Not opened.')
-
-    if self._current_offset < 0:
-      raise IOError((
-          f'Invalid current offset: {self._current_offset:d} value less than '
-          f'zero.'))
-
-    if self._decrypted_stream_size is None:
-      self._decrypted_stream_size = self._GetDecryptedStreamSize()
-
-    if self._decrypted_stream_size < 0:
-      raise IOError('Invalid decrypted stream size.')
-
-    if self._current_offset >= self._decrypted_stream_size:
-      return b''
-
-    if self._realign_offset:
-      self._AlignDecryptedDataOffset(self._current_offset)
-      self._realign_offset = False
-
-    if size is None:
-      size = self._decrypted_stream_size
-    if self._current_offset + size > self._decrypted_stream_size:
-      size = self._decrypted_stream_size - self._current_offset
-
-    decrypted_data = b''
-
-    if size == 0:
-      return decrypted_data
+    return b''.join(self._ReadDecryptedDataSegments(size))
 
-    while size > self._decrypted_data_size:
-      decrypted_data = b''.join([
-          decrypted_data,
-          self._decrypted_data[self._decrypted_data_offset:]])
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a buffer.
 
-      remaining_decrypted_data_size = (
-          self._decrypted_data_size - self._decrypted_data_offset)
-
-      self._current_offset += remaining_decrypted_data_size
-      size -= remaining_decrypted_data_size
-
-      if self._current_offset >= self._decrypted_stream_size:
-        break
-
-      read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
-      if read_count == 0:
-        self._ReadEncryptedData(0, finalize=True)
-
-      self._decrypted_data_offset = 0
-
-    if size > 0:
-      slice_start_offset = self._decrypted_data_offset
-      slice_end_offset = slice_start_offset + size
-
-      decrypted_data = b''.join([
-          decrypted_data,
-          self._decrypted_data[slice_start_offset:slice_end_offset]])
+    Args:
+      buffer (bytearray|memoryview): writable buffer to read into.
 
-      self._decrypted_data_offset += size
-      self._current_offset += size
+    Returns:
+      int: number of bytes read, which is 0 at the end of the data.
 
-    return decrypted_data
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    with memoryview(buffer).cast('B') as buffer_view:
+      buffer_offset = 0
+      for segment in self._ReadDecryptedDataSegments(len(buffer_view)):
+        segment_size = len(segment)
+        buffer_view[buffer_offset:buffer_offset + segment_size] = segment
+        buffer_offset += segment_size
+
+    return buffer_offset
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""The extent-based file-like object."""
+
+import bisect
+import os
+
+from dfvfs.file_io import file_io
+from dfvfs.lib import definitions
+
+
+class ExtentFile(file_io.FileIO):
+  """File input/output (IO) object that maps extents of a parent file-like.
+
+  The extent file object allows to read the data of a file entry directly
+  from the file-like object of the volume that contains the file system, by
+  mapping the data extents of the file entry on top of the volume. Sparse
+  extents are read as zero bytes.
+  """
+
+  def __init__(self, resolver_context, path_spec, file_object, extents, size):
+    """Initializes a file input/output (IO) object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      path_spec (PathSpec): a path specification.
+      file_object (FileIO): file-like object of the volume that contains
+          the file system.
+      extents (list[Extent]): data and sparse extents of the file entry, where
+          the offsets are relative to the start of the volume.
+      size (int): size of the data of the file entry.
+
+    Raises:
+      ValueError: if the extents or size are invalid.
+    """
+    if size < 0:
+      raise ValueError(f'Invalid size: {size:d} value out of bounds.')
+
+    extents_size = 0
+    for extent in extents:
+      if extent.extent_type not in (
+          definitions.EXTENT_TYPE_DATA, definitions.EXTENT_TYPE_SPARSE):
+        raise ValueError(f'Unsupported extent type: {extent.extent_type!s}.')
+
+      extents_size += extent.size
+
+    if extents_size < size:
+      raise ValueError((
+          f'Size of extents: {extents_size:d} smaller than size: '
+          f'{size:d}.'))
+
+    super(ExtentFile, self).__init__(resolver_context, path_spec)
+    self._current_offset = 0
+    self._extent_offsets = []
+    self._extents = extents
+    self._file_object = file_object
+    self._size = size
+
+    extent_offset = 0
+    for extent in extents:
+      self._extent_offsets.append(extent_offset)
+      extent_offset += extent.size
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    The file-like object of the volume was passed in the init function, hence
+    the extent file-like object does not control it and should not actually
+    close it.
+    """
+    self._file_object = None
+
+  def _Open(self, mode='rb'):
+    """Opens the file-like object.
+
+    Args:
+      mode (Optional[str]): file access mode.
+
+    Raises:
+      IOError: if the file-like object could not be opened.
+      OSError: if the file-like object could not be opened.
+    """
+    if not self._file_object:
+      raise IOError('Missing file-like object of the volume.')
+
+  def _ReadDataAtOffset(self, offset, size):
+    """Reads a byte string from the extents at a specific offset.
+
+    Args:
+      offset (int): offset of the data relative to the start of the file
+          entry data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    size = min(size, self._size - offset)
+    if size <= 0:
+      return b''
+
+    data_segments = []
+    extent_index = bisect.bisect_right(self._extent_offsets, offset) - 1
+
+    while size > 0:
+      extent = self._extents[extent_index]
+      relative_offset = offset - self._extent_offsets[extent_index]
+      read_size = min(size, extent.size - relative_offset)
+
+      if extent.extent_type == definitions.EXTENT_TYPE_SPARSE:
+        data = bytes(read_size)
+      else:
+        data = self._file_object.read_at(
+            extent.offset + relative_offset, read_size)
+        if len(data) != read_size:
+          raise IOError((
+              f'Unable to read extent data at offset: '
+              f'0x{extent.offset + relative_offset:08x}.'))
+
+      data_segments.append(data)
+      offset += read_size
+      size -= read_size
+      extent_index += 1
+
+    if len(data_segments) == 1:
+      return data_segments[0]
+
+    return b''.join(data_segments)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError((
+          f'Invalid current offset: {self._current_offset:d} value less than '
+          f'zero.'))
+
+    if self._current_offset >= self._size:
+      return b''
+
+    if size is None or self._current_offset + size > self._size:
+      size = self._size - self._current_offset
+
+    data = self._ReadDataAtOffset(self._current_offset, size)
+
+    self._current_offset += len(data)
+
+    return data
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at an offset.
+
+    The data is read from the file-like object of the volume at an offset,
+    hence the current offset is not changed.
+
+    Args:
+      offset (int): offset of the data relative to the start of the file
+          entry data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed or the offset or size is invalid.
+      OSError: if the read failed or the offset or size is invalid.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    if size < 0:
+      raise IOError('Invalid size value less than zero.')
+
+    return self._ReadDataAtOffset(offset, size)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file entry data.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._size
@@ -3,12 +3,18 @@
 
 import abc
 import os
+import threading
+
 
 class FileIO(object):
   """VFS file input/output (IO) object interface."""
 
   # pylint: disable=redundant-returns-doc
 
+  # Value to indicate the file input/output (IO) object can read data using
+  # the block cache of the resolver context.
+  _SUPPORTS_BLOCK_CACHE = False
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file input/output (IO) object.
 
@@ -17,8 +23,11 @@ class FileIO(object):
       path_spec (PathSpec): a path specification.
     """
     super(FileIO, self).__init__()
+    self._block_cache = None
+    self._block_cache_identifier = None
     self._is_open = False
     self._path_spec = path_spec
+    self._read_at_lock = threading.RLock()
     self._resolver_context = resolver_context
 
   def __del__(self):
@@ -86,6 +95,12 @@ class FileIO(object):
     self._Open(mode=mode)
     self._is_open = True
 
+    if self._SUPPORTS_BLOCK_CACHE:
+      self._block_cache = self._resolver_context.GetBlockCache(
+          self._path_spec)
+      if self._block_cache:
+        self._block_cache_identifier = self._path_spec.comparable
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -117,6 +132,71 @@ class FileIO(object):
       OSError: if the read failed.
     """
 
+  def readinto(self, buffer):
+    """Reads data from the file input/output (IO) object into a buffer.
+
+    The function reads at most the size of the buffer from the current
+    offset. This allows to reuse a pre-allocated buffer for successive reads.
+    This default implementation copies the data returned by read(), file
+    input/output (IO) objects that can read into a buffer directly override
+    it.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read, which is 0 at the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    with memoryview(buffer).cast('B') as buffer_view:
+      data = self.read(len(buffer_view))
+      read_count = len(data)
+      buffer_view[:read_count] = data
+
+    return read_count
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file input/output (IO) object at an offset.
+
+    The function reads at most the specified size from the offset, without
+    changing the current offset. This allows multiple threads to read from
+    the same file input/output (IO) object. This default implementation seeks
+    and reads while holding a lock, hence it is atomic with respect to other
+    read_at() calls but not to concurrent seek() and read() calls. File
+    input/output (IO) objects that can read at an offset without changing
+    the current offset override it.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed or the offset or size is invalid.
+      OSError: if the read failed or the offset or size is invalid.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    if size < 0:
+      raise IOError('Invalid size value less than zero.')
+
+    with self._read_at_lock:
+      current_offset = self.get_offset()
+      try:
+        self.seek(offset, os.SEEK_SET)
+        return self.read(size)
+      finally:
+        self.seek(current_offset, os.SEEK_SET)
+
   @abc.abstractmethod
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file input/output (IO) object.
@@ -168,3 +248,134 @@ class FileIO(object):
       bool: True since a file IO object provides a seek method.
     """
     return True
+
+
+class BlockCacheMixIn(object):
+  """Mix-in for file input/output (IO) objects that support the block cache.
+
+  The block cache of the resolver context is used by FileIO.Open when
+  _SUPPORTS_BLOCK_CACHE is set. The file input/output (IO) object reads
+  the data of blocks that are not cached with _ReadDataAtOffset.
+  """
+
+  # The block cache attributes are set by FileIO.
+  # pylint: disable=no-member
+
+  def _GetBlockWithBlockCache(self, block_number):
+    """Retrieves the data of a block using the block cache.
+
+    Args:
+      block_number (int): number of the block.
+
+    Returns:
+      bytes: data of the block, which is smaller than the block size for
+          the last block.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    block_data = self._block_cache.GetBlock(
+        self._block_cache_identifier, block_number)
+    if block_data is None:
+      block_size = self._block_cache.block_size
+      block_data = self._ReadDataAtOffset(
+          block_number * block_size, block_size)
+      if block_data:
+        self._block_cache.CacheBlock(
+            self._block_cache_identifier, block_number, block_data)
+
+    return block_data
+
+  @abc.abstractmethod
+  def _ReadDataAtOffset(self, offset, size):
+    """Reads a byte string from the backend at a specific offset.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+
+  def _ReadIntoWithBlockCache(self, offset, buffer):
+    """Reads data into a buffer using the block cache.
+
+    Args:
+      offset (int): offset of the data.
+      buffer (memoryview): unsigned bytes view of the buffer to read into.
+
+    Returns:
+      int: number of bytes read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    block_size = self._block_cache.block_size
+    block_number, block_offset = divmod(offset, block_size)
+
+    buffer_offset = 0
+    buffer_size = len(buffer)
+    while buffer_offset < buffer_size:
+      block_data = self._GetBlockWithBlockCache(block_number)
+
+      data_segment_size = min(
+          len(block_data) - block_offset, buffer_size - buffer_offset)
+      if data_segment_size <= 0:
+        break
+
+      buffer[buffer_offset:buffer_offset + data_segment_size] = memoryview(
+          block_data)[block_offset:block_offset + data_segment_size]
+      buffer_offset += data_segment_size
+
+      # A block smaller than the block size is the last block.
+      if len(block_data) < block_size:
+        break
+
+      block_number += 1
+      block_offset = 0
+
+    return buffer_offset
+
+  def _ReadWithBlockCache(self, offset, size):
+    """Reads a byte string using the block cache.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    block_size = self._block_cache.block_size
+    block_number, block_offset = divmod(offset, block_size)
+
+    data_segments = []
+    while size > 0:
+      block_data = self._GetBlockWithBlockCache(block_number)
+
+      data_segment = block_data[block_offset:block_offset + size]
+      if not data_segment:
+        break
+
+      data_segments.append(data_segment)
+      size -= len(data_segment)
+
+      # A block smaller than the block size is the last block.
+      if len(block_data) < block_size:
+        break
+
+      block_number += 1
+      block_offset = 0
+
+    return b''.join(data_segments)
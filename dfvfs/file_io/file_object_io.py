@@ -7,11 +7,13 @@ import os
 from dfvfs.file_io import file_io
 
 
-class FileObjectIO(file_io.FileIO):
+class FileObjectIO(file_io.BlockCacheMixIn, file_io.FileIO):
   """Base class for file object-based file input/output (IO) object."""
 
   # pylint: disable=redundant-returns-doc
 
+  _SUPPORTS_BLOCK_CACHE = True
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file input/output (IO) object.
 
@@ -44,6 +46,23 @@ class FileObjectIO(file_io.FileIO):
     if not self._file_object:
       raise IOError('Unable to open missing file-like object.')
 
+  def _ReadDataAtOffset(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    self._file_object.seek(offset, os.SEEK_SET)
+    return self._file_object.read(size)
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def _OpenFileObject(self, path_spec):
@@ -83,9 +102,51 @@ class FileObjectIO(file_io.FileIO):
     if not self._is_open:
       raise IOError('Not opened.')
 
-    # Do not pass the size argument as a keyword argument since it breaks
-    # some file-like object implementations.
-    return self._file_object.read(size)
+    if not self._block_cache:
+      # Do not pass the size argument as a keyword argument since it breaks
+      # some file-like object implementations.
+      return self._file_object.read(size)
+
+    current_offset = self.get_offset()
+    if size is None:
+      size = max(self.get_size() - current_offset, 0)
+
+    data = self._ReadWithBlockCache(current_offset, size)
+
+    self._file_object.seek(current_offset + len(data), os.SEEK_SET)
+
+    return data
+
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read, which is 0 at the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if not self._block_cache and not hasattr(self._file_object, 'readinto'):
+      return super(FileObjectIO, self).readinto(buffer)
+
+    with memoryview(buffer).cast('B') as buffer_view:
+      if not self._block_cache:
+        return self._file_object.readinto(buffer_view)
+
+      current_offset = self.get_offset()
+
+      read_count = self._ReadIntoWithBlockCache(current_offset, buffer_view)
+
+    self._file_object.seek(current_offset + read_count, os.SEEK_SET)
+
+    return read_count
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -1,14 +1,28 @@
 # -*- coding: utf-8 -*-
 """The gzip file-like object."""
 
+import hashlib
+import os
+
 from dfvfs.file_io import file_object_io
+from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import gzipfile
 from dfvfs.resolver import resolver
 
 
 class GzipFile(file_object_io.FileObjectIO):
-  """File input/output (IO) object of a gzip file."""
+  """File input/output (IO) object of a gzip file.
+
+  To speed up opening the gzip file can use a gzip index, which contains
+  the offsets and sizes of the members, so that the members do not have to be
+  decompressed to determine these. The gzip index is stored in the index
+  directory of the resolver context. A gzip index that is stored next to
+  a gzip file in the operating system, with the same name and the extension
+  ".gzidx", is used as well.
+  """
+
+  _INDEX_FILE_EXTENSION = 'gzidx'
 
   @property
   def comments(self):
@@ -55,6 +69,34 @@ class GzipFile(file_object_io.FileObjectIO):
     """
     return self._file_object.uncompressed_data_size
 
+  def _GetIndexPath(self, path_spec):
+    """Retrieves the path of the gzip index.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      str: path of the gzip index file or None if not available.
+    """
+    parent_path_spec = path_spec.parent
+    if parent_path_spec.type_indicator == definitions.TYPE_INDICATOR_OS:
+      location = getattr(parent_path_spec, 'location', None)
+      if location:
+        index_path = f'{location:s}.{self._INDEX_FILE_EXTENSION:s}'
+        if os.path.exists(index_path):
+          return index_path
+
+    index_directory = self._resolver_context.index_directory
+    if not index_directory:
+      return None
+
+    lookup_hash = hashlib.sha256()
+    lookup_hash.update(parent_path_spec.comparable.encode('utf-8'))
+    identifier = lookup_hash.hexdigest()
+
+    return os.path.join(
+        index_directory, f'{identifier:s}.{self._INDEX_FILE_EXTENSION:s}')
+
   def _OpenFileObject(self, path_spec):
     """Opens the file-like object defined by path specification.
 
@@ -74,11 +116,30 @@ class GzipFile(file_object_io.FileObjectIO):
     file_object = resolver.Resolver.OpenFileObject(
         path_spec.parent, resolver_context=self._resolver_context)
 
+    index_path = self._GetIndexPath(path_spec)
+
     gzip_compressed_stream = gzipfile.GzipCompressedStream()
-    gzip_compressed_stream.Open(file_object)
+    gzip_compressed_stream.Open(file_object, index_path=index_path)
 
     return gzip_compressed_stream
 
+  def WriteIndex(self, index_path):
+    """Writes a gzip index.
+
+    Args:
+      index_path (str): path of the gzip index file.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the gzip index
+          cannot be written.
+      OSError: if the file-like object has not been opened or the gzip index
+          cannot be written.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    self._file_object.WriteIndex(index_path)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -11,9 +11,11 @@ from dfvfs.lib import definitions
 from dfvfs.lib import errors
 
 
-class OSFile(file_io.FileIO):
+class OSFile(file_io.BlockCacheMixIn, file_io.FileIO):
   """File input/output (IO) object that uses the operating system."""
 
+  _SUPPORTS_BLOCK_CACHE = True
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file input/output (IO) object.
 
@@ -22,12 +24,14 @@ class OSFile(file_io.FileIO):
       path_spec (PathSpec): a path specification.
     """
     super(OSFile, self).__init__(resolver_context, path_spec)
+    self._file_descriptor = None
     self._file_object = None
     self._size = 0
 
   def _Close(self):
     """Closes the file-like object."""
     self._file_object.close()
+    self._file_descriptor = None
     self._file_object = None
 
   def _Open(self, mode='rb'):
@@ -111,6 +115,45 @@ class OSFile(file_io.FileIO):
       self._file_object = open(location, mode=mode)  # pylint: disable=consider-using-with,unspecified-encoding
       self._size = stat_info.st_size
 
+      # Note that os.pread() is not available on Windows.
+      if hasattr(os, 'pread'):
+        self._file_descriptor = self._file_object.fileno()
+
+  def _ReadDataAtOffset(self, offset, size):
+    """Reads a byte string from the file at a specific offset.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if self._file_descriptor is None:
+      self._file_object.seek(offset, os.SEEK_SET)
+      return self._file_object.read(size)
+
+    # Note that os.pread() does not change the offset of the file descriptor
+    # and can return less data than requested, for example for large reads.
+    data_segments = []
+    while size > 0:
+      data = os.pread(self._file_descriptor, size, offset)
+      if not data:
+        break
+
+      data_segments.append(data)
+      offset += len(data)
+      size -= len(data)
+
+    if len(data_segments) == 1:
+      return data_segments[0]
+
+    return b''.join(data_segments)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -138,7 +181,81 @@ class OSFile(file_io.FileIO):
     if size is None:
       size = self._size - self._file_object.tell()
 
-    return self._file_object.read(size)
+    if not self._block_cache:
+      return self._file_object.read(size)
+
+    current_offset = self._file_object.tell()
+
+    data = self._ReadWithBlockCache(current_offset, size)
+
+    self._file_object.seek(current_offset + len(data), os.SEEK_SET)
+
+    return data
+
+  def readinto(self, buffer):
+    """Reads data from the file-like object into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer to read into.
+
+    Returns:
+      int: number of bytes read, which is 0 at the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if not self._block_cache and not hasattr(self._file_object, 'readinto'):
+      return super(OSFile, self).readinto(buffer)
+
+    with memoryview(buffer).cast('B') as buffer_view:
+      if not self._block_cache:
+        return self._file_object.readinto(buffer_view)
+
+      current_offset = self._file_object.tell()
+
+      read_count = self._ReadIntoWithBlockCache(current_offset, buffer_view)
+
+    self._file_object.seek(current_offset + read_count, os.SEEK_SET)
+
+    return read_count
+
+  def read_at(self, offset, size):
+    """Reads a byte string from the file-like object at an offset.
+
+    Files are read using os.pread(), which does not change the current
+    offset, if available.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed or the offset or size is invalid.
+      OSError: if the read failed or the offset or size is invalid.
+    """
+    if self._file_descriptor is None:
+      return super(OSFile, self).read_at(offset, size)
+
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    if size < 0:
+      raise IOError('Invalid size value less than zero.')
+
+    if self._block_cache:
+      return self._ReadWithBlockCache(offset, size)
+
+    return self._ReadDataAtOffset(offset, size)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -2,10 +2,10 @@
 """The SQlite blob file-like object."""
 
 import os
+import sqlite3
 
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
-from dfvfs.lib import sqlite_database
 from dfvfs.resolver import resolver
 
 
@@ -25,16 +25,21 @@ class SQLiteBlobFile(file_io.FileIO):
     self._blob = None
     self._current_offset = 0
     self._database_object = None
+    self._file_system = None
     self._number_of_rows = None
     self._size = 0
     self._table_name = None
 
   def _Close(self):
     """Closes the file-like object."""
-    if self._database_object:
-      self._database_object.Close()
+    # Note that the database object is owned by the file system, which closes
+    # all blobs when it closes the database.
+    if self._blob is not None and not isinstance(self._blob, bytes):
+      self._database_object.CloseBlob(self._blob)
 
     self._blob = None
+    self._database_object = None
+    self._file_system = None
     self._current_offset = 0
     self._size = 0
     self._table_name = None
@@ -81,14 +86,13 @@ class SQLiteBlobFile(file_io.FileIO):
     if self._database_object:
       raise IOError('Database file already set.')
 
-    file_object = resolver.Resolver.OpenFileObject(
-        self._path_spec.parent, resolver_context=self._resolver_context)
+    file_system = resolver.Resolver.OpenFileSystem(
+        self._path_spec, resolver_context=self._resolver_context)
 
-    database_object = sqlite_database.SQLiteDatabaseFile()
-    database_object.Open(file_object)
+    database_object = file_system.GetDatabaseObject()
 
     # Sanity check the table and column names.
-    rows = []
+    blobs = []
     error_string = ''
     if not database_object.HasTable(table_name):
       error_string = f'Missing table: {table_name:s}'
@@ -98,9 +102,8 @@ class SQLiteBlobFile(file_io.FileIO):
           f'Missing column: {column_name:s} in table: {table_name:s}')
 
     elif not row_condition:
-      query = (f'SELECT {column_name:s} FROM {table_name:s} LIMIT 1 '
-               f'OFFSET {row_index:d}')
-      rows = database_object.Query(query)
+      query = f'FROM {table_name:s} LIMIT 1 OFFSET {row_index:d}'
+      blobs = self._QueryBlobs(database_object, table_name, column_name, query)
 
     elif not database_object.HasColumn(table_name, row_condition[0]):
       condition_column_name = row_condition[0]
@@ -116,13 +119,15 @@ class SQLiteBlobFile(file_io.FileIO):
     else:
       condition_column_name = row_condition[0]
       condition_operator = row_condition[1]
-      query = (f'SELECT {column_name:s} FROM {table_name:s} '
+      query = (f'FROM {table_name:s} '
                f'WHERE {condition_column_name:s} {condition_operator:s} ?')
-      rows = database_object.Query(query, parameters=(row_condition[2], ))
+      blobs = self._QueryBlobs(
+          database_object, table_name, column_name, query,
+          parameters=(row_condition[2], ))
 
     # Make sure the query returns a single row, using cursor.rowcount
     # is not reliable for this purpose.
-    if not error_string and (len(rows) != 1 or len(rows[0]) != 1):
+    if not error_string and len(blobs) != 1:
       if not row_condition:
         error_string = (
             f'Unable to open blob in table: {table_name:s} and column: '
@@ -136,15 +141,59 @@ class SQLiteBlobFile(file_io.FileIO):
             f'{column_name:s} where: {row_condition_string:s}.')
 
     if error_string:
-      database_object.Close()
       raise IOError(error_string)
 
-    self._blob = rows[0][0]
+    self._blob = blobs[0]
     self._current_offset = 0
     self._database_object = database_object
+    self._file_system = file_system
     self._size = len(self._blob)
     self._table_name = table_name
 
+  def _QueryBlobs(
+      self, database_object, table_name, column_name, query, parameters=None):
+    """Queries the blobs of the rows that match a query.
+
+    If supported the row identifier is queried instead of the value, so that
+    the blob can be read incrementally without reading the entire value into
+    memory. Text is read as a blob if the database is UTF-8 encoded, which
+    matches the value returned by a query. The value is queried if incremental
+    blob I/O is not supported, for example if the value is an integer or the
+    table has no row identifiers.
+
+    Args:
+      database_object (SQLiteDatabaseFile): SQLite database file object.
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+      query (str): part of the SQL query that selects the rows, starting
+          with the FROM clause.
+      parameters (Optional[tuple]): query parameters.
+
+    Returns:
+      list[bytes|sqlite3.Blob]: values or blobs of the rows.
+    """
+    if database_object.SUPPORTS_BLOB_IO:
+      try:
+        rows = database_object.Query(
+            f'SELECT _ROWID_, typeof({column_name:s}) {query:s}',
+            parameters=parameters)
+      except sqlite3.Error:
+        rows = None
+
+      if rows is not None:
+        if len(rows) != 1:
+          return [None] * len(rows)
+
+        value_type = rows[0][1]
+        if value_type == b'blob' or (
+            value_type == b'text' and database_object.GetEncoding() == 'UTF-8'):
+          blob = database_object.OpenBlob(table_name, column_name, rows[0][0])
+          return [blob]
+
+    rows = database_object.Query(
+        f'SELECT {column_name:s} {query:s}', parameters=parameters)
+    return [row[0] for row in rows]
+
   # TODO: remove this when there is a move this to a central temp file
   # manager. https://github.com/log2timeline/dfvfs/issues/92
   def GetNumberOfRows(self):
@@ -203,7 +252,11 @@ class SQLiteBlobFile(file_io.FileIO):
 
     start_offset = self._current_offset
     self._current_offset += size
-    return self._blob[start_offset:self._current_offset]
+
+    if isinstance(self._blob, bytes):
+      return self._blob[start_offset:self._current_offset]
+
+    return self._database_object.ReadBlob(self._blob, start_offset, size)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 """A data slice interface for file-like objects."""
 
-import os
-
 
 class DataSlice(object):
-  """Data slice interface for file-like objects."""
+  """Data slice interface for file-like objects.
+
+  The data is read at an offset, hence the current offset of the file-like
+  object is not changed.
+  """
 
   def __init__(self, file_object):
     """Initializes the data slice.
@@ -45,11 +47,9 @@ class DataSlice(object):
     """
     if isinstance(key, int):
       if key < 0:
-        self._file_object.seek(key, os.SEEK_END)
-      else:
-        self._file_object.seek(key, os.SEEK_SET)
+        key += self._file_object_size
 
-      return self._file_object.read(1)
+      return self._file_object.read_at(key, 1)
 
     if not isinstance(key, slice):
       key_type = type(key)
@@ -59,17 +59,17 @@ class DataSlice(object):
       raise ValueError(f'Unsupported slice step: {key.step!s}')
 
     start_offset = max(key.start or 0, 0)
-    end_offset = key.stop or self._file_object_size
-
-    if end_offset < 0:
-      self._file_object.seek(end_offset, os.SEEK_END)
-      read_size = -(start_offset - end_offset)
 
+    if key.stop is None:
+      end_offset = self._file_object_size
+    elif key.stop < 0:
+      end_offset = self._file_object_size + key.stop
     else:
-      self._file_object.seek(start_offset, os.SEEK_SET)
-      read_size = end_offset - start_offset
+      end_offset = key.stop
+
+    read_size = max(end_offset - start_offset, 0)
 
-    return self._file_object.read(read_size)
+    return self._file_object.read_at(start_offset, read_size)
 
   def __len__(self):
     """Retrieves the file data size.
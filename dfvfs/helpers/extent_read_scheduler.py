@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""Helper to read the data of many file entries in order of their extents."""
+
+import hashlib
+import os
+
+from dfvfs.lib import definitions
+
+
+class _ScheduledFileEntry(object):
+  """File entry scheduled to be read.
+
+  Attributes:
+    file_entry (FileEntry): file entry.
+    file_object (ExtentFile): file-like object that reads the data from
+        the extents or None if the data cannot be read from the extents.
+    is_deferred (bool): True if the remaining data is read after all the
+        extents, because its data segments could not be buffered.
+    pending_data (dict[int, bytes]): data of segments that was read before
+        the preceding segments, per segment index.
+    segment_index (int): index of the next segment to return the data of.
+    segments (list[tuple[int, int, int]]): logical offset, size and offset
+        in the volume of the data segments, where the offset in the volume
+        is None for sparse data.
+  """
+
+  def __init__(self, file_entry, maximum_segment_size):
+    """Initializes a scheduled file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      maximum_segment_size (int): maximum size of a data segment.
+    """
+    super(_ScheduledFileEntry, self).__init__()
+    self.file_entry = file_entry
+    self.file_object = file_entry.GetExtentFileObject()
+    self.is_deferred = False
+    self.pending_data = {}
+    self.segment_index = 0
+    self.segments = []
+
+    if self.file_object:
+      remaining_size = self.file_object.get_size()
+      logical_offset = 0
+
+      for extent in file_entry.GetExtents():
+        if remaining_size <= 0:
+          break
+
+        extent_offset = 0
+        extent_size = min(extent.size, remaining_size)
+        while extent_offset < extent_size:
+          segment_size = min(
+              extent_size - extent_offset, maximum_segment_size)
+
+          if extent.extent_type == definitions.EXTENT_TYPE_SPARSE:
+            volume_offset = None
+          else:
+            volume_offset = extent.offset + extent_offset
+
+          self.segments.append((logical_offset, segment_size, volume_offset))
+
+          extent_offset += segment_size
+          logical_offset += segment_size
+
+        remaining_size -= extent_size
+
+  def ReadSegment(self, segment_index):
+    """Reads the data of a segment.
+
+    Args:
+      segment_index (int): index of the segment.
+
+    Returns:
+      bytes: data of the segment.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    logical_offset, segment_size, _ = self.segments[segment_index]
+
+    self.file_object.seek(logical_offset, os.SEEK_SET)
+    return self.file_object.read(segment_size)
+
+
+class ExtentReadScheduler(object):
+  """Reads the data of many file entries in order of their extents.
+
+  The data segments of all the file entries are read in order of their
+  offset in the volume, so that reading a whole volume is close to
+  a sequential read. Data segments that are read before the preceding data
+  segments of the same file entry are buffered, so that the data of every
+  file entry is returned in order. If the buffer is full the remaining data
+  of a file entry is read after all the extents have been read.
+
+  File entries that have no extents that can be read directly, for example
+  because the data is compressed or encrypted, are read using their file-like
+  object after the file entries that could be read from the extents.
+
+  Attributes:
+    maximum_buffer_size (int): maximum size of the buffered data segments.
+    maximum_read_size (int): maximum size of a single read.
+  """
+
+  _DEFAULT_MAXIMUM_BUFFER_SIZE = 64 * 1024 * 1024
+
+  _DEFAULT_MAXIMUM_READ_SIZE = 16 * 1024 * 1024
+
+  def __init__(
+      self, maximum_buffer_size=_DEFAULT_MAXIMUM_BUFFER_SIZE,
+      maximum_read_size=_DEFAULT_MAXIMUM_READ_SIZE):
+    """Initializes an extent read scheduler.
+
+    Args:
+      maximum_buffer_size (Optional[int]): maximum size of the buffered data
+          segments.
+      maximum_read_size (Optional[int]): maximum size of a single read.
+
+    Raises:
+      ValueError: if the maximum buffer size or maximum read size is invalid.
+    """
+    if maximum_buffer_size < 0:
+      raise ValueError((
+          f'Invalid maximum buffer size: {maximum_buffer_size:d} value out '
+          f'of bounds.'))
+
+    if maximum_read_size <= 0:
+      raise ValueError((
+          f'Invalid maximum read size: {maximum_read_size:d} value out of '
+          f'bounds.'))
+
+    super(ExtentReadScheduler, self).__init__()
+    self._buffered_data_size = 0
+    self._file_entries = []
+    self.maximum_buffer_size = maximum_buffer_size
+    self.maximum_read_size = maximum_read_size
+
+  def _ReadAvailableSegments(self, scheduled_file_entry):
+    """Reads the data of segments that no longer depend on unread data.
+
+    Args:
+      scheduled_file_entry (_ScheduledFileEntry): scheduled file entry.
+
+    Yields:
+      tuple[FileEntry, bytes]: file entry and data, where empty data
+          indicates the end of the data of the file entry.
+    """
+    file_entry = scheduled_file_entry.file_entry
+    number_of_segments = len(scheduled_file_entry.segments)
+
+    while scheduled_file_entry.segment_index < number_of_segments:
+      segment_index = scheduled_file_entry.segment_index
+      _, segment_size, volume_offset = (
+          scheduled_file_entry.segments[segment_index])
+
+      if volume_offset is None:
+        data = bytes(segment_size)
+
+      else:
+        data = scheduled_file_entry.pending_data.pop(segment_index, None)
+        if data is None:
+          if not scheduled_file_entry.is_deferred:
+            return
+
+          data = scheduled_file_entry.ReadSegment(segment_index)
+        else:
+          self._buffered_data_size -= len(data)
+
+      scheduled_file_entry.segment_index += 1
+
+      yield file_entry, data
+
+    scheduled_file_entry.file_object = None
+
+    yield file_entry, b''
+
+  def _ReadFileObject(self, file_entry):
+    """Reads the data of a file entry using its file-like object.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Yields:
+      tuple[FileEntry, bytes]: file entry and data, where empty data
+          indicates the end of the data of the file entry.
+    """
+    file_object = file_entry.GetFileObject()
+    if file_object:
+      data = file_object.read(self.maximum_read_size)
+      while data:
+        yield file_entry, data
+        data = file_object.read(self.maximum_read_size)
+
+    yield file_entry, b''
+
+  def AddFileEntry(self, file_entry):
+    """Adds a file entry to be read.
+
+    Args:
+      file_entry (FileEntry): file entry.
+    """
+    self._file_entries.append(file_entry)
+
+  def HashFileEntries(self, hash_name='sha256'):
+    """Calculates the digest hashes of the data of the file entries.
+
+    Args:
+      hash_name (Optional[str]): name of the hash algorithm, as supported by
+          hashlib.
+
+    Yields:
+      tuple[FileEntry, str]: file entry and hexadecimal digest hash of its
+          data, in the order in which the data was read.
+
+    Raises:
+      IOError: if a read failed.
+      OSError: if a read failed.
+      ValueError: if the hash algorithm is not supported.
+    """
+    hash_contexts = {}
+    for file_entry, data in self.ReadFileEntries():
+      hash_context = hash_contexts.get(file_entry, None)
+      if not hash_context:
+        hash_context = hashlib.new(hash_name)
+        hash_contexts[file_entry] = hash_context
+
+      if data:
+        hash_context.update(data)
+      else:
+        del hash_contexts[file_entry]
+        yield file_entry, hash_context.hexdigest()
+
+  def ReadFileEntries(self):
+    """Reads the data of the file entries.
+
+    The data of every file entry is returned in order, however the data of
+    different file entries can be interleaved.
+
+    Yields:
+      tuple[FileEntry, bytes]: file entry and data, where empty data
+          indicates the end of the data of the file entry.
+
+    Raises:
+      IOError: if a read failed.
+      OSError: if a read failed.
+    """
+    self._buffered_data_size = 0
+
+    scheduled_file_entries = []
+    unscheduled_file_entries = []
+    for file_entry in self._file_entries:
+      scheduled_file_entry = _ScheduledFileEntry(
+          file_entry, self.maximum_read_size)
+      if scheduled_file_entry.file_object:
+        scheduled_file_entries.append(scheduled_file_entry)
+      else:
+        unscheduled_file_entries.append(file_entry)
+
+    read_order = []
+    for file_index, scheduled_file_entry in enumerate(scheduled_file_entries):
+      path_spec = scheduled_file_entry.file_entry.path_spec
+      volume_identifier = path_spec.parent.comparable
+      for segment_index, (_, _, volume_offset) in enumerate(
+          scheduled_file_entry.segments):
+        if volume_offset is not None:
+          read_order.append((
+              volume_identifier, volume_offset, file_index, segment_index))
+
+    read_order.sort()
+
+    # Leading sparse segments and file entries without data segments, such as
+    # empty files, do not depend on any read.
+    for scheduled_file_entry in scheduled_file_entries:
+      yield from self._ReadAvailableSegments(scheduled_file_entry)
+
+    for _, _, file_index, segment_index in read_order:
+      scheduled_file_entry = scheduled_file_entries[file_index]
+      if scheduled_file_entry.is_deferred:
+        continue
+
+      if segment_index != scheduled_file_entry.segment_index:
+        _, segment_size, _ = scheduled_file_entry.segments[segment_index]
+        if self._buffered_data_size + segment_size > self.maximum_buffer_size:
+          for data in scheduled_file_entry.pending_data.values():
+            self._buffered_data_size -= len(data)
+
+          scheduled_file_entry.is_deferred = True
+          scheduled_file_entry.pending_data = {}
+
+        else:
+          data = scheduled_file_entry.ReadSegment(segment_index)
+          scheduled_file_entry.pending_data[segment_index] = data
+          self._buffered_data_size += len(data)
+
+        continue
+
+      data = scheduled_file_entry.ReadSegment(segment_index)
+      scheduled_file_entry.segment_index += 1
+
+      yield scheduled_file_entry.file_entry, data
+      yield from self._ReadAvailableSegments(scheduled_file_entry)
+
+    for scheduled_file_entry in scheduled_file_entries:
+      if scheduled_file_entry.is_deferred:
+        yield from self._ReadAvailableSegments(scheduled_file_entry)
+
+    for file_entry in unscheduled_file_entries:
+      yield from self._ReadFileObject(file_entry)
@@ -17,6 +17,8 @@ from dfvfs.path import factory as path_spec_factory
 class FindSpec(object):
   """Find specification."""
 
+  _REGEX_SPECIAL_CHARACTERS = frozenset('$()*+.?[]^{|}')
+
   def __init__(
       self, case_sensitive=True, file_entry_types=None, is_allocated=True,
       location=None, location_glob=None, location_regex=None,
@@ -74,6 +76,8 @@ class FindSpec(object):
     self._is_regex = False
     self._location = None
     self._location_regex = None
+    self._location_segment_names = None
+    self._location_segment_regexes = None
     self._location_segments = None
     self._number_of_location_segments = None
 
@@ -134,6 +138,14 @@ class FindSpec(object):
     if self._location_segments is not None:
       self._number_of_location_segments = len(self._location_segments)
 
+      if self._is_regex:
+        self._location_segment_names = [
+            self._GetLiteralFromRegex(location_segment)
+            for location_segment in self._location_segments]
+        self._location_segment_regexes = list(self._location_segments)
+      else:
+        self._location_segment_names = list(self._location_segments)
+
     # TODO: add support for name
     # TODO: add support for owner (user, group)
     # TODO: add support for permissions (mode)
@@ -323,6 +335,46 @@ class FindSpec(object):
     # slashes "/", which needs to be undone.
     return location_regex.replace('\\/', '/')
 
+  def _GetLiteralFromRegex(self, regex):
+    """Retrieves the literal string matched by a regular expression.
+
+    Args:
+      regex (str): regular expression pattern.
+
+    Returns:
+      str: literal string matched by the regular expression or None if
+          the regular expression contains special characters, such as
+          wildcards.
+    """
+    if not isinstance(regex, str):
+      return None
+
+    characters = []
+    is_escaped = False
+    for character in regex:
+      if is_escaped:
+        # Escaped alphanumeric characters, such as "\d", have a special
+        # meaning.
+        if character.isalnum():
+          return None
+
+        characters.append(character)
+        is_escaped = False
+
+      elif character == '\\':
+        is_escaped = True
+
+      elif character in self._REGEX_SPECIAL_CHARACTERS:
+        return None
+
+      else:
+        characters.append(character)
+
+    if is_escaped or not characters:
+      return None
+
+    return ''.join(characters)
+
   def _SplitPath(self, path, path_separator):
     """Splits the path into path segments.
 
@@ -459,6 +511,42 @@ class FindSpec(object):
 
     return True
 
+  def GetLocationSegmentName(self, segment_index):
+    """Retrieves the name of a location segment.
+
+    Args:
+      segment_index (int): index of the location segment, where 0 represents
+          the root segment.
+
+    Returns:
+      str: name of the location segment or None if not available, such as
+          for the root segment or a location segment that is a glob or
+          regular expression with special characters.
+    """
+    if (self._location_segment_names is None or segment_index < 1 or
+        segment_index > self._number_of_location_segments):
+      return None
+
+    return self._location_segment_names[segment_index - 1]
+
+  def GetLocationSegmentRegex(self, segment_index):
+    """Retrieves the regular expression of a location segment.
+
+    Args:
+      segment_index (int): index of the location segment, where 0 represents
+          the root segment.
+
+    Returns:
+      str: regular expression pattern of the location segment or None if not
+          available, such as for the root segment or if the location is not
+          defined as a glob or regular expression.
+    """
+    if (self._location_segment_regexes is None or segment_index < 1 or
+        segment_index > self._number_of_location_segments):
+      return None
+
+    return self._location_segment_regexes[segment_index - 1]
+
   def HasLocation(self):
     """Determines if the find specification has a location defined.
 
@@ -467,6 +555,14 @@ class FindSpec(object):
     """
     return bool(self._location_segments)
 
+  def IsCaseSensitive(self):
+    """Determines if string matches are case sensitive.
+
+    Returns:
+      bool: True if string matches are case sensitive.
+    """
+    return self._is_case_sensitive
+
   def IsLastLocationSegment(self, segment_index):
     """Determines if the a location segment is the last one.
 
@@ -480,6 +576,176 @@ class FindSpec(object):
                 segment_index == self._number_of_location_segments)
 
 
+class _LocationSegmentMatcher(object):
+  """Matcher of names against location segments of find specifications.
+
+  The location segments of the find specifications at a specific segment
+  index are compiled into dictionaries of names and, per case sensitivity,
+  a tree of regular expressions that combine the regular expression location
+  segments as alternatives. The root of the tree combines all regular
+  expressions and every branch half of the regular expressions of its parent.
+  This allows to test a name against a vast number of find specifications
+  with a single regular expression, when it matches none of them, and with
+  a number of regular expressions proportional to the logarithm of the number
+  of find specifications, per matching find specification.
+  """
+
+  # Regular expressions with back references or conditional groups cannot be
+  # combined, since their group numbers would change.
+  _GROUP_REFERENCE_REGEX = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+  def __init__(self, find_specs, segment_index):
+    """Initializes a location segment matcher.
+
+    Args:
+      find_specs (list[FindSpec]): find specifications.
+      segment_index (int): index of the location segment to match, where
+          0 represents the root segment.
+    """
+    super(_LocationSegmentMatcher, self).__init__()
+    self._find_specs_by_lower_case_name = {}
+    self._find_specs_by_name = {}
+    self._find_specs_without_location = []
+    self._regex_nodes = []
+    self._segment_index = segment_index
+
+    find_specs_by_regex = {}
+    for find_spec_index, find_spec in enumerate(find_specs):
+      if not find_spec.HasLocation():
+        self._find_specs_without_location.append((find_spec_index, find_spec))
+        continue
+
+      case_sensitive = find_spec.IsCaseSensitive()
+
+      regex = find_spec.GetLocationSegmentRegex(segment_index)
+      if regex is not None:
+        lookup_key = (regex, case_sensitive)
+        find_specs_by_regex.setdefault(lookup_key, []).append(
+            (find_spec_index, find_spec))
+        continue
+
+      name = find_spec.GetLocationSegmentName(segment_index)
+      if name is None:
+        continue
+
+      if case_sensitive:
+        find_specs_by_name = self._find_specs_by_name
+      else:
+        find_specs_by_name = self._find_specs_by_lower_case_name
+        name = name.lower()
+
+      find_specs_by_name.setdefault(name, []).append(
+          (find_spec_index, find_spec))
+
+    for case_sensitive in (True, False):
+      flags = re.DOTALL | re.UNICODE
+      if not case_sensitive:
+        flags |= re.IGNORECASE
+
+      combinable_regexes = []
+      for (regex, regex_case_sensitive), regex_find_specs in (
+          find_specs_by_regex.items()):
+        if regex_case_sensitive != case_sensitive:
+          continue
+
+        if self._GROUP_REFERENCE_REGEX.search(regex):
+          self._regex_nodes.append((None, None, regex_find_specs))
+        else:
+          combinable_regexes.append((regex, regex_find_specs))
+
+      if combinable_regexes:
+        self._regex_nodes.append(
+            self._BuildRegexTree(combinable_regexes, flags))
+
+  def _BuildRegexTree(self, regexes, flags):
+    """Builds a tree of combined regular expressions.
+
+    Args:
+      regexes (list[tuple[str, list[tuple[int, FindSpec]]]]): regular
+          expression patterns and their corresponding find specifications.
+      flags (int): regular expression flags.
+
+    Returns:
+      tuple[re.Pattern, list[tuple], list[tuple[int, FindSpec]]]: node of
+          the tree, which consists of the combined regular expression, or None
+          if not available, the sub nodes of a branch and the find
+          specifications of a leaf.
+    """
+    if len(regexes) == 1:
+      _, regex_find_specs = regexes[0]
+      return None, None, regex_find_specs
+
+    # Every alternative is anchored individually to preserve the behavior
+    # of the individual regular expressions.
+    combined_regex = '|'.join([f'(?:^{regex:s}$)' for regex, _ in regexes])
+
+    try:
+      combined_regex = re.compile(combined_regex, flags=flags)
+    except (OverflowError, RecursionError, sre_constants.error):
+      combined_regex = None
+
+    middle_index = len(regexes) // 2
+    sub_nodes = [
+        self._BuildRegexTree(regexes[:middle_index], flags),
+        self._BuildRegexTree(regexes[middle_index:], flags)]
+
+    return combined_regex, sub_nodes, None
+
+  def _MatchRegexTree(self, regex_node, file_entry, name, matches):
+    """Matches a name against a tree of combined regular expressions.
+
+    Args:
+      regex_node (tuple[re.Pattern, list[tuple], list[tuple[int, FindSpec]]]):
+          node of the tree.
+      file_entry (FileEntry): file entry.
+      name (str): name of the file entry.
+      matches (list[tuple[int, FindSpec]]): matching find specifications.
+    """
+    combined_regex, sub_nodes, regex_find_specs = regex_node
+    if combined_regex and not combined_regex.match(name):
+      return
+
+    if sub_nodes:
+      for sub_node in sub_nodes:
+        self._MatchRegexTree(sub_node, file_entry, name, matches)
+
+    else:
+      # Find specifications with the same regular expression only need to
+      # be compared once.
+      _, find_spec = regex_find_specs[0]
+      if find_spec.CompareNameWithLocationSegment(
+          file_entry, self._segment_index):
+        matches.extend(regex_find_specs)
+
+  def GetMatchingFindSpecs(self, file_entry):
+    """Retrieves the find specifications that match the name of a file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      list[FindSpec]: find specifications that have no location defined or
+          of which the location segment matches the name of the file entry,
+          in the order in which they were provided.
+    """
+    name = file_entry.name or ''
+
+    matches = list(self._find_specs_without_location)
+    matches.extend(self._find_specs_by_name.get(name, []))
+
+    if self._find_specs_by_lower_case_name:
+      matches.extend(self._find_specs_by_lower_case_name.get(
+          name.lower(), []))
+
+    for regex_node in self._regex_nodes:
+      self._MatchRegexTree(regex_node, file_entry, name, matches)
+
+    if len(matches) > 1:
+      matches.sort(key=lambda match: match[0])
+
+    return [find_spec for _, find_spec in matches]
+
+
 class FileSystemSearcher(object):
   """Searcher to find file entries within a file system."""
 
@@ -506,14 +772,90 @@ class FileSystemSearcher(object):
 
     super(FileSystemSearcher, self).__init__()
     self._file_system = file_system
+    self._location_segment_matchers = {}
     self._mount_point = mount_point
 
+  def _GetLocationSegmentMatcher(self, find_specs, segment_index):
+    """Retrieves a location segment matcher.
+
+    Location segment matchers are cached per set of find specifications and
+    segment index, since all the directories at the same depth of a location
+    are typically searched with the same find specifications.
+
+    Args:
+      find_specs (list[FindSpec]): find specifications.
+      segment_index (int): index of the location segment to match.
+
+    Returns:
+      _LocationSegmentMatcher: location segment matcher.
+    """
+    lookup_key = (segment_index, tuple(find_specs))
+
+    matcher = self._location_segment_matchers.get(lookup_key, None)
+    if not matcher:
+      matcher = _LocationSegmentMatcher(find_specs, segment_index)
+      self._location_segment_matchers[lookup_key] = matcher
+
+    return matcher
+
+  def _GetSubFileEntriesByName(self, file_entry, find_specs, segment_index):
+    """Retrieves sub file entries by the name of location segments.
+
+    Looking up a sub file entry by name avoids enumerating all the sub file
+    entries of directories with a vast number of entries, but is only
+    possible if the file system supports looking up a file entry by location
+    and the location segment of every find specification is a name.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      find_specs (list[FindSpec]): find specifications.
+      segment_index (int): index of the location path segment to look up.
+
+    Returns:
+      list[tuple[FileEntry, list[FindSpec]]]: sub file entries and their
+          corresponding find specifications or None if the sub file entries
+          need to be enumerated.
+    """
+    if not self._file_system.SUPPORTS_LOCATION_LOOKUP:
+      return None
+
+    find_specs_per_name = {}
+    for find_spec in find_specs:
+      name = find_spec.GetLocationSegmentName(segment_index)
+      if name is None:
+        return None
+
+      case_sensitive = find_spec.IsCaseSensitive()
+      if case_sensitive:
+        lookup_key = (name, True)
+      elif self._file_system.CASE_INSENSITIVE_LOCATION_LOOKUP:
+        lookup_key = (name.lower(), False)
+      else:
+        return None
+
+      if lookup_key not in find_specs_per_name:
+        find_specs_per_name[lookup_key] = (name, [])
+
+      find_specs_per_name[lookup_key][1].append(find_spec)
+
+    sub_file_entries = []
+    for (_, case_sensitive), (name, name_find_specs) in (
+        find_specs_per_name.items()):
+      sub_file_entry = file_entry.GetSubFileEntryByName(
+          name, case_sensitive=case_sensitive)
+      if sub_file_entry:
+        sub_file_entries.append((sub_file_entry, name_find_specs))
+
+    return sub_file_entries
+
   def _FindInFileEntry(self, file_entry, find_specs, segment_index):
     """Searches for matching file entries within the file entry.
 
     Args:
       file_entry (FileEntry): file entry.
-      find_specs (list[FindSpec]): find specifications.
+      find_specs (list[FindSpec]): find specifications that have no location
+          defined or of which the location segment matches the name of
+          the file entry.
       segment_index (int): index of the location path segment to compare.
 
     Yields:
@@ -522,13 +864,11 @@ class FileSystemSearcher(object):
     sub_find_specs = []
     for find_spec in find_specs:
       has_location = find_spec.HasLocation()
-      # Do a quick check to see if the current location segment matches.
-      location_match = find_spec.CompareNameWithLocationSegment(
-          file_entry, segment_index)
+      location_match = True
       is_last_location_segment = find_spec.IsLastLocationSegment(
           segment_index)
 
-      if location_match and is_last_location_segment:
+      if has_location and is_last_location_segment:
         # Check if the full location matches.
         location_match = find_spec.ComparePathSpecLocation(
             file_entry.path_spec, self._file_system,
@@ -539,15 +879,34 @@ class FileSystemSearcher(object):
           yield file_entry.path_spec
 
       at_last_location_segment = find_spec.AtLastLocationSegment(segment_index)
-      if (not has_location or location_match) and not at_last_location_segment:
+      if location_match and not at_last_location_segment:
         sub_find_specs.append(find_spec)
 
     if sub_find_specs:
       segment_index += 1
       try:
-        for sub_file_entry in file_entry.sub_file_entries:
-          yield from self._FindInFileEntry(
-              sub_file_entry, sub_find_specs, segment_index)
+        sub_file_entries = self._GetSubFileEntriesByName(
+            file_entry, sub_find_specs, segment_index)
+        if sub_file_entries is not None:
+          for sub_file_entry, name_find_specs in sub_file_entries:
+            name_find_specs = [
+                find_spec for find_spec in name_find_specs
+                if find_spec.CompareNameWithLocationSegment(
+                    sub_file_entry, segment_index)]
+            if name_find_specs:
+              yield from self._FindInFileEntry(
+                  sub_file_entry, name_find_specs, segment_index)
+
+        else:
+          # Test the name of every sub file entry once against all the find
+          # specifications, instead of once per find specification.
+          matcher = self._GetLocationSegmentMatcher(
+              sub_find_specs, segment_index)
+          for sub_file_entry in file_entry.sub_file_entries:
+            matching_find_specs = matcher.GetMatchingFindSpecs(sub_file_entry)
+            if matching_find_specs:
+              yield from self._FindInFileEntry(
+                  sub_file_entry, matching_find_specs, segment_index)
 
       except errors.AccessError:
         pass
@@ -563,7 +922,9 @@ class FileSystemSearcher(object):
       PathSpec: path specification of a matching file entry.
     """
     if not find_specs:
-      find_specs.append(FindSpec())
+      find_specs = [FindSpec()]
+
+    self._location_segment_matchers = {}
 
     if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
         self._file_system.type_indicator):
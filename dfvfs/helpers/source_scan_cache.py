@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""Persistent cache of source scan results."""
+
+import hashlib
+import json
+import os
+import stat
+import zlib
+
+from dfvfs.lib import definitions
+from dfvfs.serializer import json_serializer
+
+
+class SourceScanCache(object):
+  """Persistent cache of source scan results.
+
+  The cache stores the scan nodes, including their scanned and locked state,
+  and the source type of a source scanner context, per source, in a cache
+  directory. A cached scan result is only used when the size, modification
+  time and a checksum of the data at the start and end of the source match
+  those of the source when it was scanned. Note that only the source itself
+  is checked, not additional segment files, such as those of a split storage
+  media image.
+
+  Credentials are never stored. A scan node that was unlocked is stored as
+  a locked scan node without sub nodes, hence it needs to be unlocked again
+  after the scan result has been read from the cache.
+  """
+
+  _CACHE_FILE_EXTENSION = 'scncache'
+
+  _FORMAT_VERSION = 1
+
+  # The size of the data at the start and end of the source used to determine
+  # if a cached scan result matches the source.
+  _FINGERPRINT_DATA_SIZE = 4096
+
+  def __init__(self, cache_directory):
+    """Initializes a source scan cache.
+
+    Args:
+      cache_directory (str): path of the directory to store the cached scan
+          results in.
+    """
+    super(SourceScanCache, self).__init__()
+    self._cache_directory = cache_directory
+
+  def _GetCachePath(self, path_spec):
+    """Retrieves the path of the cached scan result of a source.
+
+    Args:
+      path_spec (PathSpec): path specification of the source.
+
+    Returns:
+      str: path of the cached scan result.
+    """
+    lookup_hash = hashlib.sha256()
+    lookup_hash.update(path_spec.comparable.encode('utf-8'))
+    identifier = lookup_hash.hexdigest()
+
+    return os.path.join(
+        self._cache_directory, f'{identifier:s}.{self._CACHE_FILE_EXTENSION:s}')
+
+  def _GetConfiguration(self):
+    """Retrieves the scanner configuration that affects the scan result.
+
+    Returns:
+      dict[str, str]: preferred back-ends per format.
+    """
+    return {
+        'apm': definitions.PREFERRED_APM_BACK_END,
+        'ext': definitions.PREFERRED_EXT_BACK_END,
+        'fat': definitions.PREFERRED_FAT_BACK_END,
+        'gpt': definitions.PREFERRED_GPT_BACK_END,
+        'hfs': definitions.PREFERRED_HFS_BACK_END,
+        'mbr': definitions.PREFERRED_MBR_BACK_END,
+        'ntfs': definitions.PREFERRED_NTFS_BACK_END}
+
+  def _GetSourceFingerprint(self, path_spec):
+    """Determines the fingerprint of a source.
+
+    The fingerprint consists of the size, modification time and a checksum of
+    the data at the start and end of the source.
+
+    Args:
+      path_spec (PathSpec): path specification of the source.
+
+    Returns:
+      dict[str, int]: fingerprint of the source or None if the source is not
+          a file or device in the operating system or cannot be read.
+    """
+    location = getattr(path_spec, 'location', None)
+    if path_spec.type_indicator != definitions.TYPE_INDICATOR_OS or (
+        not location):
+      return None
+
+    try:
+      stat_object = os.stat(location)
+      if not (stat.S_ISREG(stat_object.st_mode) or
+              stat.S_ISBLK(stat_object.st_mode) or
+              stat.S_ISCHR(stat_object.st_mode)):
+        return None
+
+      with open(location, 'rb') as file_object:
+        # Note that the size of a device is not available in its stat object.
+        size = file_object.seek(0, os.SEEK_END)
+
+        file_object.seek(0, os.SEEK_SET)
+        checksum = zlib.crc32(file_object.read(self._FINGERPRINT_DATA_SIZE))
+
+        data_offset = max(size - self._FINGERPRINT_DATA_SIZE, 0)
+        file_object.seek(data_offset, os.SEEK_SET)
+        checksum = zlib.crc32(
+            file_object.read(self._FINGERPRINT_DATA_SIZE), checksum)
+
+    except (IOError, OSError):
+      return None
+
+    return {
+        'checksum': checksum,
+        'modification_time': stat_object.st_mtime_ns,
+        'size': size}
+
+  def _GetSourceScanNode(self, scan_context):
+    """Retrieves the scan node of the source.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+
+    Returns:
+      SourceScanNode: root scan node or None if not available.
+    """
+    scan_node = scan_context.GetRootScanNode()
+    if not scan_node or scan_node.parent_node:
+      return None
+
+    return scan_node
+
+  def ReadScanContext(self, scan_context):
+    """Reads the cached scan result of a source into a source scanner context.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context, that only
+          contains the unscanned scan node of the source.
+
+    Returns:
+      bool: True if the scan result was read from the cache, False if there is
+          no cached scan result, it cannot be read or it does not match
+          the source.
+    """
+    scan_node = self._GetSourceScanNode(scan_context)
+    if not scan_node or scan_node.scanned or scan_node.sub_nodes:
+      return False
+
+    fingerprint = self._GetSourceFingerprint(scan_node.path_spec)
+    if not fingerprint:
+      return False
+
+    try:
+      with open(
+          self._GetCachePath(scan_node.path_spec), 'r',
+          encoding='utf-8') as cache_file:
+        cache_values = json.load(cache_file)
+
+    except (IOError, OSError, ValueError):
+      return False
+
+    try:
+      if (cache_values.get('format_version', None) != self._FORMAT_VERSION or
+          cache_values.get('configuration', None) != (
+              self._GetConfiguration()) or
+          cache_values.get('fingerprint', None) != fingerprint):
+        return False
+
+      # The scan node values are converted before the scan context is changed
+      # so that an invalid cached scan result does not leave a partial result.
+      scan_nodes_values = []
+      for index, scan_node_values in enumerate(
+          cache_values.get('scan_nodes', [])):
+        path_spec = json_serializer.JsonPathSpecSerializer.ReadSerialized(
+            scan_node_values['path_spec'])
+        parent_index = scan_node_values['parent']
+
+        if index == 0:
+          if parent_index is not None or path_spec != scan_node.path_spec:
+            return False
+
+        elif not isinstance(parent_index, int) or not (
+            0 <= parent_index < index):
+          return False
+
+        scan_nodes_values.append((
+            path_spec, parent_index, bool(scan_node_values['scanned']),
+            bool(scan_node_values['locked'])))
+
+      source_type = cache_values.get('source_type', None)
+
+    except (AttributeError, KeyError, TypeError, ValueError):
+      return False
+
+    if not scan_nodes_values:
+      return False
+
+    scan_nodes = []
+    for path_spec, parent_index, scanned, locked in scan_nodes_values:
+      if parent_index is None:
+        cached_scan_node = scan_node
+      else:
+        cached_scan_node = scan_context.AddScanNode(
+            path_spec, scan_nodes[parent_index])
+
+      cached_scan_node.scanned = scanned
+      if locked:
+        scan_context.LockScanNode(path_spec)
+
+      scan_nodes.append(cached_scan_node)
+
+    if source_type:
+      scan_context.SetSourceType(source_type)
+
+    return True
+
+  def WriteScanContext(self, scan_context):
+    """Writes the scan result of a source scanner context to the cache.
+
+    Scan results of sources that are not a file or device in the operating
+    system are not stored.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+
+    Raises:
+      IOError: if the cached scan result cannot be written.
+      OSError: if the cached scan result cannot be written.
+    """
+    scan_node = self._GetSourceScanNode(scan_context)
+    if not scan_node:
+      return
+
+    fingerprint = self._GetSourceFingerprint(scan_node.path_spec)
+    if not fingerprint:
+      return
+
+    scan_nodes_values = []
+    scan_nodes_stack = [(scan_node, None)]
+    while scan_nodes_stack:
+      scan_node, parent_index = scan_nodes_stack.pop()
+
+      is_unlocked = bool(scan_node.credential)
+      is_locked = is_unlocked or scan_context.IsLockedScanNode(
+          scan_node.path_spec)
+
+      scan_nodes_values.append({
+          'locked': is_locked,
+          'parent': parent_index,
+          'path_spec': json_serializer.JsonPathSpecSerializer.WriteSerialized(
+              scan_node.path_spec),
+          'scanned': is_unlocked or scan_node.scanned})
+
+      # The sub nodes of an unlocked scan node are only available with
+      # the credential, which is not stored.
+      if not is_unlocked:
+        index = len(scan_nodes_values) - 1
+        scan_nodes_stack.extend([
+            (sub_scan_node, index)
+            for sub_scan_node in reversed(scan_node.sub_nodes)])
+
+    cache_values = {
+        'configuration': self._GetConfiguration(),
+        'fingerprint': fingerprint,
+        'format_version': self._FORMAT_VERSION,
+        'scan_nodes': scan_nodes_values,
+        'source_type': scan_context.source_type}
+
+    cache_path = self._GetCachePath(scan_context.GetRootScanNode().path_spec)
+    temporary_cache_path = f'{cache_path:s}.tmp'
+
+    with open(temporary_cache_path, 'w', encoding='utf-8') as cache_file:
+      json.dump(cache_values, cache_file)
+
+    os.replace(temporary_cache_path, cache_path)
@@ -19,12 +19,15 @@ the nodea and user provided context information, such as:
 * which VSS stores to default to.
 """
 
+from concurrent import futures
+
 from dfvfs.analyzer import analyzer
 from dfvfs.lib import apfs_helper
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import raw_helper
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 
 
@@ -406,20 +409,104 @@ class SourceScannerContext(object):
 class SourceScanner(object):
   """Searcher to find volumes within a volume system."""
 
-  def __init__(self, resolver_context=None):
+  # The format categories a scan node is scanned for at once.
+  _SCAN_FORMAT_CATEGORIES = frozenset([
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+      definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE,
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+
+  def __init__(
+      self, resolver_context=None, maximum_number_of_workers=1,
+      scan_cache=None):
     """Initializes a source scanner.
 
     Args:
       resolver_context (Optional[Context]): resolver context, where None
           indicates to use the built-in context which is not multi process
           safe.
+      maximum_number_of_workers (Optional[int]): maximum number of threads
+          that scan the sub nodes of a volume system concurrently, where 1
+          indicates the sub nodes are scanned sequentially.
+      scan_cache (Optional[SourceScanCache]): persistent cache of source scan
+          results, where None indicates scan results are not cached.
+
+    Raises:
+      ValueError: if the maximum number of workers is invalid.
     """
+    if maximum_number_of_workers < 1:
+      raise ValueError((
+          f'Invalid maximum number of workers: {maximum_number_of_workers:d} '
+          f'value out of bounds.'))
+
     super(SourceScanner, self).__init__()
+    self._maximum_number_of_workers = maximum_number_of_workers
     self._resolver_context = resolver_context
+    self._scan_cache = scan_cache
+    self._type_indicators_cache = None
 
   # TODO: add functions to check if path spec type is a storage media image
   # type, file system type, etc.
 
+  def _GetTypeIndicators(self, path_spec, format_category):
+    """Determines the supported format types of a specific format category.
+
+    During a scan the scan node is analyzed once for the formats of all
+    the categories that are scanned for, and the results are cached.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_category (str): format category.
+
+    Returns:
+      list[str]: supported format type indicators.
+    """
+    if self._type_indicators_cache is None:
+      type_indicators_per_category = (
+          analyzer.Analyzer.GetTypeIndicatorsByCategory(
+              path_spec, [format_category],
+              resolver_context=self._resolver_context))
+
+    else:
+      type_indicators_per_category = self._type_indicators_cache.get(
+          path_spec, None)
+      if type_indicators_per_category is None:
+        type_indicators_per_category = (
+            analyzer.Analyzer.GetTypeIndicatorsByCategory(
+                path_spec, self._SCAN_FORMAT_CATEGORIES,
+                resolver_context=self._resolver_context))
+        self._type_indicators_cache[path_spec] = type_indicators_per_category
+
+    return list(type_indicators_per_category[format_category])
+
+  def _MergeScanNodes(
+      self, scan_context, scan_node, sub_scan_context, sub_scan_node):
+    """Merges scan nodes of a separate source scanner context.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context to merge
+          the scan nodes into.
+      scan_node (SourceScanNode): scan node to merge the sub nodes into.
+      sub_scan_context (SourceScannerContext): source scanner context to
+          merge the scan nodes from.
+      sub_scan_node (SourceScanNode): scan node of which the sub nodes are
+          merged.
+    """
+    for sub_node in sub_scan_node.sub_nodes:
+      merged_scan_node = scan_context.GetScanNode(sub_node.path_spec)
+      if not merged_scan_node:
+        merged_scan_node = scan_context.AddScanNode(
+            sub_node.path_spec, scan_node)
+
+      merged_scan_node.scanned = sub_node.scanned
+      if sub_node.credential:
+        merged_scan_node.credential = sub_node.credential
+
+      if sub_scan_context.IsLockedScanNode(sub_node.path_spec):
+        scan_context.LockScanNode(sub_node.path_spec)
+
+      self._MergeScanNodes(
+          scan_context, merged_scan_node, sub_scan_context, sub_node)
+
   def _ScanNode(self, scan_context, scan_node, auto_recurse=True):
     """Scans a node for supported formats.
 
@@ -632,9 +719,19 @@ class SourceScanner(object):
       # https://github.com/log2timeline/dfvfs/issues/578
       return
 
-    for sub_file_entry in file_entry.sub_file_entries:
-      sub_scan_node = scan_context.AddScanNode(
-          sub_file_entry.path_spec, scan_node)
+    sub_path_specs = [
+        sub_file_entry.path_spec
+        for sub_file_entry in file_entry.sub_file_entries]
+
+    if (auto_recurse and self._maximum_number_of_workers > 1 and
+        len(sub_path_specs) > 1 and
+        scan_node.type_indicator != definitions.TYPE_INDICATOR_VSHADOW):
+      self._ScanVolumeSystemSubNodesConcurrently(
+          scan_context, scan_node, sub_path_specs)
+      return
+
+    for sub_path_spec in sub_path_specs:
+      sub_scan_node = scan_context.AddScanNode(sub_path_spec, scan_node)
 
       if scan_node.type_indicator == definitions.TYPE_INDICATOR_VSHADOW:
         # Since scanning for file systems in VSS snapshot volumes can
@@ -644,6 +741,83 @@ class SourceScanner(object):
       if auto_recurse or not scan_context.updated:
         self._ScanNode(scan_context, sub_scan_node, auto_recurse=auto_recurse)
 
+  def _ScanVolumeSystemSubNode(self, volume_system_path_spec, path_spec):
+    """Scans a sub node of a volume system root node in a separate context.
+
+    The sub node is scanned with its own resolver context and source scanner
+    context, so that multiple sub nodes can be scanned concurrently.
+
+    Args:
+      volume_system_path_spec (PathSpec): path specification of the volume
+          system root node.
+      path_spec (PathSpec): path specification of the sub node.
+
+    Returns:
+      SourceScannerContext: source scanner context, that contains the volume
+          system root node, with the scanned sub node as its only sub node.
+    """
+    resolver_context = context.Context()
+    scanner = SourceScanner(resolver_context=resolver_context)
+
+    sub_scan_context = SourceScannerContext()
+    volume_system_scan_node = sub_scan_context.AddScanNode(
+        volume_system_path_spec, None)
+    sub_scan_context.AddScanNode(path_spec, volume_system_scan_node)
+
+    try:
+      scanner.Scan(sub_scan_context, scan_path_spec=path_spec)
+    finally:
+      resolver_context.Empty()
+
+    return sub_scan_context
+
+  def _ScanVolumeSystemSubNodesConcurrently(
+      self, scan_context, scan_node, sub_path_specs):
+    """Scans the sub nodes of a volume system root node concurrently.
+
+    Every sub node is scanned in a separate thread, with its own resolver
+    context and source scanner context. The resulting scan nodes are merged
+    into the source scanner context in order of the sub nodes, hence
+    the resulting scan nodes, locked scan nodes and source type are the same
+    as those of a sequential scan.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+      scan_node (SourceScanNode): volume system root scan node.
+      sub_path_specs (list[PathSpec]): path specifications of the sub nodes.
+
+    Raises:
+      ValueError: if the scan context or scan node is invalid.
+    """
+    maximum_number_of_workers = min(
+        self._maximum_number_of_workers, len(sub_path_specs))
+
+    with futures.ThreadPoolExecutor(
+        max_workers=maximum_number_of_workers,
+        thread_name_prefix='dfvfs_source_scanner') as executor:
+      scan_futures = [
+          executor.submit(
+              self._ScanVolumeSystemSubNode, scan_node.path_spec,
+              sub_path_spec)
+          for sub_path_spec in sub_path_specs]
+
+      try:
+        for sub_path_spec, scan_future in zip(sub_path_specs, scan_futures):
+          scan_context.AddScanNode(sub_path_spec, scan_node)
+
+          sub_scan_context = scan_future.result()
+          if sub_scan_context.source_type:
+            scan_context.SetSourceType(sub_scan_context.source_type)
+
+          self._MergeScanNodes(
+              scan_context, scan_node, sub_scan_context,
+              sub_scan_context.GetRootScanNode())
+
+      except Exception:
+        for scan_future in scan_futures:
+          scan_future.cancel()
+        raise
+
   def GetVolumeIdentifiers(self, volume_system):
     """Retrieves the volume identifiers.
 
@@ -686,8 +860,30 @@ class SourceScanner(object):
     else:
       scan_node = scan_context.GetUnscannedScanNode()
 
-    if scan_node:
+    if not scan_node:
+      return
+
+    # Only the result of a full scan of the source is cached.
+    use_scan_cache = bool(
+        self._scan_cache and auto_recurse and not scan_node.parent_node and
+        not scan_node.scanned and not scan_node.sub_nodes)
+
+    if use_scan_cache and self._scan_cache.ReadScanContext(scan_context):
+      return
+
+    self._type_indicators_cache = {}
+    try:
       self._ScanNode(scan_context, scan_node, auto_recurse=auto_recurse)
+    finally:
+      self._type_indicators_cache = None
+
+    if use_scan_cache:
+      try:
+        self._scan_cache.WriteScanContext(scan_context)
+      except (IOError, OSError):
+        # Note that the scan cache is an optimization, the scan result is
+        # still valid if it cannot be cached.
+        pass
 
   def ScanForFileSystem(self, source_path_spec):
     """Scans the path specification for a supported file system format.
@@ -712,8 +908,8 @@ class SourceScanner(object):
           parent=source_path_spec)
 
     try:
-      type_indicators = analyzer.Analyzer.GetFileSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM)
     except RuntimeError as exception:
       raise errors.BackEndError((
           f'Unable to process source path specification with error: '
@@ -773,8 +969,8 @@ class SourceScanner(object):
           media image type is found.
     """
     try:
-      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
     except RuntimeError as exception:
       raise errors.BackEndError((
           f'Unable to process source path specification with error: '
@@ -836,8 +1032,8 @@ class SourceScanner(object):
       return None
 
     try:
-      type_indicators = analyzer.Analyzer.GetVolumeSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
     except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           f'Unable to process source path specification with error: '
@@ -172,16 +172,18 @@ class VolumeScannerMediator(object):
 class VolumeScanner(object):
   """Volume scanner."""
 
-  def __init__(self, mediator=None):
+  def __init__(self, mediator=None, scan_cache=None):
     """Initializes a volume scanner.
 
     Args:
       mediator (Optional[VolumeScannerMediator]): a volume scanner mediator.
+      scan_cache (Optional[SourceScanCache]): persistent cache of source scan
+          results, where None indicates scan results are not cached.
     """
     super(VolumeScanner, self).__init__()
     self._mediator = mediator
     self._source_path = None
-    self._source_scanner = source_scanner.SourceScanner()
+    self._source_scanner = source_scanner.SourceScanner(scan_cache=scan_cache)
     self._source_type = None
 
   def _GetBasePathSpecs(self, scan_context, options):
@@ -715,13 +717,16 @@ class WindowsVolumeScanner(VolumeScanner):
       'C:\\WINNT35',
   ])
 
-  def __init__(self, mediator=None):
+  def __init__(self, mediator=None, scan_cache=None):
     """Initializes a Windows volume scanner.
 
     Args:
       mediator (VolumeScannerMediator): a volume scanner mediator.
+      scan_cache (Optional[SourceScanCache]): persistent cache of source scan
+          results, where None indicates scan results are not cached.
     """
-    super(WindowsVolumeScanner, self).__init__(mediator=mediator)
+    super(WindowsVolumeScanner, self).__init__(
+        mediator=mediator, scan_cache=scan_cache)
     self._file_system = None
     self._path_resolver = None
     self._windows_directory = None
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Directory index of archive file systems, such as ZIP, TAR and CPIO."""
+
+
+class ArchiveDirectoryIndex(object):
+  """Directory index of an archive file system.
+
+  Archive formats store the paths of their members in a flat list, which
+  does not necessarily contain an entry for every parent directory. The
+  directory index maps every directory, including virtual directories that
+  are only implied by the paths of their members, to the names of its
+  children. This allows to list a directory and determine if a path exists
+  without iterating over all the members of the archive.
+
+  Paths in the directory index are relative to the root of the archive and
+  do not start or end with a path separator. The root directory is
+  represented by an empty string.
+  """
+
+  def __init__(self, path_separator='/'):
+    """Initializes a directory index.
+
+    Args:
+      path_separator (Optional[str]): path segment separator.
+    """
+    super(ArchiveDirectoryIndex, self).__init__()
+    self._directories = {'': {}}
+    self._path_separator = path_separator
+
+  @property
+  def number_of_directories(self):
+    """int: number of directories, including the root directory."""
+    return len(self._directories)
+
+  def _NormalizePath(self, path):
+    """Normalizes a path.
+
+    Args:
+      path (str): path relative to the root of the archive.
+
+    Returns:
+      str: path without trailing path separators.
+    """
+    return path.rstrip(self._path_separator)
+
+  def AddPath(self, path, is_directory=False):
+    """Adds a path of a member of the archive.
+
+    Parent directories that are not yet in the directory index are added as
+    virtual directories.
+
+    Args:
+      path (str): path of the member relative to the root of the archive.
+      is_directory (Optional[bool]): True if the member is a directory.
+    """
+    path = self._NormalizePath(path)
+    if not path:
+      return
+
+    if is_directory:
+      self._directories.setdefault(path, {})
+
+    parent_path, _, name = path.rpartition(self._path_separator)
+    while True:
+      children = self._directories.get(parent_path, None)
+      if children is not None:
+        children[name] = children.get(name, False) or is_directory
+        break
+
+      self._directories[parent_path] = {name: is_directory}
+
+      # The parent directory is virtual, add it to its own parent.
+      path = parent_path
+      is_directory = True
+      parent_path, _, name = path.rpartition(self._path_separator)
+
+  def DirectoryExists(self, path):
+    """Determines if a directory exists.
+
+    Args:
+      path (str): path relative to the root of the archive.
+
+    Returns:
+      bool: True if the path is a directory, including a virtual directory.
+    """
+    return self._NormalizePath(path) in self._directories
+
+  def GetSubPaths(self, path):
+    """Retrieves the paths of the children of a directory.
+
+    Args:
+      path (str): path of the directory relative to the root of the archive.
+
+    Yields:
+      tuple[str, bool]: path of the child relative to the root of the archive
+          and a value to indicate the child is a directory.
+    """
+    path = self._NormalizePath(path)
+    children = self._directories.get(path, None)
+    if children:
+      for name, is_directory in children.items():
+        if path:
+          sub_path = self._path_separator.join([path, name])
+        else:
+          sub_path = name
+
+        yield sub_path, is_directory or sub_path in self._directories
+
+  def PathExists(self, path):
+    """Determines if a path exists.
+
+    Args:
+      path (str): path relative to the root of the archive.
+
+    Returns:
+      bool: True if the path is a member of the archive or a directory,
+          including a virtual directory.
+    """
+    path = self._NormalizePath(path)
+    if path in self._directories:
+      return True
+
+    parent_path, _, name = path.rpartition(self._path_separator)
+    return name in self._directories.get(parent_path, {})
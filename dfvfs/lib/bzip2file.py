@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""BZIP2 compressed stream file."""
+
+# Note: do not rename file to bzip2.py or bz2.py this can cause a conflict
+# with the bz2 module when using pip.
+
+import bisect
+import bz2
+import os
+
+from dfvfs.lib import decompression_engine
+from dfvfs.lib import errors
+
+
+class BZIP2Block(object):
+  """BZIP2 compressed block.
+
+  BZIP2 compressed blocks are not aligned to byte boundaries hence their
+  offset and size are stored in bits.
+
+  Attributes:
+    compressed_bit_offset (int): offset of the block, including the block
+        header, in bits relative to the start of the compressed stream.
+    compressed_bit_size (int): size of the block, including the block header,
+        in bits.
+    uncompressed_data_offset (int): offset of the uncompressed data of
+        the block relative to the start of the uncompressed stream.
+    uncompressed_data_size (int): size of the uncompressed data of the block.
+  """
+
+  def __init__(self, compressed_bit_offset, compressed_bit_size):
+    """Initializes a BZIP2 compressed block.
+
+    Args:
+      compressed_bit_offset (int): offset of the block, including the block
+          header, in bits relative to the start of the compressed stream.
+      compressed_bit_size (int): size of the block, including the block
+          header, in bits.
+    """
+    super(BZIP2Block, self).__init__()
+    self.compressed_bit_offset = compressed_bit_offset
+    self.compressed_bit_size = compressed_bit_size
+    self.uncompressed_data_offset = None
+    self.uncompressed_data_size = None
+
+  @property
+  def compressed_data_size(self):
+    """int: size of the block in bytes, rounded up to a byte boundary."""
+    return (self.compressed_bit_size + 7) // 8
+
+
+class BZIP2BlockIndex(object):
+  """Index of the blocks in a BZIP2 compressed stream.
+
+  BZIP2 compressed data consists of blocks that can be decompressed
+  independently. The BZIP2 compressed stream format has no index of these
+  blocks, however the start of every block and the end of stream are marked
+  by 48-bit signatures. The block index is built by scanning the compressed
+  data for these signatures and by decompressing every block once, to
+  determine the size of its uncompressed data.
+
+  Attributes:
+    blocks (list[BZIP2Block]): blocks in the order they are stored in
+        the stream.
+    uncompressed_data_size (int): size of the uncompressed data.
+  """
+
+  _BLOCK_HEADER_SIGNATURE = 0x314159265359
+
+  _END_OF_STREAM_SIGNATURE = 0x177245385090
+
+  _STREAM_HEADER_SIGNATURE = b'BZh'
+
+  # Use the largest block size in the stream header of a block that is
+  # decompressed independently, to support blocks of every block size.
+  _STREAM_HEADER_VALUE = int.from_bytes(b'BZh9', 'big')
+
+  # The size of the compressed data that is scanned for signatures at a time.
+  _SCAN_BUFFER_SIZE = 8 * 1024 * 1024
+
+  def __init__(self):
+    """Initializes a BZIP2 block index."""
+    super(BZIP2BlockIndex, self).__init__()
+    self._uncompressed_data_offsets = []
+    self.blocks = []
+    self.uncompressed_data_size = 0
+
+  def _GetSignatureSearchPatterns(self, signature):
+    """Retrieves the search patterns of a 48-bit signature.
+
+    Since the signature can start at any bit, one search pattern is determined
+    per bit shift. The signature spans 7 bytes when shifted, of which the 5
+    middle bytes are fully defined by the signature. The first and last byte
+    are partially defined and need to be compared using a mask.
+
+    Args:
+      signature (int): 48-bit signature.
+
+    Returns:
+      list[tuple[int, bytes, int, int, int, int]]: bit shift, middle bytes,
+          first byte value, first byte mask, last byte value and last byte
+          mask per bit shift.
+    """
+    search_patterns = []
+    for bit_shift in range(8):
+      pattern_data = (signature << (8 - bit_shift)).to_bytes(7, 'big')
+      search_patterns.append((
+          bit_shift, pattern_data[1:6], pattern_data[0], 0xff >> bit_shift,
+          pattern_data[6], (0xff << (8 - bit_shift)) & 0xff))
+
+    return search_patterns
+
+  def _ReadBlockData(self, file_object, block):
+    """Reads the compressed data of a block, aligned to a byte boundary.
+
+    Args:
+      file_object (FileIO): file-like object that contains the BZIP2
+          compressed stream.
+      block (BZIP2Block): block.
+
+    Returns:
+      int: compressed data of the block as an integer of
+          block.compressed_bit_size bits.
+
+    Raises:
+      BackEndError: if the compressed data of the block cannot be read.
+    """
+    data_offset = block.compressed_bit_offset // 8
+    data_end_offset = (
+        block.compressed_bit_offset + block.compressed_bit_size + 7) // 8
+    data_size = data_end_offset - data_offset
+
+    file_object.seek(data_offset, os.SEEK_SET)
+    compressed_data = file_object.read(data_size)
+    if len(compressed_data) != data_size:
+      raise errors.BackEndError(
+          f'Unable to read BZIP2 block at offset: {data_offset:d}.')
+
+    # Remove the bits after the end of the block and before the start of
+    # the block.
+    trailing_bit_size = (data_size * 8) - (
+        block.compressed_bit_offset % 8) - block.compressed_bit_size
+
+    block_data = int.from_bytes(compressed_data, 'big') >> trailing_bit_size
+    return block_data & ((1 << block.compressed_bit_size) - 1)
+
+  def _ScanForSignatures(self, file_object):
+    """Scans the compressed data for block header and end of stream signatures.
+
+    Args:
+      file_object (FileIO): file-like object that contains the BZIP2
+          compressed stream.
+
+    Returns:
+      tuple[list[int], list[int]]: bit offsets of the block header signatures
+          and bit offsets of the end of stream signatures.
+    """
+    block_header_search_patterns = self._GetSignatureSearchPatterns(
+        self._BLOCK_HEADER_SIGNATURE)
+    end_of_stream_search_patterns = self._GetSignatureSearchPatterns(
+        self._END_OF_STREAM_SIGNATURE)
+
+    block_header_bit_offsets = set()
+    end_of_stream_bit_offsets = set()
+
+    file_object.seek(0, os.SEEK_SET)
+
+    # Keep the last 6 bytes of the previous buffer to detect signatures that
+    # span buffer boundaries.
+    buffer_offset = 0
+    scan_data = b''
+
+    while True:
+      read_data = file_object.read(self._SCAN_BUFFER_SIZE)
+      if not read_data:
+        break
+
+      scan_data = b''.join([scan_data, read_data])
+
+      for search_patterns, bit_offsets in (
+          (block_header_search_patterns, block_header_bit_offsets),
+          (end_of_stream_search_patterns, end_of_stream_bit_offsets)):
+        self._ScanDataForSignature(
+            scan_data, buffer_offset, search_patterns, bit_offsets)
+
+      buffer_offset += len(scan_data) - 6
+      scan_data = scan_data[-6:]
+
+    return sorted(block_header_bit_offsets), sorted(end_of_stream_bit_offsets)
+
+  def _ScanDataForSignature(
+      self, data, data_offset, search_patterns, bit_offsets):
+    """Scans data for a signature.
+
+    Args:
+      data (bytes): data to scan.
+      data_offset (int): offset of the data relative to the start of
+          the compressed stream.
+      search_patterns (list[tuple[int, bytes, int, int, int, int]]): search
+          patterns of the signature.
+      bit_offsets (set[int]): bit offsets of the signatures found, relative
+          to the start of the compressed stream.
+    """
+    data_size = len(data)
+
+    for (bit_shift, middle_bytes, first_byte, first_byte_mask, last_byte,
+         last_byte_mask) in search_patterns:
+      match_offset = data.find(middle_bytes, 1)
+      while match_offset != -1:
+        first_byte_offset = match_offset - 1
+        last_byte_offset = match_offset + 5
+
+        if (data[first_byte_offset] & first_byte_mask == first_byte and (
+            not last_byte_mask or (last_byte_offset < data_size and
+            data[last_byte_offset] & last_byte_mask == last_byte))):
+          bit_offsets.add(((data_offset + first_byte_offset) * 8) + bit_shift)
+
+        match_offset = data.find(middle_bytes, match_offset + 1)
+
+  def CreateDecompressionEngine(
+      self, file_object, blocks=None, maximum_number_of_workers=1):
+    """Creates an engine to decompress the blocks.
+
+    Args:
+      file_object (FileIO): file-like object that contains the BZIP2
+          compressed stream.
+      blocks (Optional[list[BZIP2Block]]): blocks to decompress, where None
+          represents the blocks of the index.
+      maximum_number_of_workers (Optional[int]): maximum number of threads
+          that decompress blocks, where 1 represents that blocks are only
+          decompressed by the thread that requests them.
+
+    Returns:
+      BlockDecompressionEngine: block decompression engine.
+    """
+    if blocks is None:
+      blocks = self.blocks
+
+    def _ReadBlock(block_number):
+      return self.ReadCompressedBlock(file_object, blocks[block_number])
+
+    def _DecompressBlock(block_number, compressed_data):
+      return self.DecompressBlock(blocks[block_number], compressed_data)
+
+    return decompression_engine.BlockDecompressionEngine(
+        len(blocks), _ReadBlock, _DecompressBlock,
+        maximum_number_of_workers=maximum_number_of_workers)
+
+  def GetBlockIndexForOffset(self, offset):
+    """Retrieves the index of the block that contains an uncompressed offset.
+
+    Args:
+      offset (int): offset in the uncompressed data.
+
+    Returns:
+      int: index of the block in blocks or None if not available.
+    """
+    if offset < 0 or offset >= self.uncompressed_data_size:
+      return None
+
+    return bisect.bisect_right(self._uncompressed_data_offsets, offset) - 1
+
+  def Read(self, file_object, maximum_number_of_workers=1):
+    """Reads the block index from the compressed stream.
+
+    The blocks are decompressed concurrently to determine the size of their
+    uncompressed data.
+
+    Args:
+      file_object (FileIO): file-like object that contains the BZIP2
+          compressed stream.
+      maximum_number_of_workers (Optional[int]): maximum number of threads
+          that decompress blocks, where 1 represents that blocks are only
+          decompressed by the thread that requests them.
+
+    Raises:
+      BackEndError: if a block cannot be decompressed, for example when
+          a signature was found in the compressed data of a block.
+      FileFormatError: if the compressed stream is not supported.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    stream_header_data = file_object.read(3)
+    if stream_header_data != self._STREAM_HEADER_SIGNATURE:
+      raise errors.FileFormatError('Unsupported stream header signature.')
+
+    block_header_bit_offsets, end_of_stream_bit_offsets = (
+        self._ScanForSignatures(file_object))
+
+    if not end_of_stream_bit_offsets:
+      raise errors.FileFormatError('Missing end of stream signature.')
+
+    # A block ends at the start of the next block or the end of the stream.
+    end_bit_offsets = sorted(
+        block_header_bit_offsets[1:] + end_of_stream_bit_offsets)
+
+    blocks = []
+    for bit_offset in block_header_bit_offsets:
+      end_index = bisect.bisect_right(end_bit_offsets, bit_offset)
+      if end_index >= len(end_bit_offsets):
+        raise errors.FileFormatError(
+            f'Missing end of block at bit offset: {bit_offset:d}.')
+
+      end_bit_offset = end_bit_offsets[end_index]
+      blocks.append(BZIP2Block(bit_offset, end_bit_offset - bit_offset))
+
+    engine = self.CreateDecompressionEngine(
+        file_object, blocks=blocks,
+        maximum_number_of_workers=maximum_number_of_workers)
+
+    uncompressed_data_offset = 0
+
+    try:
+      for block_number, block in enumerate(blocks):
+        uncompressed_data = engine.GetBlock(block_number)
+
+        block.uncompressed_data_offset = uncompressed_data_offset
+        block.uncompressed_data_size = len(uncompressed_data)
+
+        uncompressed_data_offset += block.uncompressed_data_size
+
+    finally:
+      engine.Close()
+
+    self._uncompressed_data_offsets = [
+        block.uncompressed_data_offset for block in blocks]
+    self.blocks = blocks
+    self.uncompressed_data_size = uncompressed_data_offset
+
+  def DecompressBlock(self, block, compressed_data):
+    """Decompresses a block.
+
+    Args:
+      block (BZIP2Block): block.
+      compressed_data (bytes): compressed data of the block, wrapped into
+          a stream of its own, as returned by ReadCompressedBlock.
+
+    Returns:
+      bytes: uncompressed data of the block.
+
+    Raises:
+      BackEndError: if the block cannot be decompressed.
+    """
+    try:
+      return bz2.decompress(compressed_data)
+
+    except (EOFError, IOError, ValueError) as exception:
+      raise errors.BackEndError((
+          f'Unable to decompress BZIP2 block at bit offset: '
+          f'{block.compressed_bit_offset:d} with error: {exception!s}.'))
+
+  def ReadBlock(self, file_object, block):
+    """Reads and decompresses a block.
+
+    Args:
+      file_object (FileIO): file-like object that contains the BZIP2
+          compressed stream.
+      block (BZIP2Block): block.
+
+    Returns:
+      bytes: uncompressed data of the block.
+
+    Raises:
+      BackEndError: if the block cannot be read or decompressed.
+    """
+    compressed_data = self.ReadCompressedBlock(file_object, block)
+    return self.DecompressBlock(block, compressed_data)
+
+  def ReadCompressedBlock(self, file_object, block):
+    """Reads the compressed data of a block.
+
+    The block is decompressed independently of the rest of the stream by
+    wrapping it into a stream of its own, which consists of a stream header,
+    the block and an end of stream marker with a checksum. Since the stream
+    contains a single block its checksum is equal to the block checksum.
+
+    Args:
+      file_object (FileIO): file-like object that contains the BZIP2
+          compressed stream.
+      block (BZIP2Block): block.
+
+    Returns:
+      bytes: compressed data of the block, wrapped into a stream of its own.
+
+    Raises:
+      BackEndError: if the block cannot be read.
+    """
+    # The block header consists of the 48-bit signature and 32-bit checksum.
+    if block.compressed_bit_size < 80:
+      raise errors.BackEndError(
+          f'Invalid BZIP2 block size: {block.compressed_bit_size:d} bits.')
+
+    block_data = self._ReadBlockData(file_object, block)
+
+    checksum = (block_data >> (block.compressed_bit_size - 80)) & 0xffffffff
+
+    stream_data = (self._STREAM_HEADER_VALUE << block.compressed_bit_size) | (
+        block_data)
+    stream_data = (stream_data << 80) | (
+        self._END_OF_STREAM_SIGNATURE << 32) | checksum
+
+    stream_bit_size = 32 + block.compressed_bit_size + 80
+    padding_bit_size = (8 - (stream_bit_size % 8)) % 8
+
+    stream_data <<= padding_bit_size
+    return stream_data.to_bytes(
+        (stream_bit_size + padding_bit_size) // 8, 'big')
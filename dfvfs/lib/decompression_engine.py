@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Engine to decompress independent blocks of a compressed stream."""
+
+from concurrent import futures
+
+
+class BlockDecompressionEngine(object):
+  """Engine to decompress independent blocks of a compressed stream.
+
+  Compressed streams such as BZIP2 and XZ with multiple blocks consist of
+  blocks that can be decompressed independently. When blocks are requested
+  sequentially, the engine decompresses the blocks that follow the requested
+  block, in a pool of threads, so that they are available when they are
+  requested. Both the bz2 and lzma modules release the global interpreter
+  lock during decompression, hence the blocks are decompressed concurrently.
+
+  The compressed data of a block is read by the thread that requests
+  the block, since file-like objects are not thread-safe. The number of
+  blocks that are read and decompressed ahead is bounded, to bound memory
+  usage. By default blocks are only decompressed by the thread that requests
+  them, since every block that is decompressed ahead is kept in memory.
+
+  Attributes:
+    maximum_number_of_workers (int): maximum number of threads that
+        decompress blocks.
+    maximum_read_ahead (int): maximum number of blocks that are read and
+        decompressed ahead of the requested block.
+  """
+
+  def __init__(
+      self, number_of_blocks, read_block_function, decompress_block_function,
+      maximum_number_of_workers=1, maximum_read_ahead=None):
+    """Initializes a block decompression engine.
+
+    Args:
+      number_of_blocks (int): number of blocks in the compressed stream.
+      read_block_function (function): function that reads the compressed data
+          of a block, which takes the block number as argument and returns
+          the compressed data.
+      decompress_block_function (function): function that decompresses
+          the compressed data of a block, which takes the block number and
+          the compressed data as arguments and returns the uncompressed
+          data.
+      maximum_number_of_workers (Optional[int]): maximum number of threads
+          that decompress blocks, where 1 represents that blocks are only
+          decompressed by the thread that requests them.
+      maximum_read_ahead (Optional[int]): maximum number of blocks that are
+          read and decompressed ahead of the requested block, where None
+          represents the maximum number of workers.
+    """
+    if maximum_read_ahead is None:
+      maximum_read_ahead = maximum_number_of_workers
+
+    super(BlockDecompressionEngine, self).__init__()
+    self._decompress_block_function = decompress_block_function
+    self._executor = None
+    self._futures = {}
+    self._last_block_number = None
+    self._number_of_blocks = number_of_blocks
+    self._read_block_function = read_block_function
+    self.maximum_number_of_workers = max(maximum_number_of_workers, 1)
+    self.maximum_read_ahead = max(maximum_read_ahead, 0)
+
+  def _SubmitBlock(self, block_number):
+    """Reads a block and submits it for decompression.
+
+    Args:
+      block_number (int): number of the block.
+    """
+    compressed_data = self._read_block_function(block_number)
+
+    if not self._executor:
+      self._executor = futures.ThreadPoolExecutor(
+          max_workers=self.maximum_number_of_workers,
+          thread_name_prefix='dfvfs_decompression')
+
+    self._futures[block_number] = self._executor.submit(
+        self._decompress_block_function, block_number, compressed_data)
+
+  def Close(self):
+    """Closes the engine and discards blocks that were decompressed ahead."""
+    for future in self._futures.values():
+      future.cancel()
+
+    self._futures = {}
+    self._last_block_number = None
+
+    if self._executor:
+      self._executor.shutdown(wait=False)
+      self._executor = None
+
+  def GetBlock(self, block_number):
+    """Retrieves the uncompressed data of a block.
+
+    Blocks are only decompressed ahead when the block follows the previously
+    requested block. Blocks that were decompressed ahead and precede
+    the block, or that are beyond the read-ahead of the block, are discarded.
+
+    Args:
+      block_number (int): number of the block.
+
+    Returns:
+      bytes: uncompressed data of the block.
+
+    Raises:
+      BackEndError: if the block cannot be read or decompressed.
+    """
+    is_sequential = block_number == 0 or (
+        self._last_block_number is not None and
+        block_number - self._last_block_number in (0, 1))
+
+    self._last_block_number = block_number
+
+    read_ahead_end = block_number + 1
+    if (is_sequential and self.maximum_number_of_workers > 1 and
+        self.maximum_read_ahead > 0):
+      read_ahead_end = min(
+          read_ahead_end + self.maximum_read_ahead, self._number_of_blocks)
+
+    for submitted_block_number in list(self._futures.keys()):
+      if not block_number <= submitted_block_number < read_ahead_end:
+        future = self._futures.pop(submitted_block_number)
+        future.cancel()
+
+    compressed_data = None
+    future = self._futures.pop(block_number, None)
+    if future is None:
+      compressed_data = self._read_block_function(block_number)
+
+    for next_block_number in range(block_number + 1, read_ahead_end):
+      if next_block_number not in self._futures:
+        self._SubmitBlock(next_block_number)
+
+    if future is not None:
+      return future.result()
+
+    # A block that was not decompressed ahead is decompressed by the thread
+    # that requests it, concurrently with the blocks that are decompressed
+    # ahead.
+    return self._decompress_block_function(block_number, compressed_data)
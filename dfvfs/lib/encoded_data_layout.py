@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""Layout of encoded data, such as base16, base32 and base64."""
+
+import bisect
+import os
+
+
+class EncodedDataLayout(object):
+  """Layout of encoded data.
+
+  Encoded data consists of encoded characters that can be interleaved with
+  whitespace, such as line breaks. The layout maps the index of an encoded
+  character to its offset in the encoded data, without reading the encoded
+  data that precedes it.
+
+  Encoded data without whitespace or with lines of the same length is mapped
+  by computation. The line length is determined from the first line and
+  the layout is verified against the start and the end of the encoded data
+  and every time encoded data is read. Other encoded data is mapped by
+  a sparse index of offsets, which requires to scan the encoded data once.
+
+  Attributes:
+    number_of_characters (int): number of encoded characters.
+  """
+
+  # The bytes that are considered whitespace.
+  _WHITESPACE = b'\t\n\v\f\r '
+
+  _WHITESPACE_CHARACTERS = [
+      bytes([byte_value]) for byte_value in _WHITESPACE]
+
+  # The size of the encoded data that is read to determine the layout and
+  # per index entry.
+  _READ_SIZE = 64 * 1024
+
+  def __init__(self, file_object):
+    """Initializes an encoded data layout.
+
+    Args:
+      file_object (FileIO): file-like object that contains the encoded data.
+    """
+    super(EncodedDataLayout, self).__init__()
+    self._content_size = 0
+    self._file_object = file_object
+    self._index_character_indexes = []
+    self._index_offsets = []
+    self._line_length = None
+    self._line_size = None
+    self._uses_index = False
+    self.number_of_characters = 0
+
+  @property
+  def uses_index(self):
+    """bool: True if the layout is mapped by a sparse index of offsets."""
+    return self._uses_index
+
+  def _GetNumberOfSeparatorBytes(self, offset):
+    """Retrieves the number of line separator bytes that precede an offset.
+
+    Args:
+      offset (int): offset in the encoded data.
+
+    Returns:
+      int: number of line separator bytes.
+    """
+    number_of_lines, line_offset = divmod(offset, self._line_size)
+    separator_size = self._line_size - self._line_length
+    return (number_of_lines * separator_size) + max(
+        0, line_offset - self._line_length)
+
+  def _HasWhitespace(self, encoded_data):
+    """Determines if encoded data contains whitespace.
+
+    Args:
+      encoded_data (bytes): encoded data.
+
+    Returns:
+      bool: True if the encoded data contains whitespace.
+    """
+    # Searching for every whitespace character is faster than removing
+    # the whitespace characters with translate().
+    for whitespace_character in self._WHITESPACE_CHARACTERS:
+      if whitespace_character in encoded_data:
+        return True
+
+    return False
+
+  def _ReadAt(self, offset, size):
+    """Reads encoded data at a specific offset.
+
+    Args:
+      offset (int): offset in the encoded data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: encoded data.
+    """
+    self._file_object.seek(offset, os.SEEK_SET)
+    return self._file_object.read(size)
+
+  def BuildIndex(self):
+    """Builds the sparse index of offsets by scanning the encoded data."""
+    self._index_character_indexes = []
+    self._index_offsets = []
+    self._uses_index = True
+
+    character_index = 0
+    offset = 0
+
+    self._file_object.seek(0, os.SEEK_SET)
+    while offset < self._content_size:
+      read_size = min(self._READ_SIZE, self._content_size - offset)
+      encoded_data = self._file_object.read(read_size)
+      if not encoded_data:
+        break
+
+      self._index_character_indexes.append(character_index)
+      self._index_offsets.append(offset)
+
+      character_index += len(encoded_data.translate(None, self._WHITESPACE))
+      offset += len(encoded_data)
+
+    self.number_of_characters = character_index
+
+  def GetOffset(self, character_index):
+    """Retrieves the offset of an encoded character.
+
+    Args:
+      character_index (int): index of the encoded character.
+
+    Returns:
+      tuple[int, int]: offset in the encoded data and index of the encoded
+          character at that offset, which precedes the requested encoded
+          character if the layout is mapped by a sparse index of offsets.
+    """
+    if self._uses_index:
+      if not self._index_offsets:
+        return 0, 0
+
+      index_entry = bisect.bisect_right(
+          self._index_character_indexes, character_index) - 1
+      index_entry = max(index_entry, 0)
+      return (self._index_offsets[index_entry],
+              self._index_character_indexes[index_entry])
+
+    if self._line_length is None:
+      return character_index, character_index
+
+    number_of_lines, line_offset = divmod(character_index, self._line_length)
+    return (number_of_lines * self._line_size) + line_offset, character_index
+
+  def Open(self):
+    """Determines the layout from the start and the end of the encoded data."""
+    encoded_data_size = self._file_object.get_size()
+
+    read_size = min(self._READ_SIZE, encoded_data_size)
+    head_data = self._ReadAt(0, read_size)
+    tail_data = self._ReadAt(encoded_data_size - read_size, read_size)
+
+    stripped_tail_data = tail_data.rstrip(self._WHITESPACE)
+    self._content_size = encoded_data_size - (
+        len(tail_data) - len(stripped_tail_data))
+
+    self._line_length = None
+    self._line_size = None
+    self._uses_index = False
+
+    if not stripped_tail_data and encoded_data_size > read_size:
+      self.BuildIndex()
+      return
+
+    head_data = head_data[:self._content_size]
+    stripped_head_data = head_data.translate(None, self._WHITESPACE)
+    if len(stripped_head_data) < len(head_data):
+      if head_data[:1].isspace():
+        self.BuildIndex()
+        return
+
+      line_length = len(head_data.split(None, 1)[0])
+      remainder = head_data[line_length:]
+      separator_size = len(remainder) - len(remainder.lstrip(self._WHITESPACE))
+
+      self._line_length = line_length
+      self._line_size = line_length + separator_size
+
+    if self._line_length is None:
+      self.number_of_characters = self._content_size
+    else:
+      number_of_lines, line_offset = divmod(
+          self._content_size, self._line_size)
+      if not 0 < line_offset <= self._line_length:
+        self.BuildIndex()
+        return
+
+      self.number_of_characters = (
+          number_of_lines * self._line_length) + line_offset
+
+    tail_offset = encoded_data_size - len(tail_data)
+    if (not self.VerifyData(0, head_data) or
+        not self.VerifyData(tail_offset, tail_data)):
+      self.BuildIndex()
+
+  def RemoveWhitespace(self, encoded_data):
+    """Removes whitespace from encoded data.
+
+    Args:
+      encoded_data (bytes): encoded data.
+
+    Returns:
+      bytes: encoded characters.
+    """
+    if self._line_length is None and not self._uses_index:
+      if not self._HasWhitespace(encoded_data):
+        return encoded_data
+
+    return encoded_data.translate(None, self._WHITESPACE)
+
+  def VerifyData(self, offset, encoded_data):
+    """Verifies that encoded data matches the layout.
+
+    Args:
+      offset (int): offset of the encoded data.
+      encoded_data (bytes): encoded data.
+
+    Returns:
+      bool: True if the whitespace in the encoded data matches the layout.
+    """
+    if self._uses_index:
+      return True
+
+    encoded_data = encoded_data[:max(0, self._content_size - offset)]
+    if self._line_length is None:
+      return not self._HasWhitespace(encoded_data)
+
+    number_of_whitespace_bytes = len(encoded_data) - len(
+        encoded_data.translate(None, self._WHITESPACE))
+
+    end_offset = offset + len(encoded_data)
+    expected_number_of_whitespace_bytes = (
+        self._GetNumberOfSeparatorBytes(end_offset) -
+        self._GetNumberOfSeparatorBytes(offset))
+    if number_of_whitespace_bytes != expected_number_of_whitespace_bytes:
+      return False
+
+    for line_offset in range(self._line_length, self._line_size):
+      data_offset = (line_offset - offset) % self._line_size
+      separator_data = encoded_data[data_offset::self._line_size]
+      if separator_data.translate(None, self._WHITESPACE):
+        return False
+
+    return True
@@ -5,8 +5,11 @@
 # AttributeError: 'module' object has no attribute 'GzipFile'
 # when using pip.
 
+import bisect
 import collections
+import json
 import os
+import zlib
 
 from dtfabric.runtime import fabric as dtfabric_fabric
 
@@ -28,17 +31,29 @@ class _GzipDecompressorState(object):
 
   _MAXIMUM_READ_SIZE = 16 * 1024 * 1024
 
-  def __init__(self, stream_start):
+  def __init__(self, stream_start, checkpoint=None):
     """Initializes a gzip member decompressor wrapper.
 
     Args:
       stream_start (int): offset to the compressed stream within the containing
           file object.
+      checkpoint (Optional[GzipCheckpoint]): checkpoint to resume decompression
+          from, where None represents the start of the compressed stream.
     """
+    super(_GzipDecompressorState, self).__init__()
     self._compressed_data = b''
-    self._decompressor = zlib_decompressor.DeflateDecompressor()
-    self._last_read = stream_start
-    self.uncompressed_offset = 0
+
+    if not checkpoint:
+      self._decompressor = zlib_decompressor.DeflateDecompressor()
+      self._last_read = stream_start
+      self.uncompressed_offset = 0
+
+    else:
+      # Note that the decompressor of the checkpoint is copied so that
+      # the checkpoint can be reused.
+      self._decompressor = checkpoint.decompressor.Copy()
+      self._last_read = checkpoint.compressed_data_offset
+      self.uncompressed_offset = checkpoint.uncompressed_data_offset
 
   def Read(self, file_object):
     """Reads the next uncompressed data from the gzip stream.
@@ -75,6 +90,44 @@ class _GzipDecompressorState(object):
     return self._decompressor.unused_data
 
 
+class GzipCheckpoint(object):
+  """Gzip member checkpoint.
+
+  A checkpoint is a location in the compressed data of a gzip member from
+  which decompression can be resumed without decompressing the preceding data.
+
+  A checkpoint contains a copy of the decompressor, since Python's zlib module
+  does not expose the DEFLATE block boundaries and bit offsets needed to
+  resume decompression from a window of uncompressed data. Therefore
+  checkpoints are only kept in memory and are not stored in a gzip index.
+
+  Attributes:
+    compressed_data_offset (int): offset in the parent file object to resume
+        reading compressed data from.
+    decompressor (DeflateDecompressor): decompressor with the decompression
+        state at the checkpoint.
+    uncompressed_data_offset (int): offset of the uncompressed data at
+        the checkpoint relative to the start of the member.
+  """
+
+  def __init__(
+      self, compressed_data_offset, uncompressed_data_offset, decompressor):
+    """Initializes a gzip member checkpoint.
+
+    Args:
+      compressed_data_offset (int): offset in the parent file object to resume
+          reading compressed data from.
+      uncompressed_data_offset (int): offset of the uncompressed data at
+          the checkpoint relative to the start of the member.
+      decompressor (DeflateDecompressor): decompressor with the decompression
+          state at the checkpoint.
+    """
+    super(GzipCheckpoint, self).__init__()
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class GzipMember(data_format.DataFormat):
   """Gzip member.
 
@@ -129,8 +182,18 @@ class GzipMember(data_format.DataFormat):
   # The maximum size of the uncompressed data cache.
   _UNCOMPRESSED_DATA_CACHE_SIZE = 2 * 1024 * 1024
 
+  # The minimum size of the uncompressed data between checkpoints.
+  _CHECKPOINT_INTERVAL = 16 * 1024 * 1024
+
+  # The size of the compressed data decompressed at a time.
+  _DECOMPRESSION_SEGMENT_SIZE = 1024 * 1024
+
+  # The maximum size of the compressed data read at a time.
+  _MAXIMUM_READ_SIZE = 16 * 1024 * 1024
+
   def __init__(
-      self, file_object, member_start_offset, uncompressed_data_offset):
+      self, file_object, member_start_offset, uncompressed_data_offset,
+      member_values=None):
     """Initializes a gzip member.
 
     Args:
@@ -140,67 +203,67 @@ class GzipMember(data_format.DataFormat):
       uncompressed_data_offset (int): offset of the start of the uncompressed
           data in this member relative to the whole gzip file's uncompressed
           data.
+      member_values (Optional[dict[str, object]]): values of the member, as
+          stored in a gzip index, which are used instead of reading
+          the member.
     """
+    super(GzipMember, self).__init__()
     self._cache = b''
     # End offset of the cached uncompressed data of the member.
     self._cache_end_offset = None
     # Start offset of the cached uncompressed data of the member.
     self._cache_start_offset = None
+    self._checkpoint_offsets = []
 
+    self.checkpoints = []
     self.comment = None
     self.modification_time = None
     self.operating_system = None
     self.original_filename = None
 
-    file_size = file_object.get_size()
-
-    file_object.seek(member_start_offset, os.SEEK_SET)
-    self._ReadMemberHeader(file_object)
+    if member_values:
+      compressed_data_offset = member_values['compressed_data_offset']
+      member_end_offset = member_values['member_end_offset']
+      uncompressed_data_size = member_values['uncompressed_data_size']
 
-    data_offset = 0
-    uncompressed_data_size = 0
+      self.comment = member_values.get('comment', None)
+      self.modification_time = member_values.get('modification_time', None)
+      self.operating_system = member_values.get('operating_system', None)
+      self.original_filename = member_values.get('original_filename', None)
 
-    compressed_data_offset = file_object.get_offset()
-    decompressor_state = _GzipDecompressorState(compressed_data_offset)
+    else:
+      file_object.seek(member_start_offset, os.SEEK_SET)
+      self._ReadMemberHeader(file_object)
 
-    # Read the member data to determine the uncompressed data size and
-    # the offset of the member footer.
-    file_offset = compressed_data_offset
-    while file_offset < file_size:
-      data_offset += uncompressed_data_size
+      compressed_data_offset = file_object.get_offset()
 
-      decompressed_data = decompressor_state.Read(file_object)
-      uncompressed_data_size += len(decompressed_data)
+      # Read the member data to determine the uncompressed data size and
+      # the offset of the member footer.
+      file_offset, uncompressed_data_size, uncompressed_data = (
+          self._ReadMemberData(file_object, compressed_data_offset))
 
-      # Note that unused data will be set when the decompressor reads beyond
-      # the end of the compressed data stream.
-      unused_data = decompressor_state.GetUnusedData()
-      if unused_data:
-        file_object.seek(-len(unused_data), os.SEEK_CUR)
+      # Do not read the the last member footer if it is missing, which is
+      # a common corruption scenario.
+      if file_offset < file_object.get_size():
+        self._ReadStructureFromFileObject(
+            file_object, file_offset, self._MEMBER_FOOTER)
         file_offset = file_object.get_offset()
-        break
 
-      file_offset = file_object.get_offset()
+      member_end_offset = file_offset
 
-    # Do not read the the last member footer if it is missing, which is
-    # a common corruption scenario.
-    if file_offset < file_size:
-      self._ReadStructureFromFileObject(
-          file_object, file_offset, self._MEMBER_FOOTER)
+      # Cache uncompressed data of gzip files that fit entirely in the cache.
+      if uncompressed_data is not None:
+        self._cache = uncompressed_data
+        self._cache_start_offset = 0
+        self._cache_end_offset = uncompressed_data_size
 
-    member_end_offset = file_object.get_offset()
+    self._checkpoint_offsets = [
+        checkpoint.uncompressed_data_offset for checkpoint in self.checkpoints]
 
     # Initialize the member with data.
     self._file_object = file_object
     self._file_object.seek(member_start_offset, os.SEEK_SET)
 
-    # Cache uncompressed data of gzip files that fit entirely in the cache.
-    if (data_offset == 0 and
-        uncompressed_data_size < self._UNCOMPRESSED_DATA_CACHE_SIZE):
-      self._cache = decompressed_data
-      self._cache_start_offset = 0
-      self._cache_end_offset = uncompressed_data_size
-
     # Offset to the beginning of the compressed data in the file object.
     self._compressed_data_start = compressed_data_offset
     self._decompressor_state = _GzipDecompressorState(compressed_data_offset)
@@ -229,6 +292,21 @@ class GzipMember(data_format.DataFormat):
 
     return self._cache_end_offset - self._cache_start_offset
 
+  def _GetCheckpointForOffset(self, offset):
+    """Retrieves the last checkpoint before an uncompressed offset.
+
+    Args:
+      offset (int): offset into this member's uncompressed data.
+
+    Returns:
+      GzipCheckpoint: checkpoint or None if not available.
+    """
+    checkpoint_index = bisect.bisect_right(self._checkpoint_offsets, offset)
+    if checkpoint_index == 0:
+      return None
+
+    return self.checkpoints[checkpoint_index - 1]
+
   def _IsCacheFull(self):
     """Checks whether the uncompressed data cache is full.
 
@@ -251,9 +329,13 @@ class GzipMember(data_format.DataFormat):
     # Decompression can only be performed from beginning to end of the stream.
     # So, if data before the current position of the decompressor in the stream
     # is required, it's necessary to throw away the current decompression
-    # state and start again.
-    if minimum_offset < self._decompressor_state.uncompressed_offset:
-      self._ResetDecompressorState()
+    # state and start again from the nearest checkpoint. The same applies when
+    # a checkpoint is closer to the required data than the decompressor.
+    checkpoint = self._GetCheckpointForOffset(minimum_offset)
+    if (minimum_offset < self._decompressor_state.uncompressed_offset or (
+        checkpoint and checkpoint.uncompressed_data_offset >
+        self._decompressor_state.uncompressed_offset)):
+      self._ResetDecompressorState(uncompressed_offset=minimum_offset)
 
     cache_is_full = self._IsCacheFull()
     while not cache_is_full:
@@ -345,10 +427,108 @@ class GzipMember(data_format.DataFormat):
     if member_header.flags & self._FLAG_FHCRC:
       file_object.read(2)
 
-  def _ResetDecompressorState(self):
-    """Resets the state of the internal decompression object."""
+  def _ReadMemberData(self, file_object, compressed_data_offset):
+    """Reads the compressed data of the member.
+
+    While reading the compressed data checkpoints are added at intervals of
+    uncompressed data.
+
+    Args:
+      file_object (FileIO): file-like object.
+      compressed_data_offset (int): offset of the compressed data of
+          the member in the file-like object.
+
+    Returns:
+      tuple[int, int, bytes]: offset of the end of the compressed data,
+          uncompressed data size and uncompressed data, where the uncompressed
+          data is None if it does not fit in the cache.
+    """
+    file_size = file_object.get_size()
+
+    decompressor = zlib_decompressor.DeflateDecompressor()
+    last_checkpoint_offset = 0
+    uncompressed_data_segments = []
+    uncompressed_data_size = 0
+
+    file_offset = compressed_data_offset
+    while file_offset < file_size:
+      file_object.seek(file_offset, os.SEEK_SET)
+      read_data = file_object.read(self._MAXIMUM_READ_SIZE)
+      if not read_data:
+        break
+
+      read_data_size = len(read_data)
+
+      # The compressed data is decompressed in segments, so that checkpoints
+      # can be added at intervals smaller than the read size.
+      for segment_start_offset in range(
+          0, read_data_size, self._DECOMPRESSION_SEGMENT_SIZE):
+        segment_end_offset = min(
+            segment_start_offset + self._DECOMPRESSION_SEGMENT_SIZE,
+            read_data_size)
+
+        decompressed_data, unused_data = decompressor.Decompress(
+            read_data[segment_start_offset:segment_end_offset])
+
+        uncompressed_data_size += len(decompressed_data)
+
+        if uncompressed_data_segments is not None:
+          uncompressed_data_segments.append(decompressed_data)
+          if uncompressed_data_size >= self._UNCOMPRESSED_DATA_CACHE_SIZE:
+            uncompressed_data_segments = None
+
+        # Note that unused data will be set when the decompressor reads beyond
+        # the end of the compressed data stream.
+        if unused_data:
+          file_offset += segment_end_offset - len(unused_data)
+          if uncompressed_data_segments is not None:
+            uncompressed_data_segments = b''.join(uncompressed_data_segments)
+          return file_offset, uncompressed_data_size, uncompressed_data_segments
+
+        if (uncompressed_data_size - last_checkpoint_offset >=
+            self._CHECKPOINT_INTERVAL):
+          checkpoint = GzipCheckpoint(
+              file_offset + segment_end_offset, uncompressed_data_size,
+              decompressor.Copy())
+          self.checkpoints.append(checkpoint)
+          last_checkpoint_offset = uncompressed_data_size
+
+      file_offset += read_data_size
+
+    if uncompressed_data_segments is not None:
+      uncompressed_data_segments = b''.join(uncompressed_data_segments)
+    return file_offset, uncompressed_data_size, uncompressed_data_segments
+
+  def _ResetDecompressorState(self, uncompressed_offset=0):
+    """Resets the state of the internal decompression object.
+
+    Args:
+      uncompressed_offset (Optional[int]): offset into this member's
+          uncompressed data, where the state is reset to the last checkpoint
+          before the offset.
+    """
+    checkpoint = self._GetCheckpointForOffset(uncompressed_offset)
     self._decompressor_state = _GzipDecompressorState(
-        self._compressed_data_start)
+        self._compressed_data_start, checkpoint=checkpoint)
+
+  def CopyToDict(self):
+    """Copies the member to a dictionary.
+
+    The checkpoints are not copied, since these depend on the decompressor.
+
+    Returns:
+      dict[str, object]: values of the member.
+    """
+    return {
+        'comment': self.comment,
+        'compressed_data_offset': self._compressed_data_start,
+        'member_end_offset': self.member_end_offset,
+        'member_start_offset': self.member_start_offset,
+        'modification_time': self.modification_time,
+        'operating_system': self.operating_system,
+        'original_filename': self.original_filename,
+        'uncompressed_data_offset': self.uncompressed_data_offset,
+        'uncompressed_data_size': self.uncompressed_data_size}
 
   def FlushCache(self):
     """Empties the cache that holds cached decompressed data."""
@@ -415,6 +595,13 @@ class GzipCompressedStream(object):
         in the gzip file.
   """
 
+  # The format version of the gzip index.
+  _INDEX_FORMAT_VERSION = 1
+
+  # The size of the data at the start and end of the file used to determine
+  # if a gzip index matches the file.
+  _INDEX_FINGERPRINT_DATA_SIZE = 4096
+
   def __init__(self):
     """Initializes a file-like object."""
     super(GzipCompressedStream, self).__init__()
@@ -459,17 +646,99 @@ class GzipCompressedStream(object):
 
     return None
 
-  def Open(self, file_object):
+  def _GetIndexFingerprint(self, file_object):
+    """Determines the fingerprint of a file-like object for a gzip index.
+
+    The fingerprint consists of the file size and a checksum of the data at
+    the start and end of the file, which includes the checksum and size of
+    the uncompressed data of the last member.
+
+    Args:
+      file_object (FileIO): file-like object that contains the gzip compressed
+          stream.
+
+    Returns:
+      tuple[int, int]: file size and checksum.
+    """
+    file_size = file_object.get_size()
+
+    file_object.seek(0, os.SEEK_SET)
+    checksum = zlib.crc32(file_object.read(self._INDEX_FINGERPRINT_DATA_SIZE))
+
+    data_offset = max(file_size - self._INDEX_FINGERPRINT_DATA_SIZE, 0)
+    file_object.seek(data_offset, os.SEEK_SET)
+    checksum = zlib.crc32(
+        file_object.read(self._INDEX_FINGERPRINT_DATA_SIZE), checksum)
+
+    return file_size, checksum
+
+  def _ReadIndex(self, file_object, index_path):
+    """Reads the members from a gzip index.
+
+    Args:
+      file_object (FileIO): file-like object that contains the gzip compressed
+          stream.
+      index_path (str): path of the gzip index file.
+
+    Returns:
+      bool: True if the members were read from the gzip index, False if
+          the gzip index does not exist, cannot be read or does not match
+          the file-like object.
+    """
+    try:
+      with open(index_path, 'r', encoding='utf-8') as index_file:
+        index_values = json.load(index_file)
+
+    except (IOError, OSError, ValueError):
+      return False
+
+    try:
+      if index_values.get('format_version', None) != (
+          self._INDEX_FORMAT_VERSION):
+        return False
+
+      file_size, checksum = self._GetIndexFingerprint(file_object)
+      if (index_values.get('file_size', None) != file_size or
+          index_values.get('checksum', None) != checksum):
+        return False
+
+      members_by_end_offset = collections.OrderedDict()
+      uncompressed_data_offset = 0
+
+      for member_values in index_values.get('members', []):
+        member = GzipMember(
+            file_object, member_values['member_start_offset'],
+            uncompressed_data_offset, member_values=member_values)
+        uncompressed_data_offset += member.uncompressed_data_size
+        members_by_end_offset[uncompressed_data_offset] = member
+
+    except (AttributeError, KeyError, TypeError, ValueError):
+      return False
+
+    self._members_by_end_offset = members_by_end_offset
+    self.uncompressed_data_size = uncompressed_data_offset
+
+    return True
+
+  def Open(self, file_object, index_path=None):
     """Opens the file-like object defined by path specification.
 
     Args:
       file_object (FileIO): file-like object that contains the gzip compressed
           stream.
+      index_path (Optional[str]): path of a gzip index file. The members are
+          read from the gzip index if it matches the file-like object,
+          otherwise the members are read from the file-like object and
+          the gzip index is (re)written.
 
     Raises:
       IOError: if the file-like object could not be opened.
       OSError: if the file-like object could not be opened.
     """
+    if index_path and self._ReadIndex(file_object, index_path):
+      self._file_object = file_object
+      return
+
     file_size = file_object.get_size()
 
     file_object.seek(0, os.SEEK_SET)
@@ -488,6 +757,52 @@ class GzipCompressedStream(object):
 
     self._file_object = file_object
 
+    if index_path:
+      try:
+        self.WriteIndex(index_path)
+      except (IOError, OSError):
+        # Note that the gzip index is an optimization, the gzip compressed
+        # stream can be read without it.
+        pass
+
+  def WriteIndex(self, index_path):
+    """Writes the members to a gzip index.
+
+    The gzip index is written to a temporary file first, which replaces
+    the gzip index file, so that concurrent readers never read a partially
+    written gzip index.
+
+    Args:
+      index_path (str): path of the gzip index file.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the gzip index
+          cannot be written.
+      OSError: if the file-like object has not been opened or the gzip index
+          cannot be written.
+    """
+    if not self._file_object:
+      raise IOError('Not opened.')
+
+    file_size, checksum = self._GetIndexFingerprint(self._file_object)
+
+    index_values = {
+        'checksum': checksum,
+        'file_size': file_size,
+        'format_version': self._INDEX_FORMAT_VERSION,
+        'members': [member.CopyToDict() for member in self.members]}
+
+    temporary_index_path = f'{index_path:s}.{os.getpid():d}.tmp'
+    try:
+      with open(temporary_index_path, 'w', encoding='utf-8') as index_file:
+        json.dump(index_values, index_file)
+
+      os.replace(temporary_index_path, index_path)
+
+    finally:
+      if os.path.exists(temporary_index_path):
+        os.remove(temporary_index_path)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -515,9 +830,11 @@ class GzipCompressedStream(object):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    data = b''
-    while ((size and len(data) < size) and
-           self._current_offset < self.uncompressed_data_size):
+    if size is None:
+      size = max(self.uncompressed_data_size - self._current_offset, 0)
+
+    data_segments = []
+    while size > 0 and self._current_offset < self.uncompressed_data_size:
       member = self._GetMemberForOffset(self._current_offset)
       member_offset = self._current_offset - member.uncompressed_data_offset
 
@@ -526,9 +843,10 @@ class GzipCompressedStream(object):
         break
 
       self._current_offset += len(data_read)
-      data = b''.join([data, data_read])
+      size -= len(data_read)
+      data_segments.append(data_read)
 
-    return data
+    return b''.join(data_segments)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
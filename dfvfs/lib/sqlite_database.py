@@ -4,13 +4,26 @@
 import os
 import sqlite3
 import tempfile
+import threading
 
 
 class SQLiteDatabaseFile(object):
-  """SQLite database file using a file-like object."""
+  """SQLite database file using a file-like object.
+
+  The database file object can be shared by multiple threads, access to the
+  connection is serialized.
+
+  Attributes:
+    SUPPORTS_BLOB_IO (bool): True if blobs can be read incrementally, which
+        requires sqlite3.Connection.blobopen() of Python 3.11 or later.
+  """
+
+  SUPPORTS_BLOB_IO = hasattr(sqlite3.Connection, 'blobopen')
 
   _COPY_BUFFER_SIZE = 65536
 
+  _ENCODING_QUERY = 'PRAGMA encoding'
+
   _HAS_COLUMN_QUERY = 'PRAGMA table_info("{0:s}")'
 
   _HAS_TABLE_QUERY = (
@@ -26,6 +39,9 @@ class SQLiteDatabaseFile(object):
     self._column_names_per_table = {}
     self._connection = None
     self._cursor = None
+    self._encoding = None
+    self._lock = threading.RLock()
+    self._number_of_rows_per_table = {}
     self._table_names = None
     self._temp_file_path = ''
 
@@ -36,10 +52,11 @@ class SQLiteDatabaseFile(object):
       IOError: if the close failed.
       OSError: if the close failed.
     """
-    if self._connection:
-      self._cursor = None
-      self._connection.close()
-      self._connection = None
+    with self._lock:
+      if self._connection:
+        self._cursor = None
+        self._connection.close()
+        self._connection = None
 
     # TODO: move this to a central temp file manager and have it track errors.
     # https://github.com/log2timeline/dfvfs/issues/92
@@ -50,6 +67,44 @@ class SQLiteDatabaseFile(object):
 
     self._temp_file_path = ''
 
+  def CloseBlob(self, blob):
+    """Closes a blob opened for incremental reading.
+
+    Args:
+      blob (sqlite3.Blob): blob.
+    """
+    with self._lock:
+      try:
+        blob.close()
+      except sqlite3.Error:
+        pass
+
+  def GetEncoding(self):
+    """Retrieves the text encoding of the database.
+
+    Returns:
+      str: text encoding, such as "UTF-8" or "UTF-16le".
+
+    Raises:
+      IOError: if the database file is not opened.
+      OSError: if the database file is not opened.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    if self._encoding is None:
+      with self._lock:
+        self._cursor.execute(self._ENCODING_QUERY)
+        row = self._cursor.fetchone()
+
+      encoding = row[0] if row else b''
+      if isinstance(encoding, bytes):
+        encoding = encoding.decode('utf-8')
+
+      self._encoding = encoding
+
+    return self._encoding
+
   def GetNumberOfRows(self, table_name):
     """Retrieves the number of rows in the table.
 
@@ -66,8 +121,13 @@ class SQLiteDatabaseFile(object):
     if not self._connection:
       raise IOError('Not opened.')
 
-    self._cursor.execute(self._NUMBER_OF_ROWS_QUERY.format(table_name))
-    row = self._cursor.fetchone()
+    number_of_rows = self._number_of_rows_per_table.get(table_name, None)
+    if number_of_rows is not None:
+      return number_of_rows
+
+    with self._lock:
+      self._cursor.execute(self._NUMBER_OF_ROWS_QUERY.format(table_name))
+      row = self._cursor.fetchone()
     if not row:
       raise IOError(
           f'Unable to retrieve number of rows of table: {table_name:s}')
@@ -81,6 +141,8 @@ class SQLiteDatabaseFile(object):
             f'Unable to determine number of rows of table: {table_name:s} with '
             f'error: {exception!s}'))
 
+    self._number_of_rows_per_table[table_name] = number_of_rows
+
     return number_of_rows
 
   def HasColumn(self, table_name, column_name):
@@ -108,8 +170,11 @@ class SQLiteDatabaseFile(object):
     if column_names is None:
       column_names = []
 
-      self._cursor.execute(self._HAS_COLUMN_QUERY.format(table_name))
-      for row in self._cursor.fetchall():
+      with self._lock:
+        self._cursor.execute(self._HAS_COLUMN_QUERY.format(table_name))
+        rows = self._cursor.fetchall()
+
+      for row in rows:
         if not row[1]:
           continue
 
@@ -146,8 +211,11 @@ class SQLiteDatabaseFile(object):
     if self._table_names is None:
       self._table_names = []
 
-      self._cursor.execute(self._HAS_TABLE_QUERY)
-      for row in self._cursor.fetchall():
+      with self._lock:
+        self._cursor.execute(self._HAS_TABLE_QUERY)
+        rows = self._cursor.fetchall()
+
+      for row in rows:
         if not row[0]:
           continue
 
@@ -190,10 +258,68 @@ class SQLiteDatabaseFile(object):
         temp_file.write(data)
         data = file_object.read(self._COPY_BUFFER_SIZE)
 
-    self._connection = sqlite3.connect(self._temp_file_path)
+    # The connection is shared by the threads that use the database file
+    # object, which serializes access with a lock.
+    self._connection = sqlite3.connect(
+        self._temp_file_path, check_same_thread=False)
     self._connection.text_factory = bytes
     self._cursor = self._connection.cursor()
 
+  def OpenBlob(self, table_name, column_name, row_identifier):
+    """Opens a blob for incremental reading.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+      row_identifier (int): identifier of the row, as stored in the rowid
+          column.
+
+    Returns:
+      sqlite3.Blob: blob, which supports len() and slicing.
+
+    Raises:
+      IOError: if the database file is not opened, incremental blob I/O is
+          not supported or the blob cannot be opened.
+      OSError: if the database file is not opened, incremental blob I/O is
+          not supported or the blob cannot be opened.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    if not self.SUPPORTS_BLOB_IO:
+      raise IOError('Incremental blob I/O not supported.')
+
+    try:
+      with self._lock:
+        return self._connection.blobopen(
+            table_name, column_name, row_identifier, readonly=True)
+    except sqlite3.Error as exception:
+      raise IOError((
+          f'Unable to open blob in table: {table_name:s} and column: '
+          f'{column_name:s} for row identifier: {row_identifier:d} with '
+          f'error: {exception!s}'))
+
+  def ReadBlob(self, blob, offset, size):
+    """Reads data from a blob opened for incremental reading.
+
+    Args:
+      blob (sqlite3.Blob): blob.
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    with self._lock:
+      try:
+        return blob[offset:offset + size]
+      except sqlite3.Error as exception:
+        raise IOError(f'Unable to read blob with error: {exception!s}')
+
   def Query(self, query, parameters=None):
     """Queries the database file.
 
@@ -207,9 +333,10 @@ class SQLiteDatabaseFile(object):
     # TODO: catch Warning and return None.
     # Note that we cannot pass parameters as a keyword argument here.
     # A parameters value of None is not supported.
-    if parameters:
-      self._cursor.execute(query, parameters)
-    else:
-      self._cursor.execute(query)
+    with self._lock:
+      if parameters:
+        self._cursor.execute(query, parameters)
+      else:
+        self._cursor.execute(query)
 
-    return self._cursor.fetchall()
+      return self._cursor.fetchall()
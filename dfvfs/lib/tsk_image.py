@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Helper functions for SleuthKit (TSK) image support."""
 
-import os
 import pytsk3
 
 
@@ -49,8 +48,7 @@ class TSKFileSystemImage(pytsk3.Img_Info):
     Returns:
       bytes: data read.
     """
-    self._file_object.seek(offset, os.SEEK_SET)
-    return self._file_object.read(size)
+    return self._file_object.read_at(offset, size)
 
   def get_size(self):
     """Retrieves the size."""
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""XZ compressed stream file."""
+
+# Note: do not rename file to xz.py this can cause a conflict with the
+# xz module when using pip.
+
+import bisect
+import lzma
+import os
+
+from dtfabric.runtime import fabric as dtfabric_fabric
+
+from dfvfs.lib import data_format
+from dfvfs.lib import decompression_engine
+from dfvfs.lib import errors
+
+
+class XZBlock(object):
+  """XZ compressed block.
+
+  Attributes:
+    compressed_data_offset (int): offset of the block, including the block
+        header, relative to the start of the compressed stream.
+    compressed_data_size (int): size of the block, including the block header,
+        padding and check.
+    uncompressed_data_offset (int): offset of the uncompressed data of
+        the block relative to the start of the uncompressed stream.
+    uncompressed_data_size (int): size of the uncompressed data of the block.
+  """
+
+  def __init__(
+      self, compressed_data_offset, compressed_data_size,
+      uncompressed_data_offset, uncompressed_data_size):
+    """Initializes a XZ compressed block.
+
+    Args:
+      compressed_data_offset (int): offset of the block, including the block
+          header, relative to the start of the compressed stream.
+      compressed_data_size (int): size of the block, including the block
+          header, padding and check.
+      uncompressed_data_offset (int): offset of the uncompressed data of
+          the block relative to the start of the uncompressed stream.
+      uncompressed_data_size (int): size of the uncompressed data of
+          the block.
+    """
+    super(XZBlock, self).__init__()
+    self.compressed_data_offset = compressed_data_offset
+    self.compressed_data_size = compressed_data_size
+    self.uncompressed_data_offset = uncompressed_data_offset
+    self.uncompressed_data_size = uncompressed_data_size
+
+
+class XZBlockIndex(data_format.DataFormat):
+  """Index of the blocks in a XZ compressed stream.
+
+  The XZ compressed stream format stores an index of the compressed and
+  uncompressed sizes of its blocks at the end of the stream. Since every block
+  can be decompressed independently, the index allows to determine the size of
+  the uncompressed data and to start decompression at the beginning of any
+  block, without decompressing the preceding data.
+
+  Attributes:
+    blocks (list[XZBlock]): blocks in the order they are stored in the stream.
+    compressed_data_size (int): size of the compressed data of the blocks,
+        including the stream header.
+    stream_header_data (bytes): stream header data.
+    uncompressed_data_size (int): size of the uncompressed data.
+  """
+
+  _DATA_TYPE_FABRIC_DEFINITION_FILE = os.path.join(
+      os.path.dirname(__file__), 'xzfile.yaml')
+
+  with open(_DATA_TYPE_FABRIC_DEFINITION_FILE, 'rb') as file_object:
+    _DATA_TYPE_FABRIC_DEFINITION = file_object.read()
+
+  _DATA_TYPE_FABRIC = dtfabric_fabric.DataTypeFabric(
+      yaml_definition=_DATA_TYPE_FABRIC_DEFINITION)
+
+  _STREAM_HEADER = _DATA_TYPE_FABRIC.CreateDataTypeMap('xz_stream_header')
+
+  _STREAM_HEADER_SIZE = _STREAM_HEADER.GetSizeHint()
+
+  _STREAM_FOOTER = _DATA_TYPE_FABRIC.CreateDataTypeMap('xz_stream_footer')
+
+  _STREAM_FOOTER_SIZE = _STREAM_FOOTER.GetSizeHint()
+
+  _STREAM_HEADER_SIGNATURE = b'\xfd7zXZ\x00'
+
+  _STREAM_FOOTER_SIGNATURE = b'YZ'
+
+  def __init__(self):
+    """Initializes a XZ block index."""
+    super(XZBlockIndex, self).__init__()
+    self._uncompressed_data_offsets = []
+    self.blocks = []
+    self.compressed_data_size = 0
+    self.stream_header_data = None
+    self.uncompressed_data_size = 0
+
+  def _ReadVariableSizeInteger(self, data, data_offset):
+    """Reads a variable-size integer.
+
+    Args:
+      data (bytes): data.
+      data_offset (int): offset of the variable-size integer in the data.
+
+    Returns:
+      tuple[int, int]: value of the integer and offset of the data following
+          the integer.
+
+    Raises:
+      FileFormatError: if the variable-size integer cannot be read.
+    """
+    data_size = len(data)
+    value = 0
+    for byte_index in range(9):
+      if data_offset >= data_size:
+        break
+
+      byte_value = data[data_offset]
+      data_offset += 1
+
+      value |= (byte_value & 0x7f) << (byte_index * 7)
+      if byte_value & 0x80 == 0:
+        return value, data_offset
+
+    raise errors.FileFormatError('Unsupported variable-size integer.')
+
+  def CreateDecompressionEngine(
+      self, file_object, maximum_number_of_workers=1):
+    """Creates an engine to decompress the blocks.
+
+    Args:
+      file_object (FileIO): file-like object that contains the XZ compressed
+          stream.
+      maximum_number_of_workers (Optional[int]): maximum number of threads
+          that decompress blocks, where 1 represents that blocks are only
+          decompressed by the thread that requests them.
+
+    Returns:
+      BlockDecompressionEngine: block decompression engine.
+    """
+    def _ReadBlock(block_number):
+      return self.ReadCompressedBlock(file_object, self.blocks[block_number])
+
+    def _DecompressBlock(block_number, compressed_data):
+      return self.DecompressBlock(self.blocks[block_number], compressed_data)
+
+    return decompression_engine.BlockDecompressionEngine(
+        len(self.blocks), _ReadBlock, _DecompressBlock,
+        maximum_number_of_workers=maximum_number_of_workers)
+
+  def DecompressBlock(self, block, compressed_data):
+    """Decompresses a block.
+
+    Args:
+      block (XZBlock): block.
+      compressed_data (bytes): compressed data of the block, preceded by
+          the stream header, as returned by ReadCompressedBlock.
+
+    Returns:
+      bytes: uncompressed data of the block.
+
+    Raises:
+      BackEndError: if the block cannot be decompressed.
+    """
+    # Note that lzma.FORMAT_XZ does not work for every implementation of lzma.
+    lzma_decompressor = lzma.LZMADecompressor(1)
+
+    try:
+      uncompressed_data = lzma_decompressor.decompress(compressed_data)
+    except (EOFError, IOError, lzma.LZMAError) as exception:
+      raise errors.BackEndError((
+          f'Unable to decompress XZ block at offset: '
+          f'{block.compressed_data_offset:d} with error: {exception!s}.'))
+
+    if len(uncompressed_data) != block.uncompressed_data_size:
+      raise errors.BackEndError((
+          f'Unable to decompress XZ block at offset: '
+          f'{block.compressed_data_offset:d} with error: mismatch in '
+          f'uncompressed data size.'))
+
+    return uncompressed_data
+
+  def GetBlockIndexForOffset(self, offset):
+    """Retrieves the index of the block that contains an uncompressed offset.
+
+    Args:
+      offset (int): offset in the uncompressed data.
+
+    Returns:
+      int: index of the block in blocks or None if not available.
+    """
+    if offset < 0 or offset >= self.uncompressed_data_size:
+      return None
+
+    return bisect.bisect_right(self._uncompressed_data_offsets, offset) - 1
+
+  def Read(self, file_object):
+    """Reads the block index from the end of the compressed stream.
+
+    Only a single stream is supported, without stream padding.
+
+    Args:
+      file_object (FileIO): file-like object that contains the XZ compressed
+          stream.
+
+    Raises:
+      FileFormatError: if the block index cannot be read or is not supported.
+    """
+    file_size = file_object.get_size()
+    if file_size < self._STREAM_HEADER_SIZE + self._STREAM_FOOTER_SIZE:
+      raise errors.FileFormatError('File too small.')
+
+    stream_header_data = self._ReadData(
+        file_object, 0, self._STREAM_HEADER_SIZE)
+    stream_header = self._STREAM_HEADER.MapByteStream(stream_header_data)
+    if stream_header.signature != self._STREAM_HEADER_SIGNATURE:
+      raise errors.FileFormatError('Unsupported stream header signature.')
+
+    stream_footer_offset = file_size - self._STREAM_FOOTER_SIZE
+    stream_footer, _ = self._ReadStructureFromFileObject(
+        file_object, stream_footer_offset, self._STREAM_FOOTER)
+    if stream_footer.signature != self._STREAM_FOOTER_SIGNATURE:
+      raise errors.FileFormatError('Unsupported stream footer signature.')
+
+    index_size = (stream_footer.backward_size + 1) * 4
+    index_offset = stream_footer_offset - index_size
+    if index_offset < self._STREAM_HEADER_SIZE:
+      raise errors.FileFormatError(f'Invalid index size: {index_size:d}.')
+
+    index_data = self._ReadData(file_object, index_offset, index_size)
+    if index_data[0] != 0:
+      raise errors.FileFormatError('Unsupported index indicator.')
+
+    number_of_records, data_offset = self._ReadVariableSizeInteger(
+        index_data, 1)
+
+    blocks = []
+    compressed_data_offset = self._STREAM_HEADER_SIZE
+    uncompressed_data_offset = 0
+
+    for _ in range(number_of_records):
+      unpadded_size, data_offset = self._ReadVariableSizeInteger(
+          index_data, data_offset)
+      uncompressed_size, data_offset = self._ReadVariableSizeInteger(
+          index_data, data_offset)
+
+      # The compressed data of a block is padded to a multiple of 4 bytes.
+      compressed_data_size = (unpadded_size + 3) & ~3
+
+      blocks.append(XZBlock(
+          compressed_data_offset, compressed_data_size,
+          uncompressed_data_offset, uncompressed_size))
+
+      compressed_data_offset += compressed_data_size
+      uncompressed_data_offset += uncompressed_size
+
+    # If the blocks do not end at the index the file contains multiple streams
+    # or stream padding.
+    if compressed_data_offset != index_offset:
+      raise errors.FileFormatError('Unsupported multiple streams.')
+
+    self._uncompressed_data_offsets = [
+        block.uncompressed_data_offset for block in blocks]
+    self.blocks = blocks
+    self.compressed_data_size = compressed_data_offset
+    self.stream_header_data = stream_header_data
+    self.uncompressed_data_size = uncompressed_data_offset
+
+  def ReadCompressedBlock(self, file_object, block):
+    """Reads the compressed data of a block.
+
+    The block is decompressed independently of the rest of the stream by
+    preceding it with the stream header.
+
+    Args:
+      file_object (FileIO): file-like object that contains the XZ compressed
+          stream.
+      block (XZBlock): block.
+
+    Returns:
+      bytes: compressed data of the block, preceded by the stream header.
+
+    Raises:
+      BackEndError: if the block cannot be read.
+    """
+    file_object.seek(block.compressed_data_offset, os.SEEK_SET)
+    compressed_data = file_object.read(block.compressed_data_size)
+    if len(compressed_data) != block.compressed_data_size:
+      raise errors.BackEndError((
+          f'Unable to read XZ block at offset: '
+          f'{block.compressed_data_offset:d}.'))
+
+    return b''.join([self.stream_header_data, compressed_data])
@@ -1,38 +1,88 @@
 # -*- coding: utf-8 -*-
-"""Imports for path specification factory."""
+"""Imports for path specification factory.
 
-from dfvfs.path import apfs_container_path_spec
-from dfvfs.path import apfs_path_spec
-from dfvfs.path import apm_path_spec
-from dfvfs.path import bde_path_spec
-from dfvfs.path import compressed_stream_path_spec
-from dfvfs.path import cpio_path_spec
-from dfvfs.path import cs_path_spec
-from dfvfs.path import data_range_path_spec
-from dfvfs.path import encoded_stream_path_spec
-from dfvfs.path import encrypted_stream_path_spec
-from dfvfs.path import ewf_path_spec
-from dfvfs.path import ext_path_spec
-from dfvfs.path import fake_path_spec
-from dfvfs.path import fat_path_spec
-from dfvfs.path import gpt_path_spec
-from dfvfs.path import gzip_path_spec
-from dfvfs.path import hfs_path_spec
-from dfvfs.path import lvm_path_spec
-from dfvfs.path import modi_path_spec
-from dfvfs.path import mount_path_spec
-from dfvfs.path import ntfs_path_spec
-from dfvfs.path import os_path_spec
+The path specification types are registered by type indicator and their
+modules are only imported when a path specification of the type is first
+created.
+"""
+
+from dfvfs.lib import definitions
+from dfvfs.path import factory
 from dfvfs.path import path_spec
-from dfvfs.path import phdi_path_spec
-from dfvfs.path import qcow_path_spec
-from dfvfs.path import raw_path_spec
-from dfvfs.path import sqlite_blob_path_spec
-from dfvfs.path import tar_path_spec
-from dfvfs.path import tsk_path_spec
-from dfvfs.path import tsk_partition_path_spec
-from dfvfs.path import vhdi_path_spec
-from dfvfs.path import vmdk_path_spec
-from dfvfs.path import vshadow_path_spec
-from dfvfs.path import xfs_path_spec
-from dfvfs.path import zip_path_spec
+
+
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_APFS_CONTAINER,
+    'dfvfs.path.apfs_container_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_APFS, 'dfvfs.path.apfs_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_APM, 'dfvfs.path.apm_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_BDE, 'dfvfs.path.bde_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_COMPRESSED_STREAM,
+    'dfvfs.path.compressed_stream_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_CPIO, 'dfvfs.path.cpio_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_CS, 'dfvfs.path.cs_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_DATA_RANGE, 'dfvfs.path.data_range_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_ENCODED_STREAM,
+    'dfvfs.path.encoded_stream_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_ENCRYPTED_STREAM,
+    'dfvfs.path.encrypted_stream_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_EWF, 'dfvfs.path.ewf_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_EXT, 'dfvfs.path.ext_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_FAKE, 'dfvfs.path.fake_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_FAT, 'dfvfs.path.fat_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_GPT, 'dfvfs.path.gpt_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_GZIP, 'dfvfs.path.gzip_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_HFS, 'dfvfs.path.hfs_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_LUKSDE, 'dfvfs.path.luksde_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_LVM, 'dfvfs.path.lvm_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_MODI, 'dfvfs.path.modi_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_MOUNT, 'dfvfs.path.mount_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_NTFS, 'dfvfs.path.ntfs_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_OS, 'dfvfs.path.os_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_PHDI, 'dfvfs.path.phdi_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_QCOW, 'dfvfs.path.qcow_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_RAW, 'dfvfs.path.raw_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_SQLITE_BLOB, 'dfvfs.path.sqlite_blob_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_TAR, 'dfvfs.path.tar_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_TSK_PARTITION,
+    'dfvfs.path.tsk_partition_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_TSK, 'dfvfs.path.tsk_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_VHDI, 'dfvfs.path.vhdi_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_VMDK, 'dfvfs.path.vmdk_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_VSHADOW, 'dfvfs.path.vshadow_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_XFS, 'dfvfs.path.xfs_path_spec')
+factory.Factory.RegisterPathSpecModule(
+    definitions.TYPE_INDICATOR_ZIP, 'dfvfs.path.zip_path_spec')
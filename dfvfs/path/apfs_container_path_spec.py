@@ -14,6 +14,8 @@ class APFSContainerPathSpec(path_spec.PathSpec):
     volume_index (int): volume index.
   """
 
+  __slots__ = ('location', 'volume_index')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_APFS_CONTAINER
 
   def __init__(
@@ -37,9 +39,12 @@ class APFSContainerPathSpec(path_spec.PathSpec):
     self.location = location
     self.volume_index = volume_index
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.location is not None:
@@ -47,7 +52,7 @@ class APFSContainerPathSpec(path_spec.PathSpec):
     if self.volume_index is not None:
       string_parts.append(f'volume index: {self.volume_index:d}')
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(APFSContainerPathSpec)
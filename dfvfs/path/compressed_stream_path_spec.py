@@ -13,6 +13,8 @@ class CompressedStreamPathSpec(path_spec.PathSpec):
     compression_method (str): method used to the compress the data.
   """
 
+  __slots__ = ('compression_method', )
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_COMPRESSED_STREAM
 
   def __init__(self, compression_method=None, parent=None, **kwargs):
@@ -33,11 +35,13 @@ class CompressedStreamPathSpec(path_spec.PathSpec):
     super(CompressedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.compression_method = compression_method
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    return self._GetComparable(sub_comparable_string=(
-        f'compression_method: {self.compression_method:s}'))
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return f'compression_method: {self.compression_method:s}'
 
 
 factory.Factory.RegisterPathSpec(CompressedStreamPathSpec)
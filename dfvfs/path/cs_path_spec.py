@@ -17,6 +17,10 @@ class CSPathSpec(path_spec.PathSpec):
     volume_index (int): logical volume index.
   """
 
+  __slots__ = (
+      'encrypted_root_plist', 'location', 'password', 'recovery_password',
+      'volume_index')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_CS
 
   def __init__(
@@ -48,9 +52,12 @@ class CSPathSpec(path_spec.PathSpec):
     self.recovery_password = recovery_password
     self.volume_index = volume_index
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.encrypted_root_plist:
@@ -65,7 +72,7 @@ class CSPathSpec(path_spec.PathSpec):
     if self.volume_index is not None:
       string_parts.append(f'volume index: {self.volume_index:d}')
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 # Register the path specification with the factory.
@@ -14,6 +14,8 @@ class DataRangePathSpec(path_spec.PathSpec):
     range_size (int): size of the data range.
   """
 
+  __slots__ = ('range_offset', 'range_size')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_DATA_RANGE
 
   def __init__(self, parent=None, range_offset=None, range_size=None, **kwargs):
@@ -36,12 +38,15 @@ class DataRangePathSpec(path_spec.PathSpec):
     self.range_offset = range_offset
     self.range_size = range_size
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    return self._GetComparable(sub_comparable_string=(
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return (
         f'range_offset: 0x{self.range_offset:08x}, range_size: '
-        f'0x{self.range_size:08x}'))
+        f'0x{self.range_size:08x}')
 
 
 factory.Factory.RegisterPathSpec(DataRangePathSpec)
@@ -13,6 +13,8 @@ class EncodedStreamPathSpec(path_spec.PathSpec):
     encoding_method (str): method used to the encode the data.
   """
 
+  __slots__ = ('encoding_method', )
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_ENCODED_STREAM
 
   def __init__(self, encoding_method=None, parent=None, **kwargs):
@@ -33,11 +35,13 @@ class EncodedStreamPathSpec(path_spec.PathSpec):
     super(EncodedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.encoding_method = encoding_method
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    return self._GetComparable(sub_comparable_string=(
-        f'encoding_method: {self.encoding_method:s}'))
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return f'encoding_method: {self.encoding_method:s}'
 
 
 factory.Factory.RegisterPathSpec(EncodedStreamPathSpec)
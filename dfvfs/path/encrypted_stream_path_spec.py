@@ -18,6 +18,9 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
     key (bytes): key.
   """
 
+  __slots__ = (
+      'cipher_mode', 'encryption_method', 'initialization_vector', 'key')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_ENCRYPTED_STREAM
 
   def __init__(
@@ -46,9 +49,12 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
     self.initialization_vector = initialization_vector
     self.key = key
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.cipher_mode:
@@ -67,7 +73,7 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
       key = key.decode('ascii')
       string_parts.append(f'key: {key:s}')
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(EncryptedStreamPathSpec)
@@ -14,6 +14,8 @@ class EXTPathSpec(path_spec.PathSpec):
     location (str): location.
   """
 
+  __slots__ = ('inode', 'location')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_EXT
 
   def __init__(
@@ -37,9 +39,12 @@ class EXTPathSpec(path_spec.PathSpec):
     self.inode = inode
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.inode is not None:
@@ -47,7 +52,7 @@ class EXTPathSpec(path_spec.PathSpec):
     if self.location is not None:
       string_parts.append(f'location: {self.location:s}')
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(EXTPathSpec)
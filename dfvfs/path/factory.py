@@ -1,6 +1,13 @@
 # -*- coding: utf-8 -*-
 """The path specification factory."""
 
+import importlib
+import threading
+
+
+# Serializes importing the deferred modules of path specification types.
+_IMPORT_LOCK = threading.RLock()
+
 
 class Factory(object):
   """Path specification factory."""
@@ -32,10 +39,36 @@ class Factory(object):
       'table_name',
       'volume_index'])
 
+  _path_spec_modules = {}
+
   _path_spec_types = {}
 
   _system_level_type_indicators = {}
 
+  @classmethod
+  def _ImportPathSpecModule(cls, type_indicator):
+    """Imports the deferred module of a path specification type.
+
+    Importing the module registers the path specification type. If the module
+    cannot be imported no path specification type is registered.
+
+    Args:
+      type_indicator (str): type indicator.
+    """
+    with _IMPORT_LOCK:
+      # Another thread could have imported the module while waiting on the lock.
+      if type_indicator in cls._path_spec_types:
+        return
+
+      module_name = cls._path_spec_modules.get(type_indicator, None)
+      if module_name:
+        try:
+          importlib.import_module(module_name)
+        except ImportError:
+          pass
+
+        cls._path_spec_modules.pop(type_indicator, None)
+
   @classmethod
   def DeregisterPathSpec(cls, path_spec_type):
     """Deregisters a path specification type.
@@ -70,9 +103,10 @@ class Factory(object):
     """
     properties = {}
 
-    for property_name in cls.PROPERTY_NAMES:
+    for property_name in path_spec.GetFieldNames():
       # Note that we do not want to set the properties when not used.
-      if hasattr(path_spec, property_name):
+      if (property_name in cls.PROPERTY_NAMES and
+          hasattr(path_spec, property_name)):
         properties[property_name] = getattr(path_spec, property_name)
 
     return properties
@@ -87,6 +121,9 @@ class Factory(object):
     Returns:
       bool: True if the type indicator is at system-level.
     """
+    if type_indicator in cls._path_spec_modules:
+      cls._ImportPathSpecModule(type_indicator)
+
     return type_indicator in cls._system_level_type_indicators
 
   @classmethod
@@ -103,6 +140,9 @@ class Factory(object):
     Raises:
       KeyError: if path specification is not registered.
     """
+    if type_indicator not in cls._path_spec_types:
+      cls._ImportPathSpecModule(type_indicator)
+
     if type_indicator not in cls._path_spec_types:
       raise KeyError(f'Path specification type: {type_indicator:s} not set.')
 
@@ -130,6 +170,30 @@ class Factory(object):
           f'Path specification type: {type_indicator:s} already set.')
 
     cls._path_spec_types[type_indicator] = path_spec_type
+    cls._path_spec_modules.pop(type_indicator, None)
 
     if getattr(path_spec_type, '_IS_SYSTEM_LEVEL', False):
       cls._system_level_type_indicators[type_indicator] = path_spec_type
+
+  @classmethod
+  def RegisterPathSpecModule(cls, type_indicator, module_name):
+    """Registers a deferred module of a path specification type.
+
+    The module is imported, which registers its path specification type, when
+    a path specification of the type is first created.
+
+    Args:
+      type_indicator (str): type indicator.
+      module_name (str): name of the module that registers the path
+          specification type on import, such as "dfvfs.path.ntfs_path_spec".
+
+    Raises:
+      KeyError: if path specification type or module is already registered.
+    """
+    if (type_indicator in cls._path_spec_types or
+        type_indicator in cls._path_spec_modules):
+      raise KeyError((
+          f'Path specification type or module: {type_indicator:s} already '
+          f'set.'))
+
+    cls._path_spec_modules[type_indicator] = module_name
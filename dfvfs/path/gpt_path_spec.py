@@ -14,6 +14,8 @@ class GPTPathSpec(path_spec.PathSpec):
     location (str): location.
   """
 
+  __slots__ = ('entry_index', 'location')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_GPT
 
   def __init__(self, location=None, entry_index=None, parent=None, **kwargs):
@@ -36,9 +38,12 @@ class GPTPathSpec(path_spec.PathSpec):
     self.entry_index = entry_index
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.entry_index is not None:
@@ -46,7 +51,7 @@ class GPTPathSpec(path_spec.PathSpec):
     if self.location is not None:
       string_parts.append(f'location: {self.location:s}')
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(GPTPathSpec)
@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class GzipPathSpec(path_spec.PathSpec):
   """Gzip file path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_GZIP
 
   def __init__(self, parent=None, **kwargs):
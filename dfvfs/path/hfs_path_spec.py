@@ -16,6 +16,8 @@ class HFSPathSpec(path_spec.PathSpec):
     location (str): location.
   """
 
+  __slots__ = ('data_stream', 'identifier', 'location')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_HFS
 
   def __init__(
@@ -43,9 +45,12 @@ class HFSPathSpec(path_spec.PathSpec):
     self.identifier = identifier
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.data_stream:
@@ -55,7 +60,7 @@ class HFSPathSpec(path_spec.PathSpec):
     if self.location is not None:
       string_parts.append(f'location: {self.location:s}')
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(HFSPathSpec)
@@ -11,6 +11,8 @@ class LocationPathSpec(path_spec.PathSpec):
     location (str): location.
   """
 
+  __slots__ = ('location', )
+
   def __init__(self, location=None, parent=None, **kwargs):
     """Initializes a path specification.
 
@@ -27,8 +29,10 @@ class LocationPathSpec(path_spec.PathSpec):
     super(LocationPathSpec, self).__init__(parent=parent, **kwargs)
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    return self._GetComparable(sub_comparable_string=(
-        f'location: {self.location:s}'))
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return f'location: {self.location:s}'
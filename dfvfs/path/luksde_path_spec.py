@@ -13,6 +13,8 @@ class LUKSDEPathSpec(path_spec.PathSpec):
     password (str): password.
   """
 
+  __slots__ = ('password', )
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_LUKSDE
 
   def __init__(self, password=None, parent=None, **kwargs):
@@ -33,15 +35,18 @@ class LUKSDEPathSpec(path_spec.PathSpec):
     super(LUKSDEPathSpec, self).__init__(parent=parent, **kwargs)
     self.password = password
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     if self.password:
       string_parts.append(f'password: {self.password:s}')
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(LUKSDEPathSpec)
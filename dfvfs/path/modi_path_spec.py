@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class MODIPathSpec(path_spec.PathSpec):
   """Mac OS disk image path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_MODI
 
   def __init__(self, parent=None, **kwargs):
@@ -13,6 +13,8 @@ class MountPathSpec(path_spec.PathSpec):
     identifier (str): identifier of the mount point.
   """
 
+  __slots__ = ('identifier', )
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_MOUNT
 
   def __init__(self, identifier=None, **kwargs):
@@ -32,11 +34,13 @@ class MountPathSpec(path_spec.PathSpec):
     super(MountPathSpec, self).__init__(parent=None, **kwargs)
     self.identifier = identifier
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
-    return self._GetComparable(sub_comparable_string=(
-        f'identifier: {self.identifier:s}'))
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return f'identifier: {self.identifier:s}'
 
 
 factory.Factory.RegisterPathSpec(MountPathSpec)
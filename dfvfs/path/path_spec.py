@@ -7,14 +7,31 @@ from dfvfs.lib import definitions
 class PathSpec(object):
   """Path specification interface.
 
+  The comparable representation of a path specification is determined once
+  and cached, since it is used as the identifier of the path specification
+  in the resolver context caches. The cached comparable is reset when
+  an attribute of the path specification or the comparable of its parent
+  changes.
+
+  The fields of a path specification, which are used to copy it to
+  a dictionary, are its public attributes declared in __slots__.
+
   Attributes:
     parent (PathSpec): parent path specification.
   """
 
   # pylint: disable=missing-raises-doc
 
+  # Since a large number of path specifications can be kept in memory, their
+  # attributes are stored in slots instead of a per-instance dictionary. Derived
+  # path specification classes declare their attributes in __slots__ as well.
+  __slots__ = ('_comparable', '_parent_comparable', 'parent')
+
   _IS_SYSTEM_LEVEL = False
 
+  # The field names per path specification class.
+  _field_names_per_class = {}
+
   def __init__(self, parent=None, **kwargs):
     """Initializes a path specification.
 
@@ -32,6 +49,8 @@ class PathSpec(object):
       raise ValueError(f'Unused keyword arguments: {keyword_arguments:s}.')
 
     super(PathSpec, self).__init__()
+    self._comparable = None
+    self._parent_comparable = None
     self.parent = parent
 
     if not getattr(self, 'TYPE_INDICATOR', None):
@@ -45,6 +64,21 @@ class PathSpec(object):
     """Returns the hash of a path specification."""
     return hash(self.comparable)
 
+  def __setattr__(self, name, value):
+    """Sets an attribute and resets the cached comparable.
+
+    Args:
+      name (str): name of the attribute.
+      value (object): value of the attribute.
+    """
+    # Note that object.__setattr__ is used instead of super(), which is
+    # significantly slower, since this is called for every attribute of every
+    # path specification that is created.
+    object.__setattr__(self, name, value)
+
+    if name[0] != '_' and getattr(self, '_comparable', None) is not None:
+      object.__setattr__(self, '_comparable', None)
+
   def _GetComparable(self, sub_comparable_string=''):
     """Retrieves the comparable representation.
 
@@ -67,10 +101,26 @@ class PathSpec(object):
 
     return ''.join(string_parts)
 
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
+    return ''
+
   @property
   def comparable(self):
     """str: comparable representation of the path specification."""
-    return self._GetComparable()
+    parent_comparable = getattr(self.parent, 'comparable', '')
+
+    if (self._comparable is None or
+        parent_comparable is not self._parent_comparable):
+      self._comparable = self._GetComparable(
+          sub_comparable_string=self._GetSubComparableString())
+      self._parent_comparable = parent_comparable
+
+    return self._comparable
 
   @property
   def type_indicator(self):
@@ -85,7 +135,8 @@ class PathSpec(object):
       dict[str, object]: path specification attributes.
     """
     path_spec_dict = {}
-    for attribute_name, attribute_value in self.__dict__.items():
+    for attribute_name in self.GetFieldNames():
+      attribute_value = getattr(self, attribute_name, None)
       if attribute_value is None:
         continue
 
@@ -96,6 +147,40 @@ class PathSpec(object):
 
     return path_spec_dict
 
+  def GetFieldNames(self):
+    """Retrieves the names of the fields of the path specification.
+
+    The fields are the public attributes declared in __slots__ by the path
+    specification class and its base classes, followed by the public
+    attributes stored in the instance dictionary, which is only available if
+    a derived path specification class does not declare __slots__.
+
+    Returns:
+      list[str]: names of the fields, including parent.
+    """
+    path_spec_class = type(self)
+    field_names = self._field_names_per_class.get(path_spec_class, None)
+    if field_names is None:
+      field_names = []
+      for base_class in reversed(path_spec_class.__mro__):
+        slot_names = base_class.__dict__.get('__slots__', ())
+        if isinstance(slot_names, str):
+          slot_names = (slot_names, )
+
+        field_names.extend([
+            slot_name for slot_name in slot_names
+            if slot_name[0] != '_' and slot_name not in field_names])
+
+      self._field_names_per_class[path_spec_class] = field_names
+
+    instance_dict = getattr(self, '__dict__', None)
+    if not instance_dict:
+      return list(field_names)
+
+    return field_names + [
+        attribute_name for attribute_name in instance_dict
+        if attribute_name[0] != '_' and attribute_name not in field_names]
+
   def HasParent(self):
     """Determines if the path specification has a parent.
 
@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class PHDIPathSpec(path_spec.PathSpec):
   """PHDI image path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_PHDI
 
   def __init__(self, parent=None, **kwargs):
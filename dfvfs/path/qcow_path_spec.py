@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class QCOWPathSpec(path_spec.PathSpec):
   """QCOW image path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_QCOW
 
   def __init__(self, parent=None, **kwargs):
@@ -9,6 +9,8 @@ from dfvfs.path import path_spec
 class RawPathSpec(path_spec.PathSpec):
   """RAW storage media image path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_RAW
 
   def __init__(self, parent=None, **kwargs):
@@ -18,6 +18,8 @@ class SQLiteBlobPathSpec(path_spec.PathSpec):
     table_name (str): name of the table in which the blob is stored.
   """
 
+  __slots__ = ('column_name', 'row_condition', 'row_index', 'table_name')
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_SQLITE_BLOB
 
   def __init__(
@@ -57,9 +59,12 @@ class SQLiteBlobPathSpec(path_spec.PathSpec):
     self.row_index = row_index
     self.table_name = table_name
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _GetSubComparableString(self):
+    """Retrieves the sub comparable string.
+
+    Returns:
+      str: sub comparable string of the path specification.
+    """
     string_parts = []
 
     string_parts.append(f'table name: {self.table_name:s}')
@@ -73,7 +78,7 @@ class SQLiteBlobPathSpec(path_spec.PathSpec):
     if self.row_index is not None:
       string_parts.append(f'row index: {self.row_index:d}')
 
-    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+    return ', '.join(string_parts)
 
 
 factory.Factory.RegisterPathSpec(SQLiteBlobPathSpec)
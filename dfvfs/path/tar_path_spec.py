@@ -9,6 +9,8 @@ from dfvfs.path import location_path_spec
 class TARPathSpec(location_path_spec.LocationPathSpec):
   """TAR file path specification."""
 
+  __slots__ = ()
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_TAR
 
   def __init__(self, location=None, parent=None, **kwargs):
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""The resolver block cache object."""
+
+import collections
+import threading
+
+
+class BlockCache(object):
+  """Least recently used (LRU) cache of fixed-size blocks of data.
+
+  Blocks are identified by the comparable of the path specification of
+  the file-like object they were read from and their block number. The cache
+  is bound by the total size of the cached blocks, when it is full the least
+  recently used blocks are removed. The cache can be used by multiple threads.
+
+  Attributes:
+    block_size (int): size of a block.
+    hits (int): number of blocks that were retrieved from the cache.
+    maximum_size (int): maximum size of the cached blocks.
+    misses (int): number of blocks that were not in the cache.
+  """
+
+  _DEFAULT_BLOCK_SIZE = 64 * 1024
+
+  def __init__(self, maximum_size, block_size=_DEFAULT_BLOCK_SIZE):
+    """Initializes the block cache.
+
+    Args:
+      maximum_size (int): maximum size of the cached blocks.
+      block_size (Optional[int]): size of a block.
+
+    Raises:
+      ValueError: if the block size or maximum size is invalid.
+    """
+    if block_size <= 0:
+      raise ValueError(f'Invalid block size: {block_size:d}.')
+
+    if maximum_size < block_size:
+      raise ValueError(
+          f'Invalid maximum size: {maximum_size:d} smaller than block size.')
+
+    super(BlockCache, self).__init__()
+    self._blocks = collections.OrderedDict()
+    self._lock = threading.Lock()
+    self._size = 0
+    self.block_size = block_size
+    self.hits = 0
+    self.maximum_size = maximum_size
+    self.misses = 0
+
+  @property
+  def number_of_blocks(self):
+    """int: number of cached blocks."""
+    return len(self._blocks)
+
+  @property
+  def size(self):
+    """int: total size of the cached blocks."""
+    return self._size
+
+  def CacheBlock(self, identifier, block_number, data):
+    """Caches a block.
+
+    Args:
+      identifier (str): identifier of the file-like object, such as
+          the comparable of its path specification.
+      block_number (int): number of the block.
+      data (bytes): data of the block.
+    """
+    lookup_key = (identifier, block_number)
+
+    with self._lock:
+      cached_data = self._blocks.pop(lookup_key, None)
+      if cached_data is not None:
+        self._size -= len(cached_data)
+
+      self._blocks[lookup_key] = data
+      self._size += len(data)
+
+      while self._size > self.maximum_size:
+        _, removed_data = self._blocks.popitem(last=False)
+        self._size -= len(removed_data)
+
+  def Empty(self):
+    """Empties the cache."""
+    with self._lock:
+      self._blocks.clear()
+      self._size = 0
+
+  def GetBlock(self, identifier, block_number):
+    """Retrieves a block.
+
+    Args:
+      identifier (str): identifier of the file-like object, such as
+          the comparable of its path specification.
+      block_number (int): number of the block.
+
+    Returns:
+      bytes: data of the block or None if not cached.
+    """
+    lookup_key = (identifier, block_number)
+
+    with self._lock:
+      data = self._blocks.get(lookup_key, None)
+      if data is None:
+        self.misses += 1
+        return None
+
+      self._blocks.move_to_end(lookup_key)
+      self.hits += 1
+
+    return data
+
+  def GetStatistics(self):
+    """Retrieves the cache statistics.
+
+    Returns:
+      dict[str, int]: number of hits, misses, cached blocks and total size of
+          the cached blocks.
+    """
+    return {
+        'hits': self.hits,
+        'misses': self.misses,
+        'number_of_blocks': len(self._blocks),
+        'size': self._size}
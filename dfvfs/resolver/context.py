@@ -1,17 +1,87 @@
 # -*- coding: utf-8 -*-
 """The resolver context object."""
 
+import collections
 import weakref
 
+from dfvfs.lib import definitions
 from dfvfs.mount import manager as mount_manager
+from dfvfs.resolver import block_cache
 
 
 class Context(object):
-  """Resolver context."""
+  """Resolver context.
+
+  By default the resolver context only keeps (weak) references to file-like
+  and file system objects, which are removed when the objects are no longer
+  referenced elsewhere. The context can also keep (strong) references to
+  a maximum number of the most recently used file-like and file system objects,
+  so that these are not closed and reopened when they are used again.
+  """
+
+  # Type indicators of the file-like objects that use the block cache by
+  # default, which are the storage media image and data range layers.
+  _DEFAULT_BLOCK_CACHE_TYPE_INDICATORS = frozenset([
+      definitions.TYPE_INDICATOR_DATA_RANGE,
+      definitions.TYPE_INDICATOR_EWF,
+      definitions.TYPE_INDICATOR_MODI,
+      definitions.TYPE_INDICATOR_OS,
+      definitions.TYPE_INDICATOR_PHDI,
+      definitions.TYPE_INDICATOR_QCOW,
+      definitions.TYPE_INDICATOR_RAW,
+      definitions.TYPE_INDICATOR_TSK_PARTITION,
+      definitions.TYPE_INDICATOR_VHDI,
+      definitions.TYPE_INDICATOR_VMDK])
+
+  def __init__(
+      self, index_directory=None, maximum_number_of_decompression_workers=1,
+      maximum_number_of_file_objects=0, maximum_number_of_file_systems=0):
+    """Initializes the resolver context.
+
+    Args:
+      index_directory (Optional[str]): path of the directory to store
+          persistent indexes in, such as gzip indexes, where None represents
+          indexes are not stored.
+      maximum_number_of_decompression_workers (Optional[int]): maximum number
+          of threads that decompress the blocks of a compressed stream, where
+          1 represents that blocks are only decompressed by the thread that
+          reads them.
+      maximum_number_of_file_objects (Optional[int]): maximum number of most
+          recently used file-like objects to keep open, where 0 represents
+          file-like objects are only kept open while referenced elsewhere.
+      maximum_number_of_file_systems (Optional[int]): maximum number of most
+          recently used file system objects to keep open, where 0 represents
+          file system objects are only kept open while referenced elsewhere.
+
+    Raises:
+      ValueError: if the maximum number of decompression workers, file-like
+          or file system objects is invalid.
+    """
+    if maximum_number_of_decompression_workers < 1:
+      raise ValueError((
+          f'Invalid maximum number of decompression workers: '
+          f'{maximum_number_of_decompression_workers:d}.'))
+
+    if maximum_number_of_file_objects < 0:
+      raise ValueError((
+          f'Invalid maximum number of file objects: '
+          f'{maximum_number_of_file_objects:d}.'))
+
+    if maximum_number_of_file_systems < 0:
+      raise ValueError((
+          f'Invalid maximum number of file systems: '
+          f'{maximum_number_of_file_systems:d}.'))
 
-  def __init__(self):
-    """Initializes the resolver context."""
     super(Context, self).__init__()
+    self._block_cache = None
+    self._block_cache_type_indicators = frozenset()
+    self._file_object_references = collections.OrderedDict()
+    self._file_system_references = collections.OrderedDict()
+    self._index_directory = index_directory
+    self._maximum_number_of_decompression_workers = (
+        maximum_number_of_decompression_workers)
+    self._maximum_number_of_file_objects = maximum_number_of_file_objects
+    self._maximum_number_of_file_systems = maximum_number_of_file_systems
     # The WeakValueDictionary will maintain a (weak) reference to a VFS object
     # as long as the object is (strong) referrened by other objects. If an
     # object has no remaining (strong) references it is removed from the
@@ -20,6 +90,21 @@ class Context(object):
     self._file_system_cache = weakref.WeakValueDictionary()
     self._mount_points = {}
 
+  @property
+  def block_cache(self):
+    """BlockCache: block cache or None if not enabled."""
+    return self._block_cache
+
+  @property
+  def index_directory(self):
+    """str: path of the directory to store persistent indexes in or None."""
+    return self._index_directory
+
+  @property
+  def maximum_number_of_decompression_workers(self):
+    """int: maximum number of threads that decompress compressed blocks."""
+    return self._maximum_number_of_decompression_workers
+
   def _GetFileSystemCacheIdentifier(self, path_spec):
     """Determines the file system cache identifier for the path specification.
 
@@ -36,6 +121,31 @@ class Context(object):
 
     return ''.join(string_parts)
 
+  def _KeepReference(self, references, maximum_number_of_references,
+                     identifier, vfs_object):
+    """Keeps a (strong) reference to a most recently used VFS object.
+
+    Args:
+      references (collections.OrderedDict[str, object]): (strong) references
+          to the most recently used VFS objects, where the least recently used
+          VFS object is first.
+      maximum_number_of_references (int): maximum number of references to
+          keep.
+      identifier (str): identifier of the VFS object.
+      vfs_object (object): VFS object, such as a file-like or file system
+          object.
+    """
+    if not maximum_number_of_references:
+      return
+
+    references[identifier] = vfs_object
+    references.move_to_end(identifier)
+
+    # Removing the (strong) reference closes the VFS object if it is not
+    # referenced elsewhere.
+    while len(references) > maximum_number_of_references:
+      references.popitem(last=False)
+
   def DeregisterMountPoint(self, mount_point):
     """Deregisters a path specification mount point.
 
@@ -68,6 +178,10 @@ class Context(object):
 
     self._file_object_cache[identifier] = file_object
 
+    self._KeepReference(
+        self._file_object_references, self._maximum_number_of_file_objects,
+        identifier, file_object)
+
   def CacheFileSystem(self, path_spec, file_system):
     """Caches a file system object based on a path specification.
 
@@ -86,10 +200,79 @@ class Context(object):
 
     self._file_system_cache[identifier] = file_system
 
+    self._KeepReference(
+        self._file_system_references, self._maximum_number_of_file_systems,
+        identifier, file_system)
+
+  def DisableBlockCache(self):
+    """Disables the block cache.
+
+    Note that file-like objects that are already open keep using the block
+    cache they were opened with.
+    """
+    self._block_cache = None
+    self._block_cache_type_indicators = frozenset()
+
   def Empty(self):
     """Empties the caches."""
     self._file_object_cache.clear()
+    self._file_object_references.clear()
     self._file_system_cache.clear()
+    self._file_system_references.clear()
+
+    if self._block_cache:
+      self._block_cache.Empty()
+
+  def EnableBlockCache(
+      self, maximum_size, block_size=None, type_indicators=None):
+    """Enables the block cache.
+
+    The block cache is shared by the file-like objects opened with this
+    context, of which the type indicator of the path specification is in
+    type_indicators, and holds the data these file-like objects read from
+    their backend in fixed-size blocks.
+
+    Args:
+      maximum_size (int): maximum size of the cached blocks.
+      block_size (Optional[int]): size of a block, where None represents
+          the default block size.
+      type_indicators (Optional[list[str]]): type indicators of the file-like
+          objects that should use the block cache, where None represents
+          the storage media image and data range file-like objects.
+
+    Returns:
+      BlockCache: block cache.
+
+    Raises:
+      ValueError: if the block size or maximum size is invalid.
+    """
+    if block_size is None:
+      self._block_cache = block_cache.BlockCache(maximum_size)
+    else:
+      self._block_cache = block_cache.BlockCache(
+          maximum_size, block_size=block_size)
+
+    if type_indicators is None:
+      type_indicators = self._DEFAULT_BLOCK_CACHE_TYPE_INDICATORS
+
+    self._block_cache_type_indicators = frozenset(type_indicators)
+
+    return self._block_cache
+
+  def GetBlockCache(self, path_spec):
+    """Retrieves the block cache for a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      BlockCache: block cache or None if the block cache is not enabled for
+          the type indicator of the path specification.
+    """
+    if path_spec.type_indicator not in self._block_cache_type_indicators:
+      return None
+
+    return self._block_cache
 
   def GetFileObject(self, path_spec):
     """Retrieves a file-like object defined by path specification.
@@ -100,7 +283,15 @@ class Context(object):
     Returns:
       FileIO: a file-like object or None if not cached.
     """
-    return self._file_object_cache.get(path_spec.comparable, None)
+    identifier = path_spec.comparable
+
+    file_object = self._file_object_cache.get(identifier, None)
+    if file_object:
+      self._KeepReference(
+          self._file_object_references, self._maximum_number_of_file_objects,
+          identifier, file_object)
+
+    return file_object
 
   def GetFileSystem(self, path_spec):
     """Retrieves a file system object defined by path specification.
@@ -112,7 +303,14 @@ class Context(object):
       FileSystem: a file system object or None if not cached.
     """
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
-    return self._file_system_cache.get(identifier, None)
+
+    file_system = self._file_system_cache.get(identifier, None)
+    if file_system:
+      self._KeepReference(
+          self._file_system_references, self._maximum_number_of_file_systems,
+          identifier, file_system)
+
+    return file_system
 
   def GetMountPoint(self, mount_point):
     """Retrieves the path specification of a mount point.
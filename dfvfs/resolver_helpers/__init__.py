@@ -1,131 +1,112 @@
 # -*- coding: utf-8 -*-
-"""Imports for the path specification resolver."""
-
-try:
-  from dfvfs.resolver_helpers import apfs_container_resolver_helper
-  from dfvfs.resolver_helpers import apfs_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import apm_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import bde_resolver_helper
-except ImportError:
-  pass
-
-from dfvfs.resolver_helpers import compressed_stream_resolver_helper
-from dfvfs.resolver_helpers import cpio_resolver_helper
-
-try:
-  from dfvfs.resolver_helpers import cs_resolver_helper
-except ImportError:
-  pass
-
-from dfvfs.resolver_helpers import data_range_resolver_helper
-from dfvfs.resolver_helpers import encoded_stream_resolver_helper
-from dfvfs.resolver_helpers import encrypted_stream_resolver_helper
-
-try:
-  from dfvfs.resolver_helpers import ewf_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import ext_resolver_helper
-except ImportError:
-  pass
-
-from dfvfs.resolver_helpers import fake_resolver_helper
-
-try:
-  from dfvfs.resolver_helpers import fat_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import gpt_resolver_helper
-except ImportError:
-  pass
-
-from dfvfs.resolver_helpers import gzip_resolver_helper
-
-try:
-  from dfvfs.resolver_helpers import hfs_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import luksde_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import lvm_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import modi_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import ntfs_resolver_helper
-except ImportError:
-  pass
-
-from dfvfs.resolver_helpers import os_resolver_helper
-
-try:
-  from dfvfs.resolver_helpers import phdi_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import qcow_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import raw_resolver_helper
-except ImportError:
-  pass
-
-from dfvfs.resolver_helpers import sqlite_blob_resolver_helper
-from dfvfs.resolver_helpers import tar_resolver_helper
-
-try:
-  from dfvfs.resolver_helpers import tsk_partition_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import tsk_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import vhdi_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import vmdk_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import vshadow_resolver_helper
-except ImportError:
-  pass
-
-try:
-  from dfvfs.resolver_helpers import xfs_resolver_helper
-except ImportError:
-  pass
-
-from dfvfs.resolver_helpers import zip_resolver_helper
+"""Imports for the path specification resolver.
+
+The resolver helpers are registered by type indicator and their modules,
+including the back-ends they depend on, are only imported when a resolver
+helper is first used.
+"""
+
+from dfvfs.lib import definitions
+from dfvfs.resolver_helpers import manager
+
+
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_APFS_CONTAINER,
+    'dfvfs.resolver_helpers.apfs_container_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_APFS,
+    'dfvfs.resolver_helpers.apfs_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_APM,
+    'dfvfs.resolver_helpers.apm_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_BDE,
+    'dfvfs.resolver_helpers.bde_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_COMPRESSED_STREAM,
+    'dfvfs.resolver_helpers.compressed_stream_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_CPIO,
+    'dfvfs.resolver_helpers.cpio_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_CS, 'dfvfs.resolver_helpers.cs_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_DATA_RANGE,
+    'dfvfs.resolver_helpers.data_range_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_ENCODED_STREAM,
+    'dfvfs.resolver_helpers.encoded_stream_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_ENCRYPTED_STREAM,
+    'dfvfs.resolver_helpers.encrypted_stream_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_EWF,
+    'dfvfs.resolver_helpers.ewf_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_EXT,
+    'dfvfs.resolver_helpers.ext_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_FAKE,
+    'dfvfs.resolver_helpers.fake_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_FAT,
+    'dfvfs.resolver_helpers.fat_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_GPT,
+    'dfvfs.resolver_helpers.gpt_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_GZIP,
+    'dfvfs.resolver_helpers.gzip_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_HFS,
+    'dfvfs.resolver_helpers.hfs_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_LUKSDE,
+    'dfvfs.resolver_helpers.luksde_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_LVM,
+    'dfvfs.resolver_helpers.lvm_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_MODI,
+    'dfvfs.resolver_helpers.modi_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_NTFS,
+    'dfvfs.resolver_helpers.ntfs_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_OS, 'dfvfs.resolver_helpers.os_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_PHDI,
+    'dfvfs.resolver_helpers.phdi_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_QCOW,
+    'dfvfs.resolver_helpers.qcow_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_RAW,
+    'dfvfs.resolver_helpers.raw_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_SQLITE_BLOB,
+    'dfvfs.resolver_helpers.sqlite_blob_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_TAR,
+    'dfvfs.resolver_helpers.tar_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_TSK_PARTITION,
+    'dfvfs.resolver_helpers.tsk_partition_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_TSK,
+    'dfvfs.resolver_helpers.tsk_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_VHDI,
+    'dfvfs.resolver_helpers.vhdi_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_VMDK,
+    'dfvfs.resolver_helpers.vmdk_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_VSHADOW,
+    'dfvfs.resolver_helpers.vshadow_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_XFS,
+    'dfvfs.resolver_helpers.xfs_resolver_helper')
+manager.ResolverHelperManager.RegisterHelperModule(
+    definitions.TYPE_INDICATOR_ZIP,
+    'dfvfs.resolver_helpers.zip_resolver_helper')
@@ -23,7 +23,9 @@ class CompressedStreamResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       FileIO: file input/output (IO) object.
     """
-    return compressed_stream_io.CompressedStream(resolver_context, path_spec)
+    return compressed_stream_io.CompressedStream(
+        resolver_context, path_spec, maximum_number_of_workers=(
+            resolver_context.maximum_number_of_decompression_workers))
 
   def NewFileSystem(self, resolver_context, path_spec):
     """Creates a new file system object.
@@ -1,12 +1,46 @@
 # -*- coding: utf-8 -*-
 """The path specification resolver helper manager."""
 
+import importlib
+import threading
+
+
+# Serializes importing the deferred modules of resolver helpers.
+_IMPORT_LOCK = threading.RLock()
+
 
 class ResolverHelperManager(object):
   """Path specification resolver helper manager."""
 
+  _resolver_helper_modules = {}
+
   _resolver_helpers = {}
 
+  @classmethod
+  def _ImportHelperModule(cls, type_indicator):
+    """Imports the deferred module of a resolver helper.
+
+    Importing the module registers the resolver helper. If the module cannot
+    be imported, for example because the back-end it depends on is not
+    available, no resolver helper is registered.
+
+    Args:
+      type_indicator (str): type indicator.
+    """
+    with _IMPORT_LOCK:
+      # Another thread could have imported the module while waiting on the lock.
+      if type_indicator in cls._resolver_helpers:
+        return
+
+      module_name = cls._resolver_helper_modules.get(type_indicator, None)
+      if module_name:
+        try:
+          importlib.import_module(module_name)
+        except ImportError:
+          pass
+
+        cls._resolver_helper_modules.pop(type_indicator, None)
+
   @classmethod
   def DeregisterHelper(cls, resolver_helper):
     """Deregisters a path specification resolver helper.
@@ -39,6 +73,9 @@ class ResolverHelperManager(object):
       KeyError: if resolver helper is not set for the corresponding type
           indicator.
     """
+    if type_indicator not in cls._resolver_helpers:
+      cls._ImportHelperModule(type_indicator)
+
     if type_indicator not in cls._resolver_helpers:
       raise KeyError(
           f'Resolver helper not set for type indicator: {type_indicator:s}.')
@@ -62,3 +99,30 @@ class ResolverHelperManager(object):
           f'{resolver_helper.type_indicator!s}.'))
 
     cls._resolver_helpers[resolver_helper.type_indicator] = resolver_helper
+    cls._resolver_helper_modules.pop(resolver_helper.type_indicator, None)
+
+  @classmethod
+  def RegisterHelperModule(cls, type_indicator, module_name):
+    """Registers a deferred module of a path specification resolver helper.
+
+    The module is imported, which registers its resolver helper, when the
+    resolver helper is first retrieved. This prevents importing back-ends
+    that are never used.
+
+    Args:
+      type_indicator (str): type indicator.
+      module_name (str): name of the module that registers the resolver
+          helper on import, such as
+          "dfvfs.resolver_helpers.ntfs_resolver_helper".
+
+    Raises:
+      KeyError: if resolver helper object or module is already set for
+          the corresponding type indicator.
+    """
+    if (type_indicator in cls._resolver_helpers or
+        type_indicator in cls._resolver_helper_modules):
+      raise KeyError((
+          f'Resolver helper object or module already set for type indicator: '
+          f'{type_indicator!s}.'))
+
+    cls._resolver_helper_modules[type_indicator] = module_name
@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""The binary serializer object implementation."""
+
+import struct
+
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.path import path_spec
+from dfvfs.serializer import serializer
+
+
+class BinaryPathSpecSerializer(serializer.PathSpecSerializer):
+  """Binary path specification serializer object.
+
+  The binary serialized form consists of a signature and format version,
+  followed by a stream of records. Every path specification, including its
+  parents, is stored only once per serialized form, in a table of path
+  specifications, hence a path specification record only contains a reference
+  to its parent and its own properties. Strings, such as type indicators and
+  property names, are stored only once as well, in a table of strings.
+
+  The serialized form consists of:
+  * signature: b'DFPS'
+  * format version: uint8
+  * records, where every record starts with a record type: uint8, followed
+    by a reference: uint32
+    * path specification record, which adds a path specification to
+      the table of path specifications, and is also part of the result if
+      the record type is _RECORD_TYPE_RESULT_PATH_SPEC, where the reference
+      is that of the parent, 0 represents no parent and the other values
+      an index in the table of path specifications + 1, followed by:
+      * type indicator: string reference;
+      * number of properties: uint8;
+      * per property the name, as string reference, and a value.
+    * reference record, that adds a path specification from the table of
+      path specifications to the result, where the reference is an index in
+      the table of path specifications.
+
+  A string reference consists of a uint32, where 0 represents a new string
+  that is added to the table of strings and the other values an index in
+  the table of strings + 1. A new string is stored as a uint32 size followed
+  by the UTF-8 encoded string.
+
+  A value consists of a value type: uint8, followed by the value data.
+  """
+
+  _SIGNATURE = b'DFPS'
+
+  _FORMAT_VERSION = 1
+
+  _RECORD_TYPE_PATH_SPEC = 1
+  _RECORD_TYPE_RESULT_PATH_SPEC = 2
+  _RECORD_TYPE_REFERENCE = 3
+
+  _VALUE_TYPE_INTEGER = 1
+  _VALUE_TYPE_STRING = 2
+  _VALUE_TYPE_BYTES = 3
+  _VALUE_TYPE_TUPLE = 4
+
+  _HEADER = struct.Struct('<4sB')
+  _INT64 = struct.Struct('<q')
+  _INTEGER_VALUE = struct.Struct('<Bq')
+  _NEW_STRING = struct.Struct('<II')
+  _RECORD_HEADER = struct.Struct('<BI')
+  _UINT32 = struct.Struct('<I')
+  _UINT8 = struct.Struct('<B')
+
+  _PROPERTY_NAMES = sorted(path_spec_factory.Factory.PROPERTY_NAMES)
+
+  @classmethod
+  def _ReadString(cls, data, data_offset, strings):
+    """Reads a string reference.
+
+    Args:
+      data (bytes): serialized form.
+      data_offset (int): offset of the string reference.
+      strings (list[str]): table of strings, to which a new string is added.
+
+    Returns:
+      tuple[str, int]: string and offset of the data after the string.
+
+    Raises:
+      IndexError: if the string reference is out of bounds.
+      struct.error: if the data is truncated.
+      UnicodeDecodeError: if the string cannot be decoded.
+    """
+    string_reference = cls._UINT32.unpack_from(data, data_offset)[0]
+    data_offset += 4
+
+    if string_reference:
+      return strings[string_reference - 1], data_offset
+
+    string_size = cls._UINT32.unpack_from(data, data_offset)[0]
+    data_offset += 4
+
+    string_end_offset = data_offset + string_size
+    if string_end_offset > len(data):
+      raise struct.error('String data truncated.')
+
+    string = data[data_offset:string_end_offset].decode('utf-8')
+    strings.append(string)
+
+    return string, string_end_offset
+
+  @classmethod
+  def _ReadValue(cls, data, data_offset, strings):
+    """Reads a property value.
+
+    Args:
+      data (bytes): serialized form.
+      data_offset (int): offset of the value.
+      strings (list[str]): table of strings.
+
+    Returns:
+      tuple[object, int]: value and offset of the data after the value.
+
+    Raises:
+      IndexError: if a string reference is out of bounds.
+      ValueError: if the value type is not supported.
+      struct.error: if the data is truncated.
+      UnicodeDecodeError: if a string cannot be decoded.
+    """
+    value_type = data[data_offset]
+    data_offset += 1
+
+    if value_type == cls._VALUE_TYPE_STRING:
+      return cls._ReadString(data, data_offset, strings)
+
+    if value_type == cls._VALUE_TYPE_INTEGER:
+      value = cls._INT64.unpack_from(data, data_offset)[0]
+      return value, data_offset + 8
+
+    if value_type == cls._VALUE_TYPE_BYTES:
+      value_size = cls._UINT32.unpack_from(data, data_offset)[0]
+      data_offset += 4
+
+      value_end_offset = data_offset + value_size
+      if value_end_offset > len(data):
+        raise struct.error('Value data truncated.')
+
+      return data[data_offset:value_end_offset], value_end_offset
+
+    if value_type == cls._VALUE_TYPE_TUPLE:
+      number_of_values = data[data_offset]
+      data_offset += 1
+
+      values = []
+      for _ in range(number_of_values):
+        value, data_offset = cls._ReadValue(data, data_offset, strings)
+        values.append(value)
+
+      return tuple(values), data_offset
+
+    raise ValueError(f'Unsupported value type: {value_type:d}.')
+
+  @classmethod
+  def _WriteString(cls, string, strings, data_segments):
+    """Writes a string reference.
+
+    Args:
+      string (str): string.
+      strings (dict[str, int]): string references per string, to which a new
+          string is added.
+      data_segments (list[bytes]): data segments of the serialized form.
+    """
+    string_reference = strings.get(string, None)
+    if string_reference:
+      data_segments.append(cls._UINT32.pack(string_reference))
+      return
+
+    strings[string] = len(strings) + 1
+
+    encoded_string = string.encode('utf-8')
+    data_segments.extend([
+        cls._NEW_STRING.pack(0, len(encoded_string)), encoded_string])
+
+  @classmethod
+  def _WriteValue(cls, value, strings, data_segments):
+    """Writes a property value.
+
+    Args:
+      value (object): value.
+      strings (dict[str, int]): string references per string.
+      data_segments (list[bytes]): data segments of the serialized form.
+
+    Raises:
+      ValueError: if the value type is not supported.
+    """
+    if isinstance(value, str):
+      data_segments.append(cls._UINT8.pack(cls._VALUE_TYPE_STRING))
+      cls._WriteString(value, strings, data_segments)
+
+    elif isinstance(value, int) and not isinstance(value, bool):
+      data_segments.append(
+          cls._INTEGER_VALUE.pack(cls._VALUE_TYPE_INTEGER, value))
+
+    elif isinstance(value, bytes):
+      data_segments.extend([
+          cls._UINT8.pack(cls._VALUE_TYPE_BYTES), cls._UINT32.pack(len(value)),
+          value])
+
+    elif isinstance(value, (list, tuple)):
+      data_segments.extend([
+          cls._UINT8.pack(cls._VALUE_TYPE_TUPLE), cls._UINT8.pack(len(value))])
+      for tuple_value in value:
+        cls._WriteValue(tuple_value, strings, data_segments)
+
+    else:
+      value_type = type(value)
+      raise ValueError(f'Unsupported value type: {value_type!s}.')
+
+  @classmethod
+  def _WritePathSpec(
+      cls, path_spec_object, record_type, path_specs, strings, data_segments):
+    """Writes a path specification record and those of its parents.
+
+    Args:
+      path_spec_object (PathSpec): a path specification.
+      record_type (int): record type.
+      path_specs (dict[str, int]): path specification references per
+          comparable, to which the path specification and its parents are
+          added.
+      strings (dict[str, int]): string references per string.
+      data_segments (list[bytes]): data segments of the serialized form.
+
+    Raises:
+      ValueError: if a property value type is not supported.
+    """
+    parent_reference = 0
+    if path_spec_object.HasParent():
+      parent_path_spec = path_spec_object.parent
+      parent_reference = path_specs.get(parent_path_spec.comparable, None)
+      if parent_reference is None:
+        cls._WritePathSpec(
+            parent_path_spec, cls._RECORD_TYPE_PATH_SPEC, path_specs, strings,
+            data_segments)
+        parent_reference = len(path_specs)
+
+      else:
+        parent_reference += 1
+
+    path_specs[path_spec_object.comparable] = len(path_specs)
+
+    properties = []
+    for property_name in cls._PROPERTY_NAMES:
+      property_value = getattr(path_spec_object, property_name, None)
+      if property_value is not None:
+        properties.append((property_name, property_value))
+
+    data_segments.append(
+        cls._RECORD_HEADER.pack(record_type, parent_reference))
+    cls._WriteString(path_spec_object.type_indicator, strings, data_segments)
+
+    data_segments.append(cls._UINT8.pack(len(properties)))
+    for property_name, property_value in properties:
+      cls._WriteString(property_name, strings, data_segments)
+      cls._WriteValue(property_value, strings, data_segments)
+
+  @classmethod
+  def ReadSerialized(cls, serialized):  # pylint: disable=arguments-differ,arguments-renamed
+    """Reads a path specification from serialized form.
+
+    Args:
+      serialized (bytes): binary serialized path specification.
+
+    Returns:
+      PathSpec: a path specification.
+
+    Raises:
+      ValueError: if the serialized form is invalid or does not contain
+          exactly 1 path specification.
+    """
+    path_specs = list(cls.ReadSerializedBatch(serialized))
+    if len(path_specs) != 1:
+      raise ValueError((
+          f'Unsupported number of path specifications: {len(path_specs):d} '
+          f'in serialized form.'))
+
+    return path_specs[0]
+
+  @classmethod
+  def ReadSerializedBatch(cls, serialized):
+    """Reads path specifications from serialized form.
+
+    The path specifications are decoded while the records are read, hence
+    a path specification is returned before the remaining records are read.
+
+    Args:
+      serialized (bytes): binary serialized path specifications.
+
+    Yields:
+      PathSpec: a path specification.
+
+    Raises:
+      ValueError: if the serialized form is invalid.
+    """
+    try:
+      signature, format_version = cls._HEADER.unpack_from(serialized, 0)
+    except struct.error:
+      raise ValueError('Serialized form too small.')
+
+    if signature != cls._SIGNATURE:
+      raise ValueError('Unsupported serialized form signature.')
+
+    if format_version != cls._FORMAT_VERSION:
+      raise ValueError(
+          f'Unsupported serialized form format version: {format_version:d}.')
+
+    data_offset = cls._HEADER.size
+    data_size = len(serialized)
+
+    path_specs = []
+    strings = []
+
+    while data_offset < data_size:
+      try:
+        record_type, record_reference = cls._RECORD_HEADER.unpack_from(
+            serialized, data_offset)
+        data_offset += 5
+
+        if record_type == cls._RECORD_TYPE_REFERENCE:
+          path_spec_object = path_specs[record_reference]
+
+        elif record_type in (
+            cls._RECORD_TYPE_PATH_SPEC, cls._RECORD_TYPE_RESULT_PATH_SPEC):
+          type_indicator, data_offset = cls._ReadString(
+              serialized, data_offset, strings)
+
+          number_of_properties = serialized[data_offset]
+          data_offset += 1
+
+          kwargs = {}
+          if record_reference:
+            kwargs['parent'] = path_specs[record_reference - 1]
+
+          for _ in range(number_of_properties):
+            property_name, data_offset = cls._ReadString(
+                serialized, data_offset, strings)
+            kwargs[property_name], data_offset = cls._ReadValue(
+                serialized, data_offset, strings)
+
+          path_spec_object = path_spec_factory.Factory.NewPathSpec(
+              type_indicator, **kwargs)
+
+        else:
+          raise ValueError(f'Unsupported record type: {record_type:d}.')
+
+      except (IndexError, KeyError, TypeError, UnicodeDecodeError,
+              struct.error) as exception:
+        raise ValueError(
+            f'Unable to read serialized form with error: {exception!s}')
+
+      if record_type == cls._RECORD_TYPE_REFERENCE:
+        yield path_spec_object
+        continue
+
+      if type_indicator == definitions.TYPE_INDICATOR_OS:
+        # OSPathSpec() will change the location to an absolute path
+        # here we want to preserve the original location.
+        path_spec_object.location = kwargs.get('location', None)
+
+      path_specs.append(path_spec_object)
+
+      if record_type == cls._RECORD_TYPE_RESULT_PATH_SPEC:
+        yield path_spec_object
+
+  @classmethod
+  def WriteSerialized(cls, path_spec_object):  # pylint: disable=arguments-differ,arguments-renamed
+    """Writes a path specification to serialized form.
+
+    Args:
+      path_spec_object (PathSpec): a path specification.
+
+    Returns:
+      bytes: binary serialized path specification.
+
+    Raises:
+      TypeError: if not an instance of PathSpec.
+      ValueError: if a property value type is not supported.
+    """
+    return cls.WriteSerializedBatch([path_spec_object])
+
+  @classmethod
+  def WriteSerializedBatch(cls, path_specs):
+    """Writes path specifications to serialized form.
+
+    Path specifications and parents that are shared by the path
+    specifications are stored only once.
+
+    Args:
+      path_specs (iterable[PathSpec]): path specifications.
+
+    Returns:
+      bytes: binary serialized path specifications.
+
+    Raises:
+      TypeError: if not an instance of PathSpec.
+      ValueError: if a property value type is not supported.
+    """
+    data_segments = [cls._HEADER.pack(cls._SIGNATURE, cls._FORMAT_VERSION)]
+    path_spec_references = {}
+    strings = {}
+
+    for path_spec_object in path_specs:
+      if not isinstance(path_spec_object, path_spec.PathSpec):
+        raise TypeError('Unsupported path specification type.')
+
+      path_spec_reference = path_spec_references.get(
+          path_spec_object.comparable, None)
+      if path_spec_reference is not None:
+        data_segments.append(cls._RECORD_HEADER.pack(
+            cls._RECORD_TYPE_REFERENCE, path_spec_reference))
+      else:
+        cls._WritePathSpec(
+            path_spec_object, cls._RECORD_TYPE_RESULT_PATH_SPEC,
+            path_spec_references, strings, data_segments)
+
+    return b''.join(data_segments)
@@ -135,6 +135,44 @@ class APFSFileEntry(file_entry.FileEntry):
         yield APFSFileEntry(
             self._resolver_context, self._file_system, path_spec)
 
+  def _GetSubFileEntryByLocation(self, location, name):
+    """Retrieves a sub file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+      name (str): name of the sub file entry.
+
+    Returns:
+      APFSFileEntry: sub file entry or None if not available.
+
+    Raises:
+      BackEndError: if the sub file entry cannot be opened.
+    """
+    path_spec = apfs_path_spec.APFSPathSpec(
+        location=self._file_system.JoinPath([location, name]),
+        parent=self.path_spec.parent)
+
+    try:
+      fsapfs_sub_file_entry = self._file_system.GetAPFSFileEntryByPathSpec(
+          path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    if not fsapfs_sub_file_entry:
+      return None
+
+    # Use the same path specification as the directory entry, which contains
+    # the identifier and the name as stored in the file system.
+    sub_location = self._file_system.JoinPath([
+        location, fsapfs_sub_file_entry.name])
+    path_spec = apfs_path_spec.APFSPathSpec(
+        identifier=fsapfs_sub_file_entry.identifier, location=sub_location,
+        parent=self.path_spec.parent)
+
+    return APFSFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsapfs_file_entry=fsapfs_sub_file_entry)
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 """The APFS file system implementation."""
 
+from dfdatetime import apfs_time as dfdatetime_apfs_time
+
 from dfvfs.lib import apfs_helper
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import apfs_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import file_entry_stat
 from dfvfs.vfs import file_system
 from dfvfs.vfs import apfs_file_entry
 
@@ -15,6 +18,8 @@ class APFSFileSystem(file_system.FileSystem):
 
   ROOT_DIRECTORY_IDENTIFIER = 2
 
+  SUPPORTS_LOCATION_LOOKUP = True
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_APFS
 
   def __init__(self, resolver_context, path_spec):
@@ -35,6 +40,36 @@ class APFSFileSystem(file_system.FileSystem):
     """
     self._fsapfs_volume = None
 
+  def _GetFileEntryStat(self, fsapfs_file_entry, location):
+    """Retrieves a stat record of an APFS file entry.
+
+    Args:
+      fsapfs_file_entry (pyfsapfs.file_entry): APFS file entry.
+      location (str): location of the file entry or None if not available.
+
+    Returns:
+      FileEntryStat: stat record.
+    """
+    stat_record = file_entry_stat.FileEntryStat()
+    stat_record.access_time = dfdatetime_apfs_time.APFSTime(
+        timestamp=fsapfs_file_entry.get_access_time_as_integer())
+    stat_record.change_time = dfdatetime_apfs_time.APFSTime(
+        timestamp=fsapfs_file_entry.get_inode_change_time_as_integer())
+    stat_record.creation_time = dfdatetime_apfs_time.APFSTime(
+        timestamp=fsapfs_file_entry.get_creation_time_as_integer())
+    stat_record.inode_number = fsapfs_file_entry.identifier
+    stat_record.location = location
+    stat_record.modification_time = dfdatetime_apfs_time.APFSTime(
+        timestamp=fsapfs_file_entry.get_modification_time_as_integer())
+    stat_record.name = fsapfs_file_entry.name
+    stat_record.size = fsapfs_file_entry.size
+
+    # pylint: disable=protected-access
+    stat_record.type = apfs_file_entry.APFSFileEntry._ENTRY_TYPES.get(
+        fsapfs_file_entry.file_mode & 0xf000, None)
+
+    return stat_record
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -106,6 +141,59 @@ class APFSFileSystem(file_system.FileSystem):
 
     return fsapfs_file_entry is not None
 
+  def GetFileEntriesStat(self, path_spec):
+    """Retrieves stat records of the sub file entries of a directory.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Yields:
+      FileEntryStat: stat record of a sub file entry.
+
+    Raises:
+      BackEndError: if the directory cannot be opened.
+    """
+    try:
+      fsapfs_file_entry = self.GetAPFSFileEntryByPathSpec(path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    location_prefix = self._GetSubFileEntryLocationPrefix(path_spec)
+
+    for fsapfs_sub_file_entry in fsapfs_file_entry.sub_file_entries:
+      location = None
+      if location_prefix is not None:
+        location = ''.join([location_prefix, fsapfs_sub_file_entry.name])
+
+      yield self._GetFileEntryStat(fsapfs_sub_file_entry, location)
+
+  def GetFileEntriesStatByInodeRange(
+      self, first_inode_number, last_inode_number):
+    """Retrieves stat records of the file entries in a range of inodes.
+
+    The inode numbers of APFS are file entry identifiers. Identifiers that
+    are not in use are skipped. The locations of the file entries are not
+    available.
+
+    Args:
+      first_inode_number (int): number of the first inode in the range.
+      last_inode_number (int): number of the last inode in the range.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    last_inode_number = min(
+        last_inode_number, self._fsapfs_volume.next_file_entry_identifier - 1)
+
+    for identifier in range(first_inode_number, last_inode_number + 1):
+      try:
+        fsapfs_file_entry = self._fsapfs_volume.get_file_entry_by_identifier(
+            identifier)
+      except IOError:
+        continue
+
+      yield self._GetFileEntryStat(fsapfs_file_entry, None)
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
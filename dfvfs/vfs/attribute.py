@@ -37,6 +37,10 @@ class StatAttribute(object):
     type (str): file type, value derived from st_mode >> 12.
   """
 
+  __slots__ = (
+      'device_number', 'group_identifier', 'inode_number', 'mode',
+      'number_of_links', 'owner_identifier', 'size', 'type')
+
   TYPE_BLOCK_DEVICE = definitions.FILE_ENTRY_TYPE_BLOCK_DEVICE
   TYPE_CHARACTER_DEVICE = definitions.FILE_ENTRY_TYPE_CHARACTER_DEVICE
   TYPE_DEVICE = definitions.FILE_ENTRY_TYPE_DEVICE
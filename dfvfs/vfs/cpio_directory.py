@@ -20,27 +20,11 @@ class CPIODirectory(directory.Directory):
     location = getattr(self.path_spec, 'location', None)
 
     if location and location.startswith(self._file_system.PATH_SEPARATOR):
-      cpio_archive_file = self._file_system.GetCPIOArchiveFile()
-      sub_directories = set()
-      for cpio_archive_file_entry in cpio_archive_file.GetFileEntries(
-          path_prefix=location[1:]):
-
-        path = cpio_archive_file_entry.path
-        if not path or path == location:
-          continue
-
-        prefix, suffix = self._file_system.GetPathSegmentAndSuffix(
-            location[1:], path)
-
-        if not suffix:
-          path_spec_location = self._file_system.JoinPath([path])
-          yield cpio_path_spec.CPIOPathSpec(
-              location=path_spec_location, parent=self.path_spec.parent)
-
-        elif prefix not in sub_directories:
-          sub_directories.add(prefix)
-
-          # Include prefixes as virtual sub directories.
-          path_spec_location = self._file_system.JoinPath([prefix])
-          yield cpio_path_spec.CPIOPathSpec(
-              location=path_spec_location, parent=self.path_spec.parent)
+      directory_index = self._file_system.GetDirectoryIndex()
+
+      # Sometimes the CPIO archive file lacks directories, therefore
+      # the directory index contains virtual ones.
+      for path, _ in directory_index.GetSubPaths(location[1:]):
+        path_spec_location = self._file_system.JoinPath([path])
+        yield cpio_path_spec.CPIOPathSpec(
+            location=path_spec_location, parent=self.path_spec.parent)
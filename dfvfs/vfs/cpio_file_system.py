@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """The CPIO archive file system implementation."""
 
+import stat
+
+from dfvfs.lib import archive_index
 from dfvfs.lib import cpio
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
@@ -25,6 +28,7 @@ class CPIOFileSystem(file_system.FileSystem):
     """
     super(CPIOFileSystem, self).__init__(resolver_context, path_spec)
     self._cpio_archive_file = None
+    self._directory_index = None
     self._file_object = None
     self.encoding = encoding
 
@@ -36,6 +40,7 @@ class CPIOFileSystem(file_system.FileSystem):
     """
     self._cpio_archive_file.Close()
     self._cpio_archive_file = None
+    self._directory_index = None
     self._file_object = None
 
   def _Open(self, mode='rb'):
@@ -61,6 +66,16 @@ class CPIOFileSystem(file_system.FileSystem):
     cpio_archive_file = cpio.CPIOArchiveFile()
     cpio_archive_file.Open(file_object)
 
+    directory_index = archive_index.ArchiveDirectoryIndex(
+        path_separator=self.PATH_SEPARATOR)
+
+    for cpio_archive_file_entry in cpio_archive_file.GetFileEntries():
+      path = cpio_archive_file_entry.path
+      if path:
+        is_directory = stat.S_ISDIR(cpio_archive_file_entry.mode or 0)
+        directory_index.AddPath(path, is_directory=is_directory)
+
+    self._directory_index = directory_index
     self._file_object = file_object
     self._cpio_archive_file = cpio_archive_file
 
@@ -80,7 +95,7 @@ class CPIOFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    return self._cpio_archive_file.FileEntryExistsByPath(location[1:])
+    return self._directory_index.PathExists(location[1:])
 
   def GetCPIOArchiveFile(self):
     """Retrieves the CPIO archive file.
@@ -114,6 +129,15 @@ class CPIOFileSystem(file_system.FileSystem):
 
     return self._cpio_archive_file.GetFileEntryByPath(location[1:])
 
+  def GetDirectoryIndex(self):
+    """Retrieves the directory index.
+
+    Returns:
+      ArchiveDirectoryIndex: directory index, including virtual directories,
+          or None if not available.
+    """
+    return self._directory_index
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -137,7 +161,13 @@ class CPIOFileSystem(file_system.FileSystem):
     cpio_archive_file_entry = self._cpio_archive_file.GetFileEntryByPath(
         location[1:])
     if cpio_archive_file_entry is None:
-      return None
+      # Sometimes the CPIO archive file lacks directories, therefore
+      # the directory index contains virtual ones.
+      if not self._directory_index.DirectoryExists(location[1:]):
+        return None
+
+      return cpio_file_entry.CPIOFileEntry(
+          self._resolver_context, self, path_spec, is_virtual=True)
 
     return cpio_file_entry.CPIOFileEntry(
         self._resolver_context, self, path_spec,
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""The Virtual File System (VFS) directory cache."""
+
+import collections
+
+
+class CachedDirectory(object):
+  """Cached entries of a directory.
+
+  Attributes:
+    entries (list[tuple[str, PathSpec]]): names and path specifications of
+        the directory entries, in the order of the directory.
+  """
+
+  def __init__(self, entries):
+    """Initializes cached directory entries.
+
+    Args:
+      entries (list[tuple[str, PathSpec]]): names and path specifications of
+          the directory entries, in the order of the directory.
+    """
+    super(CachedDirectory, self).__init__()
+    self._path_specs_by_lower_case_name = {}
+    self._path_specs_by_name = {}
+    self.entries = entries
+
+    for name, path_spec in entries:
+      if name is None:
+        continue
+
+      # Note that the first entry is kept for names that are the same or only
+      # differ in case, like when the entries are enumerated.
+      self._path_specs_by_name.setdefault(name, path_spec)
+      self._path_specs_by_lower_case_name.setdefault(name.lower(), path_spec)
+
+  @property
+  def number_of_entries(self):
+    """int: number of directory entries."""
+    return len(self.entries)
+
+  def GetPathSpecByName(self, name, case_sensitive=True):
+    """Retrieves the path specification of a directory entry by name.
+
+    Args:
+      name (str): name of the directory entry.
+      case_sensitive (Optional[bool]): True if the name is case sensitive.
+
+    Returns:
+      PathSpec: path specification or None if there is no directory entry
+          with the name.
+    """
+    path_spec = self._path_specs_by_name.get(name, None)
+    if path_spec is None and not case_sensitive:
+      path_spec = self._path_specs_by_lower_case_name.get(name.lower(), None)
+
+    return path_spec
+
+
+class DirectoryCache(object):
+  """Least recently used (LRU) cache of directory entries.
+
+  Directories are identified by the comparable of their path specification.
+  The cache is bound by the total number of cached directory entries, when it
+  is full the entries of the least recently used directories are removed.
+
+  Attributes:
+    hits (int): number of directories that were retrieved from the cache.
+    maximum_number_of_entries (int): maximum number of cached directory
+        entries.
+    misses (int): number of directories that were not in the cache.
+  """
+
+  def __init__(self, maximum_number_of_entries):
+    """Initializes the directory cache.
+
+    Args:
+      maximum_number_of_entries (int): maximum number of cached directory
+          entries.
+
+    Raises:
+      ValueError: if the maximum number of entries is invalid.
+    """
+    if maximum_number_of_entries <= 0:
+      raise ValueError((
+          f'Invalid maximum number of entries: '
+          f'{maximum_number_of_entries:d}.'))
+
+    super(DirectoryCache, self).__init__()
+    self._directories = collections.OrderedDict()
+    self._number_of_entries = 0
+    self.hits = 0
+    self.maximum_number_of_entries = maximum_number_of_entries
+    self.misses = 0
+
+  @property
+  def number_of_directories(self):
+    """int: number of cached directories."""
+    return len(self._directories)
+
+  @property
+  def number_of_entries(self):
+    """int: total number of cached directory entries."""
+    return self._number_of_entries
+
+  def CacheDirectory(self, identifier, entries):
+    """Caches the entries of a directory.
+
+    Directories with more entries than the maximum number of entries are not
+    cached.
+
+    Args:
+      identifier (str): identifier of the directory, such as the comparable
+          of its path specification.
+      entries (list[tuple[str, PathSpec]]): names and path specifications of
+          the directory entries, in the order of the directory.
+
+    Returns:
+      CachedDirectory: cached directory entries or None if not cached.
+    """
+    cached_directory = self._directories.pop(identifier, None)
+    if cached_directory is not None:
+      self._number_of_entries -= cached_directory.number_of_entries
+
+    if len(entries) > self.maximum_number_of_entries:
+      return None
+
+    cached_directory = CachedDirectory(entries)
+
+    self._directories[identifier] = cached_directory
+    self._number_of_entries += cached_directory.number_of_entries
+
+    while self._number_of_entries > self.maximum_number_of_entries:
+      _, removed_directory = self._directories.popitem(last=False)
+      self._number_of_entries -= removed_directory.number_of_entries
+
+    return cached_directory
+
+  def Empty(self):
+    """Empties the cache."""
+    self._directories.clear()
+    self._number_of_entries = 0
+
+  def GetDirectory(self, identifier):
+    """Retrieves the cached entries of a directory.
+
+    Args:
+      identifier (str): identifier of the directory, such as the comparable
+          of its path specification.
+
+    Returns:
+      CachedDirectory: cached directory entries or None if not cached.
+    """
+    cached_directory = self._directories.get(identifier, None)
+    if cached_directory is None:
+      self.misses += 1
+      return None
+
+    self._directories.move_to_end(identifier)
+    self.hits += 1
+    return cached_directory
+
+  def GetStatistics(self):
+    """Retrieves the cache statistics.
+
+    Returns:
+      dict[str, int]: number of hits, misses, cached directories and total
+          number of cached directory entries.
+    """
+    return {
+        'hits': self.hits,
+        'misses': self.misses,
+        'number_of_directories': len(self._directories),
+        'number_of_entries': self._number_of_entries}
@@ -151,6 +151,52 @@ class EXTFileEntry(file_entry.FileEntry):
       for path_spec in self._directory.entries:
         yield EXTFileEntry(self._resolver_context, self._file_system, path_spec)
 
+  def _GetSubFileEntryByLocation(self, location, name):
+    """Retrieves a sub file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+      name (str): name of the sub file entry.
+
+    Returns:
+      EXTFileEntry: sub file entry or None if not available.
+
+    Raises:
+      BackEndError: if the sub file entry cannot be opened.
+    """
+    path_spec = ext_path_spec.EXTPathSpec(
+        location=self._file_system.JoinPath([location, name]),
+        parent=self.path_spec.parent)
+
+    try:
+      fsext_sub_file_entry = self._file_system.GetEXTFileEntryByPathSpec(
+          path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    if not fsext_sub_file_entry:
+      return None
+
+    # Use the same path specification as the directory entry, which contains
+    # the inode and the name as stored in the file system.
+    sub_location = self._file_system.JoinPath([
+        location, fsext_sub_file_entry.name])
+    path_spec = ext_path_spec.EXTPathSpec(
+        inode=fsext_sub_file_entry.inode_number, location=sub_location,
+        parent=self.path_spec.parent)
+
+    return EXTFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsext_file_entry=fsext_sub_file_entry)
+
+  def _IsDataStoredInExtents(self):
+    """Determines if the data is stored as-is in the extents.
+
+    Returns:
+      bool: True if the data is stored as-is in the extents.
+    """
+    return True
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
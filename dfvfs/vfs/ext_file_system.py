@@ -3,10 +3,13 @@
 
 import pyfsext
 
+from dfdatetime import posix_time as dfdatetime_posix_time
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import ext_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import file_entry_stat
 from dfvfs.vfs import file_system
 from dfvfs.vfs import ext_file_entry
 
@@ -16,8 +19,12 @@ class EXTFileSystem(file_system.FileSystem):
 
   ROOT_DIRECTORY_INODE_NUMBER = 2
 
+  SUPPORTS_LOCATION_LOOKUP = True
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_EXT
 
+  _NANOSECONDS_PER_SECOND = 1000000000
+
   def __init__(self, resolver_context, path_spec):
     """Initializes an EXT file system.
 
@@ -38,6 +45,101 @@ class EXTFileSystem(file_system.FileSystem):
     self._fsext_volume = None
     self._file_object = None
 
+  def _GetDateTimeValue(self, timestamp, has_creation_time):
+    """Retrieves a date and time value.
+
+    Args:
+      timestamp (int): POSIX timestamp in nanoseconds.
+      has_creation_time (bool): True if the inode contains a creation time.
+
+    Returns:
+      dfdatetime.DateTimeValues: date and time value.
+    """
+    # If creation time is not present the timestamp precision is in seconds.
+    if not has_creation_time:
+      timestamp, _ = divmod(timestamp, self._NANOSECONDS_PER_SECOND)
+      return dfdatetime_posix_time.PosixTime(timestamp=timestamp)
+
+    return dfdatetime_posix_time.PosixTimeInNanoseconds(timestamp=timestamp)
+
+  def _GetFileEntryStat(self, fsext_file_entry, name, location):
+    """Retrieves a stat record of an EXT file entry.
+
+    Args:
+      fsext_file_entry (pyfsext.file_entry): EXT file entry.
+      name (str): name of the file entry or None if not available.
+      location (str): location of the file entry or None if not available.
+
+    Returns:
+      FileEntryStat: stat record.
+    """
+    creation_time = fsext_file_entry.get_creation_time_as_integer()
+    has_creation_time = creation_time is not None
+
+    stat_record = file_entry_stat.FileEntryStat()
+    stat_record.access_time = self._GetDateTimeValue(
+        fsext_file_entry.get_access_time_as_integer(), has_creation_time)
+    stat_record.change_time = self._GetDateTimeValue(
+        fsext_file_entry.get_inode_change_time_as_integer(), has_creation_time)
+    stat_record.inode_number = fsext_file_entry.inode_number
+    stat_record.is_allocated = fsext_file_entry.number_of_links > 0
+    stat_record.location = location
+    stat_record.modification_time = self._GetDateTimeValue(
+        fsext_file_entry.get_modification_time_as_integer(),
+        has_creation_time)
+    stat_record.name = name
+    stat_record.size = fsext_file_entry.size
+
+    # pylint: disable=protected-access
+    stat_record.type = ext_file_entry.EXTFileEntry._ENTRY_TYPES.get(
+        fsext_file_entry.file_mode & 0xf000, None)
+
+    # Creation time can be None if not present and 0 if not set.
+    if creation_time:
+      stat_record.creation_time = (
+          dfdatetime_posix_time.PosixTimeInNanoseconds(
+              timestamp=creation_time))
+
+    return stat_record
+
+  def _GetFileEntryStatByInode(self, inode_number):
+    """Retrieves a stat record of a file entry by inode.
+
+    Args:
+      inode_number (int): inode number of the file entry.
+
+    Returns:
+      FileEntryStat: stat record or None if the inode was never used.
+
+    Raises:
+      IOError: if the inode cannot be retrieved.
+    """
+    fsext_file_entry = self._fsext_volume.get_file_entry_by_inode(
+        inode_number)
+    if fsext_file_entry.is_empty():
+      return None
+
+    return self._GetFileEntryStat(fsext_file_entry, None, None)
+
+  def _GetSubFileEntriesStatByInode(self, inode_number):
+    """Retrieves stat records of the sub file entries of a directory by inode.
+
+    Args:
+      inode_number (int): inode number of the directory.
+
+    Yields:
+      FileEntryStat: stat record, without location, of a sub file entry.
+    """
+    try:
+      fsext_file_entry = self._fsext_volume.get_file_entry_by_inode(
+          inode_number)
+      for fsext_sub_file_entry in fsext_file_entry.sub_file_entries:
+        yield self._GetFileEntryStat(
+            fsext_sub_file_entry, fsext_sub_file_entry.name, None)
+
+    except IOError:
+      pass
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -91,6 +193,62 @@ class EXTFileSystem(file_system.FileSystem):
 
     return fsext_file_entry is not None
 
+  def GetFileEntriesStat(self, path_spec):
+    """Retrieves stat records of the sub file entries of a directory.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Yields:
+      FileEntryStat: stat record of a sub file entry.
+
+    Raises:
+      BackEndError: if the directory cannot be opened.
+    """
+    try:
+      fsext_file_entry = self.GetEXTFileEntryByPathSpec(path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    location_prefix = self._GetSubFileEntryLocationPrefix(path_spec)
+
+    for fsext_sub_file_entry in fsext_file_entry.sub_file_entries:
+      name = fsext_sub_file_entry.name
+
+      location = None
+      if location_prefix is not None:
+        location = ''.join([location_prefix, name])
+
+      yield self._GetFileEntryStat(fsext_sub_file_entry, name, location)
+
+  def GetFileEntriesStatByInodeRange(
+      self, first_inode_number, last_inode_number):
+    """Retrieves stat records of the file entries in a range of inodes.
+
+    Inodes that cannot be retrieved and inodes that were never used are
+    skipped. The locations and names of the file entries are not available.
+    Inodes that are no longer used are reported as not allocated.
+
+    Args:
+      first_inode_number (int): number of the first inode in the range.
+      last_inode_number (int): number of the last inode in the range.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    last_inode_number = min(
+        last_inode_number, self._fsext_volume.number_of_file_entries)
+
+    for inode_number in range(max(first_inode_number, 1),
+                              last_inode_number + 1):
+      try:
+        stat_record = self._GetFileEntryStatByInode(inode_number)
+      except IOError:
+        continue
+
+      if stat_record:
+        yield stat_record
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -169,3 +327,19 @@ class EXTFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, inode=self.ROOT_DIRECTORY_INODE_NUMBER,
         parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
+
+  def IterateFileEntriesByInode(self):
+    """Iterates over the file entries in order of inode number.
+
+    The inode tables are read sequentially and the locations of the file
+    entries are reconstructed from the entries of the directories. Inodes
+    that are not referenced by a directory, such as the reserved inodes,
+    have location None. The stat records of the file entries of which the
+    location is not known yet are kept in memory and yielded last.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    yield from self._IterateFileEntriesByInodeRange(
+        1, self._fsext_volume.number_of_file_entries,
+        self.ROOT_DIRECTORY_INODE_NUMBER)
@@ -12,6 +12,8 @@ class Extent(object):
     size (int): size of the extent in bytes.
   """
 
+  __slots__ = ('extent_type', 'offset', 'size')
+
   def __init__(self, extent_type=None, offset=None, size=None):
     """Initializes an extent.
 
@@ -11,6 +11,8 @@ from dfvfs.vfs import fake_file_entry
 class FakeFileSystem(file_system.FileSystem):
   """Fake file system."""
 
+  SUPPORTS_LOCATION_LOOKUP = True
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_FAKE
 
   def __init__(self, resolver_context, path_spec):
@@ -107,6 +107,44 @@ class FATFileEntry(file_entry.FileEntry):
       for path_spec in self._directory.entries:
         yield FATFileEntry(self._resolver_context, self._file_system, path_spec)
 
+  def _GetSubFileEntryByLocation(self, location, name):
+    """Retrieves a sub file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+      name (str): name of the sub file entry.
+
+    Returns:
+      FATFileEntry: sub file entry or None if not available.
+
+    Raises:
+      BackEndError: if the sub file entry cannot be opened.
+    """
+    path_spec = fat_path_spec.FATPathSpec(
+        location=self._file_system.JoinPath([location, name]),
+        parent=self.path_spec.parent)
+
+    try:
+      fsfat_sub_file_entry = self._file_system.GetFATFileEntryByPathSpec(
+          path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    if not fsfat_sub_file_entry:
+      return None
+
+    # Use the same path specification as the directory entry, which contains
+    # the identifier and the name as stored in the file system.
+    sub_location = self._file_system.JoinPath([
+        location, fsfat_sub_file_entry.name])
+    path_spec = fat_path_spec.FATPathSpec(
+        identifier=fsfat_sub_file_entry.identifier, location=sub_location,
+        parent=self.path_spec.parent)
+
+    return FATFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsfat_file_entry=fsfat_sub_file_entry)
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
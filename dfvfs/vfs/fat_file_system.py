@@ -16,9 +16,13 @@ class FATFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_FAT
 
+  CASE_INSENSITIVE_LOCATION_LOOKUP = True
+
   LOCATION_ROOT = '\\'
   PATH_SEPARATOR = '\\'
 
+  SUPPORTS_LOCATION_LOOKUP = True
+
   def __init__(self, resolver_context, path_spec):
     """Initializes an FAT file system.
 
@@ -7,7 +7,9 @@ directory or file system metadata.
 
 import abc
 
+from dfvfs.file_io import extent_file_io
 from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import resolver
 from dfvfs.vfs import data_stream
 
@@ -58,6 +60,20 @@ class FileEntry(object):
     if not getattr(self, 'TYPE_INDICATOR', None):
       raise ValueError('Missing type indicator.')
 
+  def _CacheDirectory(self, cache):
+    """Enumerates the sub file entries and caches them in the directory cache.
+
+    Args:
+      cache (DirectoryCache): directory cache.
+
+    Returns:
+      CachedDirectory: cached directory entries or None if not cached.
+    """
+    entries = [
+        (sub_file_entry.name, sub_file_entry.path_spec)
+        for sub_file_entry in self._GetSubFileEntries()]
+    return cache.CacheDirectory(self.path_spec.comparable, entries)
+
   def _GetAttributes(self):
     """Retrieves the attributes.
 
@@ -69,6 +85,25 @@ class FileEntry(object):
 
     return self._attributes
 
+  def _GetCachedDirectory(self):
+    """Retrieves the cached entries of the directory.
+
+    The directory is enumerated and cached if not already cached.
+
+    Returns:
+      CachedDirectory: cached directory entries or None if the directory cache
+          is not enabled or the file entry is not a directory.
+    """
+    cache = self._file_system.directory_cache
+    if not cache or not self.IsDirectory():
+      return None
+
+    cached_directory = cache.GetDirectory(self.path_spec.comparable)
+    if not cached_directory:
+      cached_directory = self._CacheDirectory(cache)
+
+    return cached_directory
+
   def _GetDataStreams(self):
     """Retrieves the data streams.
 
@@ -120,6 +155,65 @@ class FileEntry(object):
       FileEntry: a sub file entry.
     """
 
+  def _GetSubFileEntriesWithDirectoryCache(self, cache):
+    """Retrieves sub file entries and caches them once enumerated.
+
+    Args:
+      cache (DirectoryCache): directory cache.
+
+    Yields:
+      FileEntry: a sub file entry.
+    """
+    entries = []
+
+    for sub_file_entry in self._GetSubFileEntries():
+      if entries is not None:
+        entries.append((sub_file_entry.name, sub_file_entry.path_spec))
+        if len(entries) > cache.maximum_number_of_entries:
+          entries = None
+
+      yield sub_file_entry
+
+    if entries is not None:
+      cache.CacheDirectory(self.path_spec.comparable, entries)
+
+  def _GetSubFileEntryByLocation(self, location, name):
+    """Retrieves a sub file entry by location.
+
+    File systems that support looking up a file entry by location override
+    this method to return a sub file entry with the same path specification
+    as that of the sub file entry when the directory is enumerated.
+
+    Args:
+      location (str): location of the file entry.
+      name (str): name of the sub file entry.
+
+    Returns:
+      FileEntry: sub file entry or None if not available.
+
+    Raises:
+      BackEndError: if the sub file entry cannot be opened.
+    """
+    sub_location = self._file_system.JoinPath([location, name])
+    parent_path_spec = getattr(self.path_spec, 'parent', None)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        self.path_spec.type_indicator, location=sub_location,
+        parent=parent_path_spec)
+
+    return self._file_system.GetFileEntryByPathSpec(path_spec)
+
+  def _IsDataStoredInExtents(self):
+    """Determines if the data is stored as-is in the extents.
+
+    Back-ends that store the data of the default data stream as-is in the
+    extents returned by GetExtents() override this method, hence the data
+    is not compressed, encrypted or stored in the metadata.
+
+    Returns:
+      bool: True if the data is stored as-is in the extents.
+    """
+    return False
+
   @property
   def access_time(self):
     """Retrieves the access time.
@@ -249,6 +343,10 @@ class FileEntry(object):
     Returns:
       int: number of sub file entries.
     """
+    cached_directory = self._GetCachedDirectory()
+    if cached_directory:
+      return cached_directory.number_of_entries
+
     number_of_sub_file_entries = 0
     if self.entry_type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
       directory = self._GetDirectory()
@@ -273,6 +371,10 @@ class FileEntry(object):
     Returns:
       generator[FileEntry]: sub file entries.
     """
+    cache = self._file_system.directory_cache
+    if cache and self.IsDirectory():
+      return self._GetSubFileEntriesWithDirectoryCache(cache)
+
     return self._GetSubFileEntries()
 
   @property
@@ -321,6 +423,49 @@ class FileEntry(object):
     """
     return []
 
+  def GetExtentFileObject(self):
+    """Retrieves a file-like object that reads the data from the extents.
+
+    The file-like object reads the data of the default data stream directly
+    from the file-like object of the volume that contains the file system,
+    which bypasses the file system back-end.
+
+    Returns:
+      ExtentFile: file-like object or None if the data cannot be read from
+          the extents, for example if the data is compressed, encrypted or
+          stored in the metadata.
+    """
+    if (self.entry_type != definitions.FILE_ENTRY_TYPE_FILE or
+        not self.path_spec.HasParent() or
+        not self._IsDataStoredInExtents()):
+      return None
+
+    size = self.size
+    if size is None:
+      return None
+
+    extents = self.GetExtents()
+
+    extents_size = 0
+    for extent in extents:
+      if extent.extent_type not in (
+          definitions.EXTENT_TYPE_DATA, definitions.EXTENT_TYPE_SPARSE):
+        return None
+
+      extents_size += extent.size
+
+    if extents_size < size:
+      return None
+
+    file_object = resolver.Resolver.OpenFileObject(
+        self.path_spec.parent, resolver_context=self._resolver_context)
+
+    extent_file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self.path_spec, file_object, extents, size)
+    extent_file_object.Open()
+
+    return extent_file_object
+
   def GetFileObject(self, data_stream_name=''):
     """Retrieves a file-like object of a specific data stream.
 
@@ -364,6 +509,11 @@ class FileEntry(object):
   def GetSubFileEntryByName(self, name, case_sensitive=True):
     """Retrieves a sub file entry by name.
 
+    If the directory is in the directory cache of the file system, the sub
+    file entry is looked up in the cache. Otherwise, if the file system
+    supports it, the sub file entry is looked up by location, otherwise the
+    sub file entries are enumerated.
+
     Args:
       name (str): name of the file entry.
       case_sensitive (Optional[bool]): True if the name is case sensitive.
@@ -371,6 +521,40 @@ class FileEntry(object):
     Returns:
       FileEntry: a file entry or None if not available.
     """
+    supports_location_lookup = self._file_system.SUPPORTS_LOCATION_LOOKUP and (
+        case_sensitive or self._file_system.CASE_INSENSITIVE_LOCATION_LOOKUP)
+
+    cache = self._file_system.directory_cache
+    if cache and self.IsDirectory():
+      cached_directory = cache.GetDirectory(self.path_spec.comparable)
+
+      # A directory is only enumerated to be cached if the sub file entry
+      # cannot be looked up by location.
+      if not cached_directory and not supports_location_lookup:
+        cached_directory = self._CacheDirectory(cache)
+
+      if cached_directory:
+        path_spec = cached_directory.GetPathSpecByName(
+            name, case_sensitive=case_sensitive)
+        if not path_spec:
+          return None
+
+        return self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    location = getattr(self.path_spec, 'location', None)
+    if (supports_location_lookup and location is not None and name and
+        name not in ('.', '..') and
+        self._file_system.PATH_SEPARATOR not in name and self.IsDirectory()):
+      sub_file_entry = self._GetSubFileEntryByLocation(location, name)
+      if not sub_file_entry:
+        return None
+
+      # A case insensitive look up can return a sub file entry with a name
+      # that only differs in case, in which case the sub file entries are
+      # enumerated to find an exact match.
+      if not case_sensitive or sub_file_entry.name == name:
+        return sub_file_entry
+
     name_lower = name.lower()
     matching_sub_file_entry = None
 
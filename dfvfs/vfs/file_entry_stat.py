@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""The Virtual File System (VFS) file entry stat record."""
+
+
+class FileEntryStat(object):
+  """Stat record of a file entry.
+
+  A stat record contains the metadata of a file entry that is commonly needed
+  to list file entries, for example to generate a timeline, and is retrieved
+  without creating a file entry object.
+
+  Attributes:
+    access_time (dfdatetime.DateTimeValues): access time or None if not
+        available.
+    change_time (dfdatetime.DateTimeValues): change time or None if not
+        available.
+    creation_time (dfdatetime.DateTimeValues): creation time or None if not
+        available.
+    inode_number (int): number of the corresponding inode, equivalent to
+        st_ino, or None if not available.
+    is_allocated (bool): True if the file entry is allocated.
+    location (str): location of the file entry or None if not available.
+    modification_time (dfdatetime.DateTimeValues): modification time or None
+        if not available.
+    name (str): name of the file entry, which does not include the full path,
+        or None if not available.
+    parent_inode_number (int): number of the inode of the parent directory or
+        None if not available.
+    size (int): size of the file entry in bytes or None if not available.
+    type (str): file entry type, such as device, directory, file, link,
+        socket and pipe or None if not available. The available file entry
+        types are defined in dfvfs.lib.definitions for example
+        FILE_ENTRY_TYPE_FILE.
+  """
+
+  def __init__(self):
+    """Initializes a stat record."""
+    super(FileEntryStat, self).__init__()
+    self.access_time = None
+    self.change_time = None
+    self.creation_time = None
+    self.inode_number = None
+    self.is_allocated = True
+    self.location = None
+    self.modification_time = None
+    self.name = None
+    self.parent_inode_number = None
+    self.size = None
+    self.type = None
@@ -2,6 +2,13 @@
 """The Virtual File System (VFS) file system interface."""
 
 import abc
+import heapq
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.vfs import directory_cache
+from dfvfs.vfs import file_entry_stat
 
 
 class FileSystem(object):
@@ -11,10 +18,19 @@ class FileSystem(object):
   # methods
   # pylint: disable=redundant-returns-doc
 
+  # True if looking up a file entry by location is case insensitive.
+  CASE_INSENSITIVE_LOCATION_LOOKUP = False
+
   LOCATION_ROOT = '/'
 
   PATH_SEPARATOR = '/'
 
+  _DEFAULT_MAXIMUM_NUMBER_OF_DIRECTORY_ENTRIES = 65536
+
+  # True if the file system can look up a file entry by location without
+  # enumerating the sub file entries of the parent directories.
+  SUPPORTS_LOCATION_LOOKUP = False
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file system.
 
@@ -27,6 +43,7 @@ class FileSystem(object):
           indicator.
     """
     super(FileSystem, self).__init__()
+    self._directory_cache = None
     self._is_open = False
     self._path_spec = path_spec
     self._resolver_context = resolver_context
@@ -39,6 +56,11 @@ class FileSystem(object):
     if self._is_open:
       self._Close()
 
+  @property
+  def directory_cache(self):
+    """DirectoryCache: directory cache or None if not enabled."""
+    return self._directory_cache
+
   @property
   def type_indicator(self):
     """str: type indicator."""
@@ -53,6 +75,196 @@ class FileSystem(object):
       IOError: if the close failed.
     """
 
+  def _GetFileEntryStatByInode(self, inode_number):
+    """Retrieves a stat record of a file entry by inode.
+
+    Args:
+      inode_number (int): inode number of the file entry.
+
+    Returns:
+      FileEntryStat: stat record or None if not available.
+
+    Raises:
+      NotSupported: if the file system does not support retrieving file
+          entries by inode.
+    """
+    raise errors.NotSupported(
+        f'File system: {self.type_indicator:s} does not support retrieving '
+        f'file entries by inode.')
+
+  def _GetFileEntryStatFromFileEntry(self, file_entry):
+    """Retrieves a stat record from a file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+
+    Returns:
+      FileEntryStat: stat record.
+    """
+    stat_attribute = file_entry.GetStatAttribute()
+
+    stat_record = file_entry_stat.FileEntryStat()
+    stat_record.access_time = file_entry.access_time
+    stat_record.change_time = file_entry.change_time
+    stat_record.creation_time = file_entry.creation_time
+    stat_record.inode_number = getattr(stat_attribute, 'inode_number', None)
+    stat_record.is_allocated = file_entry.IsAllocated()
+    stat_record.location = getattr(file_entry.path_spec, 'location', None)
+    stat_record.modification_time = file_entry.modification_time
+    stat_record.name = file_entry.name
+    stat_record.size = file_entry.size
+    stat_record.type = file_entry.entry_type
+
+    return stat_record
+
+  def _GetLocationByInode(self, inode_number, parent_references, locations):
+    """Reconstructs the location of a file entry from parent references.
+
+    Args:
+      inode_number (int): inode number of the file entry.
+      parent_references (dict[int, tuple[int, str]]): inode number and name
+          of the parent per inode number.
+      locations (dict[int, str]): location per inode number, which is used
+          as a cache of the locations that were reconstructed earlier and
+          should at least contain the location of the root inode.
+
+    Returns:
+      str: location of the file entry or None if the file entry cannot be
+          reached from the root with the parent references.
+    """
+    path_segments = []
+    visited_inode_numbers = set()
+
+    parent_inode_number = inode_number
+    while parent_inode_number not in locations:
+      parent_reference = parent_references.get(parent_inode_number, None)
+      if not parent_reference or parent_inode_number in visited_inode_numbers:
+        return None
+
+      visited_inode_numbers.add(parent_inode_number)
+      path_segments.append((parent_inode_number, parent_reference[1]))
+      parent_inode_number = parent_reference[0]
+
+    location = locations[parent_inode_number]
+
+    # Note that locations that cannot be reconstructed are not cached, since
+    # the missing parent references can be added later.
+    for segment_inode_number, name in reversed(path_segments):
+      if location.endswith(self.PATH_SEPARATOR):
+        location = ''.join([location, name])
+      else:
+        location = ''.join([location, self.PATH_SEPARATOR, name])
+
+      locations[segment_inode_number] = location
+
+    return location
+
+  def _GetSubFileEntriesStatByInode(self, inode_number):
+    """Retrieves stat records of the sub file entries of a directory by inode.
+
+    File systems that only store the names of file entries in their parent
+    directory override this method.
+
+    Args:
+      inode_number (int): inode number of the directory.
+
+    Returns:
+      iterator[FileEntryStat]: stat records, without location, of the sub
+          file entries.
+    """
+    # pylint: disable=unused-argument
+    return iter(())
+
+  def _GetSubFileEntryLocationPrefix(self, path_spec):
+    """Retrieves the location prefix of the sub file entries of a directory.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Returns:
+      str: location of the directory followed by the path separator or None
+          if not available.
+    """
+    location = getattr(path_spec, 'location', None)
+    if location is None or location.endswith(self.PATH_SEPARATOR):
+      return location
+
+    return ''.join([location, self.PATH_SEPARATOR])
+
+  def _IterateFileEntriesByInodeRange(
+      self, first_inode_number, last_inode_number, root_inode_number):
+    """Iterates over the file entries in a range of inodes.
+
+    A stat record is yielded, in order of inode number, as soon as the
+    location of the file entry can be reconstructed from the parent
+    references read so far. The stat records of which the location cannot
+    be reconstructed yet are kept and yielded, in order of inode number,
+    after the last inode of the range was read. The stat records of the sub
+    file entries of a directory are kept, so that inodes that follow their
+    parent directory are not read a second time.
+
+    Args:
+      first_inode_number (int): number of the first inode in the range.
+      last_inode_number (int): number of the last inode in the range.
+      root_inode_number (int): inode number of the root directory.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    locations = {root_inode_number: self.LOCATION_ROOT}
+    parent_references = {}
+    pending_stat_records = {}
+    unresolved_stat_records = []
+
+    for inode_number in range(first_inode_number, last_inode_number + 1):
+      stat_record = pending_stat_records.pop(inode_number, None)
+      if not stat_record:
+        try:
+          stat_record = self._GetFileEntryStatByInode(inode_number)
+        except (IOError, errors.BackEndError):
+          stat_record = None
+
+        if not stat_record:
+          continue
+
+      # Note that the inode number of the stat record can contain more than
+      # the number of the inode, such as the sequence number of a NTFS file
+      # reference.
+      record_inode_number = stat_record.inode_number
+
+      if stat_record.parent_inode_number is not None:
+        if stat_record.name and record_inode_number not in parent_references:
+          parent_references[record_inode_number] = (
+              stat_record.parent_inode_number, stat_record.name)
+
+      elif (stat_record.is_allocated and
+            stat_record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY):
+        for sub_stat_record in self._GetSubFileEntriesStatByInode(
+            inode_number):
+          sub_inode_number = sub_stat_record.inode_number
+          if sub_inode_number in parent_references:
+            continue
+
+          parent_references[sub_inode_number] = (
+              record_inode_number, sub_stat_record.name)
+
+          if inode_number < sub_inode_number <= last_inode_number:
+            pending_stat_records[sub_inode_number] = sub_stat_record
+
+      location = self._GetLocationByInode(
+          record_inode_number, parent_references, locations)
+      if location is None:
+        unresolved_stat_records.append(stat_record)
+      else:
+        self._SetStatRecordParent(stat_record, location, parent_references)
+        yield stat_record
+
+    for stat_record in unresolved_stat_records:
+      location = self._GetLocationByInode(
+          stat_record.inode_number, parent_references, locations)
+      self._SetStatRecordParent(stat_record, location, parent_references)
+      yield stat_record
+
   @abc.abstractmethod
   def _Open(self, mode='rb'):
     """Opens the file system object defined by path specification.
@@ -68,6 +280,23 @@ class FileSystem(object):
       ValueError: if the path specification is invalid.
     """
 
+  def _SetStatRecordParent(self, stat_record, location, parent_references):
+    """Sets the location and parent of a stat record.
+
+    Args:
+      stat_record (FileEntryStat): stat record of a file entry.
+      location (str): location of the file entry or None if not available.
+      parent_references (dict[int, tuple[int, str]]): inode number and name
+          of the parent per inode number.
+    """
+    stat_record.location = location
+
+    parent_reference = parent_references.get(stat_record.inode_number, None)
+    if parent_reference:
+      stat_record.parent_inode_number = parent_reference[0]
+      if stat_record.name is None:
+        stat_record.name = parent_reference[1]
+
   def BasenamePath(self, path):
     """Determines the basename of the path.
 
@@ -101,6 +330,34 @@ class FileSystem(object):
     dirname, _, _ = path.rpartition(self.PATH_SEPARATOR)
     return dirname
 
+  def DisableDirectoryCache(self):
+    """Disables the directory cache."""
+    self._directory_cache = None
+
+  def EnableDirectoryCache(
+      self, maximum_number_of_entries=(
+          _DEFAULT_MAXIMUM_NUMBER_OF_DIRECTORY_ENTRIES)):
+    """Enables the directory cache.
+
+    The directory cache holds the names and path specifications of the sub
+    file entries of the most recently used directories, which are used to
+    look up a sub file entry by name and to determine the number of sub file
+    entries without enumerating the directory again.
+
+    Args:
+      maximum_number_of_entries (Optional[int]): maximum number of cached
+          directory entries.
+
+    Returns:
+      DirectoryCache: directory cache.
+
+    Raises:
+      ValueError: if the maximum number of entries is invalid.
+    """
+    self._directory_cache = directory_cache.DirectoryCache(
+        maximum_number_of_entries)
+    return self._directory_cache
+
   @abc.abstractmethod
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
@@ -139,6 +396,51 @@ class FileSystem(object):
       FileEntry: a file entry or None if not available.
     """
 
+  def GetFileEntriesStat(self, path_spec):
+    """Retrieves stat records of the sub file entries of a directory.
+
+    This implementation creates a file entry per sub file entry. File systems
+    that can retrieve the metadata of the sub file entries from their back-end
+    directly override it.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Yields:
+      FileEntryStat: stat record of a sub file entry.
+    """
+    file_entry = self.GetFileEntryByPathSpec(path_spec)
+    if file_entry:
+      for sub_file_entry in file_entry.sub_file_entries:
+        yield self._GetFileEntryStatFromFileEntry(sub_file_entry)
+
+  def GetFileEntriesStatByInodeRange(
+      self, first_inode_number, last_inode_number):
+    """Retrieves stat records of the file entries in a range of inodes.
+
+    Inodes that cannot be retrieved are skipped. The locations of the file
+    entries are not available.
+
+    Args:
+      first_inode_number (int): number of the first inode in the range.
+      last_inode_number (int): number of the last inode in the range.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+
+    Raises:
+      NotSupported: if the file system does not support retrieving file
+          entries by inode.
+    """
+    # pylint: disable=unused-argument
+    raise errors.NotSupported(
+        f'File system: {self.type_indicator:s} does not support retrieving '
+        f'file entries by inode.')
+
+    # The yield makes this method a generator, like the methods that override
+    # it, hence the error is raised when the stat records are iterated.
+    yield  # pylint: disable=unreachable
+
   def GetFileObjectByPathSpec(self, path_spec):
     """Retrieves a file-like object for a path specification.
 
@@ -188,6 +490,62 @@ class FileSystem(object):
       FileEntry: a file entry or None if not available.
     """
 
+  def IterateFileEntriesByInode(self):
+    """Iterates over the file entries in order of inode number.
+
+    This implementation traverses the directories, starting at the root
+    directory, in order of the inode number of the directories, which only
+    yields the file entries that can be reached from the root directory.
+    File systems that can read their inode table, or equivalent,
+    sequentially override it and also yield the file entries that cannot be
+    reached from the root directory, with location None. Since a location
+    can only be reconstructed once the parents of a file entry were read,
+    these keep the stat records of the file entries of which the location
+    is not known yet in memory, and yield them after the last inode was
+    read. The memory used therefore grows with the number of these file
+    entries, such as unreferenced inodes.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    root_file_entry = self.GetRootFileEntry()
+    if not root_file_entry:
+      return
+
+    stat_record = self._GetFileEntryStatFromFileEntry(root_file_entry)
+    yield stat_record
+
+    visited_inode_numbers = set([stat_record.inode_number])
+
+    # The index prevents the path specifications from being compared when
+    # the inode numbers are the same or None.
+    directories = [
+        (stat_record.inode_number or 0, 0, root_file_entry.path_spec)]
+    index = 1
+
+    while directories:
+      _, _, path_spec = heapq.heappop(directories)
+
+      for stat_record in self.GetFileEntriesStat(path_spec):
+        inode_number = stat_record.inode_number
+        if inode_number is not None:
+          if inode_number in visited_inode_numbers:
+            continue
+
+          visited_inode_numbers.add(inode_number)
+
+        yield stat_record
+
+        if (stat_record.type == definitions.FILE_ENTRY_TYPE_DIRECTORY and
+            stat_record.location):
+          sub_path_spec = path_spec_factory.Factory.NewPathSpec(
+              self.type_indicator, location=stat_record.location,
+              parent=self._path_spec.parent)
+
+          heapq.heappush(
+              directories, (inode_number or 0, index, sub_path_spec))
+          index += 1
+
   def JoinPath(self, path_segments):
     """Joins the path segments into a path.
 
@@ -3,10 +3,13 @@
 
 import pyfshfs
 
+from dfdatetime import hfs_time as dfdatetime_hfs_time
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import hfs_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import file_entry_stat
 from dfvfs.vfs import file_system
 from dfvfs.vfs import hfs_file_entry
 
@@ -16,6 +19,8 @@ class HFSFileSystem(file_system.FileSystem):
 
   ROOT_DIRECTORY_IDENTIFIER_NUMBER = 2
 
+  SUPPORTS_LOCATION_LOOKUP = True
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_HFS
 
   def __init__(self, resolver_context, path_spec):
@@ -38,6 +43,42 @@ class HFSFileSystem(file_system.FileSystem):
     self._fshfs_volume = None
     self._file_object = None
 
+  def _GetFileEntryStat(self, fshfs_file_entry, location):
+    """Retrieves a stat record of a HFS file entry.
+
+    Args:
+      fshfs_file_entry (pyfshfs.file_entry): HFS file entry.
+      location (str): location of the file entry or None if not available.
+
+    Returns:
+      FileEntryStat: stat record.
+    """
+    stat_record = file_entry_stat.FileEntryStat()
+    stat_record.creation_time = dfdatetime_hfs_time.HFSTime(
+        timestamp=fshfs_file_entry.get_creation_time_as_integer())
+    stat_record.inode_number = fshfs_file_entry.identifier
+    stat_record.location = location
+    stat_record.modification_time = dfdatetime_hfs_time.HFSTime(
+        timestamp=fshfs_file_entry.get_modification_time_as_integer())
+    stat_record.name = fshfs_file_entry.name
+    stat_record.size = fshfs_file_entry.size
+
+    # pylint: disable=protected-access
+    stat_record.type = hfs_file_entry.HFSFileEntry._ENTRY_TYPES.get(
+        fshfs_file_entry.file_mode & 0xf000, None)
+
+    access_time = fshfs_file_entry.get_access_time_as_integer()
+    if access_time is not None:
+      stat_record.access_time = dfdatetime_hfs_time.HFSTime(
+          timestamp=access_time)
+
+    change_time = fshfs_file_entry.get_entry_modification_time_as_integer()
+    if change_time is not None:
+      stat_record.change_time = dfdatetime_hfs_time.HFSTime(
+          timestamp=change_time)
+
+    return stat_record
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -92,6 +133,56 @@ class HFSFileSystem(file_system.FileSystem):
 
     return fshfs_file_entry is not None
 
+  def GetFileEntriesStat(self, path_spec):
+    """Retrieves stat records of the sub file entries of a directory.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Yields:
+      FileEntryStat: stat record of a sub file entry.
+
+    Raises:
+      BackEndError: if the directory cannot be opened.
+    """
+    try:
+      fshfs_file_entry = self.GetHFSFileEntryByPathSpec(path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    location_prefix = self._GetSubFileEntryLocationPrefix(path_spec)
+
+    for fshfs_sub_file_entry in fshfs_file_entry.sub_file_entries:
+      location = None
+      if location_prefix is not None:
+        location = ''.join([location_prefix, fshfs_sub_file_entry.name])
+
+      yield self._GetFileEntryStat(fshfs_sub_file_entry, location)
+
+  def GetFileEntriesStatByInodeRange(
+      self, first_inode_number, last_inode_number):
+    """Retrieves stat records of the file entries in a range of inodes.
+
+    The inode numbers of HFS are catalog node identifiers (CNIDs). Identifiers
+    that are not in use are skipped. The locations of the file entries are
+    not available.
+
+    Args:
+      first_inode_number (int): number of the first inode in the range.
+      last_inode_number (int): number of the last inode in the range.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    for identifier in range(first_inode_number, last_inode_number + 1):
+      try:
+        fshfs_file_entry = self._fshfs_volume.get_file_entry_by_identifier(
+            identifier)
+      except IOError:
+        continue
+
+      yield self._GetFileEntryStat(fshfs_file_entry, None)
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
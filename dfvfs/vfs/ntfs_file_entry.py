@@ -32,6 +32,8 @@ class NTFSFileEntry(file_entry.FileEntry):
       0x00000050: ntfs_attribute.SecurityDescriptorNTFSAttribute,
   }
 
+  _ATTRIBUTE_TYPE_DATA = 0x00000080
+
   _FILE_REFERENCE_MFT_ENTRY_BITMASK = 0xffffffffffff
 
   def __init__(
@@ -165,6 +167,49 @@ class NTFSFileEntry(file_entry.FileEntry):
         yield NTFSFileEntry(
             self._resolver_context, self._file_system, path_spec)
 
+  def _GetSubFileEntryByLocation(self, location, name):
+    """Retrieves a sub file entry by location.
+
+    Args:
+      location (str): location of the file entry.
+      name (str): name of the sub file entry.
+
+    Returns:
+      NTFSFileEntry: sub file entry or None if not available.
+
+    Raises:
+      BackEndError: if the sub file entry cannot be opened.
+    """
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=self._file_system.JoinPath([location, name]),
+        parent=self.path_spec.parent)
+
+    try:
+      fsntfs_sub_file_entry = self._file_system.GetNTFSFileEntryByPathSpec(
+          path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    if not fsntfs_sub_file_entry:
+      return None
+
+    # Use the same path specification as the directory entry, which contains
+    # the MFT entry, the index of the $FILE_NAME attribute and the name as
+    # stored in the file system.
+    mft_entry = (
+        fsntfs_sub_file_entry.file_reference &
+        self._FILE_REFERENCE_MFT_ENTRY_BITMASK)
+    sub_location = self._file_system.JoinPath([
+        location, fsntfs_sub_file_entry.name])
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=sub_location,
+        mft_attribute=fsntfs_sub_file_entry.name_attribute_index,
+        mft_entry=mft_entry, parent=self.path_spec.parent)
+
+    return NTFSFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsntfs_file_entry=fsntfs_sub_file_entry)
+
   def _IsDevice(self, file_attribute_flags):
     """Determines if a file entry is a device.
 
@@ -192,6 +237,31 @@ class NTFSFileEntry(file_entry.FileEntry):
     return bool(
         file_attribute_flags & pyfsntfs.file_attribute_flags.REPARSE_POINT)
 
+  def _IsDataStoredInExtents(self):
+    """Determines if the data is stored as-is in the extents.
+
+    Returns:
+      bool: True if the data is stored as-is in the extents.
+    """
+    if not self._fsntfs_file_entry.has_default_data_stream():
+      return False
+
+    file_attribute_flags = self._fsntfs_file_entry.file_attribute_flags
+    if file_attribute_flags & (
+        pyfsntfs.file_attribute_flags.COMPRESSED |
+        pyfsntfs.file_attribute_flags.ENCRYPTED):
+      return False
+
+    for fsntfs_attribute in self._fsntfs_file_entry.attributes:
+      if (fsntfs_attribute.attribute_type == self._ATTRIBUTE_TYPE_DATA and
+          not fsntfs_attribute.attribute_name):
+        # Data beyond the valid data size is not stored in the extents and
+        # reads as zero bytes.
+        return (
+            fsntfs_attribute.valid_data_size == fsntfs_attribute.data_size)
+
+    return False
+
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
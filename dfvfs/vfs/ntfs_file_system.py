@@ -3,10 +3,13 @@
 
 import pyfsntfs
 
+from dfdatetime import filetime as dfdatetime_filetime
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import ntfs_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import file_entry_stat
 from dfvfs.vfs import file_system
 from dfvfs.vfs import ntfs_file_entry
 
@@ -16,11 +19,19 @@ class NTFSFileSystem(file_system.FileSystem):
 
   MFT_ENTRY_ROOT_DIRECTORY = 5
 
+  CASE_INSENSITIVE_LOCATION_LOOKUP = True
+
   LOCATION_ROOT = '\\'
   PATH_SEPARATOR = '\\'
 
+  SUPPORTS_LOCATION_LOOKUP = True
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_NTFS
 
+  _ATTRIBUTE_TYPE_FILE_NAME = 0x00000030
+
+  _FILE_NAME_SPACE_DOS = 2
+
   def __init__(self, resolver_context, path_spec):
     """Initializes a file system object.
 
@@ -41,6 +52,92 @@ class NTFSFileSystem(file_system.FileSystem):
     self._fsntfs_volume = None
     self._file_object = None
 
+  def _GetFileEntryNameAndParent(self, fsntfs_file_entry):
+    """Retrieves the name and parent of a NTFS file entry.
+
+    The name and parent are read from the $FILE_NAME attributes, where a long
+    name is preferred over a DOS (8.3) name.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+
+    Returns:
+      tuple[str, int]: name and file reference of the parent of the file
+          entry or (None, None) if not available.
+    """
+    name = None
+    parent_file_reference = None
+    for fsntfs_attribute in fsntfs_file_entry.attributes:
+      if fsntfs_attribute.attribute_type == self._ATTRIBUTE_TYPE_FILE_NAME:
+        name = fsntfs_attribute.name
+        parent_file_reference = fsntfs_attribute.parent_file_reference
+        if fsntfs_attribute.name_space != self._FILE_NAME_SPACE_DOS:
+          break
+
+    return name, parent_file_reference
+
+  def _GetFileEntryStat(self, fsntfs_file_entry, name, location):
+    """Retrieves a stat record of a NTFS file entry.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+      name (str): name of the file entry or None if not available.
+      location (str): location of the file entry or None if not available.
+
+    Returns:
+      FileEntryStat: stat record.
+    """
+    stat_record = file_entry_stat.FileEntryStat()
+    stat_record.access_time = dfdatetime_filetime.Filetime(
+        timestamp=fsntfs_file_entry.get_access_time_as_integer())
+    stat_record.change_time = dfdatetime_filetime.Filetime(
+        timestamp=fsntfs_file_entry.get_entry_modification_time_as_integer())
+    stat_record.creation_time = dfdatetime_filetime.Filetime(
+        timestamp=fsntfs_file_entry.get_creation_time_as_integer())
+    stat_record.inode_number = fsntfs_file_entry.file_reference
+    stat_record.is_allocated = fsntfs_file_entry.is_allocated()
+    stat_record.location = location
+    stat_record.modification_time = dfdatetime_filetime.Filetime(
+        timestamp=fsntfs_file_entry.get_modification_time_as_integer())
+    stat_record.name = name
+    stat_record.size = fsntfs_file_entry.size
+
+    file_attribute_flags = fsntfs_file_entry.file_attribute_flags or 0
+    if file_attribute_flags & pyfsntfs.file_attribute_flags.REPARSE_POINT:
+      stat_record.type = definitions.FILE_ENTRY_TYPE_LINK
+    elif fsntfs_file_entry.has_directory_entries_index():
+      stat_record.type = definitions.FILE_ENTRY_TYPE_DIRECTORY
+    elif file_attribute_flags & pyfsntfs.file_attribute_flags.DEVICE:
+      stat_record.type = definitions.FILE_ENTRY_TYPE_DEVICE
+    else:
+      stat_record.type = definitions.FILE_ENTRY_TYPE_FILE
+
+    return stat_record
+
+  def _GetFileEntryStatByInode(self, inode_number):
+    """Retrieves a stat record of a file entry by inode.
+
+    Args:
+      inode_number (int): MFT entry number of the file entry.
+
+    Returns:
+      FileEntryStat: stat record or None if the MFT entry extends another
+          MFT entry.
+
+    Raises:
+      IOError: if the MFT entry cannot be retrieved.
+    """
+    fsntfs_file_entry = self._fsntfs_volume.get_file_entry(inode_number)
+    if fsntfs_file_entry.base_record_file_reference:
+      return None
+
+    name, parent_file_reference = self._GetFileEntryNameAndParent(
+        fsntfs_file_entry)
+
+    stat_record = self._GetFileEntryStat(fsntfs_file_entry, name, None)
+    stat_record.parent_inode_number = parent_file_reference
+    return stat_record
+
   def _Open(self, mode='rb'):
     """Opens the file system object defined by path specification.
 
@@ -97,6 +194,65 @@ class NTFSFileSystem(file_system.FileSystem):
 
     return fsntfs_file_entry is not None
 
+  def GetFileEntriesStat(self, path_spec):
+    """Retrieves stat records of the sub file entries of a directory.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Yields:
+      FileEntryStat: stat record of a sub file entry.
+
+    Raises:
+      BackEndError: if the directory cannot be opened.
+    """
+    try:
+      fsntfs_file_entry = self.GetNTFSFileEntryByPathSpec(path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    location_prefix = self._GetSubFileEntryLocationPrefix(path_spec)
+
+    for fsntfs_sub_file_entry in fsntfs_file_entry.sub_file_entries:
+      name = fsntfs_sub_file_entry.name
+
+      # Ignore references to self or parent.
+      if name in ('.', '..'):
+        continue
+
+      location = None
+      if location_prefix is not None:
+        location = ''.join([location_prefix, name])
+
+      yield self._GetFileEntryStat(fsntfs_sub_file_entry, name, location)
+
+  def GetFileEntriesStatByInodeRange(
+      self, first_inode_number, last_inode_number):
+    """Retrieves stat records of the file entries in a range of inodes.
+
+    The inode numbers of NTFS are MFT entry numbers. MFT entries that cannot
+    be retrieved and MFT entries that extend another MFT entry are skipped.
+    The locations of the file entries are not available.
+
+    Args:
+      first_inode_number (int): number of the first inode in the range.
+      last_inode_number (int): number of the last inode in the range.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    last_inode_number = min(
+        last_inode_number, self._fsntfs_volume.number_of_file_entries - 1)
+
+    for mft_entry in range(first_inode_number, last_inode_number + 1):
+      try:
+        stat_record = self._GetFileEntryStatByInode(mft_entry)
+      except IOError:
+        continue
+
+      if stat_record:
+        yield stat_record
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -178,3 +334,22 @@ class NTFSFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, mft_entry=self.MFT_ENTRY_ROOT_DIRECTORY,
         parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
+
+  def IterateFileEntriesByInode(self):
+    """Iterates over the file entries in order of inode number.
+
+    The MFT is read sequentially and the locations of the file entries are
+    reconstructed from the parent file references of their $FILE_NAME
+    attributes. File entries whose parent no longer references them have
+    location None. The stat records of the file entries of which the
+    location is not known yet are kept in memory and yielded last.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    fsntfs_file_entry = self._fsntfs_volume.get_file_entry(
+        self.MFT_ENTRY_ROOT_DIRECTORY)
+
+    yield from self._IterateFileEntriesByInodeRange(
+        0, self._fsntfs_volume.number_of_file_entries - 1,
+        fsntfs_file_entry.file_reference)
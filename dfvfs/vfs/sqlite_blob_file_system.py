@@ -3,6 +3,7 @@
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import sqlite_database
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import sqlite_blob_file_entry
@@ -22,6 +23,7 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
       path_spec (PathSpec): a path specification.
     """
     super(SQLiteBlobFileSystem, self).__init__(resolver_context, path_spec)
+    self._database_object = None
     self._file_object = None
     self._number_of_rows = None
 
@@ -31,6 +33,10 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    if self._database_object:
+      self._database_object.Close()
+
+    self._database_object = None
     self._file_object = None
     self._number_of_rows = None
 
@@ -54,6 +60,12 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
     file_object = resolver.Resolver.OpenFileObject(
         self._path_spec.parent, resolver_context=self._resolver_context)
 
+    # The database is opened once per parent and shared by all the SQLite
+    # blob file-like objects of the file system.
+    database_object = sqlite_database.SQLiteDatabaseFile()
+    database_object.Open(file_object)
+
+    self._database_object = database_object
     self._file_object = file_object
 
   def FileEntryExistsByPathSpec(self, path_spec):
@@ -76,6 +88,14 @@ class SQLiteBlobFileSystem(file_system.FileSystem):
 
     return bool(file_object)
 
+  def GetDatabaseObject(self):
+    """Retrieves the SQLite database file object.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database file object.
+    """
+    return self._database_object
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -4,6 +4,7 @@
 import os
 import tarfile
 
+from dfvfs.lib import archive_index
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import tar_path_spec
@@ -30,8 +31,10 @@ class TARFileSystem(file_system.FileSystem):
       encoding (Optional[str]): file entry name encoding.
     """
     super(TARFileSystem, self).__init__(resolver_context, path_spec)
+    self._directory_index = None
     self._file_object = None
     self._tar_file = None
+    self._tar_infos = None
     self.encoding = encoding
 
   def _Close(self):
@@ -42,6 +45,8 @@ class TARFileSystem(file_system.FileSystem):
     """
     self._tar_file.close()
     self._tar_file = None
+    self._tar_infos = None
+    self._directory_index = None
     self._file_object = None
 
   def _Open(self, mode='rb'):
@@ -75,8 +80,22 @@ class TARFileSystem(file_system.FileSystem):
     except tarfile.ReadError as exception:
       raise IOError(exception)
 
+    directory_index = archive_index.ArchiveDirectoryIndex(
+        path_separator=self.PATH_SEPARATOR)
+    tar_infos = {}
+
+    # Note that similar to tarfile.getmember() the last occurrence of a name
+    # in the TAR file takes precedence.
+    for tar_info in tar_file.getmembers():
+      path = tar_info.name.rstrip(self.PATH_SEPARATOR)
+      if path:
+        directory_index.AddPath(path, is_directory=tar_info.isdir())
+        tar_infos[path] = tar_info
+
+    self._directory_index = directory_index
     self._file_object = file_object
     self._tar_file = tar_file
+    self._tar_infos = tar_infos
 
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
@@ -96,20 +115,18 @@ class TARFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    try:
-      self._tar_file.getmember(location[1:])
-      return True
-    except KeyError:
-      pass
+    # The TAR info name does not have the leading path separator as
+    # the location string does.
+    return self._directory_index.PathExists(location[1:])
 
-    # Check if location could be a virtual directory.
-    for name in self._tar_file.getnames():
-      # The TAR info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
+  def GetDirectoryIndex(self):
+    """Retrieves the directory index.
 
-    return False
+    Returns:
+      ArchiveDirectoryIndex: directory index, including virtual directories,
+          or None if not available.
+    """
+    return self._directory_index
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -131,9 +148,11 @@ class TARFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     kwargs = {}
-    try:
-      kwargs['tar_info'] = self._tar_file.getmember(location[1:])
-    except KeyError:
+    tar_info = self._tar_infos.get(
+        location[1:].rstrip(self.PATH_SEPARATOR), None)
+    if tar_info is not None:
+      kwargs['tar_info'] = tar_info
+    else:
       kwargs['is_virtual'] = True
 
     return tar_file_entry.TARFileEntry(
@@ -176,11 +195,7 @@ class TARFileSystem(file_system.FileSystem):
     if not location.startswith(self.LOCATION_ROOT):
       raise errors.PathSpecError('Invalid location in path specification.')
 
-    tar_file = None
-    if len(location) > 1:
-      try:
-        tar_file = self._tar_file.getmember(location[1:])
-      except KeyError:
-        pass
+    if len(location) == 1:
+      return None
 
-    return tar_file
+    return self._tar_infos.get(location[1:].rstrip(self.PATH_SEPARATOR), None)
@@ -181,82 +181,200 @@ class TSKTime(dfdatetime_interface.DateTimeValues):
       return None, None, None
 
 
+# pytsk3.TSK_FS_TYPE_ENUM is unhashable, preventing a set
+# based lookup, hence lists are used.
+
+_TSK_EXT_FS_TYPES = [
+    pytsk3.TSK_FS_TYPE_EXT2,
+    pytsk3.TSK_FS_TYPE_EXT3,
+    pytsk3.TSK_FS_TYPE_EXT4,
+    pytsk3.TSK_FS_TYPE_EXT_DETECT]
+
+_TSK_FAT_FS_TYPES = [
+    pytsk3.TSK_FS_TYPE_EXFAT,
+    pytsk3.TSK_FS_TYPE_FAT_DETECT,
+    pytsk3.TSK_FS_TYPE_FAT12,
+    pytsk3.TSK_FS_TYPE_FAT16,
+    pytsk3.TSK_FS_TYPE_FAT32]
+
+_TSK_HFS_FS_TYPES = [
+    pytsk3.TSK_FS_TYPE_HFS,
+    pytsk3.TSK_FS_TYPE_HFS_DETECT]
+
+_TSK_ISO9660_FS_TYPES = [
+    pytsk3.TSK_FS_TYPE_ISO9660,
+    pytsk3.TSK_FS_TYPE_ISO9660_DETECT]
+
+_TSK_NTFS_FS_TYPES = [
+    pytsk3.TSK_FS_TYPE_NTFS,
+    pytsk3.TSK_FS_TYPE_NTFS_DETECT]
+
+_TSK_UFS_FS_TYPES = [
+    pytsk3.TSK_FS_TYPE_FFS_DETECT,
+    pytsk3.TSK_FS_TYPE_FFS1,
+    pytsk3.TSK_FS_TYPE_FFS1B,
+    pytsk3.TSK_FS_TYPE_FFS2]
+
+_TSK_ATIME_FS_TYPES = [pytsk3.TSK_FS_TYPE_YAFFS2]
+_TSK_ATIME_FS_TYPES.extend(_TSK_EXT_FS_TYPES)
+_TSK_ATIME_FS_TYPES.extend(_TSK_FAT_FS_TYPES)
+_TSK_ATIME_FS_TYPES.extend(_TSK_HFS_FS_TYPES)
+_TSK_ATIME_FS_TYPES.extend(_TSK_NTFS_FS_TYPES)
+_TSK_ATIME_FS_TYPES.extend(_TSK_UFS_FS_TYPES)
+
+_TSK_BKUP_FS_TYPES = _TSK_HFS_FS_TYPES
+
+_TSK_CTIME_FS_TYPES = [pytsk3.TSK_FS_TYPE_YAFFS2]
+_TSK_CTIME_FS_TYPES.extend(_TSK_EXT_FS_TYPES)
+_TSK_CTIME_FS_TYPES.extend(_TSK_HFS_FS_TYPES)
+_TSK_CTIME_FS_TYPES.extend(_TSK_NTFS_FS_TYPES)
+_TSK_CTIME_FS_TYPES.extend(_TSK_UFS_FS_TYPES)
+
+_TSK_CRTIME_FS_TYPES = [pytsk3.TSK_FS_TYPE_EXT4]
+_TSK_CRTIME_FS_TYPES.extend(_TSK_FAT_FS_TYPES)
+_TSK_CRTIME_FS_TYPES.extend(_TSK_HFS_FS_TYPES)
+_TSK_CRTIME_FS_TYPES.extend(_TSK_ISO9660_FS_TYPES)
+_TSK_CRTIME_FS_TYPES.extend(_TSK_NTFS_FS_TYPES)
+
+_TSK_DTIME_FS_TYPES = _TSK_EXT_FS_TYPES
+
+_TSK_MTIME_FS_TYPES = [pytsk3.TSK_FS_TYPE_YAFFS2]
+_TSK_MTIME_FS_TYPES.extend(_TSK_EXT_FS_TYPES)
+_TSK_MTIME_FS_TYPES.extend(_TSK_FAT_FS_TYPES)
+_TSK_MTIME_FS_TYPES.extend(_TSK_HFS_FS_TYPES)
+_TSK_MTIME_FS_TYPES.extend(_TSK_NTFS_FS_TYPES)
+_TSK_MTIME_FS_TYPES.extend(_TSK_UFS_FS_TYPES)
+
+_TSK_HAS_NANO_FS_TYPES = frozenset([
+    pytsk3.TSK_FS_TYPE_EXFAT,
+    pytsk3.TSK_FS_TYPE_EXT4,
+    pytsk3.TSK_FS_TYPE_FFS2,
+    pytsk3.TSK_FS_TYPE_HFS,
+    pytsk3.TSK_FS_TYPE_NTFS])
+
+_TSK_FS_TYPES_PER_TIME_VALUE = {
+    'atime': _TSK_ATIME_FS_TYPES,
+    'bkup': _TSK_BKUP_FS_TYPES,
+    'crtime': _TSK_CRTIME_FS_TYPES,
+    'ctime': _TSK_CTIME_FS_TYPES,
+    'dtime': _TSK_DTIME_FS_TYPES,
+    'mtime': _TSK_MTIME_FS_TYPES}
+
+
+def TSKFileGetEntryType(tsk_file):
+  """Retrieves the file entry type of a TSK file.
+
+  Args:
+    tsk_file (pytsk3.File): TSK file.
+
+  Returns:
+    str: file entry type or None if not available.
+  """
+  # The type is an instance of pytsk3.TSK_FS_META_TYPE_ENUM.
+  tsk_fs_meta_type = getattr(
+      tsk_file.info.meta, 'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
+
+  if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_REG:
+    return definitions.FILE_ENTRY_TYPE_FILE
+  if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_DIR:
+    return definitions.FILE_ENTRY_TYPE_DIRECTORY
+  if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_LNK:
+    return definitions.FILE_ENTRY_TYPE_LINK
+  if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_CHR:
+    return definitions.FILE_ENTRY_TYPE_CHARACTER_DEVICE
+  if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_BLK:
+    return definitions.FILE_ENTRY_TYPE_BLOCK_DEVICE
+  if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_FIFO:
+    return definitions.FILE_ENTRY_TYPE_PIPE
+  if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_SOCK:
+    return definitions.FILE_ENTRY_TYPE_SOCKET
+
+  # TODO: implement support for:
+  # pytsk3.TSK_FS_META_TYPE_UNDEF
+  # pytsk3.TSK_FS_META_TYPE_SHAD
+  # pytsk3.TSK_FS_META_TYPE_WHT
+  # pytsk3.TSK_FS_META_TYPE_VIRT
+
+  return None
+
+
+def TSKFileGetTimeValue(tsk_file, name):
+  """Retrieves a date and time value of a TSK file.
+
+  Args:
+    tsk_file (pytsk3.File): TSK file.
+    name (str): name of the date and time value, for example "atime" or
+        "mtime".
+
+  Returns:
+    dfdatetime.DateTimeValues: date and time value or None if not available.
+  """
+  file_system_type = tsk_file.info.fs_info.ftype
+  if file_system_type not in _TSK_FS_TYPES_PER_TIME_VALUE.get(name, []):
+    return None
+
+  timestamp = getattr(tsk_file.info.meta, name, None)
+  if timestamp is None:
+    return None
+
+  if file_system_type in _TSK_HAS_NANO_FS_TYPES:
+    fraction_of_second = getattr(tsk_file.info.meta, f'{name:s}_nano', None)
+  else:
+    fraction_of_second = None
+
+  is_local_time = False
+  precision = None
+
+  if file_system_type in (pytsk3.TSK_FS_TYPE_EXT2, pytsk3.TSK_FS_TYPE_EXT3):
+    precision = dfdatetime_definitions.PRECISION_1_SECOND
+
+  elif file_system_type == pytsk3.TSK_FS_TYPE_EXT4:
+    # Note that pytsk3 can return 0 for an ext4 creation time even if the
+    # inode does not contain it.
+    if name == 'crtime' and timestamp == 0:
+      return None
+
+  elif file_system_type in (
+      pytsk3.TSK_FS_TYPE_FAT12, pytsk3.TSK_FS_TYPE_FAT16,
+      pytsk3.TSK_FS_TYPE_FAT32):
+    is_local_time = True
+    if name == 'atime':
+      precision = dfdatetime_definitions.PRECISION_1_DAY
+    else:
+      precision = dfdatetime_definitions.PRECISION_2_SECONDS
+
+  elif file_system_type == pytsk3.TSK_FS_TYPE_NTFS:
+    precision = dfdatetime_definitions.PRECISION_100_NANOSECONDS
+
+  # TODO: determine if file system type is traditional HFS and set
+  # is_local_time accordingly.
+
+  date_time = TSKTime(
+      fraction_of_second=fraction_of_second, precision=precision,
+      timestamp=timestamp)
+  date_time.is_local_time = is_local_time
+  return date_time
+
+
+def TSKFileIsAllocated(tsk_file):
+  """Determines if a TSK file is allocated.
+
+  Args:
+    tsk_file (pytsk3.File): TSK file.
+
+  Returns:
+    bool: True if the TSK file is allocated.
+  """
+  # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
+  flags = getattr(tsk_file.info.meta, 'flags', 0)
+  return bool(int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC)
+
+
 class TSKFileEntry(file_entry.FileEntry):
   """File system file entry that uses pytsk3."""
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_TSK
 
-  # pytsk3.TSK_FS_TYPE_ENUM is unhashable, preventing a set
-  # based lookup, hence lists are used.
-
-  _TSK_EXT_FS_TYPES = [
-      pytsk3.TSK_FS_TYPE_EXT2,
-      pytsk3.TSK_FS_TYPE_EXT3,
-      pytsk3.TSK_FS_TYPE_EXT4,
-      pytsk3.TSK_FS_TYPE_EXT_DETECT]
-
-  _TSK_FAT_FS_TYPES = [
-      pytsk3.TSK_FS_TYPE_EXFAT,
-      pytsk3.TSK_FS_TYPE_FAT_DETECT,
-      pytsk3.TSK_FS_TYPE_FAT12,
-      pytsk3.TSK_FS_TYPE_FAT16,
-      pytsk3.TSK_FS_TYPE_FAT32]
-
-  _TSK_HFS_FS_TYPES = [
-      pytsk3.TSK_FS_TYPE_HFS,
-      pytsk3.TSK_FS_TYPE_HFS_DETECT]
-
-  _TSK_ISO9660_FS_TYPES = [
-      pytsk3.TSK_FS_TYPE_ISO9660,
-      pytsk3.TSK_FS_TYPE_ISO9660_DETECT]
-
-  _TSK_NTFS_FS_TYPES = [
-      pytsk3.TSK_FS_TYPE_NTFS,
-      pytsk3.TSK_FS_TYPE_NTFS_DETECT]
-
-  _TSK_UFS_FS_TYPES = [
-      pytsk3.TSK_FS_TYPE_FFS_DETECT,
-      pytsk3.TSK_FS_TYPE_FFS1,
-      pytsk3.TSK_FS_TYPE_FFS1B,
-      pytsk3.TSK_FS_TYPE_FFS2]
-
-  _TSK_ATIME_FS_TYPES = [pytsk3.TSK_FS_TYPE_YAFFS2]
-  _TSK_ATIME_FS_TYPES.extend(_TSK_EXT_FS_TYPES)
-  _TSK_ATIME_FS_TYPES.extend(_TSK_FAT_FS_TYPES)
-  _TSK_ATIME_FS_TYPES.extend(_TSK_HFS_FS_TYPES)
-  _TSK_ATIME_FS_TYPES.extend(_TSK_NTFS_FS_TYPES)
-  _TSK_ATIME_FS_TYPES.extend(_TSK_UFS_FS_TYPES)
-
-  _TSK_BKUP_FS_TYPES = _TSK_HFS_FS_TYPES
-
-  _TSK_CTIME_FS_TYPES = [pytsk3.TSK_FS_TYPE_YAFFS2]
-  _TSK_CTIME_FS_TYPES.extend(_TSK_EXT_FS_TYPES)
-  _TSK_CTIME_FS_TYPES.extend(_TSK_HFS_FS_TYPES)
-  _TSK_CTIME_FS_TYPES.extend(_TSK_NTFS_FS_TYPES)
-  _TSK_CTIME_FS_TYPES.extend(_TSK_UFS_FS_TYPES)
-
-  _TSK_CRTIME_FS_TYPES = [pytsk3.TSK_FS_TYPE_EXT4]
-  _TSK_CRTIME_FS_TYPES.extend(_TSK_FAT_FS_TYPES)
-  _TSK_CRTIME_FS_TYPES.extend(_TSK_HFS_FS_TYPES)
-  _TSK_CRTIME_FS_TYPES.extend(_TSK_ISO9660_FS_TYPES)
-  _TSK_CRTIME_FS_TYPES.extend(_TSK_NTFS_FS_TYPES)
-
-  _TSK_DTIME_FS_TYPES = _TSK_EXT_FS_TYPES
-
-  _TSK_MTIME_FS_TYPES = [pytsk3.TSK_FS_TYPE_YAFFS2]
-  _TSK_MTIME_FS_TYPES.extend(_TSK_EXT_FS_TYPES)
-  _TSK_MTIME_FS_TYPES.extend(_TSK_FAT_FS_TYPES)
-  _TSK_MTIME_FS_TYPES.extend(_TSK_HFS_FS_TYPES)
-  _TSK_MTIME_FS_TYPES.extend(_TSK_NTFS_FS_TYPES)
-  _TSK_MTIME_FS_TYPES.extend(_TSK_UFS_FS_TYPES)
-
-  _TSK_HAS_NANO_FS_TYPES = frozenset([
-      pytsk3.TSK_FS_TYPE_EXFAT,
-      pytsk3.TSK_FS_TYPE_EXT4,
-      pytsk3.TSK_FS_TYPE_FFS2,
-      pytsk3.TSK_FS_TYPE_HFS,
-      pytsk3.TSK_FS_TYPE_NTFS])
-
   _TSK_INTERNAL_ATTRIBUTE_TYPES = frozenset([
       pytsk3.TSK_FS_ATTR_TYPE_APFS_COMP_REC,
       pytsk3.TSK_FS_ATTR_TYPE_APFS_DATA,
@@ -300,35 +418,11 @@ class TSKFileEntry(file_entry.FileEntry):
     super(TSKFileEntry, self).__init__(
         resolver_context, file_system, path_spec, is_root=is_root,
         is_virtual=is_virtual)
-    self._file_system_type = tsk_file.info.fs_info.ftype
     self._name = None
     self._parent_inode = parent_inode
     self._tsk_file = tsk_file
 
-    # The type is an instance of pytsk3.TSK_FS_META_TYPE_ENUM.
-    tsk_fs_meta_type = getattr(
-        tsk_file.info.meta, 'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
-
-    if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_REG:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_FILE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_DIR:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_DIRECTORY
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_LNK:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_LINK
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_CHR:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_CHARACTER_DEVICE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_BLK:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_BLOCK_DEVICE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_FIFO:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_PIPE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_SOCK:
-      self.entry_type = definitions.FILE_ENTRY_TYPE_SOCKET
-
-    # TODO: implement support for:
-    # pytsk3.TSK_FS_META_TYPE_UNDEF
-    # pytsk3.TSK_FS_META_TYPE_SHAD
-    # pytsk3.TSK_FS_META_TYPE_WHT
-    # pytsk3.TSK_FS_META_TYPE_VIRT
+    self.entry_type = TSKFileGetEntryType(tsk_file)
 
   def _GetAttributes(self):
     """Retrieves the attributes.
@@ -408,6 +502,30 @@ class TSKFileEntry(file_entry.FileEntry):
 
     return self._data_streams
 
+  def _GetDefaultDataAttribute(self):
+    """Retrieves the attribute of the default data stream.
+
+    Returns:
+      pytsk3.Attribute: attribute of the default data stream or None if not
+          available.
+    """
+    for pytsk_attribute in self._tsk_file:
+      if not getattr(pytsk_attribute, 'info', None):
+        continue
+
+      attribute_name = getattr(pytsk_attribute.info, 'name', None)
+      attribute_type = getattr(pytsk_attribute.info, 'type', None)
+
+      # The data stream is returned as a name-less attribute of type
+      # pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA or
+      # pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA
+      if not attribute_name and attribute_type in (
+          pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA,
+          pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA):
+        return pytsk_attribute
+
+    return None
+
   def _GetDirectory(self):
     """Retrieves a directory.
 
@@ -485,112 +603,71 @@ class TSKFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
-        yield TSKFileEntry(self._resolver_context, self._file_system, path_spec)
+      parent_inode = getattr(self.path_spec, 'inode', None)
 
-  def _GetTimeValue(self, name):
-    """Retrieves a date and time value.
+      # Note that the TSK files of the directory iteration are passed to
+      # the sub file entries, so that they are not opened again by inode.
+      for path_spec, tsk_file in self._directory.GetEntriesWithTSKFiles():
+        yield TSKFileEntry(
+            self._resolver_context, self._file_system, path_spec,
+            parent_inode=parent_inode, tsk_file=tsk_file)
 
-    Args:
-      name (str): name of the date and time value, for example "atime" or
-          "mtime".
+  def _IsDataStoredInExtents(self):
+    """Determines if the data is stored as-is in the extents.
 
     Returns:
-      dfdatetime.DateTimeValues: date and time value or None if not available.
+      bool: True if the data is stored as-is in the extents.
     """
-    timestamp = getattr(self._tsk_file.info.meta, name, None)
-    if timestamp is None:
-      return None
-
-    if self._file_system_type in self._TSK_HAS_NANO_FS_TYPES:
-      fraction_of_second = getattr(
-          self._tsk_file.info.meta, f'{name:s}_nano', None)
-    else:
-      fraction_of_second = None
-
-    is_local_time = False
-    precision = None
-
-    if self._file_system_type in (
-        pytsk3.TSK_FS_TYPE_EXT2, pytsk3.TSK_FS_TYPE_EXT3):
-      precision = dfdatetime_definitions.PRECISION_1_SECOND
-
-    elif self._file_system_type == pytsk3.TSK_FS_TYPE_EXT4:
-      # Note that pytsk3 can return 0 for an ext4 creation time even if the
-      # inode does not contain it.
-      if name == 'crtime' and timestamp == 0:
-        return None
-
-    elif self._file_system_type in (
-        pytsk3.TSK_FS_TYPE_FAT12, pytsk3.TSK_FS_TYPE_FAT16,
-        pytsk3.TSK_FS_TYPE_FAT32):
-      is_local_time = True
-      if name == 'atime':
-        precision = dfdatetime_definitions.PRECISION_1_DAY
-      else:
-        precision = dfdatetime_definitions.PRECISION_2_SECONDS
+    data_attribute = self._GetDefaultDataAttribute()
+    if not data_attribute:
+      return False
 
-    elif self._file_system_type == pytsk3.TSK_FS_TYPE_NTFS:
-      precision = dfdatetime_definitions.PRECISION_100_NANOSECONDS
+    attribute_flags = getattr(data_attribute.info, 'flags', None)
+    if attribute_flags is None or attribute_flags & (
+        pytsk3.TSK_FS_ATTR_COMP | pytsk3.TSK_FS_ATTR_ENC |
+        pytsk3.TSK_FS_ATTR_RES):
+      return False
 
-    # TODO: determine if file system type is traditional HFS and set
-    # is_local_time accordingly.
+    for tsk_attr_run in data_attribute:
+      # Filler runs have no known location in the volume.
+      if tsk_attr_run.flags & (
+          pytsk3.TSK_FS_ATTR_RUN_FLAG_ENCRYPTED |
+          pytsk3.TSK_FS_ATTR_RUN_FLAG_FILLER):
+        return False
 
-    date_time = TSKTime(
-        fraction_of_second=fraction_of_second, precision=precision,
-        timestamp=timestamp)
-    date_time.is_local_time = is_local_time
-    return date_time
+    return True
 
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
-    if self._file_system_type not in self._TSK_ATIME_FS_TYPES:
-      return None
-
-    return self._GetTimeValue('atime')
+    return TSKFileGetTimeValue(self._tsk_file, 'atime')
 
   # TODO: add added time support, at least provided for APFS.
 
   @property
   def backup_time(self):
     """dfdatetime.DateTimeValues: backup time or None if not available."""
-    if self._file_system_type not in self._TSK_BKUP_FS_TYPES:
-      return None
-
-    return self._GetTimeValue('bkup')
+    return TSKFileGetTimeValue(self._tsk_file, 'bkup')
 
   @property
   def change_time(self):
     """dfdatetime.DateTimeValues: change time or None if not available."""
-    if self._file_system_type not in self._TSK_CTIME_FS_TYPES:
-      return None
-
-    return self._GetTimeValue('ctime')
+    return TSKFileGetTimeValue(self._tsk_file, 'ctime')
 
   @property
   def creation_time(self):
     """dfdatetime.DateTimeValues: creation time or None if not available."""
-    if self._file_system_type not in self._TSK_CRTIME_FS_TYPES:
-      return None
-
-    return self._GetTimeValue('crtime')
+    return TSKFileGetTimeValue(self._tsk_file, 'crtime')
 
   @property
   def deletion_time(self):
     """dfdatetime.DateTimeValues: deletion time or None if not available."""
-    if self._file_system_type not in self._TSK_DTIME_FS_TYPES:
-      return None
-
-    return self._GetTimeValue('dtime')
+    return TSKFileGetTimeValue(self._tsk_file, 'dtime')
 
   @property
   def modification_time(self):
     """dfdatetime.DateTimeValues: modification time or None if not available."""
-    if self._file_system_type not in self._TSK_MTIME_FS_TYPES:
-      return None
-
-    return self._GetTimeValue('mtime')
+    return TSKFileGetTimeValue(self._tsk_file, 'mtime')
 
   # pylint: disable=missing-return-doc,missing-return-type-doc
   @property
@@ -639,22 +716,7 @@ class TSKFileEntry(file_entry.FileEntry):
     if self.entry_type != definitions.FILE_ENTRY_TYPE_FILE:
       return []
 
-    data_attribute = None
-    for pytsk_attribute in self._tsk_file:
-      if not getattr(pytsk_attribute, 'info', None):
-        continue
-
-      attribute_name = getattr(pytsk_attribute.info, 'name', None)
-      attribute_type = getattr(pytsk_attribute.info, 'type', None)
-
-      # The data stream is returned as a name-less attribute of type
-      # pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA or
-      # pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA
-      if not attribute_name and attribute_type in (
-          pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA,
-          pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA):
-        data_attribute = pytsk_attribute
-        break
+    data_attribute = self._GetDefaultDataAttribute()
 
     extents = []
     if data_attribute:
@@ -799,9 +861,7 @@ class TSKFileEntry(file_entry.FileEntry):
     Returns:
       bool: True if the file entry is allocated.
     """
-    # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
-    flags = getattr(self._tsk_file.info.meta, 'flags', 0)
-    return bool(int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC)
+    return TSKFileIsAllocated(self._tsk_file)
 
 
 dfdatetime_factory.Factory.RegisterDateTimeValues(TSKTime)
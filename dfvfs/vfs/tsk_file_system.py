@@ -8,6 +8,7 @@ from dfvfs.lib import errors
 from dfvfs.lib import tsk_image
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import file_entry_stat
 from dfvfs.vfs import file_system
 from dfvfs.vfs import tsk_file_entry
 
@@ -38,6 +39,151 @@ class TSKFileSystem(file_system.FileSystem):
     self._tsk_file_system = None
     self._file_object = None
 
+  def _GetDirectoryEntries(self, tsk_directory, inode):
+    """Retrieves the entries of a TSK directory.
+
+    The per file system constants, such as if the file system is NTFS, are
+    determined once per directory instead of once per directory entry.
+
+    Args:
+      tsk_directory (pytsk3.Directory): TSK directory.
+      inode (int): inode number of the directory or None if not available.
+
+    Yields:
+      tuple[pytsk3.File, str]: TSK file and name of a directory entry, where
+          the name is None if not available.
+    """
+    is_ntfs = self.IsNTFS()
+    unallocated_flag = int(pytsk3.TSK_FS_NAME_FLAG_UNALLOC)
+
+    for tsk_directory_entry in tsk_directory:
+      # Note that because pytsk3 does not explicitly define info, fs_info, meta
+      # and addr the attributes are accessed at once and directory entries
+      # where any of them is not defined or None are ignored.
+      try:
+        tsk_file_info = tsk_directory_entry.info
+        if tsk_file_info.fs_info is None:
+          continue
+
+        directory_entry_inode = tsk_file_info.meta.addr
+
+      except AttributeError:
+        continue
+
+      # Ignore references to self.
+      if directory_entry_inode == inode:
+        continue
+
+      # On non-NTFS file systems ignore inode 0.
+      if directory_entry_inode == 0 and not is_ntfs:
+        continue
+
+      name = None
+
+      tsk_fs_name = getattr(tsk_file_info, 'name', None)
+      if tsk_fs_name is not None:
+        # Ignore file entries marked as "unallocated".
+        flags = getattr(tsk_fs_name, 'flags', 0)
+        if int(flags) & unallocated_flag:
+          continue
+
+        name = getattr(tsk_fs_name, 'name', '')
+
+        try:
+          # pytsk3 returns an UTF-8 encoded byte string.
+          name = name.decode('utf8')
+        except UnicodeError:
+          # Continue here since we cannot represent the directory entry.
+          continue
+
+        # Ignore references to self or parent.
+        if name in ('.', '..'):
+          continue
+
+      yield tsk_directory_entry, name or None
+
+  def _GetFileEntryStat(self, tsk_file, name, location):
+    """Retrieves a stat record of a TSK file.
+
+    Args:
+      tsk_file (pytsk3.File): TSK file.
+      name (str): name of the file entry or None if not available.
+      location (str): location of the file entry or None if not available.
+
+    Returns:
+      FileEntryStat: stat record.
+
+    Raises:
+      BackEndError: if the TSK File .info, .info.meta or .info.fs_info
+          attribute is missing.
+    """
+    if (not tsk_file or not tsk_file.info or not tsk_file.info.meta or
+        not tsk_file.info.fs_info):
+      raise errors.BackEndError(
+          'Missing TSK File .info, .info.meta or .info.fs_info')
+
+    stat_record = file_entry_stat.FileEntryStat()
+    stat_record.access_time = tsk_file_entry.TSKFileGetTimeValue(
+        tsk_file, 'atime')
+    stat_record.change_time = tsk_file_entry.TSKFileGetTimeValue(
+        tsk_file, 'ctime')
+    stat_record.creation_time = tsk_file_entry.TSKFileGetTimeValue(
+        tsk_file, 'crtime')
+    stat_record.inode_number = getattr(tsk_file.info.meta, 'addr', None)
+    stat_record.is_allocated = tsk_file_entry.TSKFileIsAllocated(tsk_file)
+    stat_record.location = location
+    stat_record.modification_time = tsk_file_entry.TSKFileGetTimeValue(
+        tsk_file, 'mtime')
+    stat_record.name = name
+    stat_record.size = getattr(tsk_file.info.meta, 'size', None)
+    stat_record.type = tsk_file_entry.TSKFileGetEntryType(tsk_file)
+
+    return stat_record
+
+  def _GetFileEntryStatByInode(self, inode_number):
+    """Retrieves a stat record of a file entry by inode.
+
+    Args:
+      inode_number (int): inode number of the file entry.
+
+    Returns:
+      FileEntryStat: stat record or None if the inode was never used.
+
+    Raises:
+      BackEndError: if the TSK file is missing metadata.
+      IOError: if the inode cannot be opened.
+    """
+    tsk_file = self._tsk_file_system.open_meta(inode=inode_number)
+
+    # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
+    flags = getattr(tsk_file.info.meta, 'flags', 0)
+    if int(flags) & pytsk3.TSK_FS_META_FLAG_UNUSED:
+      return None
+
+    return self._GetFileEntryStat(tsk_file, None, None)
+
+  def _GetSubFileEntriesStatByInode(self, inode_number):
+    """Retrieves stat records of the sub file entries of a directory by inode.
+
+    Args:
+      inode_number (int): inode number of the directory.
+
+    Yields:
+      FileEntryStat: stat record, without location, of a sub file entry.
+    """
+    try:
+      tsk_directory = self._tsk_file_system.open_dir(inode=inode_number)
+    except IOError:
+      return
+
+    for tsk_directory_entry, name in self._GetDirectoryEntries(
+        tsk_directory, inode_number):
+      if name:
+        try:
+          yield self._GetFileEntryStat(tsk_directory_entry, name, None)
+        except errors.BackEndError:
+          pass
+
   def _Open(self, mode='rb'):
     """Opens the file system object defined by path specification.
 
@@ -88,6 +234,62 @@ class TSKFileSystem(file_system.FileSystem):
 
     return tsk_file is not None
 
+  def GetFileEntriesStat(self, path_spec):
+    """Retrieves stat records of the sub file entries of a directory.
+
+    The sub file entries are read from the TSK directory, which prevents
+    every sub file entry from being opened again by inode.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Yields:
+      FileEntryStat: stat record of a sub file entry.
+
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    location_prefix = self._GetSubFileEntryLocationPrefix(path_spec)
+
+    for tsk_directory_entry, name in self.GetTSKDirectoryEntriesByPathSpec(
+        path_spec):
+      location = None
+      if name and location_prefix is not None:
+        location = ''.join([location_prefix, name])
+
+      yield self._GetFileEntryStat(tsk_directory_entry, name, location)
+
+  def GetFileEntriesStatByInodeRange(
+      self, first_inode_number, last_inode_number):
+    """Retrieves stat records of the file entries in a range of inodes.
+
+    Inodes that cannot be opened and inodes that were never used are skipped.
+    The locations and names of the file entries are not available.
+
+    Args:
+      first_inode_number (int): number of the first inode in the range.
+      last_inode_number (int): number of the last inode in the range.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    tsk_fs_info = getattr(self._tsk_file_system, 'info', None)
+    if tsk_fs_info is not None:
+      first_inode_number = max(
+          first_inode_number, getattr(tsk_fs_info, 'first_inum', 0))
+      last_inode_number = min(
+          last_inode_number, getattr(
+              tsk_fs_info, 'last_inum', last_inode_number))
+
+    for inode_number in range(first_inode_number, last_inode_number + 1):
+      try:
+        stat_record = self._GetFileEntryStatByInode(inode_number)
+      except (IOError, errors.BackEndError):
+        continue
+
+      if stat_record:
+        yield stat_record
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -186,6 +388,38 @@ class TSKFileSystem(file_system.FileSystem):
     # other than None
     return getattr(self._tsk_file_system.info, 'root_inum', None)
 
+  def GetTSKDirectoryEntriesByPathSpec(self, path_spec):
+    """Retrieves the entries of a TSK directory by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Yields:
+      tuple[pytsk3.File, str]: TSK file and name of a directory entry, where
+          the name is None if not available.
+
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    # Opening a file by inode number is faster than opening a file by location.
+    inode = getattr(path_spec, 'inode', None)
+    location = getattr(path_spec, 'location', None)
+
+    tsk_directory = None
+
+    try:
+      if inode is not None:
+        tsk_directory = self._tsk_file_system.open_dir(inode=inode)
+      elif location is not None:
+        tsk_directory = self._tsk_file_system.open_dir(path=location)
+
+    except IOError as exception:
+      raise errors.BackEndError(
+          f'Unable to open directory with error: {exception!s}')
+
+    if tsk_directory:
+      yield from self._GetDirectoryEntries(tsk_directory, inode)
+
   def GetTSKFileByPathSpec(self, path_spec):
     """Retrieves the SleuthKit file object for a path specification.
 
@@ -243,3 +477,23 @@ class TSKFileSystem(file_system.FileSystem):
     tsk_fs_type = self.GetFsType()
     return tsk_fs_type in [
         pytsk3.TSK_FS_TYPE_NTFS, pytsk3.TSK_FS_TYPE_NTFS_DETECT]
+
+  def IterateFileEntriesByInode(self):
+    """Iterates over the file entries in order of inode number.
+
+    The inodes are opened in order of inode number and the locations of the
+    file entries are reconstructed from the entries of the directories.
+    Inodes that are not referenced by a directory have location None. The
+    stat records of the file entries of which the location is not known yet
+    are kept in memory and yielded last.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    tsk_fs_info = getattr(self._tsk_file_system, 'info', None)
+    if tsk_fs_info is None:
+      return
+
+    yield from self._IterateFileEntriesByInodeRange(
+        getattr(tsk_fs_info, 'first_inum', 0),
+        getattr(tsk_fs_info, 'last_inum', 0), self.GetRootInode())
@@ -3,10 +3,13 @@
 
 import pyfsxfs
 
+from dfdatetime import posix_time as dfdatetime_posix_time
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import xfs_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import file_entry_stat
 from dfvfs.vfs import file_system
 from dfvfs.vfs import xfs_file_entry
 
@@ -14,6 +17,8 @@ from dfvfs.vfs import xfs_file_entry
 class XFSFileSystem(file_system.FileSystem):
   """File system that uses pyfsxfs."""
 
+  SUPPORTS_LOCATION_LOOKUP = True
+
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_XFS
 
   def __init__(self, resolver_context, path_spec):
@@ -37,6 +42,43 @@ class XFSFileSystem(file_system.FileSystem):
     self._fsxfs_volume = None
     self._file_object = None
 
+  def _GetFileEntryStat(self, fsxfs_file_entry, name, location):
+    """Retrieves a stat record of a XFS file entry.
+
+    Args:
+      fsxfs_file_entry (pyfsxfs.file_entry): XFS file entry.
+      name (str): name of the file entry or None if not available.
+      location (str): location of the file entry or None if not available.
+
+    Returns:
+      FileEntryStat: stat record.
+    """
+    stat_record = file_entry_stat.FileEntryStat()
+    stat_record.access_time = dfdatetime_posix_time.PosixTimeInNanoseconds(
+        timestamp=fsxfs_file_entry.get_access_time_as_integer())
+    stat_record.change_time = dfdatetime_posix_time.PosixTimeInNanoseconds(
+        timestamp=fsxfs_file_entry.get_inode_change_time_as_integer())
+    stat_record.inode_number = fsxfs_file_entry.inode_number
+    stat_record.is_allocated = fsxfs_file_entry.number_of_links > 0
+    stat_record.location = location
+    stat_record.modification_time = (
+        dfdatetime_posix_time.PosixTimeInNanoseconds(
+            timestamp=fsxfs_file_entry.get_modification_time_as_integer()))
+    stat_record.name = name
+    stat_record.size = fsxfs_file_entry.size
+
+    # pylint: disable=protected-access
+    stat_record.type = xfs_file_entry.XFSFileEntry._ENTRY_TYPES.get(
+        fsxfs_file_entry.file_mode & 0xf000, None)
+
+    creation_time = fsxfs_file_entry.get_creation_time_as_integer()
+    if creation_time is not None:
+      stat_record.creation_time = (
+          dfdatetime_posix_time.PosixTimeInNanoseconds(
+              timestamp=creation_time))
+
+    return stat_record
+
   def _Open(self, mode='rb'):
     """Opens the file system defined by path specification.
 
@@ -93,6 +135,58 @@ class XFSFileSystem(file_system.FileSystem):
 
     return fsxfs_file_entry is not None
 
+  def GetFileEntriesStat(self, path_spec):
+    """Retrieves stat records of the sub file entries of a directory.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Yields:
+      FileEntryStat: stat record of a sub file entry.
+
+    Raises:
+      BackEndError: if the directory cannot be opened.
+    """
+    try:
+      fsxfs_file_entry = self.GetXFSFileEntryByPathSpec(path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    location_prefix = self._GetSubFileEntryLocationPrefix(path_spec)
+
+    for fsxfs_sub_file_entry in fsxfs_file_entry.sub_file_entries:
+      name = fsxfs_sub_file_entry.name
+
+      location = None
+      if location_prefix is not None:
+        location = ''.join([location_prefix, name])
+
+      yield self._GetFileEntryStat(fsxfs_sub_file_entry, name, location)
+
+  def GetFileEntriesStatByInodeRange(
+      self, first_inode_number, last_inode_number):
+    """Retrieves stat records of the file entries in a range of inodes.
+
+    Inodes that cannot be retrieved are skipped. The locations and names of
+    the file entries are not available. Unused inodes are reported as not
+    allocated.
+
+    Args:
+      first_inode_number (int): number of the first inode in the range.
+      last_inode_number (int): number of the last inode in the range.
+
+    Yields:
+      FileEntryStat: stat record of a file entry.
+    """
+    for inode_number in range(first_inode_number, last_inode_number + 1):
+      try:
+        fsxfs_file_entry = self._fsxfs_volume.get_file_entry_by_inode(
+            inode_number)
+      except IOError:
+        continue
+
+      yield self._GetFileEntryStat(fsxfs_file_entry, None, None)
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -3,6 +3,7 @@
 
 import zipfile
 
+from dfvfs.lib import archive_index
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import zip_path_spec
@@ -29,6 +30,7 @@ class ZipFileSystem(file_system.FileSystem):
       encoding (Optional[str]): encoding of the file entry name.
     """
     super(ZipFileSystem, self).__init__(resolver_context, path_spec)
+    self._directory_index = None
     self._file_object = None
     self._zip_file = None
     self.encoding = encoding
@@ -41,6 +43,7 @@ class ZipFileSystem(file_system.FileSystem):
     """
     self._zip_file.close()
     self._zip_file = None
+    self._directory_index = None
     self._file_object = None
 
   def _Open(self, mode='rb'):
@@ -69,6 +72,22 @@ class ZipFileSystem(file_system.FileSystem):
     except zipfile.BadZipFile as exception:
       raise errors.BackEndError(exception)
 
+    directory_index = archive_index.ArchiveDirectoryIndex(
+        path_separator=self.PATH_SEPARATOR)
+
+    for zip_info in zip_file.infolist():
+      path = getattr(zip_info, 'filename', None)
+      if path is not None and not isinstance(path, str):
+        try:
+          path = path.decode(self.encoding)
+        except UnicodeDecodeError:
+          path = None
+
+      if path:
+        directory_index.AddPath(
+            path, is_directory=path.endswith(self.PATH_SEPARATOR))
+
+    self._directory_index = directory_index
     self._file_object = file_object
     self._zip_file = zip_file
 
@@ -90,20 +109,18 @@ class ZipFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    try:
-      self._zip_file.getinfo(location[1:])
-      return True
-    except KeyError:
-      pass
+    # The ZIP info name does not have the leading path separator as
+    # the location string does.
+    return self._directory_index.PathExists(location[1:])
 
-    # Check if location could be a virtual directory.
-    for name in self._zip_file.namelist():
-      # The ZIP info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
+  def GetDirectoryIndex(self):
+    """Retrieves the directory index.
 
-    return False
+    Returns:
+      ArchiveDirectoryIndex: directory index, including virtual directories,
+          or None if not available.
+    """
+    return self._directory_index
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -25,6 +25,8 @@ class VolumeAttribute(object):
 class VolumeExtent(object):
   """The VFS volume extent."""
 
+  __slots__ = ('extent_type', 'offset', 'size')
+
   EXTENT_TYPE_DATA = 0
   EXTENT_TYPE_SPARSE = 1
 
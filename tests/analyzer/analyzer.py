@@ -84,6 +84,39 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         len(analyzer.Analyzer._analyzer_helpers), number_of_helpers)
 
+  def testImportHelperModules(self):
+    """Tests the _ImportHelperModules function."""
+    analyzer.Analyzer.RegisterHelperModule(
+        'test', 'tests.analyzer.bogus_analyzer_helper',
+        [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+
+    analyzer.Analyzer._ImportHelperModules(
+        frozenset([definitions.FORMAT_CATEGORY_FILE_SYSTEM]))
+    self.assertIn('test', analyzer.Analyzer._analyzer_helper_modules)
+
+    # A module that cannot be imported does not register an analyzer helper.
+    analyzer.Analyzer._ImportHelperModules(
+        frozenset([definitions.FORMAT_CATEGORY_VOLUME_SYSTEM]))
+    self.assertNotIn('test', analyzer.Analyzer._analyzer_helper_modules)
+    self.assertNotIn('test', analyzer.Analyzer._analyzer_helpers)
+
+  def testRegisterHelperModule(self):
+    """Tests the RegisterHelperModule function."""
+    analyzer.Analyzer.RegisterHelperModule(
+        'test', 'tests.analyzer.bogus_analyzer_helper',
+        [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+
+    try:
+      self.assertIn('test', analyzer.Analyzer._analyzer_helper_modules)
+
+      with self.assertRaises(KeyError):
+        analyzer.Analyzer.RegisterHelperModule(
+            'test', 'tests.analyzer.bogus_analyzer_helper',
+            [definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+
+    finally:
+      del analyzer.Analyzer._analyzer_helper_modules['test']
+
   def testGetArchiveTypeIndicatorsTAR(self):
     """Tests the GetArchiveTypeIndicators function on a .tar file."""
     test_file = self._GetTestFilePath(['syslog.tar'])
@@ -250,6 +283,38 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
     type_indicators = analyzer.Analyzer.GetFileSystemTypeIndicators(path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testGetTypeIndicatorsByCategory(self):
+    """Tests the GetTypeIndicatorsByCategory function."""
+    test_file = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_file)
+
+    format_categories = [
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE,
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM]
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM: [],
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [
+            definitions.TYPE_INDICATOR_QCOW],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: []}
+    type_indicators = analyzer.Analyzer.GetTypeIndicatorsByCategory(
+        path_spec, format_categories)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM: [
+            definitions.PREFERRED_EXT_BACK_END],
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: []}
+    type_indicators = analyzer.Analyzer.GetTypeIndicatorsByCategory(
+        path_spec, format_categories)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
   def testGetStorageMediaImageTypeIndicatorsEWF(self):
     """Tests the GetStorageMediaImageTypeIndicator function on a .E01 file."""
     test_file = self._GetTestFilePath(['ext2.E01'])
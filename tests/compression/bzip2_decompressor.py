@@ -13,6 +13,11 @@ from tests.compression import test_lib
 class BZIP2DecompressorTestCase(test_lib.DecompressorTestCase):
   """Tests for the bzip2 decompressor object."""
 
+  def testCopy(self):
+    """Tests the Copy method."""
+    decompressor = bzip2_decompressor.BZIP2Decompressor()
+    self.assertIsNone(decompressor.Copy())
+
   def testDecompress(self):
     """Tests the Decompress method."""
     decompressor = bzip2_decompressor.BZIP2Decompressor()
@@ -26,6 +26,20 @@ class Base16DecoderTestCase(test_lib.DecoderTestCase):
     with self.assertRaises(errors.BackEndError):
       decoder.Decode(b'\x01\x02\x03\x04\x05\x06\x07\x08')
 
+  def testGetDecodedOffset(self):
+    """Tests the GetDecodedOffset method."""
+    decoder = base16_decoder.Base16Decoder()
+
+    self.assertEqual(decoder.GetDecodedOffset(0), 0)
+    self.assertEqual(decoder.GetDecodedOffset(7), 3)
+
+  def testGetEncodedOffset(self):
+    """Tests the GetEncodedOffset method."""
+    decoder = base16_decoder.Base16Decoder()
+
+    self.assertEqual(decoder.GetEncodedOffset(0), 0)
+    self.assertEqual(decoder.GetEncodedOffset(3), 6)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -26,6 +26,20 @@ class Base32DecoderTestCase(test_lib.DecoderTestCase):
     with self.assertRaises(errors.BackEndError):
       decoder.Decode(b'\x01\x02\x03\x04\x05\x06\x07\x08')
 
+  def testGetDecodedOffset(self):
+    """Tests the GetDecodedOffset method."""
+    decoder = base32_decoder.Base32Decoder()
+
+    self.assertEqual(decoder.GetDecodedOffset(0), 0)
+    self.assertEqual(decoder.GetDecodedOffset(25), 15)
+
+  def testGetEncodedOffset(self):
+    """Tests the GetEncodedOffset method."""
+    decoder = base32_decoder.Base32Decoder()
+
+    self.assertEqual(decoder.GetEncodedOffset(0), 0)
+    self.assertEqual(decoder.GetEncodedOffset(19), 24)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -26,6 +26,20 @@ class Base64DecoderTestCase(test_lib.DecoderTestCase):
     with self.assertRaises(errors.BackEndError):
       decoder.Decode(b'\x01\x02\x03\x04\x05\x06\x07\x08A')
 
+  def testGetDecodedOffset(self):
+    """Tests the GetDecodedOffset method."""
+    decoder = base64_decoder.Base64Decoder()
+
+    self.assertEqual(decoder.GetDecodedOffset(0), 0)
+    self.assertEqual(decoder.GetDecodedOffset(13), 9)
+
+  def testGetEncodedOffset(self):
+    """Tests the GetEncodedOffset method."""
+    decoder = base64_decoder.Base64Decoder()
+
+    self.assertEqual(decoder.GetEncodedOffset(0), 0)
+    self.assertEqual(decoder.GetEncodedOffset(11), 12)
+
 
 if __name__ == '__main__':
   unittest.main()
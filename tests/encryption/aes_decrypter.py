@@ -95,6 +95,38 @@ class AESDecrypterTestCase(test_lib.DecrypterTestCase):
     self.assertEqual(decrypted_data, b'This is secret e')
     self.assertEqual(remaining_encrypted_data, b'B\x01\xdb8E7\xfe')
 
+  def testSeekBlock(self):
+    """Tests the SeekBlock method."""
+    try:
+      decrypter = aes_decrypter.AESDecrypter(
+          cipher_mode=definitions.ENCRYPTION_MODE_CBC,
+          initialization_vector=self._AES_INITIALIZATION_VECTOR,
+          key=self._AES_KEY)
+    except errors.BackEndError:
+      raise unittest.SkipTest('missing cryptograpy AES support')
+
+    self.assertTrue(decrypter.SUPPORTS_RANDOM_ACCESS)
+
+    # Test decryption of a block using the preceding encrypted block.
+    decrypter.SeekBlock(b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xce')
+
+    decrypted_data, remaining_encrypted_data = decrypter.Decrypt(
+        b'B\x01\xdb8E7\xfe\x92j\xf0\x1d(\xb9\x9f\xad\x13')
+    self.assertEqual(decrypted_data, b'ncrypted text!!!')
+    self.assertEqual(remaining_encrypted_data, b'')
+
+    # Test decryption of the first block.
+    decrypter.SeekBlock()
+
+    decrypted_data, remaining_encrypted_data = decrypter.Decrypt(
+        b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xce')
+    self.assertEqual(decrypted_data, b'This is secret e')
+    self.assertEqual(remaining_encrypted_data, b'')
+
+    # Test unsupported previous encrypted block size.
+    with self.assertRaises(ValueError):
+      decrypter.SeekBlock(b'Wrong size')
+
 
 if __name__ == '__main__':
   unittest.main()
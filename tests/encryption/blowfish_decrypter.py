@@ -86,6 +86,35 @@ class BlowfishDecrypterTestCase(test_lib.DecrypterTestCase):
     self.assertEqual(decrypted_data, b'This is ')
     self.assertEqual(remaining_encrypted_data, b'y\xef')
 
+  def testSeekBlock(self):
+    """Tests the SeekBlock method."""
+    decrypter = blowfish_decrypter.BlowfishDecrypter(
+        cipher_mode=definitions.ENCRYPTION_MODE_CBC,
+        initialization_vector=self._BLOWFISH_INITIALIZATION_VECTOR,
+        key=self._BLOWFISH_KEY)
+
+    self.assertTrue(decrypter.SUPPORTS_RANDOM_ACCESS)
+
+    # Test decryption of a block using the preceding encrypted block.
+    decrypter.SeekBlock(b'y\xef\x0b\x0f\xf72Rp')
+
+    decrypted_data, remaining_encrypted_data = decrypter.Decrypt(
+        b'\xbb\\h\x06\xff\x07\x9a\xcf')
+    self.assertEqual(decrypted_data, b'ncrypted')
+    self.assertEqual(remaining_encrypted_data, b'')
+
+    # Test decryption of the first block.
+    decrypter.SeekBlock()
+
+    decrypted_data, remaining_encrypted_data = decrypter.Decrypt(
+        b'}\x00\x99\xd2\xab\x1c\xcd\x80')
+    self.assertEqual(decrypted_data, b'This is ')
+    self.assertEqual(remaining_encrypted_data, b'')
+
+    # Test unsupported previous encrypted block size.
+    with self.assertRaises(ValueError):
+      decrypter.SeekBlock(b'Wrong size')
+
 
 if __name__ == '__main__':
   unittest.main()
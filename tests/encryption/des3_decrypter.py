@@ -94,6 +94,38 @@ class DES3DecrypterTestCase(test_lib.DecrypterTestCase):
     self.assertEqual(decrypted_data, b'This is ')
     self.assertEqual(remaining_encrypted_data, b'\xe4\xa4\xb3~\x80')
 
+  def testSeekBlock(self):
+    """Tests the SeekBlock method."""
+    try:
+      decrypter = des3_decrypter.DES3Decrypter(
+          cipher_mode=definitions.ENCRYPTION_MODE_CBC,
+          initialization_vector=self._DES3_INITIALIZATION_VECTOR,
+          key=self._DES3_KEY)
+    except errors.BackEndError:
+      raise unittest.SkipTest('missing cryptograpy triple DES support')
+
+    self.assertTrue(decrypter.SUPPORTS_RANDOM_ACCESS)
+
+    # Test decryption of a block using the preceding encrypted block.
+    decrypter.SeekBlock(b'\xe4\xa4\xb3~\x80\xd3\xc3\x7f')
+
+    decrypted_data, remaining_encrypted_data = decrypter.Decrypt(
+        b'q{E}:L\n ')
+    self.assertEqual(decrypted_data, b'ncrypted')
+    self.assertEqual(remaining_encrypted_data, b'')
+
+    # Test decryption of the first block.
+    decrypter.SeekBlock()
+
+    decrypted_data, remaining_encrypted_data = decrypter.Decrypt(
+        b'e\x86k\t\x01W\xd7d')
+    self.assertEqual(decrypted_data, b'This is ')
+    self.assertEqual(remaining_encrypted_data, b'')
+
+    # Test unsupported previous encrypted block size.
+    with self.assertRaises(ValueError):
+      decrypter.SeekBlock(b'Wrong size')
+
 
 if __name__ == '__main__':
   unittest.main()
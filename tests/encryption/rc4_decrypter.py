@@ -36,6 +36,18 @@ class RC4DecrypterTestCase(test_lib.DecrypterTestCase):
     expected_decrypted_data = b'\x01\x02\x03\x04\x05\x06\x07\x08'
     self.assertEqual(decrypted_data, expected_decrypted_data)
 
+  def testSeekBlock(self):
+    """Tests the SeekBlock method."""
+    try:
+      decrypter = rc4_decrypter.RC4Decrypter(key=b'test1')
+    except errors.BackEndError:
+      raise unittest.SkipTest('missing cryptograpy RC4 support')
+
+    self.assertFalse(decrypter.SUPPORTS_RANDOM_ACCESS)
+
+    with self.assertRaises(ValueError):
+      decrypter.SeekBlock()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -5,10 +5,13 @@
 import os
 import unittest
 
+from unittest import mock
+
 from dfvfs.file_io import compressed_stream_io
 from dfvfs.lib import definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 
 from tests.file_io import test_lib
 
@@ -75,6 +78,14 @@ class BZIP2CompressedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, self._compressed_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
 
 class LZMACompressedStreamTest(test_lib.SylogTestCase):
   """The unit test for a LZMA compressed stream file-like object."""
@@ -138,6 +149,14 @@ class LZMACompressedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, self._compressed_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
 
 class XZCompressedStreamTest(test_lib.SylogTestCase):
   """The unit test for a XZ compressed stream file-like object."""
@@ -201,6 +220,82 @@ class XZCompressedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, self._compressed_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
+  def testReadWithBlocks(self):
+    """Test the read functionality with multiple blocks."""
+    test_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_path)
+
+    with open(test_path, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    test_path = self._GetTestFilePath(['syslog.blocks.xz'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_compressed_stream_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_COMPRESSED_STREAM,
+        compression_method=definitions.COMPRESSION_METHOD_XZ,
+        parent=test_os_path_spec)
+
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, test_compressed_stream_path_spec,
+        maximum_number_of_workers=2)
+    file_object.Open()
+
+    self.assertEqual(file_object.get_size(), len(expected_data))
+
+    # pylint: disable=protected-access
+    self.assertEqual(len(file_object._block_index.blocks), 3)
+
+    for offset in (1000, 10, 500, 1200, 0):
+      file_object.seek(offset, os.SEEK_SET)
+      read_data = file_object.read(100)
+      self.assertEqual(read_data, expected_data[offset:offset + 100])
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), expected_data)
+
+  def testReadWithBlocksAndResolverContextWorkers(self):
+    """Test the read functionality with workers set by the resolver context."""
+    test_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_path)
+
+    with open(test_path, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    test_path = self._GetTestFilePath(['syslog.blocks.xz'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_compressed_stream_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_COMPRESSED_STREAM,
+        compression_method=definitions.COMPRESSION_METHOD_XZ,
+        parent=test_os_path_spec)
+
+    resolver_context = context.Context(
+        maximum_number_of_decompression_workers=2)
+
+    file_object = resolver.Resolver.OpenFileObject(
+        test_compressed_stream_path_spec, resolver_context=resolver_context)
+
+    self.assertEqual(file_object.read(), expected_data)
+
+    # pylint: disable=protected-access
+    self.assertEqual(file_object._maximum_number_of_workers, 2)
+    self.assertEqual(len(file_object._block_index.blocks), 3)
+
+    resolver_context.Empty()
+
 
 class ZlibCompressedStreamTest(test_lib.SylogTestCase):
   """The unit test for a zlib compressed stream file-like object."""
@@ -256,6 +351,34 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
     file_object.seek(-10, os.SEEK_END)
     self.assertEqual(file_object.read(5), b'times')
 
+  def testReadWithAccessPoints(self):
+    """Test the read functionality using access points."""
+    test_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_path)
+
+    with open(test_path, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, self._compressed_stream_path_spec)
+
+    with mock.patch.object(
+        compressed_stream_io.CompressedStream, '_ACCESS_POINT_INTERVAL', 128):
+      with mock.patch.object(
+          compressed_stream_io.CompressedStream,
+          '_COMPRESSED_DATA_BUFFER_SIZE', 64):
+        file_object.Open()
+
+        self.assertEqual(file_object.get_size(), len(expected_data))
+
+        # pylint: disable=protected-access
+        self.assertGreater(len(file_object._access_points), 1)
+
+        for offset in (1000, 10, 600, 1200, 0):
+          file_object.seek(offset, os.SEEK_SET)
+          read_data = file_object.read(100)
+          self.assertEqual(read_data, expected_data[offset:offset + 100])
+
   def testRead(self):
     """Test the read functionality."""
     file_object = compressed_stream_io.CompressedStream(
@@ -264,6 +387,14 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context, self._compressed_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,7 +2,9 @@
 # -*- coding: utf-8 -*-
 """Tests for the encoded stream file-like object."""
 
+import base64
 import os
+import tempfile
 import unittest
 
 from dfvfs.file_io import encoded_stream_io
@@ -75,6 +77,56 @@ class Base16EncodedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encoded_stream_io.EncodedStream(
+        self._resolver_context, self._encoded_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
+  def testReadWithIrregularLine(self):
+    """Test the read functionality with an irregular line mid-stream."""
+    expected_data = bytes(range(256)) * 400
+
+    encoded_data = base64.b16encode(expected_data)
+    lines = [
+        encoded_data[offset:offset + 76]
+        for offset in range(0, len(encoded_data), 76)]
+
+    # Move characters of the next line into a line in the middle of the
+    # stream, which is not detected when the layout is opened.
+    line_index = len(lines) // 2
+    lines[line_index] = b''.join([
+        lines[line_index], lines[line_index + 1][:5]])
+    lines[line_index + 1] = lines[line_index + 1][5:]
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'irregular.base16')
+      with open(test_path, 'wb') as file_object:
+        file_object.write(b'\n'.join(lines))
+        file_object.write(b'\n')
+
+      test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+          definitions.TYPE_INDICATOR_OS, location=test_path)
+      test_encoded_stream_path_spec = path_spec_factory.Factory.NewPathSpec(
+          definitions.TYPE_INDICATOR_ENCODED_STREAM,
+          encoding_method=definitions.ENCODING_METHOD_BASE16,
+          parent=test_os_path_spec)
+
+      file_object = encoded_stream_io.EncodedStream(
+          self._resolver_context, test_encoded_stream_path_spec)
+      file_object.Open()
+
+      file_object.seek(40000, os.SEEK_SET)
+      self.assertEqual(file_object.read(4096), expected_data[40000:44096])
+      self.assertEqual(file_object.get_size(), len(expected_data))
+
+      file_object.seek(0, os.SEEK_SET)
+      self.assertEqual(file_object.read(), expected_data)
+
+      self._resolver_context.Empty()
+
 
 class Base32EncodedStreamTest(test_lib.SylogTestCase):
   """The unit test for a base32 encoded stream file-like object."""
@@ -138,6 +190,14 @@ class Base32EncodedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encoded_stream_io.EncodedStream(
+        self._resolver_context, self._encoded_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
 
 class Base64EncodedStreamTest(test_lib.SylogTestCase):
   """The unit test for a base64 encoded stream file-like object."""
@@ -201,6 +261,27 @@ class Base64EncodedStreamTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encoded_stream_io.EncodedStream(
+        self._resolver_context, self._encoded_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
+  def testReadAfterSeek(self):
+    """Test the read functionality after seeking backwards and forwards."""
+    file_object = encoded_stream_io.EncodedStream(
+        self._resolver_context, self._encoded_stream_path_spec)
+    file_object.Open()
+
+    expected_data = file_object.read()
+
+    for offset in (1200, 17, 640, 0, 1231):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(16), expected_data[offset:offset + 16])
+
 
 if __name__ == '__main__':
   unittest.main()
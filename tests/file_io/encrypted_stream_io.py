@@ -91,6 +91,14 @@ class AESEncryptedStreamWithKeyChainTest(test_lib.PaddedSyslogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(
+        self._resolver_context, self._encrypted_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
 
 class AESEncryptedStreamTest(test_lib.PaddedSyslogTestCase):
   """The unit test for a AES encrypted stream file-like object.
@@ -164,6 +172,27 @@ class AESEncryptedStreamTest(test_lib.PaddedSyslogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(
+        self._resolver_context, self._encrypted_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
+  def testReadAfterSeek(self):
+    """Test the read functionality after seeking backwards and forwards."""
+    file_object = encrypted_stream_io.EncryptedStream(
+        self._resolver_context, self._encrypted_stream_path_spec)
+    file_object.Open()
+
+    expected_data = file_object.read()
+
+    for offset in (1200, 17, 640, 0, 1231):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(16), expected_data[offset:offset + 16])
+
 
 class BlowfishEncryptedStreamWithKeyChainTest(test_lib.PaddedSyslogTestCase):
   """Tests the Blowfish encrypted stream file-like object.
@@ -241,6 +270,14 @@ class BlowfishEncryptedStreamWithKeyChainTest(test_lib.PaddedSyslogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(
+        self._resolver_context, self._encrypted_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
 
 class DES3EncryptedStreamWithKeyChainTest(test_lib.PaddedSyslogTestCase):
   """Tests the Triple DES encrypted stream file-like object.
@@ -318,6 +355,14 @@ class DES3EncryptedStreamWithKeyChainTest(test_lib.PaddedSyslogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(
+        self._resolver_context, self._encrypted_stream_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
 
 class RC4EncryptedStreamWithKeyChainTest(test_lib.SylogTestCase):
   """Tests the RC4 encrypted stream file-like object.
@@ -399,6 +444,30 @@ class RC4EncryptedStreamWithKeyChainTest(test_lib.SylogTestCase):
     except errors.BackEndError:
       raise unittest.SkipTest('missing cryptograpy support')
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = encrypted_stream_io.EncryptedStream(
+        self._resolver_context, self._encrypted_stream_path_spec)
+    file_object.Open()
+
+    try:
+      self._TestReadIntoFileObject(file_object)
+    except errors.BackEndError:
+      raise unittest.SkipTest('missing cryptograpy support')
+
+  def testReadAfterSeek(self):
+    """Test the read functionality after seeking backwards and forwards."""
+    file_object = encrypted_stream_io.EncryptedStream(
+        self._resolver_context, self._encrypted_stream_path_spec)
+    file_object.Open()
+
+    expected_data = file_object.read()
+
+    for offset in (1200, 17, 640, 0, 1231):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(16), expected_data[offset:offset + 16])
+
 
 if __name__ == '__main__':
   unittest.main()
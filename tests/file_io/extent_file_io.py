@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the extent-based file-like object."""
+
+import unittest
+
+from dfvfs.file_io import extent_file_io
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+from dfvfs.vfs import extent
+
+from tests.file_io import test_lib
+
+
+class ExtentFileTest(test_lib.SylogTestCase):
+  """Tests for the extent-based file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_path)
+
+    self._os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    self._volume_file_object = resolver.Resolver.OpenFileObject(
+        self._os_path_spec, resolver_context=self._resolver_context)
+
+    # The extents map the syslog test data in 2 parts, where the boundary
+    # between the parts is within the data read by the tests.
+    self._extents = [
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_DATA, offset=0, size=200),
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_DATA, offset=200, size=1536)]
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self._os_path_spec, self._volume_file_object,
+        self._extents, 1247)
+    self.assertIsNotNone(file_object)
+
+    with self.assertRaises(ValueError):
+      extent_file_io.ExtentFile(
+          self._resolver_context, self._os_path_spec,
+          self._volume_file_object, self._extents, -1)
+
+    with self.assertRaises(ValueError):
+      extent_file_io.ExtentFile(
+          self._resolver_context, self._os_path_spec,
+          self._volume_file_object, self._extents, 4096)
+
+    extents = [
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_COMPRESSED, offset=0,
+            size=4096)]
+
+    with self.assertRaises(ValueError):
+      extent_file_io.ExtentFile(
+          self._resolver_context, self._os_path_spec,
+          self._volume_file_object, extents, 1247)
+
+  def testOpenClose(self):
+    """Test the open and close functionality."""
+    file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self._os_path_spec, self._volume_file_object,
+        self._extents, 1247)
+    file_object.Open()
+
+    self._TestGetSizeFileObject(file_object)
+
+    file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self._os_path_spec, None, [], 0)
+
+    with self.assertRaises(IOError):
+      file_object.Open()
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self._os_path_spec, self._volume_file_object,
+        self._extents, 1247)
+    file_object.Open()
+
+    self._TestSeekFileObject(file_object)
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self._os_path_spec, self._volume_file_object,
+        self._extents, 1247)
+    file_object.Open()
+
+    self._TestReadFileObject(file_object)
+
+    file_object.seek(0)
+    self.assertEqual(len(file_object.read()), 1247)
+    self.assertEqual(file_object.read(), b'')
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self._os_path_spec, self._volume_file_object,
+        self._extents, 1247)
+    file_object.Open()
+
+    self._TestReadAtFileObject(file_object)
+
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self._os_path_spec, self._volume_file_object,
+        self._extents, 1247)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
+  def testReadSparse(self):
+    """Test the read functionality with a sparse extent."""
+    extents = [
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_DATA, offset=167, size=10),
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_SPARSE, offset=0, size=4),
+        extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_DATA, offset=177, size=5)]
+
+    file_object = extent_file_io.ExtentFile(
+        self._resolver_context, self._os_path_spec, self._volume_file_object,
+        extents, 19)
+    file_object.Open()
+
+    read_buffer = file_object.read()
+    self.assertEqual(read_buffer, b'Jan 22 07:\x00\x00\x00\x0053:01')
+
+    file_object.seek(8)
+    read_buffer = file_object.read(4)
+    self.assertEqual(read_buffer, b'7:\x00\x00')
+
+
+if __name__ == '__main__':
+  unittest.main()
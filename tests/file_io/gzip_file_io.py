@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests for the gzip file-like object."""
 
+import os
+import tempfile
 import unittest
 
 from dfvfs.file_io import gzip_file_io
@@ -51,6 +53,29 @@ class GzipFileTest(test_lib.SylogTestCase):
 
     self._TestSeekFileObject(file_object)
 
+  def testOpenWithIndexDirectory(self):
+    """Test the open functionality with a gzip index directory."""
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      resolver_context = context.Context(index_directory=temporary_directory)
+
+      file_object = gzip_file_io.GzipFile(
+          resolver_context, self._gzip_path_spec)
+      file_object.Open()
+
+      self._TestReadFileObject(file_object)
+
+      index_files = os.listdir(temporary_directory)
+      self.assertEqual(len(index_files), 1)
+      self.assertTrue(index_files[0].endswith('.gzidx'))
+
+      file_object = gzip_file_io.GzipFile(
+          resolver_context, self._gzip_path_spec)
+      file_object.Open()
+
+      self._TestReadFileObject(file_object)
+
+      resolver_context.Empty()
+
   def testRead(self):
     """Test the read functionality."""
     file_object = gzip_file_io.GzipFile(
@@ -59,6 +84,22 @@ class GzipFileTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = gzip_file_io.GzipFile(
+        self._resolver_context, self._gzip_path_spec)
+    file_object.Open()
+
+    self._TestReadAtFileObject(file_object)
+
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = gzip_file_io.GzipFile(
+        self._resolver_context, self._gzip_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
   def testReadCorrupt(self):
     """Tests reading a file that is corrupt."""
     # The corrupt gzip has no member footer.
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the operating system file-like object implementation."""
 
+from concurrent import futures
 import os
 import unittest
 
@@ -161,6 +162,155 @@ class OSFileTest(shared_test_lib.BaseTestCase):
     size = file_object.get_size()
     self.assertEqual(size, 116)
 
+  def testReadWithBlockCache(self):
+    """Test the read functionality with the block cache."""
+    file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+    file_object.Open()
+
+    expected_data = file_object.read()
+
+    resolver_context = context.Context()
+    block_cache = resolver_context.EnableBlockCache(1024, block_size=32)
+
+    try:
+      file_object = os_file_io.OSFile(resolver_context, self._path_spec1)
+      file_object.Open()
+
+      file_object.seek(10, os.SEEK_SET)
+      self.assertEqual(file_object.read(30), expected_data[10:40])
+      self.assertEqual(file_object.get_offset(), 40)
+      self.assertEqual(block_cache.hits, 0)
+      self.assertEqual(block_cache.misses, 2)
+
+      file_object.seek(0, os.SEEK_SET)
+      self.assertEqual(file_object.read(10), expected_data[:10])
+      self.assertEqual(block_cache.hits, 1)
+
+      file_object.seek(0, os.SEEK_SET)
+      self.assertEqual(file_object.read(), expected_data)
+      self.assertEqual(file_object.get_offset(), 116)
+
+      file_object.seek(200, os.SEEK_SET)
+      self.assertEqual(file_object.read(10), b'')
+
+    finally:
+      resolver_context.Empty()
+
+  def testReadAt(self):
+    """Test the read at offset functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(0, 10)
+
+    file_object.Open()
+
+    expected_data = file_object.read()
+
+    file_object.seek(10, os.SEEK_SET)
+    self.assertEqual(file_object.read_at(20, 24), expected_data[20:44])
+    self.assertEqual(file_object.get_offset(), 10)
+
+    self.assertEqual(file_object.read_at(100, 100), expected_data[100:])
+    self.assertEqual(file_object.read_at(200, 10), b'')
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-1, 10)
+
+    # Multiple threads can read from the same file-like object.
+    offsets = list(range(0, 116, 4)) * 10
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+      results = list(executor.map(
+          lambda offset: file_object.read_at(offset, 8), offsets))
+
+    expected_results = [
+        expected_data[offset:offset + 8] for offset in offsets]
+    self.assertEqual(results, expected_results)
+    self.assertEqual(file_object.get_offset(), 10)
+
+  def testReadAtWithBlockCache(self):
+    """Test the read at offset functionality with the block cache."""
+    file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+    file_object.Open()
+
+    expected_data = file_object.read()
+
+    resolver_context = context.Context()
+    block_cache = resolver_context.EnableBlockCache(1024, block_size=32)
+
+    try:
+      file_object = os_file_io.OSFile(resolver_context, self._path_spec1)
+      file_object.Open()
+
+      self.assertEqual(file_object.read_at(10, 30), expected_data[10:40])
+      self.assertEqual(file_object.get_offset(), 0)
+      self.assertEqual(block_cache.misses, 2)
+
+      self.assertEqual(file_object.read_at(0, 10), expected_data[:10])
+      self.assertEqual(block_cache.hits, 1)
+
+    finally:
+      resolver_context.Empty()
+
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+    file_object.Open()
+
+    expected_data = file_object.read()
+
+    file_object.seek(10, os.SEEK_SET)
+
+    read_buffer = bytearray(30)
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 30)
+    self.assertEqual(read_buffer, expected_data[10:40])
+    self.assertEqual(file_object.get_offset(), 40)
+
+    read_buffer = bytearray(200)
+    read_count = file_object.readinto(memoryview(read_buffer)[50:])
+    self.assertEqual(read_count, 76)
+    self.assertEqual(read_buffer[50:126], expected_data[40:])
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 0)
+
+  def testReadIntoWithBlockCache(self):
+    """Test the read into buffer functionality with the block cache."""
+    file_object = os_file_io.OSFile(self._resolver_context, self._path_spec1)
+    file_object.Open()
+
+    expected_data = file_object.read()
+
+    resolver_context = context.Context()
+    block_cache = resolver_context.EnableBlockCache(1024, block_size=32)
+
+    try:
+      file_object = os_file_io.OSFile(resolver_context, self._path_spec1)
+      file_object.Open()
+
+      file_object.seek(10, os.SEEK_SET)
+
+      read_buffer = bytearray(30)
+      read_count = file_object.readinto(read_buffer)
+      self.assertEqual(read_count, 30)
+      self.assertEqual(read_buffer, expected_data[10:40])
+      self.assertEqual(file_object.get_offset(), 40)
+      self.assertEqual(block_cache.misses, 2)
+
+      read_buffer = bytearray(200)
+      read_count = file_object.readinto(read_buffer)
+      self.assertEqual(read_count, 76)
+      self.assertEqual(read_buffer[:76], expected_data[40:])
+      self.assertEqual(file_object.get_offset(), 116)
+      self.assertEqual(block_cache.hits, 1)
+
+      read_count = file_object.readinto(read_buffer)
+      self.assertEqual(read_count, 0)
+
+    finally:
+      resolver_context.Empty()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,13 +2,19 @@
 # -*- coding: utf-8 -*-
 """Tests for the SQLite blob file-like object."""
 
+import os
+import sqlite3
+import tempfile
+import threading
 import unittest
 
 from dfvfs.file_io import sqlite_blob_file_io
 from dfvfs.lib import definitions
+from dfvfs.lib import sqlite_database
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 
+from tests import test_lib as shared_test_lib
 from tests.file_io import test_lib
 
 
@@ -100,6 +106,114 @@ class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
 
     self._TestReadFileObject(file_object)
 
+  def testGetNumberOfRows(self):
+    """Test the GetNumberOfRows function."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, self._sqlite_blob_path_spec)
+    file_object.Open()
+
+    self.assertEqual(file_object.GetNumberOfRows(), 1)
+
+  def testOpenShareDatabase(self):
+    """Test that file-like objects of the same database share it."""
+    file_object1 = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, self._sqlite_blob_path_spec)
+    file_object1.Open()
+
+    sqlite_blob_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_SQLITE_BLOB, column_name='blob',
+        parent=self._sqlite_blob_path_spec.parent,
+        row_condition=('identifier', '==', 'myblob'), table_name='blobs')
+    file_object2 = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, sqlite_blob_path_spec)
+    file_object2.Open()
+
+    # pylint: disable=protected-access
+    self.assertIsNotNone(file_object1._database_object)
+    self.assertIs(
+        file_object1._database_object, file_object2._database_object)
+
+    self.assertEqual(file_object1.read(), file_object2.read())
+
+  def testReadInOtherThread(self):
+    """Test reading a shared database in another thread."""
+    file_object1 = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, self._sqlite_blob_path_spec)
+    file_object1.Open()
+
+    results = []
+
+    def _ReadInThread():
+      """Reads the blob using the database opened by the main thread."""
+      file_object2 = sqlite_blob_file_io.SQLiteBlobFile(
+          self._resolver_context, self._sqlite_blob_path_spec)
+      file_object2.Open()
+      results.append(file_object2.read())
+      results.append(file_object2.GetNumberOfRows())
+
+    thread = threading.Thread(target=_ReadInThread)
+    thread.start()
+    thread.join()
+
+    self.assertEqual(results, [file_object1.read(), 1])
+
+  @unittest.skipUnless(
+      sqlite_database.SQLiteDatabaseFile.SUPPORTS_BLOB_IO,
+      'requires incremental blob I/O support')
+  def testReadIncremental(self):
+    """Test that the blob is read incrementally."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(
+        self._resolver_context, self._sqlite_blob_path_spec)
+    file_object.Open()
+
+    # pylint: disable=protected-access
+    self.assertNotIsInstance(file_object._blob, bytes)
+
+
+class SQLiteBlobFileWithoutRowIdentifierTest(shared_test_lib.BaseTestCase):
+  """The unit test for a SQLite blob file-like object without row identifier.
+
+  A table without row identifier does not support incremental blob I/O.
+  """
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def testRead(self):
+    """Test the read functionality."""
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      test_path = os.path.join(temporary_directory, 'test.db')
+      connection = sqlite3.connect(test_path)
+      connection.execute((
+          'CREATE TABLE blobs ( identifier TEXT PRIMARY KEY, blob BLOB ) '
+          'WITHOUT ROWID'))
+      connection.execute(
+          'INSERT INTO blobs VALUES ( ?, ? )', ('myblob', b'blob data'))
+      connection.commit()
+      connection.close()
+
+      test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+          definitions.TYPE_INDICATOR_OS, location=test_path)
+      sqlite_blob_path_spec = path_spec_factory.Factory.NewPathSpec(
+          definitions.TYPE_INDICATOR_SQLITE_BLOB, column_name='blob',
+          parent=test_os_path_spec, row_index=0, table_name='blobs')
+
+      file_object = sqlite_blob_file_io.SQLiteBlobFile(
+          self._resolver_context, sqlite_blob_path_spec)
+      file_object.Open()
+
+      self.assertEqual(file_object.get_size(), 9)
+
+      file_object.seek(5, os.SEEK_SET)
+      self.assertEqual(file_object.read(), b'data')
+
+      self._resolver_context.Empty()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -634,6 +634,37 @@ class SylogTestCase(shared_test_lib.BaseTestCase):
     """
     self.assertEqual(file_object.get_size(), 1247)
 
+  def _TestReadAtFileObject(self, file_object, base_offset=167):
+    """Runs the read at offset tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object with the test data.
+      base_offset (Optional[int]): base offset use in the tests.
+    """
+    file_object.seek(10, os.SEEK_SET)
+
+    expected_buffer = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    read_buffer = file_object.read_at(base_offset, 95)
+    self.assertEqual(read_buffer, expected_buffer)
+
+    # Reading at an offset does not change the current offset.
+    self.assertEqual(file_object.get_offset(), 10)
+
+    read_buffer = file_object.read_at(base_offset + 1080 - 5, 100)
+    self.assertEqual(read_buffer, b' ---\n')
+
+    read_buffer = file_object.read_at(base_offset + 2048, 100)
+    self.assertEqual(read_buffer, b'')
+
+    with self.assertRaises(IOError):
+      file_object.read_at(-1, 100)
+
+    with self.assertRaises(IOError):
+      file_object.read_at(base_offset, -1)
+
   def _TestReadFileObject(self, file_object, base_offset=167):
     """Runs the read tests on the file-like object.
 
@@ -657,6 +688,38 @@ class SylogTestCase(shared_test_lib.BaseTestCase):
 
     self.assertEqual(file_object.get_offset(), expected_offset)
 
+  def _TestReadIntoFileObject(self, file_object, base_offset=167):
+    """Runs the read into buffer tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object with the test data.
+      base_offset (Optional[int]): base offset use in the tests.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    expected_data = file_object.read()
+
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    read_buffer = bytearray(95)
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 95)
+    self.assertEqual(read_buffer, expected_data[base_offset:base_offset + 95])
+    self.assertEqual(file_object.get_offset(), base_offset + 95)
+
+    # Read all the data reusing the same buffer.
+    file_object.seek(0, os.SEEK_SET)
+
+    data_segments = []
+    read_buffer = bytearray(100)
+    with memoryview(read_buffer) as buffer_view:
+      read_count = file_object.readinto(buffer_view)
+      while read_count:
+        data_segments.append(bytes(buffer_view[:read_count]))
+        read_count = file_object.readinto(buffer_view)
+
+    self.assertEqual(b''.join(data_segments), expected_data)
+    self.assertEqual(file_object.get_offset(), len(expected_data))
+
   def _TestSeekFileObject(self, file_object, base_offset=167):
     """Runs the seek tests on the file-like object.
 
@@ -737,6 +800,22 @@ class PaddedSyslogTestCase(SylogTestCase):
     except errors.BackEndError:
       raise unittest.SkipTest('missing cryptograpy support')
 
+  def _TestReadIntoFileObject(self, file_object, base_offset=167):
+    """Runs the read into buffer tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object with the test data.
+      base_offset (Optional[int]): base offset use in the tests.
+
+    Raises:
+      SkipTest: if the path does not exist and the test should be skipped.
+    """
+    try:
+      super(PaddedSyslogTestCase, self)._TestReadIntoFileObject(
+          file_object, base_offset=base_offset)
+    except errors.BackEndError:
+      raise unittest.SkipTest('missing cryptograpy support')
+
   def _TestSeekFileObject(self, file_object, base_offset=167):
     """Runs the seek tests on the file-like object.
 
@@ -58,6 +58,14 @@ class ZipFileTest(test_lib.SylogTestCase):
 
     # TODO: add tests for read > UNCOMPRESSED_DATA_BUFFER_SIZE
 
+  def testReadInto(self):
+    """Test the read into buffer functionality."""
+    file_object = zip_file_io.ZipFile(
+        self._resolver_context, self._zip_path_spec)
+    file_object.Open()
+
+    self._TestReadIntoFileObject(file_object)
+
 
 if __name__ == '__main__':
   unittest.main()
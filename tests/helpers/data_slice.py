@@ -49,6 +49,12 @@ class TextFileTest(shared_test_lib.BaseTestCase):
     # Test edge cases.
     self.assertEqual(file_data[-150:20], b'place,user,password\n')
     self.assertEqual(file_data[86:150], b'uber secret laire,admin,admin\n')
+    self.assertEqual(file_data[86:-19], b'uber secret')
+    self.assertEqual(file_data[0], b'p')
+    self.assertEqual(file_data[-2], b'n')
+
+    # Reading a data slice does not change the current offset.
+    self.assertEqual(file_object.get_offset(), 0)
 
     with self.assertRaises(TypeError):
       file_data['key']  # pylint: disable=pointless-statement
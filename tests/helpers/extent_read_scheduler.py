@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the extent read scheduler."""
+
+import unittest
+
+from dfvfs.helpers import extent_read_scheduler
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class ExtentReadSchedulerTest(shared_test_lib.BaseTestCase):
+  """Tests for the extent read scheduler."""
+
+  _LOCATIONS = [
+      '/passwords.txt', '/a_directory', '/a_directory/another_file',
+      '/a_directory/a_file']
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_path = self._GetTestFilePath(['hfsplus.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    self._raw_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_RAW, parent=test_os_path_spec)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_HFS, location='/',
+        parent=self._raw_path_spec)
+
+    self._file_system = resolver.Resolver.OpenFileSystem(
+        path_spec, resolver_context=self._resolver_context)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def _CreateScheduler(self, **kwargs):
+    """Creates an extent read scheduler with the test file entries.
+
+    Args:
+      kwargs (dict[str, object]): keyword arguments of the scheduler.
+
+    Returns:
+      ExtentReadScheduler: extent read scheduler.
+    """
+    scheduler = extent_read_scheduler.ExtentReadScheduler(**kwargs)
+
+    for location in self._LOCATIONS:
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          definitions.TYPE_INDICATOR_HFS, location=location,
+          parent=self._raw_path_spec)
+      file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+      self.assertIsNotNone(file_entry)
+
+      scheduler.AddFileEntry(file_entry)
+
+    return scheduler
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    scheduler = extent_read_scheduler.ExtentReadScheduler()
+    self.assertIsNotNone(scheduler)
+
+    with self.assertRaises(ValueError):
+      extent_read_scheduler.ExtentReadScheduler(maximum_buffer_size=-1)
+
+    with self.assertRaises(ValueError):
+      extent_read_scheduler.ExtentReadScheduler(maximum_read_size=0)
+
+  def testHashFileEntries(self):
+    """Tests the HashFileEntries function."""
+    scheduler = self._CreateScheduler()
+
+    results = [
+        (file_entry.path_spec.location, digest_hash)
+        for file_entry, digest_hash in scheduler.HashFileEntries(
+            hash_name='md5')]
+
+    # The file entries are ordered by the offset of their extents, followed by
+    # the file entries that cannot be read from their extents.
+    expected_results = [
+        ('/a_directory/a_file', '85bebf486af24792085f769afa46717d'),
+        ('/passwords.txt', '39cb097008d17660abd0539891a672af'),
+        ('/a_directory/another_file', 'd54ff73404ed6041a3bd66850b061bff'),
+        ('/a_directory', 'd41d8cd98f00b204e9800998ecf8427e')]
+
+    self.assertEqual(results, expected_results)
+
+  def testReadFileEntries(self):
+    """Tests the ReadFileEntries function."""
+    scheduler = self._CreateScheduler(maximum_read_size=16)
+
+    data_per_location = {}
+    end_of_data_locations = []
+    number_of_reads = 0
+    for file_entry, data in scheduler.ReadFileEntries():
+      location = file_entry.path_spec.location
+      self.assertNotIn(location, end_of_data_locations)
+
+      if data:
+        data_per_location.setdefault(location, []).append(data)
+        number_of_reads += 1
+      else:
+        end_of_data_locations.append(location)
+
+    self.assertEqual(sorted(end_of_data_locations), sorted(self._LOCATIONS))
+
+    # 116 + 22 + 53 bytes read in segments of at most 16 bytes.
+    self.assertEqual(number_of_reads, 8 + 2 + 4)
+
+    data = b''.join(data_per_location['/a_directory/another_file'])
+    self.assertEqual(data, b'This is another file.\n')
+
+
+if __name__ == '__main__':
+  unittest.main()
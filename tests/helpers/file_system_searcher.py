@@ -5,14 +5,21 @@
 import os
 import unittest
 
+from unittest import mock
+
 from dfvfs.lib import definitions
 from dfvfs.helpers import fake_file_system_builder
 from dfvfs.helpers import file_system_searcher
+from dfvfs.path import ext_path_spec
 from dfvfs.path import fake_path_spec
+from dfvfs.path import hfs_path_spec
 from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
 from dfvfs.path import raw_path_spec
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
+from dfvfs.vfs import ext_file_system
+from dfvfs.vfs import hfs_file_system
 from dfvfs.vfs import os_file_system
 from dfvfs.vfs import tsk_file_system
 
@@ -274,6 +281,34 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
         '/tmp/loca?ion')
     self.assertEqual(location_regex, '/tmp/loca.ion')
 
+  def testGetLiteralFromRegex(self):
+    """Test the _GetLiteralFromRegex function."""
+    find_spec = file_system_searcher.FindSpec()
+
+    literal = find_spec._GetLiteralFromRegex('location')
+    self.assertEqual(literal, 'location')
+
+    literal = find_spec._GetLiteralFromRegex('__init__\\.py')
+    self.assertEqual(literal, '__init__.py')
+
+    literal = find_spec._GetLiteralFromRegex('Program\\ Files')
+    self.assertEqual(literal, 'Program Files')
+
+    literal = find_spec._GetLiteralFromRegex('loca.ion')
+    self.assertIsNone(literal)
+
+    literal = find_spec._GetLiteralFromRegex('location[0-9]')
+    self.assertIsNone(literal)
+
+    literal = find_spec._GetLiteralFromRegex('location\\d')
+    self.assertIsNone(literal)
+
+    literal = find_spec._GetLiteralFromRegex('location\\')
+    self.assertIsNone(literal)
+
+    literal = find_spec._GetLiteralFromRegex('')
+    self.assertIsNone(literal)
+
   def testSplitPath(self):
     """Test the _SplitPath function."""
     find_spec = file_system_searcher.FindSpec()
@@ -368,6 +403,67 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
     result = find_spec.CompareTraits(file_entry)
     self.assertTrue(result)
 
+  def testGetLocationSegmentName(self):
+    """Test the GetLocationSegmentName function."""
+    find_spec = file_system_searcher.FindSpec()
+
+    name = find_spec.GetLocationSegmentName(1)
+    self.assertIsNone(name)
+
+    find_spec = file_system_searcher.FindSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py',
+        location_separator='/')
+
+    name = find_spec.GetLocationSegmentName(0)
+    self.assertIsNone(name)
+
+    name = find_spec.GetLocationSegmentName(1)
+    self.assertEqual(name, 'usr')
+
+    name = find_spec.GetLocationSegmentName(6)
+    self.assertEqual(name, '__init__.py')
+
+    name = find_spec.GetLocationSegmentName(7)
+    self.assertIsNone(name)
+
+    find_spec = file_system_searcher.FindSpec(
+        location_glob='/usr/lib/python*/site-packages/dfvfs/__init__.py',
+        location_separator='/')
+
+    name = find_spec.GetLocationSegmentName(2)
+    self.assertEqual(name, 'lib')
+
+    name = find_spec.GetLocationSegmentName(3)
+    self.assertIsNone(name)
+
+    name = find_spec.GetLocationSegmentName(6)
+    self.assertEqual(name, '__init__.py')
+
+  def testGetLocationSegmentRegex(self):
+    """Test the GetLocationSegmentRegex function."""
+    find_spec = file_system_searcher.FindSpec(
+        location='/usr/lib/python2.7/site-packages/dfvfs/__init__.py',
+        location_separator='/')
+
+    regex = find_spec.GetLocationSegmentRegex(1)
+    self.assertIsNone(regex)
+
+    find_spec = file_system_searcher.FindSpec(
+        location_glob='/usr/lib/python*/site-packages/dfvfs/__init__.py',
+        location_separator='/')
+
+    regex = find_spec.GetLocationSegmentRegex(0)
+    self.assertIsNone(regex)
+
+    regex = find_spec.GetLocationSegmentRegex(3)
+    self.assertEqual(regex, 'python.*')
+
+    regex = find_spec.GetLocationSegmentRegex(6)
+    self.assertEqual(regex, '__init__\\.py')
+
+    regex = find_spec.GetLocationSegmentRegex(7)
+    self.assertIsNone(regex)
+
   def testHasLocation(self):
     """Test the HasLocation function."""
     find_spec = file_system_searcher.FindSpec()
@@ -382,6 +478,18 @@ class FindSpecTest(shared_test_lib.BaseTestCase):
     result = find_spec.HasLocation()
     self.assertTrue(result)
 
+  def testIsCaseSensitive(self):
+    """Test the IsCaseSensitive function."""
+    find_spec = file_system_searcher.FindSpec()
+
+    result = find_spec.IsCaseSensitive()
+    self.assertTrue(result)
+
+    find_spec = file_system_searcher.FindSpec(case_sensitive=False)
+
+    result = find_spec.IsCaseSensitive()
+    self.assertFalse(result)
+
   def testIsLastLocationSegment(self):
     """Test the IsLastLocationSegment function."""
     find_spec = file_system_searcher.FindSpec(
@@ -733,5 +841,291 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
     self.assertEqual(test_relative_path, expected_relative_path)
 
 
+class LocationSegmentMatcherTest(shared_test_lib.BaseTestCase):
+  """Tests for the location segment matcher."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+    for name in ('config', 'Config', 'SAM', 'SYSTEM', 'software.log'):
+      file_system_builder.AddFile(f'/{name:s}', b'')
+
+    self._file_system = file_system_builder.file_system
+
+  def _GetFileEntry(self, name):
+    """Retrieves a file entry by name.
+
+    Args:
+      name (str): name of the file entry.
+
+    Returns:
+      FakeFileEntry: file entry.
+    """
+    return self._file_system.GetFileEntryByPath(f'/{name:s}')
+
+  def testGetMatchingFindSpecs(self):
+    """Test the GetMatchingFindSpecs function."""
+    find_specs = [
+        file_system_searcher.FindSpec(location='/config'),
+        file_system_searcher.FindSpec(case_sensitive=False, location='/SAM'),
+        file_system_searcher.FindSpec(location_glob='/S*'),
+        file_system_searcher.FindSpec(
+            case_sensitive=False, location_regex='/s[a-z]+'),
+        file_system_searcher.FindSpec(location_regex='/(S)\\1*AM'),
+        file_system_searcher.FindSpec(location_glob='/*.log'),
+        file_system_searcher.FindSpec(
+            file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])]
+
+    matcher = file_system_searcher._LocationSegmentMatcher(find_specs, 1)
+
+    file_entry = self._GetFileEntry('config')
+    matching_find_specs = matcher.GetMatchingFindSpecs(file_entry)
+    self.assertEqual(matching_find_specs, [find_specs[0], find_specs[6]])
+
+    file_entry = self._GetFileEntry('Config')
+    matching_find_specs = matcher.GetMatchingFindSpecs(file_entry)
+    self.assertEqual(matching_find_specs, [find_specs[6]])
+
+    file_entry = self._GetFileEntry('SAM')
+    matching_find_specs = matcher.GetMatchingFindSpecs(file_entry)
+    self.assertEqual(matching_find_specs, [
+        find_specs[1], find_specs[2], find_specs[3], find_specs[4],
+        find_specs[6]])
+
+    file_entry = self._GetFileEntry('SYSTEM')
+    matching_find_specs = matcher.GetMatchingFindSpecs(file_entry)
+    self.assertEqual(matching_find_specs, [
+        find_specs[2], find_specs[3], find_specs[6]])
+
+    file_entry = self._GetFileEntry('software.log')
+    matching_find_specs = matcher.GetMatchingFindSpecs(file_entry)
+    self.assertEqual(matching_find_specs, [find_specs[5], find_specs[6]])
+
+  def testGetMatchingFindSpecsWithManyRegexes(self):
+    """Test the GetMatchingFindSpecs function with many regexes."""
+    find_specs = [
+        file_system_searcher.FindSpec(location_glob=f'/file{index:d}*')
+        for index in range(100)]
+
+    matcher = file_system_searcher._LocationSegmentMatcher(find_specs, 1)
+
+    self._file_system.AddFileEntry('/file12.txt')
+    file_entry = self._GetFileEntry('file12.txt')
+    matching_find_specs = matcher.GetMatchingFindSpecs(file_entry)
+    self.assertEqual(matching_find_specs, [find_specs[1], find_specs[12]])
+
+    file_entry = self._GetFileEntry('config')
+    matching_find_specs = matcher.GetMatchingFindSpecs(file_entry)
+    self.assertEqual(matching_find_specs, [])
+
+
+class FileSystemSearcherOnFakeFileSystemTest(shared_test_lib.BaseTestCase):
+  """Tests for the file system searcher on a fake file system."""
+
+  # pylint: disable=protected-access
+
+  _TEST_PATHS = [
+      '/Windows/System32/config/SAM',
+      '/Windows/System32/config/SYSTEM',
+      '/Windows/WinSxS/manifest1',
+      '/Windows/WinSxS/manifest2',
+      '/windows/System32/config/SAM']
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+    for path in self._TEST_PATHS:
+      file_system_builder.AddFile(path, b'')
+
+    self._file_system = file_system_builder.file_system
+    self._mount_point = fake_path_spec.FakePathSpec(location='/')
+
+  def _FindLocations(self, find_spec):
+    """Finds the locations of the file entries matching a find specification.
+
+    Args:
+      find_spec (FindSpec): find specification.
+
+    Returns:
+      list[str]: sorted locations of the matching file entries.
+    """
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._file_system, self._mount_point)
+    return sorted(
+        path_spec.location for path_spec in searcher.Find(
+            find_specs=[find_spec]))
+
+  def testGetLocationSegmentMatcher(self):
+    """Test the _GetLocationSegmentMatcher function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._file_system, self._mount_point)
+
+    find_specs = [
+        file_system_searcher.FindSpec(location_glob='/Windows/*'),
+        file_system_searcher.FindSpec(location='/Windows/System32')]
+
+    matcher = searcher._GetLocationSegmentMatcher(find_specs, 2)
+    self.assertIsNotNone(matcher)
+
+    cached_matcher = searcher._GetLocationSegmentMatcher(find_specs, 2)
+    self.assertIs(cached_matcher, matcher)
+
+    other_matcher = searcher._GetLocationSegmentMatcher(find_specs[:1], 2)
+    self.assertIsNot(other_matcher, matcher)
+
+  def testGetSubFileEntriesByName(self):
+    """Test the _GetSubFileEntriesByName function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._file_system, self._mount_point)
+    file_entry = self._file_system.GetRootFileEntry()
+
+    find_spec = file_system_searcher.FindSpec(
+        location='/Windows/System32/config/SAM')
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        file_entry, [find_spec], 1)
+    self.assertEqual(len(sub_file_entries), 1)
+
+    sub_file_entry, find_specs = sub_file_entries[0]
+    self.assertEqual(sub_file_entry.path_spec.location, '/Windows')
+    self.assertEqual(find_specs, [find_spec])
+
+    find_spec = file_system_searcher.FindSpec(location='/bogus')
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        file_entry, [find_spec], 1)
+    self.assertEqual(sub_file_entries, [])
+
+    # The fake file system does not support a case insensitive look up.
+    find_spec = file_system_searcher.FindSpec(
+        case_sensitive=False, location='/windows')
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        file_entry, [find_spec], 1)
+    self.assertIsNone(sub_file_entries)
+
+    find_spec = file_system_searcher.FindSpec(location_glob='/Win*')
+    sub_file_entries = searcher._GetSubFileEntriesByName(
+        file_entry, [find_spec], 1)
+    self.assertIsNone(sub_file_entries)
+
+  def testFind(self):
+    """Test the Find function."""
+    find_spec = file_system_searcher.FindSpec(
+        location='/Windows/System32/config/SAM')
+    locations = self._FindLocations(find_spec)
+    self.assertEqual(locations, ['/Windows/System32/config/SAM'])
+
+    find_spec = file_system_searcher.FindSpec(
+        location_glob='/Windows/System32/config/S*')
+    locations = self._FindLocations(find_spec)
+    self.assertEqual(locations, [
+        '/Windows/System32/config/SAM', '/Windows/System32/config/SYSTEM'])
+
+    find_spec = file_system_searcher.FindSpec(
+        case_sensitive=False, location='/WINDOWS/system32/CONFIG/sam')
+    locations = self._FindLocations(find_spec)
+    self.assertEqual(locations, [
+        '/Windows/System32/config/SAM', '/windows/System32/config/SAM'])
+
+    find_spec = file_system_searcher.FindSpec(
+        location='/Windows/System32/config/SAM/bogus')
+    locations = self._FindLocations(find_spec)
+    self.assertEqual(locations, [])
+
+
+class FileSystemSearcherLocationLookupTest(shared_test_lib.BaseTestCase):
+  """Tests for the file system searcher with a location look up."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def _FindComparables(self, file_system, mount_point, find_spec):
+    """Finds the comparables of the file entries matching a find specification.
+
+    Args:
+      file_system (FileSystem): file system.
+      mount_point (PathSpec): mount point path specification.
+      find_spec (FindSpec): find specification.
+
+    Returns:
+      list[str]: sorted comparables of the matching path specifications.
+    """
+    searcher = file_system_searcher.FileSystemSearcher(
+        file_system, mount_point)
+    return sorted(
+        path_spec.comparable for path_spec in searcher.Find(
+            find_specs=[find_spec]))
+
+  def _FindComparablesWithAndWithoutLookup(
+      self, file_system_class, mount_point, find_spec):
+    """Finds comparables with and without a location look up.
+
+    Args:
+      file_system_class (type): file system class.
+      mount_point (PathSpec): mount point path specification.
+      find_spec (FindSpec): find specification.
+
+    Returns:
+      tuple[list[str], list[str]]: sorted comparables of the matching path
+          specifications with and without a location look up.
+    """
+    file_system = file_system_class(self._resolver_context, mount_point)
+    file_system.Open()
+
+    self.assertTrue(file_system.SUPPORTS_LOCATION_LOOKUP)
+    comparables = self._FindComparables(file_system, mount_point, find_spec)
+
+    with mock.patch.object(
+        file_system_class, 'SUPPORTS_LOCATION_LOOKUP', False):
+      expected_comparables = self._FindComparables(
+          file_system, mount_point, find_spec)
+
+    return comparables, expected_comparables
+
+  def testFindOnEXT(self):
+    """Test the Find function on an EXT file system."""
+    test_file = self._GetTestFilePath(['ext2.qcow2'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+    mount_point = ext_path_spec.EXTPathSpec(location='/', parent=path_spec)
+
+    find_spec = file_system_searcher.FindSpec(
+        location='/a_directory/another_file')
+    comparables, expected_comparables = (
+        self._FindComparablesWithAndWithoutLookup(
+            ext_file_system.EXTFileSystem, mount_point, find_spec))
+
+    self.assertEqual(len(comparables), 1)
+    self.assertIn('inode: ', comparables[0])
+    self.assertEqual(comparables, expected_comparables)
+
+  def testFindOnHFS(self):
+    """Test the Find function on a case insensitive HFS file system."""
+    test_file = self._GetTestFilePath(['hfsplus.raw'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = raw_path_spec.RawPathSpec(parent=path_spec)
+    mount_point = hfs_path_spec.HFSPathSpec(location='/', parent=path_spec)
+
+    find_spec = file_system_searcher.FindSpec(
+        case_sensitive=False, location='/A_DIRECTORY/ANOTHER_FILE')
+    comparables, expected_comparables = (
+        self._FindComparablesWithAndWithoutLookup(
+            hfs_file_system.HFSFileSystem, mount_point, find_spec))
+
+    self.assertEqual(len(comparables), 1)
+    self.assertIn('location: /a_directory/another_file', comparables[0])
+    self.assertIn('identifier: ', comparables[0])
+    self.assertEqual(comparables, expected_comparables)
+
+
 if __name__ == '__main__':
   unittest.main()
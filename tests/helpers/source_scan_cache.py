@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the persistent cache of source scan results."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.helpers import source_scan_cache
+from dfvfs.helpers import source_scanner
+from dfvfs.lib import definitions
+
+from tests import test_lib as shared_test_lib
+
+
+class SourceScanCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the persistent cache of source scan results."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._source_scanner = source_scanner.SourceScanner()
+
+  def _GetScanNodes(self, scan_context):
+    """Retrieves the scan nodes of a source scanner context.
+
+    Args:
+      scan_context (SourceScannerContext): source scanner context.
+
+    Returns:
+      list[tuple[str, bool, bool]]: comparable, scanned and locked state of
+          the scan nodes, in order of a depth-first traversal.
+    """
+    scan_nodes = []
+    scan_nodes_stack = [scan_context.GetRootScanNode()]
+    while scan_nodes_stack:
+      scan_node = scan_nodes_stack.pop()
+      scan_nodes.append((
+          scan_node.path_spec.comparable, scan_node.scanned,
+          scan_context.IsLockedScanNode(scan_node.path_spec)))
+      scan_nodes_stack.extend(reversed(scan_node.sub_nodes))
+
+    return scan_nodes
+
+  def _ScanSource(self, source_path):
+    """Scans a source.
+
+    Args:
+      source_path (str): path of the source.
+
+    Returns:
+      SourceScannerContext: source scanner context.
+    """
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(source_path)
+
+    self._source_scanner.Scan(scan_context)
+
+    return scan_context
+
+  def testReadScanContext(self):
+    """Tests the ReadScanContext function."""
+    test_path = self._GetTestFilePath(['hfsplus.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      scan_cache = source_scan_cache.SourceScanCache(temporary_directory)
+
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(test_path)
+
+      result = scan_cache.ReadScanContext(scan_context)
+      self.assertFalse(result)
+
+      expected_scan_context = self._ScanSource(test_path)
+      scan_cache.WriteScanContext(expected_scan_context)
+
+      result = scan_cache.ReadScanContext(scan_context)
+      self.assertTrue(result)
+
+      self.assertEqual(
+          scan_context.source_type,
+          definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE)
+      self.assertTrue(scan_context.HasFileSystemScanNodes())
+      self.assertEqual(
+          self._GetScanNodes(scan_context),
+          self._GetScanNodes(expected_scan_context))
+
+      # A scan context that was already scanned is not changed.
+      result = scan_cache.ReadScanContext(scan_context)
+      self.assertFalse(result)
+
+  def testReadScanContextOnChangedSource(self):
+    """Tests the ReadScanContext function on a changed source."""
+    test_path = self._GetTestFilePath(['hfsplus.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      scan_cache = source_scan_cache.SourceScanCache(temporary_directory)
+
+      source_path = os.path.join(temporary_directory, 'hfsplus.raw')
+      shutil.copyfile(test_path, source_path)
+
+      scan_context = self._ScanSource(source_path)
+      scan_cache.WriteScanContext(scan_context)
+
+      with open(source_path, 'ab') as file_object:
+        file_object.write(b'\x00')
+
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(source_path)
+
+      result = scan_cache.ReadScanContext(scan_context)
+      self.assertFalse(result)
+
+  def testWriteScanContext(self):
+    """Tests the WriteScanContext function."""
+    test_path = self._GetTestFilePath(['hfsplus.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      scan_cache = source_scan_cache.SourceScanCache(temporary_directory)
+
+      scan_context = self._ScanSource(test_path)
+      scan_cache.WriteScanContext(scan_context)
+
+      cache_files = os.listdir(temporary_directory)
+      self.assertEqual(len(cache_files), 1)
+
+      # Scan results of a directory are not cached.
+      test_path = self._GetTestFilePath(['testdir_os'])
+      self._SkipIfPathNotExists(test_path)
+
+      scan_context = self._ScanSource(test_path)
+      scan_cache.WriteScanContext(scan_context)
+
+      cache_files = os.listdir(temporary_directory)
+      self.assertEqual(len(cache_files), 1)
+
+  def testWriteScanContextWithUnlockedScanNode(self):
+    """Tests the WriteScanContext function with an unlocked scan node."""
+    test_path = self._GetTestFilePath(['hfsplus.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      scan_cache = source_scan_cache.SourceScanCache(temporary_directory)
+
+      expected_scan_context = self._ScanSource(test_path)
+
+      root_scan_node = expected_scan_context.GetRootScanNode()
+      unlocked_scan_node = root_scan_node.sub_nodes[0]
+      self.assertEqual(len(unlocked_scan_node.sub_nodes), 1)
+
+      unlocked_scan_node.credential = ('password', 'TEST')
+
+      scan_cache.WriteScanContext(expected_scan_context)
+
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(test_path)
+
+      result = scan_cache.ReadScanContext(scan_context)
+      self.assertTrue(result)
+
+      # The credential is not stored, hence the scan node is locked.
+      scan_node = scan_context.GetScanNode(unlocked_scan_node.path_spec)
+      self.assertIsNotNone(scan_node)
+      self.assertIsNone(scan_node.credential)
+      self.assertEqual(len(scan_node.sub_nodes), 0)
+      self.assertTrue(scan_context.IsLockedScanNode(scan_node.path_spec))
+      self.assertFalse(scan_context.HasFileSystemScanNodes())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,8 +2,12 @@
 # -*- coding: utf-8 -*-
 """Tests for the source scanner object."""
 
+import subprocess
+import sys
+import tempfile
 import unittest
 
+from dfvfs.helpers import source_scan_cache
 from dfvfs.helpers import source_scanner
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
@@ -267,6 +271,8 @@ class SourceScannerContextTest(shared_test_lib.BaseTestCase):
 class SourceScannerTest(shared_test_lib.BaseTestCase):
   """The unit test for the source scanner."""
 
+  # pylint: disable=protected-access
+
   _APFS_PASSWORD = 'apfs-TEST'
   _BDE_PASSWORD = 'bde-TEST'
   _FVDE_PASSWORD = 'fvde-TEST'
@@ -294,6 +300,63 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
 
     return scan_node
 
+  def _GetScanNodeLocations(self, scan_node):
+    """Retrieves the locations of a scan node and its sub nodes.
+
+    Args:
+      scan_node (SourceScanNode): scan node.
+
+    Returns:
+      list[tuple[str, str]]: type indicator and location of the scan node and
+          its sub nodes, in order of a depth-first traversal.
+    """
+    locations = [(
+        scan_node.type_indicator,
+        getattr(scan_node.path_spec, 'location', None))]
+    for sub_scan_node in scan_node.sub_nodes:
+      locations.extend(self._GetScanNodeLocations(sub_scan_node))
+
+    return locations
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    test_scanner = source_scanner.SourceScanner(maximum_number_of_workers=4)
+    self.assertIsNotNone(test_scanner)
+
+    with self.assertRaises(ValueError):
+      source_scanner.SourceScanner(maximum_number_of_workers=0)
+
+  def testMergeScanNodes(self):
+    """Test the _MergeScanNodes function."""
+    test_root_path_spec = fake_path_spec.FakePathSpec(location='/')
+    test_sub_path_spec = fake_path_spec.FakePathSpec(location='/p1')
+    test_locked_path_spec = fake_path_spec.FakePathSpec(location='/p1/bde')
+
+    sub_scan_context = source_scanner.SourceScannerContext()
+    sub_root_scan_node = sub_scan_context.AddScanNode(
+        test_root_path_spec, None)
+    sub_scan_node = sub_scan_context.AddScanNode(
+        test_sub_path_spec, sub_root_scan_node)
+    sub_scan_node.scanned = True
+    sub_scan_context.AddScanNode(test_locked_path_spec, sub_scan_node)
+    sub_scan_context.LockScanNode(test_locked_path_spec)
+
+    scan_context = source_scanner.SourceScannerContext()
+    root_scan_node = scan_context.AddScanNode(test_root_path_spec, None)
+    scan_context.AddScanNode(test_sub_path_spec, root_scan_node)
+
+    self._source_scanner._MergeScanNodes(
+        scan_context, root_scan_node, sub_scan_context, sub_root_scan_node)
+
+    self.assertEqual(len(root_scan_node.sub_nodes), 1)
+
+    scan_node = scan_context.GetScanNode(test_sub_path_spec)
+    self.assertTrue(scan_node.scanned)
+    self.assertEqual(len(scan_node.sub_nodes), 1)
+
+    self.assertTrue(scan_context.IsLockedScanNode(test_locked_path_spec))
+    self.assertFalse(scan_context.IsLockedScanNode(test_sub_path_spec))
+
   # TODO: add tests for _ScanEncryptedVolumeNode.
   # TODO: add tests for _ScanNode.
   # TODO: add tests for _ScanVolumeSystemRootNode.
@@ -593,6 +656,61 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         scan_node.type_indicator, definitions.PREFERRED_EXT_BACK_END)
 
+  def testScanOnMBRConcurrently(self):
+    """Test the Scan function on MBR with concurrent scanning of sub nodes."""
+    test_path = self._GetTestFilePath(['mbr.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    scan_context = source_scanner.SourceScannerContext()
+    scan_context.OpenSourcePath(test_path)
+
+    self._source_scanner.Scan(scan_context)
+
+    test_scanner = source_scanner.SourceScanner(maximum_number_of_workers=4)
+
+    concurrent_scan_context = source_scanner.SourceScannerContext()
+    concurrent_scan_context.OpenSourcePath(test_path)
+
+    test_scanner.Scan(concurrent_scan_context)
+    self.assertEqual(
+        concurrent_scan_context.source_type, scan_context.source_type)
+
+    locations = self._GetScanNodeLocations(
+        concurrent_scan_context.GetRootScanNode())
+    expected_locations = self._GetScanNodeLocations(
+        scan_context.GetRootScanNode())
+    self.assertEqual(locations, expected_locations)
+
+    self.assertEqual(
+        len(concurrent_scan_context.locked_scan_nodes),
+        len(scan_context.locked_scan_nodes))
+
+  def testScanOnMBRConcurrentlyInNewProcess(self):
+    """Test the Scan function on MBR with concurrent scanning in a new process.
+
+    The deferred modules of the path specification types and resolver helpers
+    need to be imported by the worker threads, hence the test is run in
+    a separate Python interpreter.
+    """
+    test_path = self._GetTestFilePath(['mbr.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    script = '\n'.join([
+        'import sys',
+        'from dfvfs.helpers import source_scanner',
+        'scan_context = source_scanner.SourceScannerContext()',
+        'scan_context.OpenSourcePath(sys.argv[1])',
+        'test_scanner = source_scanner.SourceScanner(',
+        '    maximum_number_of_workers=4)',
+        'test_scanner.Scan(scan_context)',
+        'print(scan_context.source_type)'])
+
+    output = subprocess.check_output(
+        [sys.executable, '-c', script, test_path], stderr=subprocess.STDOUT)
+    self.assertEqual(
+        output.strip(),
+        definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE.encode('utf-8'))
+
   def testScanOnVSS(self):
     """Test the Scan function on VSS."""
     test_path = self._GetTestFilePath(['vss.raw'])
@@ -806,6 +924,40 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
     with self.assertRaises(errors.BackEndError):
       self._source_scanner.Scan(scan_context)
 
+  def testScanWithScanCache(self):
+    """Test the Scan function with a scan cache."""
+    test_path = self._GetTestFilePath(['hfsplus.raw'])
+    self._SkipIfPathNotExists(test_path)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      scan_cache = source_scan_cache.SourceScanCache(temporary_directory)
+      test_scanner = source_scanner.SourceScanner(scan_cache=scan_cache)
+
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(test_path)
+
+      test_scanner.Scan(scan_context)
+      expected_locations = self._GetScanNodeLocations(
+          scan_context.GetRootScanNode())
+
+      cached_scan_context = source_scanner.SourceScannerContext()
+      cached_scan_context.OpenSourcePath(test_path)
+
+      result = scan_cache.ReadScanContext(cached_scan_context)
+      self.assertTrue(result)
+
+      cached_scan_context = source_scanner.SourceScannerContext()
+      cached_scan_context.OpenSourcePath(test_path)
+
+      test_scanner.Scan(cached_scan_context)
+      self.assertEqual(
+          cached_scan_context.source_type,
+          definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE)
+
+      locations = self._GetScanNodeLocations(
+          cached_scan_context.GetRootScanNode())
+      self.assertEqual(locations, expected_locations)
+
   def testScanForFileSystemOnVSS(self):
     """Test the ScanForFileSystem function on VSS."""
     test_path = self._GetTestFilePath(['vss.raw'])
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the directory index of archive file systems."""
+
+import unittest
+
+from dfvfs.lib import archive_index
+
+from tests import test_lib as shared_test_lib
+
+
+class ArchiveDirectoryIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the directory index of archive file systems."""
+
+  def _CreateTestDirectoryIndex(self):
+    """Creates a directory index for testing.
+
+    Returns:
+      ArchiveDirectoryIndex: directory index.
+    """
+    directory_index = archive_index.ArchiveDirectoryIndex()
+    directory_index.AddPath('a_directory/', is_directory=True)
+    directory_index.AddPath('a_directory/a_file')
+    directory_index.AddPath('a_directory/another_file')
+    directory_index.AddPath('virtual/sub_directory/a_file')
+    directory_index.AddPath('a_file')
+    return directory_index
+
+  def testAddPath(self):
+    """Tests the AddPath function."""
+    directory_index = self._CreateTestDirectoryIndex()
+
+    self.assertEqual(directory_index.number_of_directories, 4)
+
+    # Adding a path twice should not change the directory index.
+    directory_index.AddPath('a_directory/a_file')
+    self.assertEqual(directory_index.number_of_directories, 4)
+
+    directory_index.AddPath('')
+    self.assertEqual(directory_index.number_of_directories, 4)
+
+  def testDirectoryExists(self):
+    """Tests the DirectoryExists function."""
+    directory_index = self._CreateTestDirectoryIndex()
+
+    self.assertTrue(directory_index.DirectoryExists(''))
+    self.assertTrue(directory_index.DirectoryExists('a_directory'))
+    self.assertTrue(directory_index.DirectoryExists('a_directory/'))
+    self.assertTrue(directory_index.DirectoryExists('virtual'))
+    self.assertTrue(directory_index.DirectoryExists('virtual/sub_directory'))
+
+    self.assertFalse(directory_index.DirectoryExists('a_file'))
+    self.assertFalse(directory_index.DirectoryExists('bogus'))
+
+  def testGetSubPaths(self):
+    """Tests the GetSubPaths function."""
+    directory_index = self._CreateTestDirectoryIndex()
+
+    sub_paths = sorted(directory_index.GetSubPaths(''))
+    self.assertEqual(sub_paths, [
+        ('a_directory', True), ('a_file', False), ('virtual', True)])
+
+    sub_paths = sorted(directory_index.GetSubPaths('a_directory'))
+    self.assertEqual(sub_paths, [
+        ('a_directory/a_file', False), ('a_directory/another_file', False)])
+
+    sub_paths = sorted(directory_index.GetSubPaths('virtual/'))
+    self.assertEqual(sub_paths, [('virtual/sub_directory', True)])
+
+    sub_paths = list(directory_index.GetSubPaths('a_file'))
+    self.assertEqual(sub_paths, [])
+
+    sub_paths = list(directory_index.GetSubPaths('bogus'))
+    self.assertEqual(sub_paths, [])
+
+  def testPathExists(self):
+    """Tests the PathExists function."""
+    directory_index = self._CreateTestDirectoryIndex()
+
+    self.assertTrue(directory_index.PathExists(''))
+    self.assertTrue(directory_index.PathExists('a_directory'))
+    self.assertTrue(directory_index.PathExists('a_directory/a_file'))
+    self.assertTrue(directory_index.PathExists('virtual/sub_directory'))
+    self.assertTrue(directory_index.PathExists('a_file'))
+
+    self.assertFalse(directory_index.PathExists('a_dir'))
+    self.assertFalse(directory_index.PathExists('a_directory/bogus'))
+    self.assertFalse(directory_index.PathExists('bogus/a_file'))
+
+
+if __name__ == '__main__':
+  unittest.main()
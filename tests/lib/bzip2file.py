@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for BZIP2 compressed stream file."""
+
+import unittest
+
+from dfvfs.lib import bzip2file
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class BZIP2BlockTest(shared_test_lib.BaseTestCase):
+  """Tests for BZIP2 compressed block."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    block = bzip2file.BZIP2Block(32, 4096)
+    self.assertIsNotNone(block)
+
+
+class BZIP2BlockIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for BZIP2 block index."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def _OpenTestFile(self, path_segments):
+    """Opens a test file.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+
+    Returns:
+      FileIO: file-like object.
+    """
+    test_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    return resolver.Resolver.OpenFileObject(
+        test_os_path_spec, resolver_context=self._resolver_context)
+
+  def testGetSignatureSearchPatterns(self):
+    """Tests the _GetSignatureSearchPatterns function."""
+    block_index = bzip2file.BZIP2BlockIndex()
+
+    search_patterns = block_index._GetSignatureSearchPatterns(0x314159265359)
+    self.assertEqual(len(search_patterns), 8)
+    self.assertEqual(
+        search_patterns[0], (0, b'AY&SY', 0x31, 0xff, 0x00, 0x00))
+
+  def testScanDataForSignature(self):
+    """Tests the _ScanDataForSignature function."""
+    block_index = bzip2file.BZIP2BlockIndex()
+
+    search_patterns = block_index._GetSignatureSearchPatterns(0x314159265359)
+
+    bit_offsets = set()
+    block_index._ScanDataForSignature(
+        b'BZh91AY&SY\x00', 0, search_patterns, bit_offsets)
+    self.assertEqual(bit_offsets, set([32]))
+
+    # Test with the signature shifted by 3 bits.
+    shifted_data = (0x314159265359 << 5).to_bytes(7, 'big')
+
+    bit_offsets = set()
+    block_index._ScanDataForSignature(
+        shifted_data, 10, search_patterns, bit_offsets)
+    self.assertEqual(bit_offsets, set([83]))
+
+  def testGetBlockIndexForOffset(self):
+    """Tests the GetBlockIndexForOffset function."""
+    file_object = self._OpenTestFile(['syslog.bz2'])
+
+    block_index = bzip2file.BZIP2BlockIndex()
+    block_index.Read(file_object)
+
+    self.assertEqual(block_index.GetBlockIndexForOffset(0), 0)
+    self.assertEqual(block_index.GetBlockIndexForOffset(1246), 0)
+    self.assertIsNone(block_index.GetBlockIndexForOffset(1247))
+    self.assertIsNone(block_index.GetBlockIndexForOffset(-1))
+
+  def testRead(self):
+    """Tests the Read function."""
+    file_object = self._OpenTestFile(['syslog.bz2'])
+
+    block_index = bzip2file.BZIP2BlockIndex()
+    block_index.Read(file_object)
+
+    self.assertEqual(len(block_index.blocks), 1)
+    self.assertEqual(block_index.uncompressed_data_size, 1247)
+
+    block = block_index.blocks[0]
+    self.assertEqual(block.compressed_bit_offset, 32)
+    self.assertEqual(block.uncompressed_data_offset, 0)
+    self.assertEqual(block.uncompressed_data_size, 1247)
+
+    file_object = self._OpenTestFile(['syslog.xz'])
+
+    block_index = bzip2file.BZIP2BlockIndex()
+    with self.assertRaises(errors.FileFormatError):
+      block_index.Read(file_object)
+
+  def testReadBlock(self):
+    """Tests the ReadBlock function."""
+    file_object = self._OpenTestFile(['syslog.bz2'])
+
+    block_index = bzip2file.BZIP2BlockIndex()
+    block_index.Read(file_object)
+
+    uncompressed_data = block_index.ReadBlock(
+        file_object, block_index.blocks[0])
+    self.assertEqual(len(uncompressed_data), 1247)
+    self.assertEqual(uncompressed_data[:15], b'Jan 22 07:52:33')
+
+    block = bzip2file.BZIP2Block(32, 64)
+    with self.assertRaises(errors.BackEndError):
+      block_index.ReadBlock(file_object, block)
+
+
+if __name__ == '__main__':
+  unittest.main()
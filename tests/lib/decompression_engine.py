@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the engine to decompress independent blocks."""
+
+import unittest
+import zlib
+
+from dfvfs.lib import decompression_engine
+
+from tests import test_lib as shared_test_lib
+
+
+class BlockDecompressionEngineTest(shared_test_lib.BaseTestCase):
+  """Tests for the engine to decompress independent blocks."""
+
+  _NUMBER_OF_BLOCKS = 8
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._uncompressed_blocks = [
+        bytes([block_number]) * 1024
+        for block_number in range(self._NUMBER_OF_BLOCKS)]
+    self._compressed_blocks = [
+        zlib.compress(uncompressed_data)
+        for uncompressed_data in self._uncompressed_blocks]
+    self._read_block_numbers = []
+
+  def _DecompressBlock(self, unused_block_number, compressed_data):
+    """Decompresses the compressed data of a block.
+
+    Args:
+      unused_block_number (int): number of the block.
+      compressed_data (bytes): compressed data of the block.
+
+    Returns:
+      bytes: uncompressed data of the block.
+    """
+    return zlib.decompress(compressed_data)
+
+  def _ReadBlock(self, block_number):
+    """Reads the compressed data of a block.
+
+    Args:
+      block_number (int): number of the block.
+
+    Returns:
+      bytes: compressed data of the block.
+    """
+    self._read_block_numbers.append(block_number)
+    return self._compressed_blocks[block_number]
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    engine = decompression_engine.BlockDecompressionEngine(
+        self._NUMBER_OF_BLOCKS, self._ReadBlock, self._DecompressBlock)
+    self.assertEqual(engine.maximum_number_of_workers, 1)
+    self.assertEqual(engine.maximum_read_ahead, 1)
+
+    engine = decompression_engine.BlockDecompressionEngine(
+        self._NUMBER_OF_BLOCKS, self._ReadBlock, self._DecompressBlock,
+        maximum_number_of_workers=4)
+    self.assertEqual(engine.maximum_number_of_workers, 4)
+    self.assertEqual(engine.maximum_read_ahead, 4)
+
+  def testClose(self):
+    """Tests the Close function."""
+    engine = decompression_engine.BlockDecompressionEngine(
+        self._NUMBER_OF_BLOCKS, self._ReadBlock, self._DecompressBlock,
+        maximum_number_of_workers=2, maximum_read_ahead=2)
+
+    engine.GetBlock(0)
+    engine.Close()
+
+    # Blocks are read and decompressed again after the engine was closed.
+    uncompressed_data = engine.GetBlock(1)
+    self.assertEqual(uncompressed_data, self._uncompressed_blocks[1])
+    self.assertEqual(self._read_block_numbers, [0, 1, 2, 1])
+
+    engine.Close()
+
+  def testGetBlock(self):
+    """Tests the GetBlock function."""
+    engine = decompression_engine.BlockDecompressionEngine(
+        self._NUMBER_OF_BLOCKS, self._ReadBlock, self._DecompressBlock,
+        maximum_number_of_workers=2, maximum_read_ahead=2)
+
+    try:
+      uncompressed_data = engine.GetBlock(0)
+      self.assertEqual(uncompressed_data, self._uncompressed_blocks[0])
+      self.assertEqual(self._read_block_numbers, [0, 1, 2])
+
+      uncompressed_data = engine.GetBlock(1)
+      self.assertEqual(uncompressed_data, self._uncompressed_blocks[1])
+      self.assertEqual(self._read_block_numbers, [0, 1, 2, 3])
+
+      # Test retrieving blocks out of order, which are not read ahead.
+      for block_number in (6, 2, 7, 7):
+        uncompressed_data = engine.GetBlock(block_number)
+        self.assertEqual(
+            uncompressed_data, self._uncompressed_blocks[block_number])
+
+      self.assertEqual(self._read_block_numbers, [0, 1, 2, 3, 6, 2, 7, 7])
+
+    finally:
+      engine.Close()
+
+  def testGetBlockWithoutConcurrency(self):
+    """Tests the GetBlock function without concurrency."""
+    engine = decompression_engine.BlockDecompressionEngine(
+        self._NUMBER_OF_BLOCKS, self._ReadBlock, self._DecompressBlock,
+        maximum_number_of_workers=1)
+
+    try:
+      for block_number in range(self._NUMBER_OF_BLOCKS):
+        uncompressed_data = engine.GetBlock(block_number)
+        self.assertEqual(
+            uncompressed_data, self._uncompressed_blocks[block_number])
+
+      self.assertEqual(
+          self._read_block_numbers, list(range(self._NUMBER_OF_BLOCKS)))
+
+    finally:
+      engine.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the layout of encoded data."""
+
+import unittest
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.lib import encoded_data_layout
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class EncodedDataLayoutTest(shared_test_lib.BaseTestCase):
+  """Tests for the layout of encoded data."""
+
+  _ENCODED_DATA = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123'
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def _CreateTestLayout(self, encoded_data):
+    """Creates an encoded data layout for testing.
+
+    Args:
+      encoded_data (bytes): encoded data.
+
+    Returns:
+      EncodedDataLayout: encoded data layout.
+    """
+    test_path_spec = fake_path_spec.FakePathSpec(location='/encoded_data')
+    file_object = fake_file_io.FakeFile(
+        self._resolver_context, test_path_spec, encoded_data)
+    file_object.Open()
+
+    layout = encoded_data_layout.EncodedDataLayout(file_object)
+    layout.Open()
+    return layout
+
+  def _GetLines(self, line_length, separator):
+    """Retrieves the test encoded data as lines.
+
+    Args:
+      line_length (int): number of encoded characters per line.
+      separator (bytes): line separator.
+
+    Returns:
+      bytes: encoded data.
+    """
+    return separator.join([
+        self._ENCODED_DATA[offset:offset + line_length]
+        for offset in range(0, len(self._ENCODED_DATA), line_length)])
+
+  def testGetOffset(self):
+    """Tests the GetOffset function."""
+    layout = self._CreateTestLayout(self._ENCODED_DATA)
+    self.assertEqual(layout.GetOffset(10), (10, 10))
+
+    layout = self._CreateTestLayout(self._GetLines(16, b'\r\n') + b'\r\n')
+    self.assertEqual(layout.GetOffset(0), (0, 0))
+    self.assertEqual(layout.GetOffset(15), (15, 15))
+    self.assertEqual(layout.GetOffset(16), (18, 16))
+    self.assertEqual(layout.GetOffset(40), (44, 40))
+
+    layout = self._CreateTestLayout(b'ABCD\nEFGHIJ\nKLMN\n')
+    self.assertEqual(layout.GetOffset(0), (0, 0))
+    self.assertEqual(layout.GetOffset(7), (0, 0))
+
+  def testOpen(self):
+    """Tests the Open function."""
+    layout = self._CreateTestLayout(self._ENCODED_DATA)
+    self.assertFalse(layout.uses_index)
+    self.assertEqual(layout.number_of_characters, 56)
+
+    layout = self._CreateTestLayout(self._ENCODED_DATA + b'\n')
+    self.assertFalse(layout.uses_index)
+    self.assertEqual(layout.number_of_characters, 56)
+
+    layout = self._CreateTestLayout(self._GetLines(16, b'\n'))
+    self.assertFalse(layout.uses_index)
+    self.assertEqual(layout.number_of_characters, 56)
+
+    layout = self._CreateTestLayout(self._GetLines(8, b'\r\n') + b'\r\n')
+    self.assertFalse(layout.uses_index)
+    self.assertEqual(layout.number_of_characters, 56)
+
+    # Test lines of different lengths.
+    layout = self._CreateTestLayout(b'ABCD\nEFGHIJ\nKLMN\n')
+    self.assertTrue(layout.uses_index)
+    self.assertEqual(layout.number_of_characters, 14)
+
+    layout = self._CreateTestLayout(b'')
+    self.assertFalse(layout.uses_index)
+    self.assertEqual(layout.number_of_characters, 0)
+
+  def testRemoveWhitespace(self):
+    """Tests the RemoveWhitespace function."""
+    layout = self._CreateTestLayout(self._ENCODED_DATA)
+
+    encoded_data = layout.RemoveWhitespace(b'ABCD\r\nEFGH \t\n')
+    self.assertEqual(encoded_data, b'ABCDEFGH')
+
+  def testVerifyData(self):
+    """Tests the VerifyData function."""
+    layout = self._CreateTestLayout(self._ENCODED_DATA)
+    self.assertTrue(layout.VerifyData(8, b'IJKLMNOP'))
+    self.assertFalse(layout.VerifyData(8, b'IJKL\nMNOP'))
+
+    layout = self._CreateTestLayout(self._GetLines(16, b'\r\n') + b'\r\n')
+    self.assertTrue(layout.VerifyData(12, b'MNOP\r\nQRSTUV'))
+    self.assertTrue(layout.VerifyData(17, b'\nQRSTUV'))
+    self.assertFalse(layout.VerifyData(12, b'MNO\r\nPQRSTUV'))
+    self.assertFalse(layout.VerifyData(12, b'MNOPQR\r\nSTUV'))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -7,8 +7,12 @@
 # when using pip.
 
 import os
+import tempfile
 import unittest
 
+from unittest import mock
+
+from dfvfs.compression import zlib_decompressor
 from dfvfs.lib import definitions
 from dfvfs.lib import gzipfile
 from dfvfs.path import factory as path_spec_factory
@@ -18,7 +22,82 @@ from tests import test_lib as shared_test_lib
 
 
 # TODO: add tests for _GzipDecompressorState
-# TODO: add tests for GzipMember
+
+
+class GzipCheckpointTest(shared_test_lib.BaseTestCase):
+  """Tests a gzip member checkpoint."""
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    decompressor = zlib_decompressor.DeflateDecompressor()
+
+    checkpoint = gzipfile.GzipCheckpoint(128, 4096, decompressor)
+    self.assertIsNotNone(checkpoint)
+    self.assertEqual(checkpoint.compressed_data_offset, 128)
+    self.assertEqual(checkpoint.uncompressed_data_offset, 4096)
+    self.assertEqual(checkpoint.decompressor, decompressor)
+
+
+class GzipMemberTest(shared_test_lib.BaseTestCase):
+  """Tests a gzip member."""
+
+  def testCopyToDict(self):
+    """Test the CopyToDict function."""
+    test_path = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_object = resolver.Resolver.OpenFileObject(test_os_path_spec)
+
+    member = gzipfile.GzipMember(file_object, 0, 0)
+
+    member_values = member.CopyToDict()
+    self.assertNotIn('checkpoints', member_values)
+    self.assertEqual(member_values['member_start_offset'], 0)
+    self.assertEqual(member_values['original_filename'], 'syslog.1')
+    self.assertEqual(member_values['uncompressed_data_offset'], 0)
+    self.assertEqual(member_values['uncompressed_data_size'], 1247)
+
+    member = gzipfile.GzipMember(
+        file_object, 0, 0, member_values=member_values)
+    self.assertEqual(
+        member.member_end_offset, member_values['member_end_offset'])
+    self.assertEqual(member.uncompressed_data_size, 1247)
+
+    expected_data = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    data = member.ReadAtOffset(167, 95)
+    self.assertEqual(data, expected_data)
+
+  def testReadAtOffsetWithCheckpoints(self):
+    """Test the ReadAtOffset function with checkpoints."""
+    test_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_path)
+
+    with open(test_path, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    test_path = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_object = resolver.Resolver.OpenFileObject(test_os_path_spec)
+
+    with mock.patch.object(gzipfile.GzipMember, '_CHECKPOINT_INTERVAL', 256):
+      with mock.patch.object(gzipfile.GzipMember, '_MAXIMUM_READ_SIZE', 64):
+        with mock.patch.object(
+            gzipfile.GzipMember, '_UNCOMPRESSED_DATA_CACHE_SIZE', 128):
+          member = gzipfile.GzipMember(file_object, 0, 0)
+
+          self.assertGreater(len(member.checkpoints), 1)
+
+          for offset in (1000, 167, 600, 0):
+            data = member.ReadAtOffset(offset, 95)
+            self.assertEqual(data, expected_data[offset:offset + 95])
 
 
 class GzipCompressedStreamTest(shared_test_lib.BaseTestCase):
@@ -178,6 +257,54 @@ class GzipCompressedStreamTest(shared_test_lib.BaseTestCase):
     finally:
       test_file.close()
 
+  def testOpenWithIndex(self):
+    """Tests opening a file with a gzip index."""
+    # pylint: disable=protected-access
+
+    test_path = self._GetTestFilePath(['fsevents_000000000000b208'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    file_object = resolver.Resolver.OpenFileObject(test_os_path_spec)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      index_path = os.path.join(temporary_directory, 'index.gzidx')
+
+      test_file = gzipfile.GzipCompressedStream()
+      test_file.Open(file_object, index_path=index_path)
+
+      try:
+        self.assertTrue(os.path.exists(index_path))
+        self.assertEqual(test_file.uncompressed_data_size, 506631)
+
+      finally:
+        test_file.close()
+
+      test_file = gzipfile.GzipCompressedStream()
+      self.assertTrue(test_file._ReadIndex(file_object, index_path))
+
+      test_file.Open(file_object, index_path=index_path)
+
+      try:
+        self.assertEqual(len(test_file.members), 2)
+        self.assertEqual(test_file.uncompressed_data_size, 506631)
+
+        test_file.seek(28530)
+        self.assertEqual(test_file.read(6), b'OS\x00P\x07\x00')
+
+        test_file.seek(506631 - 4)
+        self.assertEqual(test_file.read(4), b'\x02\x00\x80\x00')
+
+      finally:
+        test_file.close()
+
+      with open(index_path, 'w', encoding='utf-8') as index_file:
+        index_file.write('{"format_version": 0}')
+
+      test_file = gzipfile.GzipCompressedStream()
+      self.assertFalse(test_file._ReadIndex(file_object, index_path))
+
 
 if __name__ == '__main__':
   unittest.main()
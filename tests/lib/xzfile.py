@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for XZ compressed stream file."""
+
+import unittest
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.lib import xzfile
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class XZBlockTest(shared_test_lib.BaseTestCase):
+  """Tests for XZ compressed block."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    block = xzfile.XZBlock(12, 512, 0, 1024)
+    self.assertIsNotNone(block)
+
+
+class XZBlockIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for XZ block index."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
+  def _OpenTestFile(self, path_segments):
+    """Opens a test file.
+
+    Args:
+      path_segments (list[str]): path segments inside the test data directory.
+
+    Returns:
+      FileIO: file-like object.
+    """
+    test_path = self._GetTestFilePath(path_segments)
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    return resolver.Resolver.OpenFileObject(
+        test_os_path_spec, resolver_context=self._resolver_context)
+
+  def testReadVariableSizeInteger(self):
+    """Tests the _ReadVariableSizeInteger function."""
+    block_index = xzfile.XZBlockIndex()
+
+    value, data_offset = block_index._ReadVariableSizeInteger(b'\x00\x7f', 1)
+    self.assertEqual(value, 0x7f)
+    self.assertEqual(data_offset, 2)
+
+    value, data_offset = block_index._ReadVariableSizeInteger(b'\x80\x01', 0)
+    self.assertEqual(value, 0x80)
+    self.assertEqual(data_offset, 2)
+
+    with self.assertRaises(errors.FileFormatError):
+      block_index._ReadVariableSizeInteger(b'\x80', 0)
+
+  def testGetBlockIndexForOffset(self):
+    """Tests the GetBlockIndexForOffset function."""
+    file_object = self._OpenTestFile(['syslog.xz'])
+
+    block_index = xzfile.XZBlockIndex()
+    block_index.Read(file_object)
+
+    self.assertEqual(block_index.GetBlockIndexForOffset(0), 0)
+    self.assertEqual(block_index.GetBlockIndexForOffset(1246), 0)
+    self.assertIsNone(block_index.GetBlockIndexForOffset(1247))
+
+  def testRead(self):
+    """Tests the Read function."""
+    file_object = self._OpenTestFile(['syslog.xz'])
+
+    block_index = xzfile.XZBlockIndex()
+    block_index.Read(file_object)
+
+    self.assertEqual(len(block_index.blocks), 1)
+    self.assertEqual(block_index.uncompressed_data_size, 1247)
+    self.assertEqual(len(block_index.stream_header_data), 12)
+
+    block = block_index.blocks[0]
+    self.assertEqual(block.compressed_data_offset, 12)
+    self.assertEqual(block.uncompressed_data_offset, 0)
+    self.assertEqual(block.uncompressed_data_size, 1247)
+
+    file_object = self._OpenTestFile(['syslog.bz2'])
+
+    block_index = xzfile.XZBlockIndex()
+    with self.assertRaises(errors.FileFormatError):
+      block_index.Read(file_object)
+
+    file_object = self._OpenTestFile(['syslog.blocks.xz'])
+
+    block_index = xzfile.XZBlockIndex()
+    block_index.Read(file_object)
+
+    self.assertEqual(len(block_index.blocks), 3)
+    self.assertEqual(block_index.uncompressed_data_size, 1247)
+
+    block = block_index.blocks[2]
+    self.assertEqual(block.uncompressed_data_offset, 1024)
+    self.assertEqual(block.uncompressed_data_size, 223)
+
+  def testReadCompressedBlock(self):
+    """Tests the ReadCompressedBlock and DecompressBlock functions."""
+    file_object = self._OpenTestFile(['syslog.blocks.xz'])
+
+    block_index = xzfile.XZBlockIndex()
+    block_index.Read(file_object)
+
+    block = block_index.blocks[1]
+    compressed_data = block_index.ReadCompressedBlock(file_object, block)
+    uncompressed_data = block_index.DecompressBlock(block, compressed_data)
+    self.assertEqual(len(uncompressed_data), 512)
+
+    with self.assertRaises(errors.BackEndError):
+      block_index.DecompressBlock(block, compressed_data[:-16])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -30,6 +30,23 @@ class FactoryTest(unittest.TestCase):
     self.assertEqual(
         len(factory.Factory._path_spec_types), number_of_path_spec_types)
 
+  def testRegisterPathSpecModule(self):
+    """Tests the RegisterPathSpecModule function."""
+    # pylint: disable=protected-access
+    factory.Factory.RegisterPathSpecModule('test', 'tests.path.bogus_path_spec')
+    self.assertIn('test', factory.Factory._path_spec_modules)
+
+    with self.assertRaises(KeyError):
+      factory.Factory.RegisterPathSpecModule(
+          'test', 'tests.path.bogus_path_spec')
+
+    # A module that cannot be imported does not register a path specification
+    # type.
+    with self.assertRaises(KeyError):
+      factory.Factory.NewPathSpec('test')
+
+    self.assertNotIn('test', factory.Factory._path_spec_modules)
+
   def testNewPathSpec(self):
     """Tests the NewPathSpec function."""
     test_path_spec = factory.Factory.NewPathSpec(
@@ -37,6 +54,14 @@ class FactoryTest(unittest.TestCase):
 
     self.assertIsNotNone(test_path_spec)
 
+    test_path_spec = factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_ZIP, location='/test',
+        parent=test_path_spec)
+
+    self.assertIsNotNone(test_path_spec)
+    self.assertEqual(
+        test_path_spec.type_indicator, definitions.TYPE_INDICATOR_ZIP)
+
   def testIsSystemLevelTypeIndicator(self):
     """Tests the IsSystemLevelTypeIndicator function."""
     result = factory.Factory.IsSystemLevelTypeIndicator(
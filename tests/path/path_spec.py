@@ -24,6 +24,22 @@ class TestPathSpec(path_spec.PathSpec):
     self.attribute = 'MyAttribute'
 
 
+class TestSlotsPathSpec(TestPathSpec):
+  """Path specification with slots for testing."""
+
+  __slots__ = ('_private_attribute', 'slot_attribute')
+
+  def __init__(self, parent=None, **kwargs):
+    """Initializes a path specification.
+
+    Args:
+      parent (Optional[PathSpec]): parent path specification.
+    """
+    super(TestSlotsPathSpec, self).__init__(parent=parent, **kwargs)
+    self._private_attribute = 'MyPrivateAttribute'
+    self.slot_attribute = 'MySlotAttribute'
+
+
 class PathSpecTest(test_lib.PathSpecTestCase):
   """Tests for the VFS path specification interface."""
 
@@ -50,6 +66,28 @@ class PathSpecTest(test_lib.PathSpecTestCase):
 
     self.assertEqual(test_path_spec.comparable, 'type: test\n')
 
+  def testComparableCached(self):
+    """Tests that the comparable property is cached."""
+    test_parent_path_spec = TestPathSpec()
+    test_path_spec = TestPathSpec(parent=test_parent_path_spec)
+
+    comparable = test_path_spec.comparable
+    self.assertEqual(comparable, 'type: test\ntype: test\n')
+    self.assertIs(test_path_spec.comparable, comparable)
+
+    # Changing an attribute resets the cached comparable.
+    test_path_spec.parent = None
+    self.assertEqual(test_path_spec.comparable, 'type: test\n')
+
+    # Changing the comparable of the parent resets the cached comparable.
+    test_parent_path_spec = test_lib.TestPathSpec()
+    test_path_spec.parent = test_parent_path_spec
+    comparable = test_path_spec.comparable
+
+    test_parent_path_spec._comparable = 'type: changed\n'
+    self.assertIsNot(test_path_spec.comparable, comparable)
+    self.assertEqual(test_path_spec.comparable, 'type: changed\ntype: test\n')
+
   def testTypeIndicator(self):
     """Tests the type_indicator property."""
     test_path_spec = TestPathSpec()
@@ -63,6 +101,31 @@ class PathSpecTest(test_lib.PathSpecTestCase):
     test_dict = test_path_spec.CopyToDict()
     self.assertEqual(test_dict, {'attribute': 'MyAttribute'})
 
+    test_path_spec = TestSlotsPathSpec(parent=TestPathSpec())
+
+    test_dict = test_path_spec.CopyToDict()
+    self.assertEqual(test_dict, {
+        'attribute': 'MyAttribute',
+        'parent': {'attribute': 'MyAttribute'},
+        'slot_attribute': 'MySlotAttribute'})
+
+  def testGetFieldNames(self):
+    """Tests the GetFieldNames function."""
+    test_path_spec = test_lib.TestPathSpec()
+
+    field_names = test_path_spec.GetFieldNames()
+    self.assertEqual(field_names, ['parent'])
+
+    test_path_spec = TestPathSpec()
+
+    field_names = test_path_spec.GetFieldNames()
+    self.assertEqual(field_names, ['parent', 'attribute'])
+
+    test_path_spec = TestSlotsPathSpec()
+
+    field_names = test_path_spec.GetFieldNames()
+    self.assertEqual(field_names, ['parent', 'slot_attribute', 'attribute'])
+
   def testHasParent(self):
     """Tests the HasParent function."""
     test_path_spec = TestPathSpec()
@@ -16,11 +16,6 @@ class TestPathSpec(path_spec.PathSpec):
     """Initializes a test path specification."""
     super(TestPathSpec, self).__init__(parent=None, **kwargs)
 
-  @property
-  def comparable(self):
-    """Comparable representation of the path specification."""
-    return self._GetComparable()
-
 
 class PathSpecTestCase(shared_test_lib.BaseTestCase):
   """The unit test case for path specification implementations."""
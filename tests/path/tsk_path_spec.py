@@ -34,6 +34,9 @@ class TSKPathSpecTest(test_lib.PathSpecTestCase):
 
     self.assertIsNotNone(path_spec)
 
+    # The attributes are stored in slots.
+    self.assertFalse(hasattr(path_spec, '__dict__'))
+
     with self.assertRaises(ValueError):
       tsk_path_spec.TSKPathSpec(location='/test', parent=None)
 
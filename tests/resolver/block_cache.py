@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the resolver block cache object."""
+
+import unittest
+
+from dfvfs.resolver import block_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class BlockCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the resolver block cache object."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    cache = block_cache.BlockCache(1024, block_size=512)
+    self.assertEqual(cache.block_size, 512)
+    self.assertEqual(cache.maximum_size, 1024)
+
+    with self.assertRaises(ValueError):
+      block_cache.BlockCache(1024, block_size=0)
+
+    with self.assertRaises(ValueError):
+      block_cache.BlockCache(256, block_size=512)
+
+  def testCacheBlock(self):
+    """Tests the CacheBlock and GetBlock functions."""
+    cache = block_cache.BlockCache(8, block_size=4)
+
+    self.assertIsNone(cache.GetBlock('file1', 0))
+
+    cache.CacheBlock('file1', 0, b'abcd')
+    cache.CacheBlock('file2', 0, b'efgh')
+    self.assertEqual(cache.number_of_blocks, 2)
+    self.assertEqual(cache.size, 8)
+
+    self.assertEqual(cache.GetBlock('file1', 0), b'abcd')
+
+    # The least recently used block is removed when the cache is full.
+    cache.CacheBlock('file1', 1, b'ijkl')
+    self.assertEqual(cache.number_of_blocks, 2)
+    self.assertEqual(cache.GetBlock('file1', 0), b'abcd')
+    self.assertIsNone(cache.GetBlock('file2', 0))
+    self.assertEqual(cache.GetBlock('file1', 1), b'ijkl')
+
+    self.assertEqual(cache.hits, 3)
+    self.assertEqual(cache.misses, 2)
+
+  def testEmpty(self):
+    """Tests the Empty function."""
+    cache = block_cache.BlockCache(8, block_size=4)
+
+    cache.CacheBlock('file1', 0, b'abcd')
+    self.assertEqual(cache.number_of_blocks, 1)
+
+    cache.Empty()
+    self.assertEqual(cache.number_of_blocks, 0)
+    self.assertEqual(cache.size, 0)
+
+  def testGetStatistics(self):
+    """Tests the GetStatistics function."""
+    cache = block_cache.BlockCache(8, block_size=4)
+
+    cache.CacheBlock('file1', 0, b'abcd')
+    cache.GetBlock('file1', 0)
+    cache.GetBlock('file1', 1)
+
+    expected_statistics = {
+        'hits': 1,
+        'misses': 1,
+        'number_of_blocks': 1,
+        'size': 4}
+    self.assertEqual(cache.GetStatistics(), expected_statistics)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -52,6 +52,106 @@ class ContextTest(shared_test_lib.BaseTestCase):
     cached_object = resolver_context.GetFileSystem(path_spec)
     self.assertEqual(cached_object, file_system)
 
+  def testCacheFileObjectWithReferences(self):
+    """Tests the cache file-like object functionality with references."""
+    resolver_context = context.Context(maximum_number_of_file_objects=2)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location='/file1.txt')
+    resolver_context.CacheFileObject(
+        path_spec1, fake_file_io.FakeFile(resolver_context, path_spec1, b''))
+
+    path_spec2 = fake_path_spec.FakePathSpec(location='/file2.txt')
+    resolver_context.CacheFileObject(
+        path_spec2, fake_file_io.FakeFile(resolver_context, path_spec2, b''))
+
+    # The file-like objects are kept while not referenced elsewhere.
+    self.assertIsNotNone(resolver_context.GetFileObject(path_spec1))
+    self.assertIsNotNone(resolver_context.GetFileObject(path_spec2))
+
+    # Using the first file-like object makes the second the least recently
+    # used.
+    self.assertIsNotNone(resolver_context.GetFileObject(path_spec1))
+
+    path_spec3 = fake_path_spec.FakePathSpec(location='/file3.txt')
+    resolver_context.CacheFileObject(
+        path_spec3, fake_file_io.FakeFile(resolver_context, path_spec3, b''))
+
+    self.assertEqual(len(resolver_context._file_object_references), 2)
+    self.assertIsNotNone(resolver_context.GetFileObject(path_spec1))
+    self.assertIsNone(resolver_context.GetFileObject(path_spec2))
+    self.assertIsNotNone(resolver_context.GetFileObject(path_spec3))
+
+    resolver_context.Empty()
+    self.assertEqual(len(resolver_context._file_object_references), 0)
+
+    with self.assertRaises(ValueError):
+      context.Context(maximum_number_of_file_objects=-1)
+
+  def testCacheFileSystemWithReferences(self):
+    """Tests the cache file system object functionality with references."""
+    resolver_context = context.Context(maximum_number_of_file_systems=1)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/')
+    resolver_context.CacheFileSystem(
+        path_spec, fake_file_system.FakeFileSystem(resolver_context, path_spec))
+
+    self.assertIsNotNone(resolver_context.GetFileSystem(path_spec))
+
+    resolver_context = context.Context()
+
+    resolver_context.CacheFileSystem(
+        path_spec, fake_file_system.FakeFileSystem(resolver_context, path_spec))
+
+    # Without references the file system is removed when it is no longer
+    # referenced elsewhere.
+    self.assertIsNone(resolver_context.GetFileSystem(path_spec))
+
+    with self.assertRaises(ValueError):
+      context.Context(maximum_number_of_file_systems=-1)
+
+  def testDecompressionWorkers(self):
+    """Tests the maximum number of decompression workers."""
+    resolver_context = context.Context()
+    self.assertEqual(
+        resolver_context.maximum_number_of_decompression_workers, 1)
+
+    resolver_context = context.Context(
+        maximum_number_of_decompression_workers=4)
+    self.assertEqual(
+        resolver_context.maximum_number_of_decompression_workers, 4)
+
+    with self.assertRaises(ValueError):
+      context.Context(maximum_number_of_decompression_workers=0)
+
+  def testEnableBlockCache(self):
+    """Tests the EnableBlockCache and DisableBlockCache functions."""
+    resolver_context = context.Context()
+    self.assertIsNone(resolver_context.block_cache)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location='/')
+
+    self.assertIsNone(resolver_context.GetBlockCache(os_path_spec))
+
+    block_cache = resolver_context.EnableBlockCache(4096, block_size=512)
+    self.assertIsNotNone(block_cache)
+    self.assertEqual(block_cache.block_size, 512)
+    self.assertEqual(resolver_context.block_cache, block_cache)
+
+    self.assertEqual(resolver_context.GetBlockCache(os_path_spec), block_cache)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/')
+    self.assertIsNone(resolver_context.GetBlockCache(path_spec))
+
+    resolver_context.EnableBlockCache(
+        65536, type_indicators=[definitions.TYPE_INDICATOR_FAKE])
+    self.assertIsNone(resolver_context.GetBlockCache(os_path_spec))
+    self.assertIsNotNone(resolver_context.GetBlockCache(path_spec))
+
+    resolver_context.DisableBlockCache()
+    self.assertIsNone(resolver_context.block_cache)
+    self.assertIsNone(resolver_context.GetBlockCache(path_spec))
+
   def testGetMountPoint(self):
     """Tests the GetMountPoint function."""
     test_path = self._GetTestFilePath(['ext2.qcow2'])
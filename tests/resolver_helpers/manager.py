@@ -2,8 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tests for the path specification resolver helper manager."""
 
+import subprocess
+import sys
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.resolver_helpers import manager
 
 from tests import test_lib as shared_test_lib
@@ -33,6 +36,68 @@ class ResolverHelperManagerTest(shared_test_lib.BaseTestCase):
         len(manager.ResolverHelperManager._resolver_helpers),
         number_of_resolver_helpers)
 
+  def testGetHelper(self):
+    """Tests the GetHelper function."""
+    resolver_helper = manager.ResolverHelperManager.GetHelper(
+        definitions.TYPE_INDICATOR_OS)
+    self.assertIsNotNone(resolver_helper)
+    self.assertEqual(
+        resolver_helper.type_indicator, definitions.TYPE_INDICATOR_OS)
+
+    self.assertNotIn(
+        definitions.TYPE_INDICATOR_OS,
+        manager.ResolverHelperManager._resolver_helper_modules)
+
+    with self.assertRaises(KeyError):
+      manager.ResolverHelperManager.GetHelper('bogus')
+
+  def testGetHelperConcurrently(self):
+    """Tests the GetHelper function from multiple threads."""
+    # The deferred module of the resolver helper needs to be imported by one
+    # of the threads, hence the test is run in a separate Python interpreter.
+    script = '\n'.join([
+        'import threading',
+        'from dfvfs.resolver_helpers import manager',
+        'barrier = threading.Barrier(8)',
+        'resolver_helpers = []',
+        'def GetHelper():',
+        '  barrier.wait()',
+        '  resolver_helpers.append(',
+        '      manager.ResolverHelperManager.GetHelper(\'NTFS\'))',
+        'threads = [threading.Thread(target=GetHelper) for _ in range(8)]',
+        'for thread in threads:',
+        '  thread.start()',
+        'for thread in threads:',
+        '  thread.join()',
+        'print(len(resolver_helpers))'])
+
+    output = subprocess.check_output(
+        [sys.executable, '-c', script], stderr=subprocess.STDOUT)
+    self.assertEqual(output.strip(), b'8')
+
+  def testRegisterHelperModule(self):
+    """Tests the RegisterHelperModule function."""
+    manager.ResolverHelperManager.RegisterHelperModule(
+        'test', 'tests.resolver_helpers.bogus_resolver_helper')
+
+    self.assertIn(
+        'test', manager.ResolverHelperManager._resolver_helper_modules)
+
+    with self.assertRaises(KeyError):
+      manager.ResolverHelperManager.RegisterHelperModule(
+          'test', 'tests.resolver_helpers.bogus_resolver_helper')
+
+    # A module that cannot be imported does not register a resolver helper.
+    with self.assertRaises(KeyError):
+      manager.ResolverHelperManager.GetHelper('test')
+
+    self.assertNotIn(
+        'test', manager.ResolverHelperManager._resolver_helper_modules)
+
+    with self.assertRaises(KeyError):
+      manager.ResolverHelperManager.RegisterHelperModule(
+          definitions.TYPE_INDICATOR_OS, 'dfvfs.resolver_helpers.bogus')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the serializer object implementation using a binary format."""
+
+import os
+import unittest
+
+from dfvfs.path import os_path_spec
+from dfvfs.path import qcow_path_spec
+from dfvfs.path import sqlite_blob_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.path import vshadow_path_spec
+from dfvfs.serializer import binary_serializer as serializer
+
+from tests import test_lib as shared_test_lib
+
+
+class BinaryPathSpecSerializerTest(shared_test_lib.BaseTestCase):
+  """Tests for the binary path specification serializer."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    test_file = self._GetTestFilePath(['ext2.qcow2'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._qcow_path_spec = qcow_path_spec.QCOWPathSpec(
+        parent=self._os_path_spec)
+    self._vshadow_path_spec = vshadow_path_spec.VShadowPathSpec(
+        store_index=1, parent=self._qcow_path_spec)
+    self._tsk_path_spec = tsk_path_spec.TSKPathSpec(
+        inode=16, location='/a_directory/another_file',
+        parent=self._vshadow_path_spec)
+
+    self._tsk_path_spec_dict = {
+        'inode': 16,
+        'location': '/a_directory/another_file',
+        'parent': {
+            'store_index': 1,
+            'parent': {
+                'parent': {
+                    'location': os.path.abspath(test_file)}
+            }
+        }
+    }
+
+  def testReadAndWriteSerialized(self):
+    """Test the ReadSerialized and WriteSerialized function."""
+    serialized_path_spec = (
+        serializer.BinaryPathSpecSerializer.WriteSerialized(
+            self._tsk_path_spec))
+
+    self.assertIsNotNone(serialized_path_spec)
+
+    path_spec = serializer.BinaryPathSpecSerializer.ReadSerialized(
+        serialized_path_spec)
+
+    self.assertIsNotNone(path_spec)
+
+    path_spec_dict = path_spec.CopyToDict()
+    self.assertEqual(
+        sorted(path_spec_dict.items()),
+        sorted(self._tsk_path_spec_dict.items()))
+
+    test_path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='blobs', column_name='blob',
+        row_condition=('identifier', '==', 5), parent=self._os_path_spec)
+
+    serialized_path_spec = (
+        serializer.BinaryPathSpecSerializer.WriteSerialized(test_path_spec))
+
+    path_spec = serializer.BinaryPathSpecSerializer.ReadSerialized(
+        serialized_path_spec)
+    self.assertEqual(path_spec, test_path_spec)
+    self.assertEqual(path_spec.row_condition, ('identifier', '==', 5))
+
+    with self.assertRaises(TypeError):
+      serializer.BinaryPathSpecSerializer.WriteSerialized('/a_directory')
+
+  def testReadSerializedInvalid(self):
+    """Test the ReadSerialized function with invalid serialized forms."""
+    serialized_path_spec = (
+        serializer.BinaryPathSpecSerializer.WriteSerialized(
+            self._tsk_path_spec))
+
+    with self.assertRaises(ValueError):
+      serializer.BinaryPathSpecSerializer.ReadSerialized(b'')
+
+    with self.assertRaises(ValueError):
+      serializer.BinaryPathSpecSerializer.ReadSerialized(
+          b'XXXX' + serialized_path_spec[4:])
+
+    with self.assertRaises(ValueError):
+      serializer.BinaryPathSpecSerializer.ReadSerialized(
+          serialized_path_spec[:-4])
+
+    serialized_path_specs = (
+        serializer.BinaryPathSpecSerializer.WriteSerializedBatch([
+            self._os_path_spec, self._tsk_path_spec]))
+
+    with self.assertRaises(ValueError):
+      serializer.BinaryPathSpecSerializer.ReadSerialized(
+          serialized_path_specs)
+
+  def testReadAndWriteSerializedBatch(self):
+    """Test the ReadSerializedBatch and WriteSerializedBatch function."""
+    test_path_specs = [self._tsk_path_spec, self._vshadow_path_spec]
+    for inode in range(17, 27):
+      test_path_specs.append(tsk_path_spec.TSKPathSpec(
+          inode=inode, location=f'/a_directory/file{inode:d}',
+          parent=self._vshadow_path_spec))
+
+    test_path_specs.append(self._tsk_path_spec)
+
+    serialized_path_specs = (
+        serializer.BinaryPathSpecSerializer.WriteSerializedBatch(
+            test_path_specs))
+
+    path_specs = list(serializer.BinaryPathSpecSerializer.ReadSerializedBatch(
+        serialized_path_specs))
+    self.assertEqual(path_specs, test_path_specs)
+
+    # The shared parents are only stored and read once.
+    self.assertIs(path_specs[0].parent, path_specs[1])
+    self.assertIs(path_specs[2].parent, path_specs[1])
+    self.assertIs(path_specs[-1], path_specs[0])
+
+    serialized_path_spec = (
+        serializer.BinaryPathSpecSerializer.WriteSerialized(
+            self._tsk_path_spec))
+    self.assertLess(
+        len(serialized_path_specs),
+        len(serialized_path_spec) * len(test_path_specs) / 2)
+
+    serialized_path_specs = (
+        serializer.BinaryPathSpecSerializer.WriteSerializedBatch([]))
+
+    path_specs = list(serializer.BinaryPathSpecSerializer.ReadSerializedBatch(
+        serialized_path_specs))
+    self.assertEqual(path_specs, [])
+
+
+if __name__ == '__main__':
+  unittest.main()
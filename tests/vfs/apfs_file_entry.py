@@ -203,6 +203,31 @@ class APFSFileEntryTest(shared_test_lib.BaseTestCase):
     fsafps_file_entry = file_entry.GetAPFSFileEntry()
     self.assertIsNotNone(fsafps_file_entry)
 
+  def testGetExtentFileObject(self):
+    """Tests the GetExtentFileObject function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_APFS,
+        identifier=self._IDENTIFIER_ANOTHER_FILE,
+        location='/a_directory/another_file',
+        parent=self._apfs_container_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    # APFS extents are relative to the start of the container and the data
+    # can be encrypted, hence the data is not read from the extents.
+    extent_file_object = file_entry.GetExtentFileObject()
+    self.assertIsNone(extent_file_object)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_APFS,
+        identifier=self._IDENTIFIER_A_DIRECTORY, location='/a_directory',
+        parent=self._apfs_container_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extent_file_object = file_entry.GetExtentFileObject()
+    self.assertIsNone(extent_file_object)
+
   def testGetExtents(self):
     """Tests the GetExtents function."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
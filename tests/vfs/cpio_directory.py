@@ -45,13 +45,23 @@ class CPIODirectoryTest(shared_test_lib.BaseTestCase):
 
   def testEntriesGenerator(self):
     """Tests the _EntriesGenerator function."""
-    directory = cpio_directory.CPIODirectory(
-        self._file_system, self._cpio_path_spec)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_CPIO, location='/',
+        parent=self._os_path_spec)
+    directory = cpio_directory.CPIODirectory(self._file_system, path_spec)
 
     self.assertIsNotNone(directory)
 
     entries = list(directory.entries)
     self.assertEqual(len(entries), 1)
+    self.assertEqual(entries[0].location, '/syslog')
+
+    # A file has no directory entries.
+    directory = cpio_directory.CPIODirectory(
+        self._file_system, self._cpio_path_spec)
+
+    entries = list(directory.entries)
+    self.assertEqual(len(entries), 0)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the VFS directory cache."""
+
+import unittest
+
+from dfvfs.path import fake_path_spec
+from dfvfs.vfs import directory_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class CachedDirectoryTest(shared_test_lib.BaseTestCase):
+  """Tests for the cached directory entries."""
+
+  def testGetPathSpecByName(self):
+    """Tests the GetPathSpecByName function."""
+    path_spec1 = fake_path_spec.FakePathSpec(location='/Windows')
+    path_spec2 = fake_path_spec.FakePathSpec(location='/windows')
+    path_spec3 = fake_path_spec.FakePathSpec(location='/Users')
+
+    cached_directory = directory_cache.CachedDirectory([
+        ('Windows', path_spec1), ('windows', path_spec2),
+        ('Users', path_spec3), (None, path_spec3)])
+    self.assertEqual(cached_directory.number_of_entries, 4)
+
+    path_spec = cached_directory.GetPathSpecByName('windows')
+    self.assertEqual(path_spec, path_spec2)
+
+    path_spec = cached_directory.GetPathSpecByName(
+        'WINDOWS', case_sensitive=False)
+    self.assertEqual(path_spec, path_spec1)
+
+    path_spec = cached_directory.GetPathSpecByName('users')
+    self.assertIsNone(path_spec)
+
+    path_spec = cached_directory.GetPathSpecByName(
+        'users', case_sensitive=False)
+    self.assertEqual(path_spec, path_spec3)
+
+
+class DirectoryCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the directory cache."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    cache = directory_cache.DirectoryCache(16)
+    self.assertEqual(cache.maximum_number_of_entries, 16)
+
+    with self.assertRaises(ValueError):
+      directory_cache.DirectoryCache(0)
+
+  def testCacheDirectory(self):
+    """Tests the CacheDirectory and GetDirectory functions."""
+    cache = directory_cache.DirectoryCache(4)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/a/1')
+    entries1 = [('1', path_spec), ('2', path_spec)]
+    entries2 = [('3', path_spec), ('4', path_spec), ('5', path_spec)]
+
+    self.assertIsNone(cache.GetDirectory('/a'))
+
+    cached_directory = cache.CacheDirectory('/a', entries1)
+    self.assertIsNotNone(cached_directory)
+    self.assertEqual(cache.number_of_directories, 1)
+    self.assertEqual(cache.number_of_entries, 2)
+
+    cached_directory = cache.GetDirectory('/a')
+    self.assertEqual(cached_directory.entries, entries1)
+
+    # The least recently used directory is removed when the cache is full.
+    cache.CacheDirectory('/b', entries2)
+    self.assertEqual(cache.number_of_directories, 1)
+    self.assertEqual(cache.number_of_entries, 3)
+    self.assertIsNone(cache.GetDirectory('/a'))
+
+    # Directories with more entries than the cache can hold are not cached.
+    cached_directory = cache.CacheDirectory('/c', entries1 + entries2)
+    self.assertIsNone(cached_directory)
+    self.assertIsNone(cache.GetDirectory('/c'))
+
+    self.assertEqual(cache.hits, 1)
+    self.assertEqual(cache.misses, 3)
+
+  def testEmpty(self):
+    """Tests the Empty function."""
+    cache = directory_cache.DirectoryCache(4)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/a/1')
+    cache.CacheDirectory('/a', [('1', path_spec)])
+    self.assertEqual(cache.number_of_directories, 1)
+
+    cache.Empty()
+    self.assertEqual(cache.number_of_directories, 0)
+    self.assertEqual(cache.number_of_entries, 0)
+
+  def testGetStatistics(self):
+    """Tests the GetStatistics function."""
+    cache = directory_cache.DirectoryCache(4)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/a/1')
+    cache.CacheDirectory('/a', [('1', path_spec)])
+    cache.GetDirectory('/a')
+    cache.GetDirectory('/b')
+
+    expected_statistics = {
+        'hits': 1,
+        'misses': 1,
+        'number_of_directories': 1,
+        'number_of_entries': 1}
+
+    statistics = cache.GetStatistics()
+    self.assertEqual(statistics, expected_statistics)
+
+
+if __name__ == '__main__':
+  unittest.main()
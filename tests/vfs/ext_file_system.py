@@ -61,6 +61,48 @@ class EXTFileSystemTest(shared_test_lib.BaseTestCase):
         parent=self._raw_path_spec)
     self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
 
+  def testGetFileEntriesStat(self):
+    """Tests the GetFileEntriesStat function."""
+    file_system = ext_file_system.EXTFileSystem(
+        self._resolver_context, self._ext_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    stat_records = {
+        stat_record.name: stat_record
+        for stat_record in file_system.GetFileEntriesStat(
+            self._ext_path_spec)}
+
+    stat_record = stat_records['passwords.txt']
+    self.assertTrue(stat_record.is_allocated)
+    self.assertEqual(stat_record.location, '/passwords.txt')
+    self.assertIsNotNone(stat_record.modification_time)
+    self.assertEqual(stat_record.size, 116)
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
+
+  def testGetFileEntriesStatByInodeRange(self):
+    """Tests the GetFileEntriesStatByInodeRange function."""
+    file_system = ext_file_system.EXTFileSystem(
+        self._resolver_context, self._ext_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    inode_numbers = {
+        stat_record.name: stat_record.inode_number
+        for stat_record in file_system.GetFileEntriesStat(
+            self._ext_path_spec)}
+    inode_number = inode_numbers['passwords.txt']
+
+    stat_records = list(file_system.GetFileEntriesStatByInodeRange(
+        inode_number, inode_number))
+    self.assertEqual(len(stat_records), 1)
+
+    stat_record = stat_records[0]
+    self.assertEqual(stat_record.inode_number, inode_number)
+    self.assertIsNone(stat_record.location)
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     file_system = ext_file_system.EXTFileSystem(
@@ -109,6 +151,30 @@ class EXTFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, '')
 
+  def testIterateFileEntriesByInode(self):
+    """Tests the IterateFileEntriesByInode function."""
+    file_system = ext_file_system.EXTFileSystem(
+        self._resolver_context, self._ext_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    stat_records = {
+        stat_record.location: stat_record
+        for stat_record in file_system.IterateFileEntriesByInode()}
+
+    self.assertIn('/', stat_records)
+
+    stat_record = stat_records['/passwords.txt']
+    self.assertEqual(stat_record.name, 'passwords.txt')
+    self.assertEqual(
+        stat_record.parent_inode_number,
+        file_system.ROOT_DIRECTORY_INODE_NUMBER)
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
+
+    # The reserved inodes are not referenced by a directory.
+    self.assertIn(None, stat_records)
+
 
 if __name__ == '__main__':
   unittest.main()
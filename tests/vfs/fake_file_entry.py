@@ -152,6 +152,67 @@ class FakeFileEntryTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(parent_file_entry.name, 'testdir_fake')
 
+  def testGetSubFileEntryByName(self):
+    """Tests the GetSubFileEntryByName function."""
+    path_spec = fake_path_spec.FakePathSpec(location=self._test_file)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('file2.txt')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(
+        sub_file_entry.path_spec.location, '/test_data/testdir_fake/file2.txt')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('FILE2.TXT')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'FILE2.TXT', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'file2.txt')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('bogus')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('..')
+    self.assertIsNone(sub_file_entry)
+
+  def testGetSubFileEntryByNameWithDirectoryCache(self):
+    """Tests the GetSubFileEntryByName function with a directory cache."""
+    directory_cache = self._file_system.EnableDirectoryCache()
+
+    try:
+      path_spec = fake_path_spec.FakePathSpec(location=self._test_file)
+      file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+      self.assertIsNotNone(file_entry)
+
+      # Enumerating the sub file entries caches the directory.
+      sub_file_entries = list(file_entry.sub_file_entries)
+      self.assertEqual(len(sub_file_entries), 6)
+      self.assertEqual(directory_cache.number_of_directories, 1)
+      self.assertEqual(directory_cache.number_of_entries, 6)
+
+      self.assertEqual(file_entry.number_of_sub_file_entries, 6)
+
+      sub_file_entry = file_entry.GetSubFileEntryByName('file2.txt')
+      self.assertIsNotNone(sub_file_entry)
+      self.assertEqual(
+          sub_file_entry.path_spec.location,
+          '/test_data/testdir_fake/file2.txt')
+
+      sub_file_entry = file_entry.GetSubFileEntryByName('FILE2.TXT')
+      self.assertIsNone(sub_file_entry)
+
+      sub_file_entry = file_entry.GetSubFileEntryByName(
+          'FILE2.TXT', case_sensitive=False)
+      self.assertIsNotNone(sub_file_entry)
+      self.assertEqual(sub_file_entry.name, 'file2.txt')
+
+      self.assertEqual(directory_cache.hits, 4)
+
+    finally:
+      self._file_system.DisableDirectoryCache()
+
   def testIsFunctions(self):
     """Test the Is* functions."""
     test_file = '/test_data/testdir_fake/file1.txt'
@@ -209,6 +209,14 @@ class FileEntryTest(shared_test_lib.BaseTestCase):
     with self.assertRaises(ValueError):
       test_file_entry.GetDataStream(0)
 
+  def testGetExtentFileObject(self):
+    """Tests the GetExtentFileObject function."""
+    test_file_entry = TestFileEntry(
+        self._resolver_context, self._file_system, self._path_spec)
+
+    extent_file_object = test_file_entry.GetExtentFileObject()
+    self.assertIsNone(extent_file_object)
+
   def testGetExtents(self):
     """Tests the GetExtents function."""
     test_file_entry = TestFileEntry(
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the VFS file entry stat record."""
+
+import unittest
+
+from dfvfs.vfs import file_entry_stat
+
+from tests import test_lib as shared_test_lib
+
+
+class FileEntryStatTest(shared_test_lib.BaseTestCase):
+  """Tests the VFS file entry stat record."""
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    stat_record = file_entry_stat.FileEntryStat()
+    self.assertIsNotNone(stat_record)
+    self.assertTrue(stat_record.is_allocated)
+    self.assertIsNone(stat_record.name)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,8 +4,12 @@
 
 import unittest
 
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
 from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
+from dfvfs.vfs import fake_file_system
+from dfvfs.vfs import file_entry_stat
 from dfvfs.vfs import file_system
 
 from tests import test_lib as shared_test_lib
@@ -19,9 +23,41 @@ class TestFileSystem(file_system.FileSystem):
   TYPE_INDICATOR = 'test'
 
 
+class TestInodeFileSystem(TestFileSystem):
+  """File system with stat records by inode for testing."""
+
+  # pylint: disable=abstract-method
+
+  def __init__(self, resolver_context, path_spec, stat_records):
+    """Initializes a file system.
+
+    Args:
+      resolver_context (Context): resolver context.
+      path_spec (PathSpec): a path specification.
+      stat_records (dict[int, FileEntryStat]): stat record per inode number.
+    """
+    super(TestInodeFileSystem, self).__init__(resolver_context, path_spec)
+    self.read_inode_numbers = []
+    self._stat_records = stat_records
+
+  def _GetFileEntryStatByInode(self, inode_number):
+    """Retrieves a stat record of a file entry by inode.
+
+    Args:
+      inode_number (int): inode number of the file entry.
+
+    Returns:
+      FileEntryStat: stat record or None if not available.
+    """
+    self.read_inode_numbers.append(inode_number)
+    return self._stat_records.get(inode_number, None)
+
+
 class FileSystemTest(shared_test_lib.BaseTestCase):
   """Tests the VFS file system object interface."""
 
+  # pylint: disable=protected-access
+
   def setUp(self):
     """Sets up the needed objects used throughout the test."""
     self._resolver_context = context.Context()
@@ -36,10 +72,121 @@ class FileSystemTest(shared_test_lib.BaseTestCase):
   # TODO: add tests for type_indicator property.
   # TODO: add tests for _Close function.
   # TODO: add tests for _Open function.
+
+  def testGetLocationByInode(self):
+    """Tests the _GetLocationByInode function."""
+    path_spec = fake_path_spec.FakePathSpec(location='/')
+
+    test_file_system = TestFileSystem(self._resolver_context, path_spec)
+
+    parent_references = {
+        3: (2, 'a_directory'),
+        4: (3, 'a_file'),
+        5: (9, 'orphan'),
+        6: (7, 'loop'),
+        7: (6, 'loop')}
+    locations = {2: '/'}
+
+    location = test_file_system._GetLocationByInode(
+        4, parent_references, locations)
+    self.assertEqual(location, '/a_directory/a_file')
+    self.assertEqual(locations[3], '/a_directory')
+
+    location = test_file_system._GetLocationByInode(
+        5, parent_references, locations)
+    self.assertIsNone(location)
+
+    location = test_file_system._GetLocationByInode(
+        6, parent_references, locations)
+    self.assertIsNone(location)
+
+  def testIterateFileEntriesByInodeRange(self):
+    """Tests the _IterateFileEntriesByInodeRange function."""
+    path_spec = fake_path_spec.FakePathSpec(location='/')
+
+    stat_records = {}
+    for inode_number, parent_inode_number, name, file_entry_type in (
+        (2, None, None, definitions.FILE_ENTRY_TYPE_DIRECTORY),
+        (3, 9, 'orphan', definitions.FILE_ENTRY_TYPE_FILE),
+        (4, 5, 'a_file', definitions.FILE_ENTRY_TYPE_FILE),
+        (5, 2, 'a_directory', definitions.FILE_ENTRY_TYPE_DIRECTORY)):
+      stat_record = file_entry_stat.FileEntryStat()
+      stat_record.inode_number = inode_number
+      stat_record.is_allocated = True
+      stat_record.name = name
+      stat_record.parent_inode_number = parent_inode_number
+      stat_record.type = file_entry_type
+      stat_records[inode_number] = stat_record
+
+    test_file_system = TestInodeFileSystem(
+        self._resolver_context, path_spec, stat_records)
+
+    generator = test_file_system._IterateFileEntriesByInodeRange(1, 5, 2)
+
+    # The stat record of the root is yielded before the next inode is read.
+    stat_record = next(generator)
+    self.assertEqual(stat_record.location, '/')
+    self.assertEqual(test_file_system.read_inode_numbers, [1, 2])
+
+    locations = [stat_record.location for stat_record in generator]
+    self.assertEqual(locations, ['/a_directory', None, '/a_directory/a_file'])
   # TODO: add tests for BasenamePath function.
   # TODO: add tests for Close function.
   # TODO: add tests for DirnamePath function.
   # TODO: add tests for GetDataStreamByPathSpec function.
+
+  def testEnableDirectoryCache(self):
+    """Tests the EnableDirectoryCache and DisableDirectoryCache functions."""
+    path_spec = fake_path_spec.FakePathSpec(location='/')
+
+    test_file_system = TestFileSystem(self._resolver_context, path_spec)
+    self.assertIsNone(test_file_system.directory_cache)
+
+    directory_cache = test_file_system.EnableDirectoryCache(
+        maximum_number_of_entries=16)
+    self.assertIsNotNone(directory_cache)
+    self.assertEqual(directory_cache.maximum_number_of_entries, 16)
+    self.assertEqual(test_file_system.directory_cache, directory_cache)
+
+    with self.assertRaises(ValueError):
+      test_file_system.EnableDirectoryCache(maximum_number_of_entries=0)
+
+    test_file_system.DisableDirectoryCache()
+    self.assertIsNone(test_file_system.directory_cache)
+
+  def testGetFileEntriesStat(self):
+    """Tests the GetFileEntriesStat function."""
+    path_spec = fake_path_spec.FakePathSpec(location='/')
+
+    test_file_system = fake_file_system.FakeFileSystem(
+        self._resolver_context, path_spec)
+    test_file_system.AddFileEntry(
+        '/test_data', file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    test_file_system.AddFileEntry('/test_data/file1.txt', file_data=b'FILE1')
+    test_file_system.Open()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/test_data')
+    stat_records = list(
+        file_system.FileSystem.GetFileEntriesStat(test_file_system, path_spec))
+    self.assertEqual(len(stat_records), 1)
+
+    stat_record = stat_records[0]
+    self.assertEqual(stat_record.location, '/test_data/file1.txt')
+    self.assertEqual(stat_record.name, 'file1.txt')
+    self.assertEqual(stat_record.size, 5)
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
+
+  def testGetFileEntriesStatByInodeRange(self):
+    """Tests the GetFileEntriesStatByInodeRange function."""
+    path_spec = fake_path_spec.FakePathSpec(location='/')
+
+    test_file_system = TestFileSystem(self._resolver_context, path_spec)
+
+    stat_records = test_file_system.GetFileEntriesStatByInodeRange(1, 10)
+
+    with self.assertRaises(errors.NotSupported):
+      list(stat_records)
+
   # TODO: add tests for GetFileObjectByPathSpec function.
   # TODO: add tests for GetPathSegmentAndSuffix function.
 
@@ -63,6 +210,22 @@ class FileSystemTest(shared_test_lib.BaseTestCase):
     path = test_file_system.JoinPath(['/test1///test2', 'test3'])
     self.assertEqual(path, expected_path)
 
+  def testIterateFileEntriesByInode(self):
+    """Tests the IterateFileEntriesByInode function."""
+    path_spec = fake_path_spec.FakePathSpec(location='/')
+
+    test_file_system = fake_file_system.FakeFileSystem(
+        self._resolver_context, path_spec)
+    test_file_system.AddFileEntry(
+        '/test_data', file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    test_file_system.AddFileEntry('/test_data/file1.txt', file_data=b'FILE1')
+    test_file_system.Open()
+
+    locations = [
+        stat_record.location for stat_record in
+        file_system.FileSystem.IterateFileEntriesByInode(test_file_system)]
+    self.assertEqual(locations, ['/', '/test_data', '/test_data/file1.txt'])
+
   # TODO: add tests for Open function.
 
   def testSplitPath(self):
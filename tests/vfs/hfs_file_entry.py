@@ -294,6 +294,34 @@ class HFSFileEntryTest(shared_test_lib.BaseTestCase):
     data_stream = file_entry.GetDataStream('rsrc')
     self.assertIsNotNone(data_stream)
 
+  def testGetExtentFileObject(self):
+    """Tests the GetExtentFileObject function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_HFS,
+        identifier=self._IDENTIFIER_ANOTHER_FILE,
+        location='/a_directory/another_file',
+        parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    file_object = file_entry.GetFileObject()
+    self.assertIsNotNone(file_object)
+    expected_data = file_object.read()
+
+    extent_file_object = file_entry.GetExtentFileObject()
+    self.assertIsNotNone(extent_file_object)
+    self.assertEqual(extent_file_object.get_size(), len(expected_data))
+    self.assertEqual(extent_file_object.read(), expected_data)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_HFS, identifier=self._IDENTIFIER_A_DIRECTORY,
+        location='/a_directory', parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extent_file_object = file_entry.GetExtentFileObject()
+    self.assertIsNone(extent_file_object)
+
   def testGetExtents(self):
     """Tests the GetExtents function."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
@@ -63,6 +63,44 @@ class HFSFileSystemTest(shared_test_lib.BaseTestCase):
     result = file_system.FileEntryExistsByPathSpec(path_spec)
     self.assertFalse(result)
 
+  def testGetFileEntriesStat(self):
+    """Tests the GetFileEntriesStat function."""
+    file_system = hfs_file_system.HFSFileSystem(
+        self._resolver_context, self._hfs_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    stat_records = {
+        stat_record.name: stat_record
+        for stat_record in file_system.GetFileEntriesStat(
+            self._hfs_path_spec)}
+    self.assertEqual(len(stat_records), 6)
+
+    stat_record = stat_records['passwords.txt']
+    self.assertEqual(stat_record.inode_number, 20)
+    self.assertTrue(stat_record.is_allocated)
+    self.assertEqual(stat_record.location, '/passwords.txt')
+    self.assertIsNotNone(stat_record.modification_time)
+    self.assertEqual(stat_record.size, 116)
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
+
+  def testGetFileEntriesStatByInodeRange(self):
+    """Tests the GetFileEntriesStatByInodeRange function."""
+    file_system = hfs_file_system.HFSFileSystem(
+        self._resolver_context, self._hfs_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    stat_records = list(file_system.GetFileEntriesStatByInodeRange(18, 22))
+    self.assertEqual(len(stat_records), 5)
+
+    stat_record = stat_records[2]
+    self.assertEqual(stat_record.inode_number, 20)
+    self.assertIsNone(stat_record.location)
+    self.assertEqual(stat_record.name, 'passwords.txt')
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     file_system = hfs_file_system.HFSFileSystem(
@@ -108,6 +146,25 @@ class HFSFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, '')
 
+  def testIterateFileEntriesByInode(self):
+    """Tests the IterateFileEntriesByInode function."""
+    file_system = hfs_file_system.HFSFileSystem(
+        self._resolver_context, self._hfs_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    stat_records = {
+        stat_record.location: stat_record
+        for stat_record in file_system.IterateFileEntriesByInode()}
+
+    self.assertEqual(len(stat_records), 13)
+
+    stat_record = stat_records['/a_directory/another_file']
+    self.assertEqual(stat_record.inode_number, 21)
+    self.assertEqual(stat_record.name, 'another_file')
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
+
 
 if __name__ == '__main__':
   unittest.main()
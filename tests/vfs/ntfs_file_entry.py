@@ -321,6 +321,32 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(file_entry.number_of_sub_file_entries, 2)
 
+  def testGetExtentFileObject(self):
+    """Tests the GetExtentFileObject function."""
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_NTFS, location='\\$UpCase', mft_entry=10,
+        parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    file_object = file_entry.GetFileObject()
+    self.assertIsNotNone(file_object)
+    expected_data = file_object.read()
+
+    extent_file_object = file_entry.GetExtentFileObject()
+    self.assertIsNotNone(extent_file_object)
+    self.assertEqual(extent_file_object.get_size(), len(expected_data))
+    self.assertEqual(extent_file_object.read(), expected_data)
+
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_NTFS, location='\\a_directory',
+        mft_entry=self._MFT_ENTRY_A_DIRECTORY, parent=self._raw_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extent_file_object = file_entry.GetExtentFileObject()
+    self.assertIsNone(extent_file_object)
+
   def testGetExtents(self):
     """Tests the GetExtents function."""
     path_spec = path_spec_factory.Factory.NewPathSpec(
@@ -55,6 +55,19 @@ class TSKDirectoryTest(shared_test_lib.BaseTestCase):
     entries = list(directory.entries)
     self.assertEqual(len(entries), 5)
 
+  def testGetEntriesWithTSKFiles(self):
+    """Tests the GetEntriesWithTSKFiles function."""
+    directory = tsk_directory.TSKDirectory(
+        self._file_system, self._tsk_path_spec)
+
+    self.assertIsNotNone(directory)
+
+    entries = list(directory.GetEntriesWithTSKFiles())
+    self.assertEqual(len(entries), 5)
+
+    for path_spec, tsk_file in entries:
+      self.assertEqual(path_spec.inode, tsk_file.info.meta.addr)
+
 
 if __name__ == '__main__':
   unittest.main()
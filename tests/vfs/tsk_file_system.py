@@ -61,6 +61,43 @@ class TSKFileSystemTest(shared_test_lib.BaseTestCase):
         parent=self._raw_path_spec)
     self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
 
+  def testGetFileEntriesStat(self):
+    """Tests the GetFileEntriesStat function."""
+    file_system = tsk_file_system.TSKFileSystem(
+        self._resolver_context, self._tsk_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    stat_records = {
+        stat_record.name: stat_record
+        for stat_record in file_system.GetFileEntriesStat(
+            self._tsk_path_spec)}
+
+    stat_record = stat_records['passwords.txt']
+    self.assertTrue(stat_record.is_allocated)
+    self.assertEqual(stat_record.location, '/passwords.txt')
+    self.assertIsNotNone(stat_record.modification_time)
+    self.assertEqual(stat_record.size, 116)
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
+
+  def testGetFileEntriesStatByInodeRange(self):
+    """Tests the GetFileEntriesStatByInodeRange function."""
+    file_system = tsk_file_system.TSKFileSystem(
+        self._resolver_context, self._tsk_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    stat_records = list(file_system.GetFileEntriesStatByInodeRange(
+        self._INODE_PASSWORDS_TXT, self._INODE_PASSWORDS_TXT))
+    self.assertEqual(len(stat_records), 1)
+
+    stat_record = stat_records[0]
+    self.assertEqual(stat_record.inode_number, self._INODE_PASSWORDS_TXT)
+    self.assertIsNone(stat_record.location)
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     file_system = tsk_file_system.TSKFileSystem(
@@ -106,6 +143,42 @@ class TSKFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, '')
 
+  def testGetTSKDirectoryEntriesByPathSpec(self):
+    """Tests the GetTSKDirectoryEntriesByPathSpec function."""
+    file_system = tsk_file_system.TSKFileSystem(
+        self._resolver_context, self._tsk_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    names = [
+        name for _, name in file_system.GetTSKDirectoryEntriesByPathSpec(
+            self._tsk_path_spec)]
+    self.assertIn('passwords.txt', names)
+    self.assertNotIn('.', names)
+    self.assertNotIn('..', names)
+
+  def testIterateFileEntriesByInode(self):
+    """Tests the IterateFileEntriesByInode function."""
+    file_system = tsk_file_system.TSKFileSystem(
+        self._resolver_context, self._tsk_path_spec)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open()
+
+    stat_records = {
+        stat_record.location: stat_record
+        for stat_record in file_system.IterateFileEntriesByInode()}
+
+    self.assertIn('/', stat_records)
+
+    stat_record = stat_records['/passwords.txt']
+    self.assertEqual(stat_record.inode_number, self._INODE_PASSWORDS_TXT)
+    self.assertEqual(stat_record.name, 'passwords.txt')
+    self.assertEqual(
+        stat_record.parent_inode_number, file_system.GetRootInode())
+    self.assertEqual(stat_record.type, definitions.FILE_ENTRY_TYPE_FILE)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the memory used to enumerate a file system.
+
+The benchmark enumerates a synthetic fake file system and keeps, per file
+entry, the objects a full volume enumeration typically keeps alive, such as
+path specifications, a stat attribute, an extent and a volume extent. The
+memory allocated by these objects is measured with tracemalloc.
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.vfs import attribute
+from dfvfs.vfs import extent
+from dfvfs.vfs import fake_file_system
+from dfvfs.volume import volume_system
+
+
+def CreateFileSystem(number_of_files):
+  """Creates a synthetic fake file system.
+
+  Args:
+    number_of_files (int): number of files in the root directory.
+
+  Returns:
+    FakeFileSystem: fake file system.
+  """
+  resolver_context = context.Context()
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_FAKE, location='/')
+
+  file_system = fake_file_system.FakeFileSystem(resolver_context, path_spec)
+  file_system.Open()
+
+  for file_index in range(number_of_files):
+    file_system.AddFileEntry(f'/file{file_index:d}', file_data=b'')
+
+  return file_system
+
+
+def EnumerateFileSystem(file_system):
+  """Enumerates a file system and keeps objects per file entry.
+
+  Args:
+    file_system (FakeFileSystem): file system.
+
+  Returns:
+    list[tuple[object]]: objects kept per file entry.
+  """
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_OS, location='/cases/image.raw')
+  parent_path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_RAW, parent=path_spec)
+
+  objects_per_file_entry = []
+
+  root_file_entry = file_system.GetRootFileEntry()
+  for inode_number, file_entry in enumerate(root_file_entry.sub_file_entries):
+    stat_attribute = attribute.StatAttribute()
+    stat_attribute.inode_number = inode_number
+    stat_attribute.mode = 0o644
+    stat_attribute.size = 0
+    stat_attribute.type = stat_attribute.TYPE_FILE
+
+    tsk_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_TSK, inode=inode_number,
+        location=file_entry.path_spec.location, parent=parent_path_spec)
+
+    data_extent = extent.Extent(
+        extent_type=definitions.EXTENT_TYPE_DATA, offset=inode_number * 4096,
+        size=4096)
+    volume_extent = volume_system.VolumeExtent(inode_number * 4096, 4096)
+
+    objects_per_file_entry.append((
+        file_entry.path_spec, tsk_path_spec, stat_attribute, data_extent,
+        volume_extent))
+
+  return objects_per_file_entry
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the memory used to enumerate a file system.'))
+
+  argument_parser.add_argument(
+      '--files', dest='number_of_files', type=int, default=1000000,
+      action='store', metavar='NUMBER', help='number of files.')
+
+  options = argument_parser.parse_args()
+
+  if options.number_of_files <= 0:
+    print('Unsupported number of files.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  print(f'Creating file system with: {options.number_of_files:d} files.')
+
+  file_system = CreateFileSystem(options.number_of_files)
+
+  gc.collect()
+  tracemalloc.start()
+
+  start_time = time.time()
+  objects_per_file_entry = EnumerateFileSystem(file_system)
+  elapsed_time = time.time() - start_time
+
+  gc.collect()
+  current_size, peak_size = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  number_of_file_entries = len(objects_per_file_entry)
+  current_size /= 1024 * 1024
+  peak_size /= 1024 * 1024
+
+  print((
+      f'{number_of_file_entries:d} file entries in {elapsed_time:.2f} '
+      f'seconds, memory: {current_size:.1f} MiB, peak: {peak_size:.1f} MiB.'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
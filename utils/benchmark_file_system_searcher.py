@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the file system searcher with many find specifications.
+
+The benchmark searches a synthetic fake file system with different numbers of
+find specifications, similar to the find specifications used to collect
+artifacts, such as a mix of literal locations, globs and regular expressions.
+"""
+
+import argparse
+import sys
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.helpers import fake_file_system_builder
+from dfvfs.helpers import file_system_searcher
+from dfvfs.path import fake_path_spec
+
+
+def CreateFileSystem(number_of_directories, number_of_files):
+  """Creates a synthetic fake file system.
+
+  Args:
+    number_of_directories (int): number of directories.
+    number_of_files (int): number of files per directory.
+
+  Returns:
+    FakeFileSystem: fake file system.
+  """
+  file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+
+  for directory_index in range(number_of_directories):
+    for file_index in range(number_of_files):
+      file_system_builder.AddFile(
+          f'/directory{directory_index:d}/file{file_index:d}.txt', b'')
+
+  return file_system_builder.file_system
+
+
+def CreateFindSpecs(number_of_find_specs):
+  """Creates find specifications.
+
+  Args:
+    number_of_find_specs (int): number of find specifications.
+
+  Returns:
+    list[FindSpec]: find specifications.
+  """
+  find_specs = []
+  for index in range(number_of_find_specs):
+    if index % 3 == 0:
+      find_spec = file_system_searcher.FindSpec(
+          location_glob=f'/directory*/file{index:d}.*')
+    elif index % 3 == 1:
+      find_spec = file_system_searcher.FindSpec(
+          case_sensitive=False,
+          location_regex=f'/directory[0-9]+/FILE{index:d}\\.TXT')
+    else:
+      find_spec = file_system_searcher.FindSpec(
+          location_glob=f'/directory*/file{index:d}?.txt')
+
+    find_specs.append(find_spec)
+
+  return find_specs
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the file system searcher with many find specifications.'))
+
+  argument_parser.add_argument(
+      '--directories', dest='number_of_directories', type=int, default=10,
+      action='store', metavar='NUMBER', help='number of directories.')
+
+  argument_parser.add_argument(
+      '--files', dest='number_of_files', type=int, default=100000,
+      action='store', metavar='NUMBER', help='number of files per directory.')
+
+  argument_parser.add_argument(
+      '--find_specs', dest='number_of_find_specs', type=str,
+      default='10,100,1000', action='store', metavar='NUMBERS', help=(
+          'comma separated numbers of find specifications to benchmark.'))
+
+  options = argument_parser.parse_args()
+
+  try:
+    numbers_of_find_specs = [
+        int(number) for number in options.number_of_find_specs.split(',')]
+  except ValueError:
+    print('Unsupported numbers of find specifications.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  number_of_entries = options.number_of_directories * options.number_of_files
+  print(f'Creating file system with: {number_of_entries:d} file entries.')
+
+  file_system = CreateFileSystem(
+      options.number_of_directories, options.number_of_files)
+  mount_point = fake_path_spec.FakePathSpec(location='/')
+
+  for number_of_find_specs in numbers_of_find_specs:
+    find_specs = CreateFindSpecs(number_of_find_specs)
+    searcher = file_system_searcher.FileSystemSearcher(
+        file_system, mount_point)
+
+    start_time = time.time()
+    number_of_matches = len(list(searcher.Find(find_specs=find_specs)))
+    elapsed_time = time.time() - start_time
+
+    print((
+        f'{number_of_find_specs:d} find specifications: '
+        f'{number_of_matches:d} matches in {elapsed_time:.2f} seconds.'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
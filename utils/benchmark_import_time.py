@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the time it takes to import dfVFS.
+
+Every measurement is done in a new Python process, since modules are only
+imported once per process. The benchmark imports the packages that register
+the back-ends and then resolves an OS path specification, similar to
+a short-lived worker process that only reads files from the operating system.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+# The Python code that is run in a new Python process per measurement. It
+# prints the time it took to import and the number of imported back-ends.
+_MEASUREMENT_CODE = """
+import sys
+import time
+
+start_time = time.perf_counter()
+
+import {module_name:s}
+
+from dfvfs.lib import definitions
+from dfvfs.path import factory
+from dfvfs.resolver import resolver
+
+path_spec = factory.Factory.NewPathSpec(
+    definitions.TYPE_INDICATOR_OS, location={location!r})
+file_entry = resolver.Resolver.OpenFileEntry(path_spec)
+
+elapsed_time = time.perf_counter() - start_time
+
+back_ends = [
+    name for name in sys.modules
+    if name.startswith('py') and name not in {standard_modules!r}]
+
+print(f'{{elapsed_time:f}} {{len(back_ends):d}}')
+"""
+
+_MODULE_NAMES = [
+    'dfvfs.analyzer',
+    'dfvfs.path',
+    'dfvfs.resolver_helpers',
+    'dfvfs.helpers.source_scanner']
+
+# Modules of the standard library and common packages whose name starts with
+# "py", which are not back-ends.
+_STANDARD_MODULES = frozenset([
+    'pyexpat',
+    'pyparsing',
+    'pydoc',
+    'pydoc_data'])
+
+
+def MeasureImportTime(module_name, number_of_runs):
+  """Measures the time it takes to import a module.
+
+  Args:
+    module_name (str): name of the module.
+    number_of_runs (int): number of runs.
+
+  Returns:
+    tuple[list[float], int]: import times in seconds per run and number of
+        imported back-ends.
+
+  Raises:
+    RuntimeError: if the measurement failed.
+  """
+  code = _MEASUREMENT_CODE.format(
+      location=__file__, module_name=module_name,
+      standard_modules=sorted(_STANDARD_MODULES))
+
+  import_times = []
+  number_of_back_ends = 0
+  for _ in range(number_of_runs):
+    try:
+      output = subprocess.check_output([sys.executable, '-c', code], cwd='.')
+    except subprocess.CalledProcessError as exception:
+      raise RuntimeError(
+          f'Unable to measure import of: {module_name:s}') from exception
+
+    import_time, number_of_back_ends = output.decode('utf-8').split()
+    import_times.append(float(import_time))
+    number_of_back_ends = int(number_of_back_ends, 10)
+
+  return import_times, number_of_back_ends
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the time it takes to import dfVFS.'))
+
+  argument_parser.add_argument(
+      '--runs', dest='number_of_runs', type=int, default=10, action='store',
+      metavar='NUMBER', help='number of runs per module.')
+
+  argument_parser.add_argument(
+      'module_names', nargs='*', action='store', metavar='MODULE',
+      default=_MODULE_NAMES, help='names of the modules to import.')
+
+  options = argument_parser.parse_args()
+
+  if options.number_of_runs <= 0:
+    print('Unsupported number of runs.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  for module_name in options.module_names:
+    try:
+      import_times, number_of_back_ends = MeasureImportTime(
+          module_name, options.number_of_runs)
+    except RuntimeError as exception:
+      print(exception)
+      return False
+
+    median_time = statistics.median(import_times) * 1000.0
+    minimum_time = min(import_times) * 1000.0
+
+    print((
+        f'{module_name:s}: median {median_time:.1f} ms, minimum '
+        f'{minimum_time:.1f} ms, {number_of_back_ends:d} back-ends imported.'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
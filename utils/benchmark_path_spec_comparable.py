@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the comparable of path specifications.
+
+The benchmark walks a synthetic fake file system with the file system
+searcher, which creates a path specification per file entry, and looks up
+path specifications with a deep chain of parents in the file-like object
+cache of a resolver context, which uses their comparable and hash.
+"""
+
+import argparse
+import sys
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.helpers import fake_file_system_builder
+from dfvfs.helpers import file_system_searcher
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+
+
+def BenchmarkCacheLookups(number_of_path_specs, number_of_runs):
+  """Benchmarks looking up path specifications in a resolver context.
+
+  The path specifications have an OS, EWF, GPT and APFS container parent.
+
+  Args:
+    number_of_path_specs (int): number of path specifications.
+    number_of_runs (int): number of times every path specification is
+        looked up.
+
+  Returns:
+    float: elapsed time in seconds.
+  """
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_OS, location='/cases/image.E01')
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_EWF, parent=path_spec)
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_GPT, location='/p1', parent=path_spec)
+  parent_path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_APFS_CONTAINER, location='/apfs1',
+      parent=path_spec)
+
+  path_specs = [
+      path_spec_factory.Factory.NewPathSpec(
+          definitions.TYPE_INDICATOR_APFS, identifier=index,
+          location=f'/directory/file{index:d}', parent=parent_path_spec)
+      for index in range(number_of_path_specs)]
+
+  resolver_context = context.Context()
+
+  start_time = time.time()
+  for _ in range(number_of_runs):
+    for path_spec in path_specs:
+      resolver_context.GetFileObject(path_spec)
+      hash(path_spec)
+
+  return time.time() - start_time
+
+
+def BenchmarkFind(number_of_directories, number_of_files):
+  """Benchmarks walking a fake file system with the file system searcher.
+
+  Args:
+    number_of_directories (int): number of directories.
+    number_of_files (int): number of files per directory.
+
+  Returns:
+    tuple[int, float]: number of matches and elapsed time in seconds.
+  """
+  file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+
+  for directory_index in range(number_of_directories):
+    for file_index in range(number_of_files):
+      file_system_builder.AddFile(
+          f'/directory{directory_index:d}/file{file_index:d}.txt', b'')
+
+  mount_point = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_FAKE, location='/')
+  searcher = file_system_searcher.FileSystemSearcher(
+      file_system_builder.file_system, mount_point)
+
+  find_spec = file_system_searcher.FindSpec(location_glob='/*/*.txt')
+
+  start_time = time.time()
+  number_of_matches = len(list(searcher.Find(find_specs=[find_spec])))
+  elapsed_time = time.time() - start_time
+
+  return number_of_matches, elapsed_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the comparable of path specifications.'))
+
+  argument_parser.add_argument(
+      '--directories', dest='number_of_directories', type=int, default=100,
+      action='store', metavar='NUMBER', help='number of directories.')
+
+  argument_parser.add_argument(
+      '--files', dest='number_of_files', type=int, default=10000,
+      action='store', metavar='NUMBER', help='number of files per directory.')
+
+  argument_parser.add_argument(
+      '--path_specs', dest='number_of_path_specs', type=int, default=1000,
+      action='store', metavar='NUMBER', help=(
+          'number of path specifications to look up.'))
+
+  argument_parser.add_argument(
+      '--runs', dest='number_of_runs', type=int, default=1000,
+      action='store', metavar='NUMBER', help=(
+          'number of times every path specification is looked up.'))
+
+  options = argument_parser.parse_args()
+
+  if (options.number_of_directories <= 0 or options.number_of_files <= 0 or
+      options.number_of_path_specs <= 0 or options.number_of_runs <= 0):
+    print('Unsupported number of directories, files, path specifications or '
+          'runs.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  number_of_lookups = options.number_of_path_specs * options.number_of_runs
+  elapsed_time = BenchmarkCacheLookups(
+      options.number_of_path_specs, options.number_of_runs)
+
+  print((
+      f'{number_of_lookups:d} resolver context look ups: '
+      f'{elapsed_time:.2f} seconds.'))
+
+  number_of_entries = options.number_of_directories * options.number_of_files
+  number_of_matches, elapsed_time = BenchmarkFind(
+      options.number_of_directories, options.number_of_files)
+
+  print((
+      f'Find in: {number_of_entries:d} file entries: '
+      f'{number_of_matches:d} matches in {elapsed_time:.2f} seconds.'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
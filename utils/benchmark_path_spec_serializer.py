@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the path specification serializers.
+
+The benchmark serializes and deserializes path specifications of file entries
+in a NTFS volume in a partition of a storage media image, similar to the path
+specifications exchanged between processes, with the JSON serializer and the
+binary serializer, per path specification and as a batch.
+"""
+
+import argparse
+import sys
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.serializer import binary_serializer
+from dfvfs.serializer import json_serializer
+
+
+def CreatePathSpecs(number_of_path_specs):
+  """Creates path specifications.
+
+  Args:
+    number_of_path_specs (int): number of path specifications.
+
+  Returns:
+    list[PathSpec]: path specifications.
+  """
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_OS, location='/cases/image.qcow2')
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_QCOW, parent=path_spec)
+  parent_path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_TSK_PARTITION, location='/p1', part_index=2,
+      start_offset=1048576, parent=path_spec)
+
+  path_specs = []
+  for index in range(number_of_path_specs):
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_NTFS,
+        location=f'\\Windows\\System32\\file{index:d}.dll',
+        mft_attribute=1, mft_entry=index + 64, parent=parent_path_spec)
+    path_specs.append(path_spec)
+
+  return path_specs
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the path specification serializers.'))
+
+  argument_parser.add_argument(
+      '--path_specs', dest='number_of_path_specs', type=int, default=100000,
+      action='store', metavar='NUMBER', help=(
+          'number of path specifications.'))
+
+  options = argument_parser.parse_args()
+
+  if options.number_of_path_specs <= 0:
+    print('Unsupported number of path specifications.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  path_specs = CreatePathSpecs(options.number_of_path_specs)
+
+  print(f'Serializing: {options.number_of_path_specs:d} path specifications.')
+
+  json_path_spec_serializer = json_serializer.JsonPathSpecSerializer
+  binary_path_spec_serializer = binary_serializer.BinaryPathSpecSerializer
+
+  start_time = time.time()
+  serialized_path_specs = [
+      json_path_spec_serializer.WriteSerialized(path_spec)
+      for path_spec in path_specs]
+  write_time = time.time() - start_time
+
+  start_time = time.time()
+  for serialized in serialized_path_specs:
+    json_path_spec_serializer.ReadSerialized(serialized)
+  read_time = time.time() - start_time
+
+  size = sum(len(serialized) for serialized in serialized_path_specs)
+  print((
+      f'JSON: write {write_time:.2f} seconds, read {read_time:.2f} seconds, '
+      f'{size:d} bytes.'))
+
+  start_time = time.time()
+  serialized_path_specs = [
+      binary_path_spec_serializer.WriteSerialized(path_spec)
+      for path_spec in path_specs]
+  write_time = time.time() - start_time
+
+  start_time = time.time()
+  for serialized in serialized_path_specs:
+    binary_path_spec_serializer.ReadSerialized(serialized)
+  read_time = time.time() - start_time
+
+  size = sum(len(serialized) for serialized in serialized_path_specs)
+  print((
+      f'Binary: write {write_time:.2f} seconds, read {read_time:.2f} seconds, '
+      f'{size:d} bytes.'))
+
+  start_time = time.time()
+  serialized = binary_path_spec_serializer.WriteSerializedBatch(path_specs)
+  write_time = time.time() - start_time
+
+  start_time = time.time()
+  number_of_path_specs = len(list(
+      binary_path_spec_serializer.ReadSerializedBatch(serialized)))
+  read_time = time.time() - start_time
+
+  if number_of_path_specs != options.number_of_path_specs:
+    print('Mismatch in number of deserialized path specifications.')
+    return False
+
+  print((
+      f'Binary batch: write {write_time:.2f} seconds, read {read_time:.2f} '
+      f'seconds, {len(serialized):d} bytes.'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
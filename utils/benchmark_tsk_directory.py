@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the enumeration of a directory with pytsk3.
+
+The benchmark enumerates the sub file entries of a directory in a storage
+media image, which reuses the TSK files of the directory iteration, and
+compares it with creating the file entries from the path specifications of
+the directory entries, which opens every TSK file again by inode.
+"""
+
+import argparse
+import sys
+import time
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+from dfvfs.vfs import tsk_directory
+
+
+def EnumerateDirectoryEntries(file_system, file_entry):
+  """Enumerates the file entries of the directory entries.
+
+  Args:
+    file_system (TSKFileSystem): file system.
+    file_entry (TSKFileEntry): file entry of the directory.
+
+  Returns:
+    list[tuple[str, int, str]]: name, size and type of the file entries.
+  """
+  directory = tsk_directory.TSKDirectory(file_system, file_entry.path_spec)
+
+  file_entries = []
+  for path_spec in directory.entries:
+    sub_file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    file_entries.append((
+        sub_file_entry.name, sub_file_entry.size, sub_file_entry.entry_type))
+
+  return file_entries
+
+
+def EnumerateSubFileEntries(file_entry):
+  """Enumerates the sub file entries of a directory.
+
+  Args:
+    file_entry (TSKFileEntry): file entry of the directory.
+
+  Returns:
+    list[tuple[str, int, str]]: name, size and type of the file entries.
+  """
+  return [
+      (sub_file_entry.name, sub_file_entry.size, sub_file_entry.entry_type)
+      for sub_file_entry in file_entry.sub_file_entries]
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks the enumeration of a directory with pytsk3.'))
+
+  argument_parser.add_argument(
+      '--location', dest='location', type=str, default='/', action='store',
+      metavar='PATH', help='location of the directory in the file system.')
+
+  argument_parser.add_argument(
+      '--runs', dest='number_of_runs', type=int, default=5, action='store',
+      metavar='NUMBER', help='number of runs, of which the fastest is used.')
+
+  argument_parser.add_argument(
+      'source', nargs='?', action='store', metavar='image.raw',
+      default=None, help='path of a storage media image with a file system.')
+
+  options = argument_parser.parse_args()
+
+  if not options.source:
+    print('Source value is missing.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  if options.number_of_runs <= 0:
+    print('Unsupported number of runs.')
+    print('')
+    argument_parser.print_help()
+    return False
+
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_OS, location=options.source)
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_TSK, location=options.location,
+      parent=path_spec)
+
+  elapsed_times = {}
+  for _ in range(options.number_of_runs):
+    for name in ('directory entries', 'sub file entries'):
+      # A new resolver context is used so that no TSK files are cached.
+      resolver_context = context.Context()
+      file_system = resolver.Resolver.OpenFileSystem(
+          path_spec, resolver_context=resolver_context)
+      file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+      if not file_entry or not file_entry.IsDirectory():
+        print(f'No such directory: {options.location:s}')
+        return False
+
+      start_time = time.time()
+      if name == 'directory entries':
+        file_entries = EnumerateDirectoryEntries(file_system, file_entry)
+      else:
+        file_entries = EnumerateSubFileEntries(file_entry)
+      elapsed_time = time.time() - start_time
+
+      elapsed_times[name] = min(
+          elapsed_times.get(name, elapsed_time), elapsed_time)
+
+      resolver_context.Empty()
+
+  number_of_file_entries = len(file_entries)
+  for name, elapsed_time in elapsed_times.items():
+    print((
+        f'{name:s}: {number_of_file_entries:d} file entries in '
+        f'{elapsed_time:.3f} seconds.'))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)